@@ -3,8 +3,11 @@
 Consolidated Charts API Router
 Combines functionality from both charts.py files with improved error handling
 """
+import asyncio
 import logging
 import json
+import os
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Literal
 
 from fastapi import APIRouter, Depends, Header, HTTPException
@@ -19,14 +22,26 @@ from database import (
     ChartData as DatabaseChartData,
     delete_chart_by_id,
     get_charts,
+    iter_natal_charts,
     save_chart,
 )
 from settings import settings
 from api.services.astro_service import AstroService, get_astro_service
+from utils.compatibility_index import compatibility_index
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/charts", tags=["charts"])
 
+# Seconds between reads of charts changed through other workers; 0 (the
+# default) loads the compatibility index once at startup
+COMPATIBILITY_INDEX_REFRESH_SECONDS = float(
+    os.getenv("COMPATIBILITY_INDEX_REFRESH_SECONDS", "0")
+)
+# Retry delay while the startup load keeps failing
+COMPATIBILITY_INDEX_RETRY_SECONDS = 60.0
+# Overlap of successive change reads, for clock differences between hosts
+COMPATIBILITY_INDEX_CURSOR_OVERLAP = timedelta(minutes=1)
+
 
 # ----- Request/Response Models -----
 
@@ -94,6 +109,8 @@ class SaveChartRequest(BaseModel):
     timezone: Optional[str] = None
     lat: Optional[float] = None
     lon: Optional[float] = None
+    # Opt in to compatibility search with this natal chart
+    discoverable: bool = False
 
 
 class SaveChartResponse(BaseModel):
@@ -135,6 +152,48 @@ def verify_id_token_dependency(
         raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
 
 
+# ----- Compatibility Index -----
+
+def rebuild_compatibility_index(updated_since: Optional[str] = None) -> int:
+    """Load saved discoverable charts into the compatibility index
+
+    With ``updated_since`` only charts changed since then are read and
+    applied on top of the current index.
+    """
+    charts = iter_natal_charts(
+        discoverable_only=True, updated_since=updated_since
+    )
+    return compatibility_index.load(charts, replace=updated_since is None)
+
+
+async def refresh_compatibility_index(
+    interval: float = COMPATIBILITY_INDEX_REFRESH_SECONDS,
+) -> None:
+    """Load the index at startup, then read changes every ``interval`` s.
+
+    Each worker process has its own in-memory index. Saves and deletes
+    update it in the worker that handles them, so one worker needs only
+    the startup load. With several workers, a positive ``interval`` makes
+    each one read the charts updated since its last load (a cursor on
+    ``updated_at``, not a full scan), so charts saved through other
+    workers become searchable; charts deleted elsewhere leave on restart.
+    A failed startup load is retried until it succeeds.
+    """
+    cursor: Optional[str] = None
+    while True:
+        started = datetime.now() - COMPATIBILITY_INDEX_CURSOR_OVERLAP
+        try:
+            await asyncio.to_thread(rebuild_compatibility_index, cursor)
+            cursor = started.isoformat()
+        except Exception:
+            logger.exception("Compatibility index load failed")
+        if cursor is not None and interval <= 0:
+            return
+        await asyncio.sleep(
+            interval if cursor is not None else COMPATIBILITY_INDEX_RETRY_SECONDS  # noqa: E501
+        )
+
+
 # ----- Endpoints -----
 
 @router.post("/save", response_model=Dict[str, Any])
@@ -303,10 +362,19 @@ async def save_user_chart(
             chart_type="natal",
             birth_data=birth_data,
             chart_data=chart_data,
+            discoverable=request.discoverable,
         )
 
         logger.info(f"Chart saved successfully for user {user_id}: {saved_chart['id']}")
 
+        if request.discoverable:
+            try:
+                compatibility_index.upsert_chart(
+                    user_id, chart_data, saved_chart["id"]
+                )
+            except Exception as index_err:  # pragma: no cover - defensive
+                logger.warning(f"Compatibility index update failed user={user_id} err={index_err}")
+
         return SaveChartResponse(
             id=saved_chart["id"],
             message="Chart saved successfully",
@@ -343,6 +411,7 @@ async def delete_user_chart(
     user_id = user.get("uid", "unknown")
     try:
         delete_chart_by_id(user_id=user_id, chart_id=chart_id)
+        compatibility_index.remove_chart(user_id, chart_id)
         return {"message": f"Chart {chart_id} deleted successfully"}
     except Exception as e:
         logger.error(f"Error deleting chart {chart_id} for user {user_id}: {str(e)}")
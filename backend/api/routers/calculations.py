@@ -6,6 +6,7 @@ Extracted from main.py for improved maintainability.
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -16,6 +17,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Protocol,
@@ -23,6 +25,7 @@ from typing import (
 )
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import (
     BaseModel,
     Field,
@@ -35,7 +38,22 @@ from astro.calculations.chart import (
     calculate_chart,
     calculate_multi_system_chart,
 )
+from astro.calculations.chart_batch import (
+    calculate_charts_batch,
+    iter_charts_batch,
+)
+from astro.calculations.house_systems import (
+    HOUSE_SYSTEMS,
+    calculate_house_systems,
+    normalize_house_systems,
+)
 from astro.calculations.human_design import calculate_human_design
+from api.utils.house_formatting import (
+    house_systems_as_dict,
+    houses_as_dict,
+    parse_house_systems,
+)
+from utils.orb_profiles import get_orb_profile
 
 # Import vectorized function if available at runtime; provide type-only import for static analysis
 try:  # Runtime optional import
@@ -112,7 +130,9 @@ class ChartResponse(BaseModel):
     planets: Dict[str, Any]
     houses: Dict[str, Any]
     aspects: List[Any]
+    aspect_patterns: Optional[Dict[str, Any]] = None
     angles: Optional[Dict[str, Any]] = None
+    house_systems: Optional[Dict[str, Any]] = None
     systems: Optional[Dict[str, Any]] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
@@ -126,11 +146,20 @@ async def calculate_chart_endpoint(
     request: Request,
     background_tasks: BackgroundTasks,
     house_system: str = Query("P", enum=["P", "E"]),
+    orb_profile: str = Query(
+        "natal", description="Orb profile used for aspects"
+    ),
+    house_systems: Optional[str] = Query(
+        None,
+        description="Comma-separated house systems to include alongside the chart, or 'all'",  # noqa: E501
+    ),
     rate_limiter_func: Optional[Callable[[Request], Awaitable[None]]] = None,
 ):
     """Calculate astrological chart with enhanced validation and caching."""
     if rate_limiter_func:
         await rate_limiter_func(request)
+    _require_orb_profile(orb_profile)
+    extra_systems = parse_house_systems(house_systems)
 
     # Debug: Log incoming request data
     logger.info(
@@ -148,18 +177,13 @@ async def calculate_chart_endpoint(
             lon=data.lon,
             city=data.city,
             timezone=data.timezone or "UTC",
+            house_system=house_system,
+            orb_profile=orb_profile,
+            house_systems=extra_systems,
         )
 
         # Convert houses list to dictionary format if needed
-        houses_data: Any = chart.get("houses", {})
-        if isinstance(houses_data, list):
-            # Convert list of houses to dictionary format
-            houses_dict: Dict[str, Any] = {}
-            houses_list = cast(List[Dict[str, Any]], houses_data)
-            for house in houses_list:
-                if "house" in house:
-                    houses_dict[f"house_{house['house']}"] = house
-            houses_data = houses_dict
+        houses_data: Any = houses_as_dict(chart.get("houses", {}))
 
         # Provide multi-system expansion in background if desired
         background_tasks.add_task(
@@ -170,7 +194,9 @@ async def calculate_chart_endpoint(
             planets=chart.get("planets", {}),
             houses=houses_data,
             aspects=chart.get("aspects", []),
+            aspect_patterns=chart.get("aspect_patterns"),
             angles=chart.get("angles"),
+            house_systems=house_systems_as_dict(chart.get("house_systems")),
             systems=chart.get("systems") if "systems" in chart else None,
             latitude=chart.get(
                 "latitude"
@@ -264,6 +290,164 @@ async def calculate_multi_system_chart_endpoint(
         )
 
 
+class BatchChartRequest(BaseModel):
+    """Request model for bulk chart calculation"""
+
+    charts: List[BirthData] = Field(..., min_length=1, max_length=5000)
+
+
+def _require_orb_profile(name: str) -> None:
+    """Reject unknown orb profile names with a 400."""
+    try:
+        get_orb_profile(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _batch_item(index: int, chart: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one batch result like ChartResponse plus index/error."""
+    if "error" in chart:
+        return {"index": index, "chart": None, "error": chart["error"]}
+    response = ChartResponse(
+        planets=chart.get("planets", {}),
+        houses=houses_as_dict(chart.get("houses", {})),
+        aspects=chart.get("aspects", []),
+        aspect_patterns=chart.get("aspect_patterns"),
+        angles=chart.get("angles"),
+        latitude=chart.get("latitude"),
+        longitude=chart.get("longitude"),
+        timezone=chart.get("timezone"),
+        julian_day=chart.get("julian_day"),
+    )
+    return {"index": index, "chart": response.model_dump(), "error": None}
+
+
+@router.post("/charts/batch")
+async def calculate_charts_batch_endpoint(
+    data: BatchChartRequest,
+    request: Request,
+    house_system: str = Query("P", enum=["P", "E"]),
+    page: int = Query(1, ge=1, description="1-based page of results"),
+    page_size: int = Query(100, ge=1, le=500),
+    stream: bool = Query(
+        False, description="Stream all results as NDJSON, one page at a time"
+    ),
+    orb_profile: str = Query(
+        "natal", description="Orb profile used for aspects"
+    ),
+    rate_limiter_func: Optional[Callable[[Request], Awaitable[None]]] = None,
+) -> Any:
+    """Calculate charts for many birth records in one request.
+
+    Locations are geocoded once per city, birth times are converted to
+    Julian Days in one vectorized pass and planetary positions are fetched
+    in batch. Results are returned one page at a time, or streamed as
+    NDJSON (one result per line) when ``stream=true``.
+    """
+    if rate_limiter_func:
+        await rate_limiter_func(request)
+    _require_orb_profile(orb_profile)
+
+    records = [birth.model_dump() for birth in data.charts]
+    total = len(records)
+    logger.info(
+        f"Batch chart calculation: records={total}, stream={stream}, page={page}, page_size={page_size}"  # noqa: E501
+    )
+
+    if stream:
+
+        def ndjson_lines() -> Iterator[bytes]:
+            index = 0
+            for chunk in iter_charts_batch(
+                records, house_system, page_size, orb_profile
+            ):
+                for chart in chunk:
+                    yield (json.dumps(_batch_item(index, chart)) + "\n").encode()  # noqa: E501
+                    index += 1
+
+        return StreamingResponse(
+            ndjson_lines(), media_type="application/x-ndjson"
+        )
+
+    start = (page - 1) * page_size
+    page_records = records[start : start + page_size]  # noqa: E203
+    try:
+        charts = calculate_charts_batch(
+            page_records,
+            house_system=house_system,
+            chunk_size=page_size,
+            orb_profile=orb_profile,
+        )
+    except Exception as e:
+        logger.error(f"Batch chart calculation error: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch chart calculation failed: {str(e)}",
+        )
+
+    total_pages = (total + page_size - 1) // page_size
+    return {
+        "results": [
+            _batch_item(start + i, chart) for i, chart in enumerate(charts)
+        ],
+        "page": page,
+        "page_size": page_size,
+        "total": total,
+        "total_pages": total_pages,
+        "has_more": page < total_pages,
+    }
+
+
+class HouseSystemsRequest(BaseModel):
+    """Request model for house cusps in several systems"""
+
+    julian_day: float
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    systems: Optional[List[str]] = Field(
+        None, description="House system names or codes; all if omitted"
+    )
+
+
+@router.post("/houses")
+async def calculate_house_systems_endpoint(
+    data: HouseSystemsRequest,
+    request: Request,
+    rate_limiter_func: Optional[Callable[[Request], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """House cusps and angles for any subset of house systems.
+
+    Uses the ``julian_day``/``latitude``/``longitude`` returned by
+    ``/chart`` so clients can switch house systems without recalculating
+    the chart; results are cached per time and place.
+    """
+    if rate_limiter_func:
+        await rate_limiter_func(request)
+
+    try:
+        names = normalize_house_systems(data.systems or list(HOUSE_SYSTEMS))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        systems = calculate_house_systems(
+            data.julian_day, data.latitude, data.longitude, names
+        )
+    except ValueError as e:
+        logger.error(f"House systems calculation error: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"House systems calculation failed: {str(e)}",
+        )
+
+    return {
+        "julian_day": data.julian_day,
+        "latitude": data.latitude,
+        "longitude": data.longitude,
+        "house_systems": house_systems_as_dict(systems),
+    }
+
+
 @router.post("/human-design")
 async def calculate_human_design_endpoint(
     data: BirthData,
@@ -470,11 +654,22 @@ class CompositeChartRequest(BaseModel):
     method: str = Field(
         "midpoint", description="Composite method: 'midpoint' or 'davison'"
     )
+    groups: Optional[List[List[int]]] = Field(
+        None,
+        description="Extra participant subsets (indexes into charts) to composite in the same vectorized call",
+    )
 
     @model_validator(mode="after")
     def check_charts_length(self) -> "CompositeChartRequest":
         if not (2 <= len(self.charts) <= 10):
             raise ValueError("`charts` must contain between 2 and 10 items")
+        for group in self.groups or []:
+            if len(set(group)) != len(group) or len(group) < 2:
+                raise ValueError(
+                    "Each group needs at least 2 distinct chart indexes"
+                )
+            if not all(0 <= i < len(self.charts) for i in group):
+                raise ValueError("Group indexes must refer to `charts`")
         return self
 
 
@@ -546,19 +741,28 @@ async def calculate_composite_chart(
                 create_vectorized_composite_calculator,
             )(optimization_level)
 
-            # Calculate composite chart
-            composite_result = calculator.calculate_composite_chart(
-                vectorized_charts, method=request.method
-            )
+            # Calculate the composite of everyone, then the extra groups
+            chart_groups = [vectorized_charts] + [
+                [vectorized_charts[i] for i in group]
+                for group in request.groups or []
+            ]
+            if request.method == "davison":
+                # One batched ephemeris fetch for every Davison chart
+                composites = calculator.calculate_davison_composites(
+                    chart_groups
+                )
+            else:
+                composites = [
+                    calculator.calculate_composite_chart(
+                        charts, method=request.method
+                    )
+                    for charts in chart_groups
+                ]
+            composite_result = composites[0]
 
             # Convert to API response format
             response_data: Dict[str, Any] = {
-                "composite_chart": {
-                    "planets": composite_result.composite_planets,
-                    "houses": composite_result.composite_houses,
-                    "aspects": composite_result.composite_aspects,
-                    "angles": composite_result.composite_angles,
-                },
+                "composite_chart": _composite_chart_payload(composite_result),
                 "relationship_analysis": {
                     "metrics": composite_result.relationship_metrics,
                     "method": request.method,
@@ -572,6 +776,15 @@ async def calculate_composite_chart(
                     "phase": "2.0",
                 },
             }
+            if request.groups:
+                response_data["group_composites"] = [
+                    {
+                        "participants": group,
+                        "composite_chart": _composite_chart_payload(result),
+                        "metrics": result.relationship_metrics,
+                    }
+                    for group, result in zip(request.groups, composites[1:])
+                ]
 
         else:
             # Traditional composite calculation
@@ -626,76 +839,61 @@ async def calculate_composite_chart(
         )
 
 
+def _composite_chart_payload(result: TypingAny) -> Dict[str, Any]:
+    """API layout of a vectorized CompositeChartResult"""
+    return {
+        "planets": result.composite_planets,
+        "houses": result.composite_houses,
+        "aspects": result.composite_aspects,
+        "angles": result.composite_angles,
+    }
+
+
 def _convert_to_vectorized_chart(
     chart_data: Dict[str, Any], chart_id: str, name: str
 ) -> TypingAny:
-    """Convert traditional chart data to vectorized format"""
+    """Convert ``calculate_chart`` output to vectorized format"""
     from datetime import datetime
 
     import numpy as np
 
     try:
-        # Extract planet positions
+        planets = chart_data.get("planets", {})
         planets_array = np.array(
             [
-                chart_data.get("planets", {})
-                .get("Sun", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Moon", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Mercury", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Venus", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Mars", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Jupiter", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Saturn", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Uranus", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Neptune", {})
-                .get("longitude", 0),
-                chart_data.get("planets", {})
-                .get("Pluto", {})
-                .get("longitude", 0),
+                planets.get(planet, {}).get("position", 0)
+                for planet in (
+                    "sun",
+                    "moon",
+                    "mercury",
+                    "venus",
+                    "mars",
+                    "jupiter",
+                    "saturn",
+                    "uranus",
+                    "neptune",
+                    "pluto",
+                )
             ]
         )
 
         # Extract house cusps
+        cusps = {
+            house["house"]: house["cusp"]
+            for house in chart_data.get("houses", [])
+        }
         houses_array = np.array(
-            [
-                chart_data.get("houses", {})
-                .get(f"House_{i}", {})
-                .get("cusp", i * 30)
-                for i in range(1, 13)
-            ]
+            [cusps.get(i, (i - 1) * 30) for i in range(1, 13)]
         )
 
-        # Extract angles
+        # Extract angles (ASC, MC, DSC, IC)
+        angles = chart_data.get("angles", {})
         angles_array = np.array(
             [
-                chart_data.get("angles", {})
-                .get("Ascendant", {})
-                .get("longitude", 0),
-                chart_data.get("angles", {})
-                .get("Midheaven", {})
-                .get("longitude", 90),
-                chart_data.get("angles", {})
-                .get("Descendant", {})
-                .get("longitude", 180),
-                chart_data.get("angles", {})
-                .get("IC", {})
-                .get("longitude", 270),
+                angles.get("ascendant", 0),
+                angles.get("mc", 90),
+                angles.get("descendant", 180),
+                angles.get("ic", 270),
             ]
         )
 
@@ -711,6 +909,9 @@ def _convert_to_vectorized_chart(
             chart_id=chart_id,
             name=name,
             birth_datetime=datetime.now(),  # Simplified - would use actual birth time
+            julian_day=chart_data.get("julian_day"),
+            latitude=chart_data.get("latitude"),
+            longitude=chart_data.get("longitude"),
         )
 
     except Exception as e:
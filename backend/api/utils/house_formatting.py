@@ -0,0 +1,63 @@
+"""
+House system request parsing and response formatting.
+
+Shared by the chart endpoints in ``main`` and ``api.routers.calculations``
+so both accept the same ``house_systems`` values and return houses in the
+same ``house_N`` layout.
+"""
+
+from typing import Any, Dict, List, Optional, cast
+
+from fastapi import HTTPException
+
+from astro.calculations.house_systems import (
+    HOUSE_SYSTEMS,
+    normalize_house_systems,
+)
+
+
+def parse_house_systems(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated house system list or "all"; 400 on unknown names."""  # noqa: E501
+    if not value:
+        return None
+    if value.strip().lower() == "all":
+        return list(HOUSE_SYSTEMS)
+    try:
+        return normalize_house_systems(
+            [name for name in value.split(",") if name.strip()]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def houses_as_dict(houses_data: Any) -> Any:
+    """Convert a houses list to the ``house_N`` dictionary format."""
+    if not isinstance(houses_data, list):
+        return houses_data
+    houses_dict: Dict[str, Any] = {}
+    for house in cast(List[Dict[str, Any]], houses_data):
+        if "house" in house:
+            houses_dict[f"house_{house['house']}"] = house
+    return houses_dict
+
+
+def house_systems_as_dict(
+    systems: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """Per-system houses in the ``house_N`` format used by ChartResponse.
+
+    Systems that failed for the chart's place keep their ``error`` entry.
+    """
+    if systems is None:
+        return None
+    return {
+        name: (
+            result
+            if "error" in result
+            else {
+                "houses": houses_as_dict(result["houses"]),
+                "angles": result["angles"],
+            }
+        )
+        for name, result in systems.items()
+    }
@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List
 
+from .aspect_patterns import get_aspect_patterns
+
 INTERPRETATION_SCHEMA_VERSION = "1.0.0"
 
 logger = logging.getLogger(__name__)
@@ -828,6 +830,12 @@ def analyze_growth_challenges(chart_data: Dict[str, Any]) -> Dict[str, Any]:
         # Sort by exactness
         challenging_aspects.sort(key=lambda x: x.get("orb", 10))
 
+        tension_patterns = [
+            pattern
+            for pattern in get_aspect_patterns(chart_data)["patterns"]
+            if pattern["type"] in ("t_square", "grand_cross")
+        ]
+
         growth_analysis = {
             "saturn_lessons": {
                 "saturn_sign": saturn_info["sign"],
@@ -847,6 +855,7 @@ def analyze_growth_challenges(chart_data: Dict[str, Any]) -> Dict[str, Any]:
                 "resolution_path": get_resolution_strategies(
                     challenging_aspects
                 ),
+                "tension_patterns": tension_patterns,
             },
             "empowerment_potential": {
                 "hidden_strengths": identify_hidden_strengths(chart_data),
@@ -938,9 +947,9 @@ def analyze_integration_themes(chart_data: Dict[str, Any]) -> Dict[str, Any]:
         # Quality balance
         quality_count = count_qualities(planets)
 
-        # Most aspected planets
-        aspects = chart_data.get("aspects", [])
-        planet_aspect_count = count_planet_aspects(aspects)
+        # Most aspected planets and configurations, computed with the chart
+        aspect_patterns = get_aspect_patterns(chart_data)
+        planet_aspect_count = aspect_patterns["planet_aspect_counts"]
 
         integration_analysis = {
             "elemental_balance": {
@@ -974,6 +983,7 @@ def analyze_integration_themes(chart_data: Dict[str, Any]) -> Dict[str, Any]:
                     planet_aspect_count
                 ),
             },
+            "aspect_configurations": aspect_patterns["patterns"],
             "overall_theme": synthesize_integration_theme(
                 element_count, quality_count, planet_aspect_count
             ),
@@ -1089,22 +1099,6 @@ def count_qualities(planets: Dict[str, Any]) -> Dict[str, int]:
     return quality_count
 
 
-def count_planet_aspects(aspects: List[Dict[str, Any]]) -> Dict[str, int]:
-    """Count aspects for each planet"""
-    aspect_count = {}
-
-    for aspect in aspects:
-        point1 = aspect.get("point1")
-        point2 = aspect.get("point2")
-
-        if point1:
-            aspect_count[point1] = aspect_count.get(point1, 0) + 1
-        if point2:
-            aspect_count[point2] = aspect_count.get(point2, 0) + 1
-
-    return aspect_count
-
-
 def find_planets_in_house(
     planets: Dict[str, Any], house_number: int
 ) -> List[str]:
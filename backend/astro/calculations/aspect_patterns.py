@@ -0,0 +1,221 @@
+# backend/astro/calculations/aspect_patterns.py
+"""
+Aspect pattern detection.
+
+Builds one adjacency bitmask per body and aspect type from a chart's aspect
+list (bit ``j`` of ``masks[type][i]`` is set when bodies ``i`` and ``j``
+form that aspect). Configurations are then found with bitwise
+intersections instead of iterating over body combinations:
+
+- grand trine: a triangle in the trine graph
+- T-square: an opposition whose ends share a square partner (the apex)
+- grand cross: two T-squares on the same opposition whose apexes oppose
+- yod: a sextile whose ends share a quincunx partner (the apex)
+- kite: a grand trine plus a body opposing one vertex and sextile the
+  other two
+
+The summary is attached to chart output as ``aspect_patterns`` so
+interpretation and PDF export can reuse it.
+"""
+
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
+
+logger = logging.getLogger(__name__)
+
+PATTERN_ASPECTS: Tuple[str, ...] = (
+    "trine",
+    "square",
+    "opposition",
+    "sextile",
+    "quincunx",
+)
+
+
+class AspectPattern(TypedDict):
+    type: str
+    planets: List[str]
+    apex: Optional[str]
+    max_orb: float
+
+
+class AspectPatternSummary(TypedDict):
+    patterns: List[AspectPattern]
+    planet_aspect_counts: Dict[str, int]
+
+
+def _above(mask: int, i: int) -> int:
+    """``mask`` restricted to bodies with an index greater than ``i``."""
+    return mask >> (i + 1) << (i + 1)
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of set bits, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _AspectGraph:
+    """Per-aspect-type adjacency bitmasks over the bodies of a chart."""
+
+    def __init__(self, aspects: Sequence[Mapping[str, Any]]):
+        self.bodies: List[str] = []
+        index: Dict[str, int] = {}
+        self.masks: Dict[str, List[int]] = {a: [] for a in PATTERN_ASPECTS}
+        self.degree: List[int] = []
+        self.orbs: Dict[Tuple[int, int], float] = {}
+
+        for aspect in aspects:
+            points = (aspect.get("point1"), aspect.get("point2"))
+            if not all(points):
+                continue
+            ends: List[int] = []
+            for point in points:
+                if point not in index:
+                    index[point] = len(self.bodies)
+                    self.bodies.append(point)
+                    self.degree.append(0)
+                    for masks in self.masks.values():
+                        masks.append(0)
+                ends.append(index[point])
+            i, j = ends
+            if i == j:
+                continue
+            self.degree[i] += 1
+            self.degree[j] += 1
+
+            name = str(aspect.get("aspect", "")).lower()
+            if name in self.masks:
+                self.masks[name][i] |= 1 << j
+                self.masks[name][j] |= 1 << i
+                self.orbs[(min(i, j), max(i, j))] = float(
+                    aspect.get("orb", 0.0)
+                )
+
+    def orb(self, i: int, j: int) -> float:
+        return self.orbs.get((min(i, j), max(i, j)), 0.0)
+
+    def pattern(
+        self,
+        kind: str,
+        members: Sequence[int],
+        edges: Sequence[Tuple[int, int]],
+        apex: Optional[int] = None,
+    ) -> AspectPattern:
+        return {
+            "type": kind,
+            "planets": [self.bodies[m] for m in members],
+            "apex": self.bodies[apex] if apex is not None else None,
+            "max_orb": max(self.orb(i, j) for i, j in edges),
+        }
+
+
+def _grand_trines(graph: _AspectGraph) -> List[Tuple[int, int, int]]:
+    trine = graph.masks["trine"]
+    triangles: List[Tuple[int, int, int]] = []
+    for i in range(len(graph.bodies)):
+        for j in _bits(_above(trine[i], i)):
+            for k in _bits(_above(trine[i] & trine[j], j)):
+                triangles.append((i, j, k))
+    return triangles
+
+
+def detect_aspect_patterns(
+    aspects: Sequence[Mapping[str, Any]],
+) -> List[AspectPattern]:
+    """Find major aspect configurations in a chart's aspect list.
+
+    ``aspects`` uses the ``calculate_aspects`` layout (``point1``,
+    ``point2``, ``aspect``, ``orb``); aspect names are case-insensitive.
+    """
+    return _detect(_AspectGraph(aspects))
+
+
+def _detect(graph: _AspectGraph) -> List[AspectPattern]:
+    trine = graph.masks["trine"]
+    square = graph.masks["square"]
+    opposition = graph.masks["opposition"]
+    sextile = graph.masks["sextile"]
+    quincunx = graph.masks["quincunx"]
+    patterns: List[AspectPattern] = []
+
+    triangles = _grand_trines(graph)
+    for i, j, k in triangles:
+        patterns.append(
+            graph.pattern("grand_trine", (i, j, k), ((i, j), (j, k), (i, k)))
+        )
+
+    for a in range(len(graph.bodies)):
+        for b in _bits(_above(opposition[a], a)):
+            apexes = square[a] & square[b]
+            for c in _bits(apexes):
+                patterns.append(
+                    graph.pattern(
+                        "t_square", (a, b, c), ((a, b), (a, c), (b, c)), c
+                    )
+                )
+            # Grand cross: count once, from its lowest-indexed body
+            for c in _bits(_above(apexes, a)):
+                for d in _bits(_above(opposition[c] & apexes, c)):
+                    patterns.append(
+                        graph.pattern(
+                            "grand_cross",
+                            (a, c, b, d),
+                            ((a, b), (c, d), (a, c), (a, d), (b, c), (b, d)),
+                        )
+                    )
+
+        for b in _bits(_above(sextile[a], a)):
+            for c in _bits(quincunx[a] & quincunx[b]):
+                patterns.append(
+                    graph.pattern(
+                        "yod", (a, b, c), ((a, b), (a, c), (b, c)), c
+                    )
+                )
+
+    for i, j, k in triangles:
+        for v, x, y in ((i, j, k), (j, i, k), (k, i, j)):
+            for d in _bits(opposition[v] & sextile[x] & sextile[y]):
+                edges = ((i, j), (j, k), (i, k), (v, d), (x, d), (y, d))
+                patterns.append(graph.pattern("kite", (i, j, k, d), edges, d))
+
+    return patterns
+
+
+def analyze_aspect_patterns(
+    aspects: Sequence[Mapping[str, Any]],
+) -> AspectPatternSummary:
+    """Aspect configurations plus the number of aspects per body."""
+    try:
+        graph = _AspectGraph(aspects)
+        summary: AspectPatternSummary = {
+            "patterns": _detect(graph),
+            "planet_aspect_counts": dict(zip(graph.bodies, graph.degree)),
+        }
+        logger.debug(
+            f"Aspect patterns found: {len(summary['patterns'])} across {len(graph.bodies)} bodies"  # noqa: E501
+        )
+        return summary
+    except Exception as e:
+        logger.error(f"Error in aspect pattern detection: {str(e)}")
+        raise ValueError(f"Error in aspect pattern detection: {str(e)}")
+
+
+def get_aspect_patterns(chart_data: Mapping[str, Any]) -> AspectPatternSummary:
+    """Patterns attached to a chart, computed from its aspects if absent."""
+    attached = chart_data.get("aspect_patterns")
+    if attached:
+        return attached  # type: ignore[return-value]
+    return analyze_aspect_patterns(chart_data.get("aspects") or [])
@@ -1,5 +1,15 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+import numpy as np
+
+from utils.jit_kernels import pair_aspect_orbs
+from utils.orb_profiles import (
+    applying_flags,
+    compile_orb_profile,
+    get_orb_profile,
+    is_applying,
+)
 
 
 # TypedDict for aspect data
@@ -14,10 +24,36 @@ class AspectData(TypedDict, total=False):
     point2_sign: str
     point1_house: int
     point2_house: int
+    applying: bool
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ORB_PROFILE = "natal"
+
+# (angle, name, registry key) for major and minor aspects
+_ASPECT_DEFINITIONS: List[Tuple[int, str, str]] = [
+    (0, "Conjunction", "conjunction"),
+    (30, "Semisextile", "semi_sextile"),
+    (45, "Semisquare", "semi_square"),
+    (60, "Sextile", "sextile"),
+    (72, "Quintile", "quintile"),
+    (90, "Square", "square"),
+    (120, "Trine", "trine"),
+    (135, "Sesquiquadrate", "sesquiquadrate"),
+    (150, "Quincunx", "quincunx"),
+    (180, "Opposition", "opposition"),
+]
+
+_ASPECT_KEYS: Tuple[str, ...] = tuple(a[2] for a in _ASPECT_DEFINITIONS)
+_ASPECT_NAMES: List[str] = [a[1] for a in _ASPECT_DEFINITIONS]
+
+# (angle, name, orb) under the default profile
+ASPECT_TYPES: List[Tuple[int, str, float]] = [
+    (angle, name, get_orb_profile(DEFAULT_ORB_PROFILE).orb(key))
+    for angle, name, key in _ASPECT_DEFINITIONS
+]
+
 
 def get_zodiac_sign(degree: float) -> str:
     signs = [
@@ -55,23 +91,12 @@ def get_house_for_planet(position: float, houses: List[Dict[str, Any]]) -> int:
 def calculate_aspects(
     planets: Dict[str, Dict[str, Any]],
     houses: Optional[List[Dict[str, Any]]] = None,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
 ) -> List[AspectData]:
     logger.debug(f"Calculating aspects for planets: {planets}")
     try:
+        profile = get_orb_profile(orb_profile)
         aspects: List[AspectData] = []
-        # Add major and minor aspects
-        aspect_types = [
-            (0, "Conjunction", 10.0),
-            (30, "Semisextile", 2.0),
-            (45, "Semisquare", 2.0),
-            (60, "Sextile", 6.0),
-            (72, "Quintile", 2.0),
-            (90, "Square", 8.0),
-            (120, "Trine", 8.0),
-            (135, "Sesquiquadrate", 2.0),
-            (150, "Quincunx", 2.0),
-            (180, "Opposition", 10.0),
-        ]
         planet_names = list(planets.keys())
 
         for i, planet1 in enumerate(planet_names):
@@ -80,8 +105,9 @@ def calculate_aspects(
                 pos2 = planets[planet2]["position"]
                 angle = abs((pos1 - pos2 + 180) % 360 - 180)
 
-                for aspect_angle, aspect_name, orb in aspect_types:
-                    if (
+                for aspect_angle, aspect_name, key in _ASPECT_DEFINITIONS:
+                    orb = profile.orb(key, planet1, planet2)
+                    if orb > 0 and (
                         abs(angle - aspect_angle) <= orb
                         or abs(angle - (360 - aspect_angle)) <= orb
                     ):
@@ -96,6 +122,15 @@ def calculate_aspects(
                             "point1_position": pos1,
                             "point2_position": pos2,
                         }
+                        applying = is_applying(
+                            pos1,
+                            pos2,
+                            planets[planet1].get("speed"),
+                            planets[planet2].get("speed"),
+                            aspect_angle,
+                        )
+                        if applying is not None:
+                            aspect["applying"] = applying
                         if houses:
                             aspect["point1_sign"] = get_zodiac_sign(pos1)
                             aspect["point2_sign"] = get_zodiac_sign(pos2)
@@ -107,7 +142,121 @@ def calculate_aspects(
                             )
                         aspects.append(aspect)
 
-        logger.debug(f"Aspects calculated: {aspects}")
+        logger.debug(f"Aspects calculated: {len(aspects)}")
+        return aspects
+    except Exception as e:
+        logger.error(f"Error in aspect calculation: {str(e)}", exc_info=True)
+        raise ValueError(f"Error in aspect calculation: {str(e)}")
+
+
+def get_houses_for_positions(
+    positions: Sequence[float], houses: List[Dict[str, Any]]
+) -> List[int]:
+    """Vectorized ``get_house_for_planet`` for many positions.
+
+    For cusps in cyclic ascending order (one wrap past 0°) the house of a
+    position is the one whose cusp is the greatest cusp <= position, or the
+    greatest cusp overall when the position precedes every cusp. That is a
+    single ``searchsorted`` over the sorted cusps. Degenerate cusp lists
+    (zero-width houses, several wraps) fall back to the linear scan.
+    """
+    if not houses:
+        return [1] * len(positions)
+
+    cusps = np.array([h["cusp"] for h in houses], dtype=np.float64)
+    steps = np.diff(np.append(cusps, cusps[0]))
+    if np.count_nonzero(steps < 0) != 1 or np.any(steps == 0):
+        return [get_house_for_planet(p, houses) for p in positions]
+
+    order = np.argsort(cusps)
+    sorted_cusps = cusps[order]
+    idx = np.searchsorted(
+        sorted_cusps, np.asarray(positions, dtype=np.float64), side="right"
+    )
+    # idx == 0: position precedes every cusp -> wraps to the last cusp
+    house_idx = order[(idx - 1) % len(cusps)]
+    return (house_idx + 1).tolist()
+
+
+def calculate_aspects_fast(
+    planets: Dict[str, Dict[str, Any]],
+    houses: Optional[List[Dict[str, Any]]] = None,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+) -> List[AspectData]:
+    """NumPy equivalent of ``calculate_aspects``.
+
+    Builds the full pairwise separation matrix once, matches every aspect
+    type against the compiled orb profile in one broadcast and only
+    materialises dicts for the aspects found. Output (content and order)
+    matches ``calculate_aspects``.
+    """
+    logger.debug(f"Calculating aspects (vectorized) for {len(planets)} bodies")
+    try:
+        compiled = compile_orb_profile(orb_profile, _ASPECT_KEYS)
+        names = list(planets.keys())
+        if len(names) < 2:
+            return []
+        raw_positions = [planets[name]["position"] for name in names]
+        pos = np.array(raw_positions, dtype=np.float64)
+
+        i_idx, j_idx = np.triu_indices(len(names), k=1)
+
+        # (pairs, aspect types) orb grid, checked against both arcs
+        max_orbs = compiled.orbs_for_pairs(names, i_idx, j_idx)
+        pair_orbs, matches = pair_aspect_orbs(
+            pos, compiled.angles, max_orbs
+        )
+        pair_hits, type_hits = np.nonzero(matches)
+        orbs = pair_orbs[pair_hits, type_hits]
+
+        # Applying flags need both speeds; unknown speeds are NaN
+        speeds = np.array(
+            [planets[name].get("speed", np.nan) for name in names],
+            dtype=np.float64,
+        )
+        hit_i = i_idx[pair_hits]
+        hit_j = j_idx[pair_hits]
+        applying, known = applying_flags(
+            pos[hit_i],
+            pos[hit_j],
+            speeds[hit_i],
+            speeds[hit_j],
+            compiled.angles[type_hits],
+        )
+
+        signs: List[str] = []
+        house_numbers: List[int] = []
+        if houses:
+            signs = [get_zodiac_sign(p) for p in raw_positions]
+            house_numbers = get_houses_for_positions(raw_positions, houses)
+
+        aspects: List[AspectData] = []
+        for i, j, type_idx, orb, is_app, has_speed in zip(
+            hit_i.tolist(),
+            hit_j.tolist(),
+            type_hits.tolist(),
+            orbs.tolist(),
+            applying.tolist(),
+            known.tolist(),
+        ):
+            aspect: AspectData = {
+                "point1": names[i],
+                "point2": names[j],
+                "aspect": _ASPECT_NAMES[type_idx],
+                "orb": orb,
+                "point1_position": raw_positions[i],
+                "point2_position": raw_positions[j],
+            }
+            if has_speed:
+                aspect["applying"] = is_app
+            if houses:
+                aspect["point1_sign"] = signs[i]
+                aspect["point2_sign"] = signs[j]
+                aspect["point1_house"] = house_numbers[i]
+                aspect["point2_house"] = house_numbers[j]
+            aspects.append(aspect)
+
+        logger.debug(f"Aspects calculated: {len(aspects)}")
         return aspects
     except Exception as e:
         logger.error(f"Error in aspect calculation: {str(e)}", exc_info=True)
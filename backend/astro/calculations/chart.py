@@ -2,7 +2,7 @@
 import logging
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import pytz
 import swisseph as swe  # type: ignore
@@ -10,9 +10,10 @@ from geopy.exc import GeocoderTimedOut  # type: ignore
 from geopy.geocoders import Nominatim  # type: ignore
 from timezonefinder import TimezoneFinder  # type: ignore
 
-from .aspects import calculate_aspects
+from .aspect_patterns import analyze_aspect_patterns
+from .aspects import DEFAULT_ORB_PROFILE, calculate_aspects_fast
 from .ephemeris import get_planetary_positions, init_ephemeris
-from .house_systems import calculate_houses
+from .house_systems import calculate_house_systems, calculate_houses
 from .mayan import calculate_mayan_astrology
 from .uranian import calculate_uranian_astrology
 
@@ -132,6 +133,22 @@ def get_location(city: str) -> Dict[str, Any]:
         raise ValueError(f"Error resolving location: {str(e)}")
 
 
+def format_chart_planets(
+    planets: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Chart output entries per planet; speed is included when known."""
+    formatted: Dict[str, Dict[str, Any]] = {}
+    for name, planet in planets.items():
+        entry = {
+            "position": planet["position"],
+            "retrograde": planet["retrograde"],
+        }
+        if planet.get("speed") is not None:
+            entry["speed"] = planet["speed"]
+        formatted[name] = entry
+    return formatted
+
+
 def calculate_chart(
     year: int,
     month: int,
@@ -143,6 +160,8 @@ def calculate_chart(
     timezone: Optional[str] = None,
     city: Optional[str] = None,
     house_system: str = "P",
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+    house_systems: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
     logger.debug(
         f"Calculating chart: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, lat={lat}, lon={lon}, timezone={timezone}, city={city}, house_system={house_system}"  # noqa: E501
@@ -178,14 +197,14 @@ def calculate_chart(
 
         planets = get_planetary_positions(julian_day) or {}  # type: ignore
         houses_data = calculate_houses(julian_day, lat, lon, house_system) or {"houses": [], "angles": {}}  # type: ignore  # noqa: E501
-        aspects = calculate_aspects(planets) or []  # type: ignore
+        aspects = calculate_aspects_fast(planets, orb_profile=orb_profile) or []  # type: ignore  # noqa: E501
 
         chart_data: Dict[str, Any] = {
             "julian_day": float(julian_day),
             "latitude": float(lat),
             "longitude": float(lon),
             "timezone": timezone,
-            "planets": {k: {"position": v["position"], "retrograde": v["retrograde"]} for k, v in planets.items()},  # type: ignore  # noqa: E501
+            "planets": format_chart_planets(planets),  # type: ignore
             "houses": houses_data["houses"],  # type: ignore
             "angles": {
                 "ascendant": float(houses_data["angles"].get("ascendant", 0)),  # type: ignore  # noqa: E501
@@ -196,7 +215,13 @@ def calculate_chart(
                 "antivertex": float((houses_data["angles"].get("vertex", 0) + 180) % 360),  # type: ignore  # noqa: E501
             },
             "aspects": aspects,  # type: ignore
+            "aspect_patterns": analyze_aspect_patterns(aspects),  # type: ignore  # noqa: E501
         }
+        if house_systems:
+            # Extra systems let clients switch houses without a new chart
+            chart_data["house_systems"] = calculate_house_systems(
+                julian_day, lat, lon, house_systems
+            )
         logger.debug(f"Chart data: {chart_data}")
         return chart_data
     except ValueError as e:
@@ -0,0 +1,312 @@
+# backend/astro/calculations/chart_batch.py
+"""
+Bulk natal chart calculation.
+
+Computes many charts in one pass instead of N independent
+``calculate_chart`` calls:
+
+- locations are geocoded once per unique city
+- local birth times are converted to Julian Days in one NumPy pass
+- planetary positions come from one batched ephemeris fetch
+- houses are computed once per unique (JD, location); aspects and aspect
+  patterns per chart
+
+Each result has the same shape as ``calculate_chart``; a record that fails
+validation or geocoding yields ``{"error": ...}`` instead of failing the
+whole batch.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+import swisseph as swe  # type: ignore
+
+from .aspect_patterns import analyze_aspect_patterns
+from .aspects import DEFAULT_ORB_PROFILE, calculate_aspects_fast
+from .chart import format_chart_planets, get_location
+from .ephemeris import get_planetary_positions_batch, init_ephemeris
+from .house_systems import HousesResult, calculate_houses
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 100
+
+Location = Tuple[float, float, str]
+
+
+def julian_days_from_local(
+    years: np.ndarray,
+    months: np.ndarray,
+    days: np.ndarray,
+    hours: np.ndarray,
+    minutes: np.ndarray,
+    utc_offsets_minutes: np.ndarray,
+) -> np.ndarray:
+    """Convert local civil times to UT Julian Days in one vectorized pass.
+
+    Uses the Gregorian calendar formula of ``swe.julday`` and applies the
+    same UTC -> UT1 correction as ``swe.utc_to_jd`` (leap seconds / delta T),
+    looked up once per distinct UTC day.
+    """
+    y = np.where(months <= 2, years - 1, years).astype(np.float64)
+    m = np.where(months <= 2, months + 12, months).astype(np.float64)
+    a = np.floor(y / 100)
+    b = 2 - a + np.floor(a / 4)
+    local_hours = hours + minutes / 60.0
+    jd_local = (
+        np.floor(365.25 * (y + 4716))
+        + np.floor(30.6001 * (m + 1))
+        + days
+        + b
+        - 1524.5
+        + local_hours / 24.0
+    )
+    jd_utc = jd_local - utc_offsets_minutes / 1440.0
+
+    day_numbers = np.floor(jd_utc + 0.5).astype(np.int64)
+    unique_days, inverse = np.unique(day_numbers, return_inverse=True)
+    corrections = np.array(
+        [_ut1_correction(int(day)) for day in unique_days], dtype=np.float64
+    )
+    return jd_utc + corrections[inverse]
+
+
+def _ut1_correction(day_number: int) -> float:
+    """Difference between ``swe.utc_to_jd`` UT1 and calendar JD for a day."""
+    year, month, day, _ = swe.revjul(day_number)  # type: ignore
+    try:
+        jd_ut1 = swe.utc_to_jd(year, month, day, 0, 0, 0, 1)[1]  # type: ignore  # noqa: E501
+    except Exception:
+        return 0.0
+    return float(jd_ut1) - float(swe.julday(year, month, day, 0.0))  # type: ignore  # noqa: E501
+
+
+def resolve_locations(
+    records: Sequence[Mapping[str, Any]],
+    location_cache: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """Resolve (lat, lon, timezone) per record, geocoding each city once.
+
+    Returns a list aligned with ``records`` holding either a
+    ``(lat, lon, timezone)`` tuple or the ``ValueError`` for that record.
+    ``location_cache`` may be shared across chunks of one batch.
+    """
+    cache: Dict[str, Any] = {} if location_cache is None else location_cache
+    resolved: List[Any] = []
+
+    for record in records:
+        lat = record.get("lat")
+        lon = record.get("lon")
+        timezone = record.get("timezone")
+        city = record.get("city")
+
+        if city and (lat is None or lon is None):
+            key = str(city).strip()
+            if key not in cache:
+                try:
+                    cache[key] = get_location(key)
+                except ValueError as e:
+                    cache[key] = e
+            loc = cache[key]
+            if isinstance(loc, ValueError):
+                resolved.append(loc)
+                continue
+            lat, lon = loc["latitude"], loc["longitude"]
+            timezone = loc["timezone"] or timezone
+
+        if lat is None or lon is None:
+            resolved.append(ValueError("Latitude and longitude are required"))
+            continue
+        resolved.append((float(lat), float(lon), timezone or "UTC"))
+
+    logger.debug(
+        f"Resolved {len(records)} locations with {len(cache)} geocoding lookups"  # noqa: E501
+    )
+    return resolved
+
+
+def _utc_offset_minutes(
+    record: Mapping[str, Any],
+    timezone: str,
+    tz_cache: Dict[str, Any],
+) -> float:
+    tz = tz_cache.get(timezone)
+    if tz is None:
+        tz = tz_cache[timezone] = pytz.timezone(timezone)
+    dt = datetime(
+        int(record["year"]),
+        int(record["month"]),
+        int(record["day"]),
+        int(record["hour"]),
+        int(record["minute"]),
+    )
+    offset = tz.localize(dt).utcoffset()
+    return offset.total_seconds() / 60.0 if offset else 0.0
+
+
+def _build_chart(
+    julian_day: float,
+    lat: float,
+    lon: float,
+    timezone: str,
+    planets: Dict[str, Any],
+    houses_data: HousesResult,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+) -> Dict[str, Any]:
+    """Assemble a chart dict with the same layout as ``calculate_chart``."""
+    angles = houses_data["angles"]
+    aspects = calculate_aspects_fast(planets, orb_profile=orb_profile) or []
+    return {
+        "julian_day": float(julian_day),
+        "latitude": float(lat),
+        "longitude": float(lon),
+        "timezone": timezone,
+        "planets": format_chart_planets(planets),
+        "houses": houses_data["houses"],
+        "angles": {
+            "ascendant": float(angles.get("ascendant", 0)),
+            "descendant": float((angles.get("ascendant", 0) + 180) % 360),
+            "mc": float(angles.get("mc", 0)),
+            "ic": float((angles.get("mc", 0) + 180) % 360),
+            "vertex": float(angles.get("vertex", 0)),
+            "antivertex": float((angles.get("vertex", 0) + 180) % 360),
+        },
+        "aspects": aspects,
+        "aspect_patterns": analyze_aspect_patterns(aspects),
+    }
+
+
+def _calculate_chunk(
+    records: Sequence[Mapping[str, Any]],
+    house_system: str,
+    location_cache: Dict[str, Any],
+    tz_cache: Dict[str, Any],
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = [{} for _ in records]
+    locations = resolve_locations(records, location_cache)
+
+    valid: List[int] = []
+    valid_locations: List[Location] = []
+    offsets: List[float] = []
+    for i, (record, location) in enumerate(zip(records, locations)):
+        if isinstance(location, ValueError):
+            results[i] = {"error": str(location)}
+            continue
+        try:
+            offsets.append(_utc_offset_minutes(record, location[2], tz_cache))
+        except pytz.exceptions.UnknownTimeZoneError:
+            results[i] = {"error": f"Invalid timezone: {location[2]}"}
+            continue
+        except (ValueError, KeyError, TypeError) as e:
+            results[i] = {"error": f"Invalid date: {str(e)}"}
+            continue
+        valid.append(i)
+        valid_locations.append(location)
+
+    if not valid:
+        return results
+
+    fields = np.array(
+        [
+            [
+                records[i]["year"],
+                records[i]["month"],
+                records[i]["day"],
+                records[i]["hour"],
+                records[i]["minute"],
+            ]
+            for i in valid
+        ],
+        dtype=np.float64,
+    )
+    julian_days = julian_days_from_local(
+        fields[:, 0],
+        fields[:, 1],
+        fields[:, 2],
+        fields[:, 3],
+        fields[:, 4],
+        np.array(offsets, dtype=np.float64),
+    ).tolist()
+
+    positions = get_planetary_positions_batch(julian_days)
+
+    houses_cache: Dict[Tuple[float, float, float], HousesResult] = {}
+    for i, jd, (lat, lon, timezone), planets in zip(
+        valid, julian_days, valid_locations, positions
+    ):
+        try:
+            key = (jd, lat, lon)
+            if key not in houses_cache:
+                houses_cache[key] = calculate_houses(
+                    jd, lat, lon, house_system
+                )
+            results[i] = _build_chart(
+                jd,
+                lat,
+                lon,
+                timezone,
+                planets or {},
+                houses_cache[key],
+                orb_profile,
+            )
+        except ValueError as e:
+            results[i] = {"error": str(e)}
+
+    return results
+
+
+def iter_charts_batch(
+    records: Sequence[Mapping[str, Any]],
+    house_system: str = "P",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield chart results chunk by chunk, in input order.
+
+    Each chunk issues one batched ephemeris fetch; geocoding results are
+    shared across chunks so a city is only looked up once per batch.
+    """
+    init_ephemeris()
+    chunk_size = max(1, chunk_size)
+    location_cache: Dict[str, Any] = {}
+    tz_cache: Dict[str, Any] = {}
+    for start in range(0, len(records), chunk_size):
+        yield _calculate_chunk(
+            records[start : start + chunk_size],  # noqa: E203
+            house_system,
+            location_cache,
+            tz_cache,
+            orb_profile,
+        )
+
+
+def calculate_charts_batch(
+    records: Sequence[Mapping[str, Any]],
+    house_system: str = "P",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+) -> List[Dict[str, Any]]:
+    """Calculate charts for many birth records.
+
+    Args:
+        records: Mappings with ``year, month, day, hour, minute`` and
+            ``lat``/``lon``/``timezone`` or ``city``
+        house_system: House system code passed to ``calculate_houses``
+        chunk_size: Records per batched ephemeris fetch
+        orb_profile: Orb profile name used for the aspects
+
+    Returns:
+        List aligned with ``records``: chart dicts shaped like
+        ``calculate_chart`` output, or ``{"error": message}``.
+    """
+    logger.debug(f"Calculating batch of {len(records)} charts")
+    results: List[Dict[str, Any]] = []
+    for chunk in iter_charts_batch(
+        records, house_system, chunk_size, orb_profile
+    ):
+        results.extend(chunk)
+    return results
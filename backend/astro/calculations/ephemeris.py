@@ -9,7 +9,7 @@ for improved performance, scalability, and modularity.
 import asyncio
 import logging
 import os
-from typing import Any, Dict, Final
+from typing import Any, Dict, Final, List, Optional, Sequence
 
 from utils.ephemeris_client import (
     EphemerisClient,
@@ -43,10 +43,17 @@ VESTA: Final[int] = 20
 class PlanetPosition(dict[str, Any]):  # type: ignore[misc]
     """Legacy planet position type for backward compatibility."""
 
-    def __init__(self, position: float, retrograde: bool):
+    def __init__(
+        self,
+        position: float,
+        retrograde: bool,
+        speed: Optional[float] = None,
+    ):
         super().__init__()  # type: ignore[misc]
         self["position"] = position
         self["retrograde"] = retrograde
+        if speed is not None:
+            self["speed"] = speed
 
     @property
     def position(self) -> float:
@@ -56,6 +63,11 @@ class PlanetPosition(dict[str, Any]):  # type: ignore[misc]
     def retrograde(self) -> bool:
         return self["retrograde"]  # type: ignore[return-value]
 
+    @property
+    def speed(self) -> Optional[float]:
+        """Longitude speed in degrees/day, if the source provided it."""
+        return self.get("speed")  # type: ignore[return-value]
+
 
 # Global variable to track if ephemeris has been initialized (kept for compatibility)  # noqa: E501
 _ephemeris_initialized = True  # Always True for remote client
@@ -160,6 +172,7 @@ def get_planetary_positions(julian_day: float) -> Dict[str, PlanetPosition]:
                     positions[planet] = PlanetPosition(
                         position=position_data.get("position", 0.0),
                         retrograde=position_data.get("retrograde", False),
+                        speed=position_data.get("speed"),
                     )
             else:
                 # Single result format (fallback)
@@ -169,6 +182,7 @@ def get_planetary_positions(julian_day: float) -> Dict[str, PlanetPosition]:
                             "longitude", planet_data.get("position", 0.0)
                         ),
                         retrograde=planet_data.get("retrograde", False),
+                        speed=planet_data.get("speed"),
                     )
 
             logger.debug(
@@ -235,13 +249,34 @@ def _should_use_test_fallback() -> bool:
     return False
 
 
+# Mean geocentric longitude speed (degrees/day) used by the test fallback
+_MEAN_DAILY_MOTION: Final[Dict[str, float]] = {
+    "sun": 0.9856,
+    "moon": 13.1764,
+    "mercury": 1.3833,
+    "venus": 1.2,
+    "mars": 0.524,
+    "jupiter": 0.0831,
+    "saturn": 0.0335,
+    "uranus": 0.0117,
+    "neptune": 0.006,
+    "pluto": 0.004,
+    "chiron": 0.0195,
+    "ceres": 0.2141,
+    "pallas": 0.2135,
+    "juno": 0.2261,
+    "vesta": 0.2716,
+}
+
+
 def _generate_deterministic_fallback(
     planets: list[str], julian_day: float
 ) -> Dict[str, PlanetPosition]:
     """Generate deterministic pseudo positions for planets for testing.
 
     Uses a simple hash of planet name and julian day to produce stable positions inside 0-360.  # noqa: E501
-    Retrograde flag alternates predictably.
+    Retrograde flag alternates predictably; speed is the body's mean daily
+    motion, negated when retrograde.
     """
     positions: Dict[str, PlanetPosition] = {}
     base = int(julian_day) % 360
@@ -249,12 +284,131 @@ def _generate_deterministic_fallback(
         # Simple deterministic formula; ensures spread across zodiac
         pos = (base + (hash(planet) % 360) + idx * 13) % 360
         retro = idx % 5 == 0  # every 5th body retrograde for variety
+        speed = _MEAN_DAILY_MOTION.get(planet, 0.05)
         positions[planet] = PlanetPosition(
-            position=float(pos), retrograde=retro
+            position=float(pos),
+            retrograde=retro,
+            speed=-speed if retro else speed,
         )
     return positions
 
 
+CHART_PLANETS: Final[List[str]] = [
+    "sun",
+    "moon",
+    "mercury",
+    "venus",
+    "mars",
+    "jupiter",
+    "saturn",
+    "uranus",
+    "neptune",
+    "pluto",
+    "chiron",
+    "ceres",
+    "pallas",
+    "juno",
+    "vesta",
+]
+
+# Matches the ephemeris server's MAX_BATCH_SIZE (calculations per request)
+EPHEMERIS_MAX_BATCH: Final[int] = int(os.getenv("EPHEMERIS_MAX_BATCH", "50"))
+
+
+def get_planetary_positions_batch(
+    julian_days: Sequence[float],
+) -> List[Dict[str, PlanetPosition]]:
+    """
+    Calculate planetary positions for many Julian Days in one batched fetch.
+
+    Duplicate Julian Days are requested once. All (julian_day, planet)
+    calculations are sent to the server's /calculate/batch endpoint over a
+    single keep-alive session, split only where the server's batch size
+    limit requires it.
+
+    Args:
+        julian_days: Julian Day Numbers, one per chart
+
+    Returns:
+        List aligned with ``julian_days``; each entry has the same shape as
+        ``get_planetary_positions`` (empty dict if the server failed).
+    """
+    unique_jds = list(dict.fromkeys(float(jd) for jd in julian_days))
+    logger.debug(
+        f"Batch planetary positions for {len(julian_days)} charts "
+        f"({len(unique_jds)} unique JDs, remote)"
+    )
+    by_jd: Dict[float, Dict[str, PlanetPosition]] = {
+        jd: {} for jd in unique_jds
+    }
+
+    try:
+        import requests
+
+        ephemeris_url = os.getenv(
+            "EPHEMERIS_SERVER_URL", "http://localhost:8001"
+        )
+        api_key = os.getenv("API_KEY", "")
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        calculations: List[Dict[str, Any]] = [
+            {"julian_day": jd, "planet": planet}
+            for jd in unique_jds
+            for planet in CHART_PLANETS
+        ]
+
+        with requests.Session() as session:
+            for start in range(0, len(calculations), EPHEMERIS_MAX_BATCH):
+                response = session.post(
+                    f"{ephemeris_url}/calculate/batch",
+                    json={
+                        "calculations": calculations[
+                            start : start + EPHEMERIS_MAX_BATCH  # noqa: E203
+                        ]
+                    },
+                    headers=headers,
+                    timeout=30,
+                )
+                if response.status_code != 200:
+                    raise ValueError(
+                        f"Ephemeris server returned status {response.status_code}: {response.text}"  # noqa: E501
+                    )
+                for result in response.json().get("results", []):
+                    jd = float(result.get("julian_day", 0.0))
+                    position_data = result.get("position", {})
+                    if jd in by_jd:
+                        by_jd[jd][result.get("planet", "unknown")] = (
+                            PlanetPosition(
+                                position=position_data.get("position", 0.0),
+                                retrograde=position_data.get(
+                                    "retrograde", False
+                                ),
+                                speed=position_data.get("speed"),
+                            )
+                        )
+
+    except Exception as e:
+        logger.error(
+            f"Error in remote batch planetary positions: {str(e)}",
+            exc_info=True,
+        )
+        fallback = _should_use_test_fallback()
+        if fallback:
+            logger.info("Using deterministic ephemeris fallback (batch)")
+        by_jd = {
+            jd: (
+                _generate_deterministic_fallback(CHART_PLANETS, jd)
+                if fallback
+                else {}
+            )
+            for jd in unique_jds
+        }
+
+    return [by_jd[float(jd)] for jd in julian_days]
+
+
 async def get_planetary_positions_async(
     julian_day: float,
 ) -> Dict[str, PlanetPosition]:
@@ -277,7 +431,9 @@ async def get_planetary_positions_async(
         positions: Dict[str, PlanetPosition] = {}
         for planet, remote_pos in remote_positions.items():
             positions[planet] = PlanetPosition(
-                position=remote_pos.position, retrograde=remote_pos.retrograde
+                position=remote_pos.position,
+                retrograde=remote_pos.retrograde,
+                speed=remote_pos.speed,
             )
 
         logger.debug(
@@ -328,6 +484,8 @@ def calculate_planet_position(
                 "position": remote_position.position,
                 "retrograde": remote_position.retrograde,
             }
+            if remote_position.speed is not None:
+                result["speed"] = remote_position.speed
             logger.debug(f"Remote position for {planet}: {result}")
             return result
         else:
@@ -367,6 +525,8 @@ async def calculate_planet_position_async(
                 "position": remote_position.position,
                 "retrograde": remote_position.retrograde,
             }
+            if remote_position.speed is not None:
+                result["speed"] = remote_position.speed
             logger.debug(f"Remote position async for {planet}: {result}")
             return result
         else:
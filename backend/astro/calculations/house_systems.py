@@ -1,6 +1,9 @@
 import logging
-from typing import List, TypedDict
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict, Union
 
+import numpy as np
 import swisseph as swe
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,98 @@ class HousesResult(TypedDict):
     angles: AnglesData
 
 
+class HouseSystemError(TypedDict):
+    error: str
+
+
+# House system names accepted by the API and their Swiss Ephemeris codes
+HOUSE_SYSTEMS: Dict[str, bytes] = {
+    "placidus": b"P",
+    "koch": b"K",
+    "equal": b"E",
+    "whole": b"W",
+    "campanus": b"C",
+    "regiomontanus": b"R",
+    "topocentric": b"T",
+    "porphyry": b"O",
+    "alcabitius": b"B",
+    "morinus": b"M",
+}
+
+_SYSTEM_NAMES: Dict[bytes, str] = {
+    code: name for name, code in HOUSE_SYSTEMS.items()
+}
+
+# Systems whose cusps follow from the Ascendant alone
+_ASCENDANT_SYSTEMS = ("equal", "whole")
+
+HOUSE_CACHE_SIZE = int(os.getenv("HOUSE_CACHE_SIZE", "4096"))
+
+RawHouses = Tuple[Tuple[float, ...], Tuple[float, ...]]
+
+
+def house_system_code(system: str) -> bytes:
+    """Swiss Ephemeris code for a system name or one-letter code.
+
+    Unknown names fall back to Placidus.
+    """
+    if len(system) > 1:
+        return HOUSE_SYSTEMS.get(system.lower(), b"P")
+    return system.upper().encode("ascii")[:1]
+
+
+def normalize_house_systems(systems: Sequence[str]) -> List[str]:
+    """Canonical names for system names/codes; rejects unknown systems."""
+    names: List[str] = []
+    for system in systems:
+        key = system.strip()
+        name = (
+            _SYSTEM_NAMES.get(key.upper().encode("ascii"))
+            if len(key) == 1
+            else key.lower()
+        )
+        if name not in HOUSE_SYSTEMS:
+            raise ValueError(
+                f"Unknown house system '{system}'. Available: {list(HOUSE_SYSTEMS)}"  # noqa: E501
+            )
+        if name not in names:
+            names.append(name)
+    return names
+
+
+@lru_cache(maxsize=HOUSE_CACHE_SIZE)
+def _houses_raw(
+    julian_day: float, lat: float, lon: float, system_bytes: bytes
+) -> RawHouses:
+    """``swe.houses_ex`` cusps and angles, cached per time/place/system."""
+    houses_result = swe.houses_ex(julian_day, lat, lon, flags=0, hsys=system_bytes)  # type: ignore  # noqa: E501
+    # Swiss Ephemeris returns a tuple of (cusps, ascmc) where both are sequences of floats  # noqa: E501
+    return (
+        tuple(float(c) for c in houses_result[0]),  # type: ignore
+        tuple(float(a) for a in houses_result[1]),  # type: ignore
+    )
+
+
+def _as_houses_result(
+    cusps: Sequence[float], ascmc: Sequence[float]
+) -> HousesResult:
+    houses_data: List[HouseData] = [
+        {"house": i + 1, "cusp": float(cusps[i])} for i in range(12)
+    ]
+    angles: AnglesData = {
+        "ascendant": float(ascmc[0]),
+        "mc": float(ascmc[1]),
+        "vertex": float(ascmc[3]),  # Vertex
+    }
+    return {"houses": houses_data, "angles": angles}
+
+
+def _ascendant_cusps(system: str, ascendant: float) -> Tuple[float, ...]:
+    """Equal (from the Ascendant) or whole sign (from its sign) cusps."""
+    first = ascendant if system == "equal" else (ascendant // 30) * 30
+    return tuple(((first + 30.0 * np.arange(12)) % 360).tolist())
+
+
 def calculate_houses(
     julian_day: float, lat: float, lon: float, system: str = "P"
 ) -> HousesResult:
@@ -29,47 +124,81 @@ def calculate_houses(
         f"Calculating houses for JD: {julian_day}, lat: {lat}, lon: {lon}, system: {system}"  # noqa: E501
     )
 
-    # Map house system names to bytes literals
-    house_system_map = {
-        "placidus": b"P",
-        "koch": b"K",
-        "equal": b"E",
-        "whole": b"W",
-        "campanus": b"C",
-        "regiomontanus": b"R",
-        "topocentric": b"T",
-    }
-
-    # Convert system name to bytes if needed
-    if len(system) > 1:
-        system_bytes = house_system_map.get(
-            system.lower(), b"P"
-        )  # Default to Placidus
-    else:
-        system_bytes = system.upper().encode("ascii")[:1]
+    system_bytes = house_system_code(system)
 
     try:
         # Calculate houses with extended flags for Vertex
+        logger.debug(f"Using house system bytes: {system_bytes}")
+        cusps, ascmc = _houses_raw(julian_day, lat, lon, system_bytes)
+        result = _as_houses_result(cusps, ascmc)
         logger.debug(
-            f"Using house system bytes: {system_bytes}, type: {type(system_bytes)}, length: {len(system_bytes)}"  # noqa: E501
+            f"Houses calculated: {result['houses']}, Angles: {result['angles']}"  # noqa: E501
         )
-        houses_result = swe.houses_ex(julian_day, lat, lon, flags=0, hsys=system_bytes)  # type: ignore  # noqa: E501
-
-        # Extract cusps and angles with proper type annotations
-        # Swiss Ephemeris returns a tuple of (cusps, ascmc) where both are sequences of floats  # noqa: E501
-        cusps: List[float] = list(houses_result[0])  # type: ignore  # House cusps (0-11)  # noqa: E501
-        ascmc: List[float] = list(houses_result[1])  # type: ignore  # Angles: Ascendant (0), MC (1), Vertex (3), etc.  # noqa: E501
-
-        houses_data: List[HouseData] = [
-            {"house": i + 1, "cusp": float(cusps[i])} for i in range(12)
-        ]
-        angles: AnglesData = {
-            "ascendant": float(ascmc[0]),
-            "mc": float(ascmc[1]),
-            "vertex": float(ascmc[3]),  # Vertex
-        }
-        logger.debug(f"Houses calculated: {houses_data}, Angles: {angles}")
-        return {"houses": houses_data, "angles": angles}
+        return result
     except Exception as e:
         logger.error(f"Error in house calculation: {str(e)}", exc_info=True)
         raise ValueError(f"Error in house calculation: {str(e)}")
+
+
+def calculate_house_systems(
+    julian_day: float,
+    lat: float,
+    lon: float,
+    systems: Optional[Sequence[str]] = None,
+) -> Dict[str, Union[HousesResult, HouseSystemError]]:
+    """Houses for several systems of one chart in a single call.
+
+    Args:
+        julian_day: Julian Day (UT)
+        lat: Geographic latitude
+        lon: Geographic longitude
+        systems: System names or one-letter codes; all systems if omitted
+
+    Returns:
+        Mapping of canonical system name to ``calculate_houses`` output.
+        Results are served from the per time/place cache; equal and whole
+        sign cusps are derived from the Ascendant of any system already
+        computed instead of another ``houses_ex`` call. A system that
+        cannot be computed for this place (Placidus and Koch beyond the
+        polar circles) maps to ``{"error": message}`` instead of failing
+        the other systems.
+    """
+    names = normalize_house_systems(
+        list(HOUSE_SYSTEMS) if systems is None else systems
+    )
+    logger.debug(
+        f"Calculating house systems {names} for JD: {julian_day}, lat: {lat}, lon: {lon}"  # noqa: E501
+    )
+
+    results: Dict[str, Union[HousesResult, HouseSystemError]] = {}
+    ascmc: Optional[Tuple[float, ...]] = None
+    # Quadrant systems first so their angles serve the derived ones
+    for name in sorted(names, key=lambda n: n in _ASCENDANT_SYSTEMS):
+        if name in _ASCENDANT_SYSTEMS and ascmc is not None:
+            results[name] = _as_houses_result(
+                _ascendant_cusps(name, ascmc[0]), ascmc
+            )
+            continue
+        try:
+            cusps, ascmc = _houses_raw(
+                julian_day, lat, lon, HOUSE_SYSTEMS[name]
+            )
+        except Exception as e:
+            logger.warning(
+                f"House system {name} failed at lat {lat}, lon {lon}: {str(e)}"  # noqa: E501
+            )
+            results[name] = {"error": f"Error in house calculation: {str(e)}"}  # noqa: E501
+            continue
+        results[name] = _as_houses_result(cusps, ascmc)
+    return {name: results[name] for name in names}
+
+
+def house_cache_info() -> Dict[str, int]:
+    """Hit/miss counters of the house calculation cache."""
+    info = _houses_raw.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,
+    }
@@ -4,9 +4,12 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, cast
 
+import numpy as np
 import swisseph as swe  # type: ignore
 from redis import Redis
 
+from utils.jit_kernels import gate_lines
+
 
 class PlanetActivation(TypedDict):
     gate: int
@@ -696,57 +699,14 @@ def detect_channels(design_data: Dict[str, Any]) -> list[str]:
     return formed_channels
 
 
-def get_gate_center(gate_number: int) -> str:
-    """Get the center associated with a specific gate number"""
-    if gate_number in GATES:
-        return GATES[gate_number]["center"]
-    return "Unknown"
-
-
-class SwissephResult(TypedDict):
-    position: Tuple[float, float, float, float, float, float]
-    error: Optional[str]
-
-
-def calculate_planetary_activations(
-    julian_day: float,
-) -> dict[str, PlanetActivation]:
-    """Calculate planetary activations for Human Design"""
-    cache_key = f"planetary_activations:{julian_day}"
-
-    # Try Redis cache first
-    try:
-        cached = redis_client.get(cache_key)
-        if cached:
-            # Handle Redis response type properly
-            try:
-                cached_str = (
-                    cached.decode("utf-8")
-                    if isinstance(cached, bytes)
-                    else str(cached)
-                )
-                return json.loads(cached_str)
-            except (  # noqa: F841
-                json.JSONDecodeError,
-                AttributeError,
-                UnicodeDecodeError,
-            ) as e:
-                # Continue to recalculate if cache is corrupted
-                pass
-    except Exception as e:  # noqa: F841
-        # Continue without cache
-        pass
-
-    activations: dict[str, PlanetActivation] = {}
-
-    # Each gate covers exactly 5.625 degrees (360/64)
-    gate_degrees = 360.0 / 64.0
+# Global offset for all Human Design calculations
+# Calibrated offset for perfect accuracy with your birth chart
+HD_OFFSET = 302.0
 
-    # Global offset for all Human Design calculations
-    # Calibrated offset for perfect accuracy with your birth chart
-    hd_offset = 302.0  # Calibrated offset for accurate gate calculations
-    # Starting from Gate 41 at 0° Aquarius, proceeding clockwise
-    gate_sequence = [
+# Starting from Gate 41 at 0° Aquarius, proceeding clockwise; each gate
+# covers exactly 5.625 degrees (360/64)
+GATE_SEQUENCE = np.array(
+    [
         41,
         19,
         13,
@@ -812,6 +772,67 @@ def calculate_planetary_activations(
         61,
         60,
     ]
+)
+
+PLANET_SYMBOLS: dict[str, str] = {
+    "sun": "☉",
+    "moon": "☽",
+    "mercury": "☿",
+    "venus": "♀",
+    "mars": "♂",
+    "jupiter": "♃",
+    "saturn": "♄",
+    "uranus": "♅",
+    "neptune": "♆",
+    "pluto": "♇",
+    "north_node": "☊",
+    "earth": "⊕",
+    "south_node": "☋",
+}
+
+
+def get_gate_center(gate_number: int) -> str:
+    """Get the center associated with a specific gate number"""
+    if gate_number in GATES:
+        return GATES[gate_number]["center"]
+    return "Unknown"
+
+
+class SwissephResult(TypedDict):
+    position: Tuple[float, float, float, float, float, float]
+    error: Optional[str]
+
+
+def calculate_planetary_activations(
+    julian_day: float,
+) -> dict[str, PlanetActivation]:
+    """Calculate planetary activations for Human Design"""
+    cache_key = f"planetary_activations:{julian_day}"
+
+    # Try Redis cache first
+    try:
+        cached = redis_client.get(cache_key)
+        if cached:
+            # Handle Redis response type properly
+            try:
+                cached_str = (
+                    cached.decode("utf-8")
+                    if isinstance(cached, bytes)
+                    else str(cached)
+                )
+                return json.loads(cached_str)
+            except (  # noqa: F841
+                json.JSONDecodeError,
+                AttributeError,
+                UnicodeDecodeError,
+            ) as e:
+                # Continue to recalculate if cache is corrupted
+                pass
+    except Exception as e:  # noqa: F841
+        # Continue without cache
+        pass
+
+    activations: dict[str, PlanetActivation] = {}
 
     try:
         planets: dict[str, int] = {
@@ -830,6 +851,7 @@ def calculate_planetary_activations(
             ),  # Changed to True Node
         }
 
+        positions: dict[str, float] = {}
         for planet_name, planet_id in planets.items():
             try:
                 result = swe.calc_ut(julian_day, planet_id, swe.FLG_SWIEPH)  # type: ignore  # noqa: E501
@@ -839,92 +861,34 @@ def calculate_planetary_activations(
                     f"Swiss Ephemeris error for {planet_name}: {str(e)}"
                 )
                 continue
+            positions[planet_name] = position
+
+        # Earth and South Node sit opposite the Sun and North Node
+        if "sun" in positions:
+            positions["earth"] = (positions["sun"] + 180.0) % 360.0
+        if "north_node" in positions:
+            positions["south_node"] = (
+                positions["north_node"] + 180.0
+            ) % 360.0
 
-            # Convert to Human Design gate/line using the I Ching wheel
-            # In Human Design, Gate 41 starts at 0° Aquarius (302° offset from standard astrology)  # noqa: E501
-            # Adjust position so the wheel aligns correctly - calibrated for conscious nodes  # noqa: E501
-            hd_position = (position - hd_offset) % 360.0
-            gate_index = int(hd_position / gate_degrees)  # 0-63
-
-            gate_number = gate_sequence[gate_index]
-
-            # Calculate line within the gate (1-6)
-            gate_progress = (
-                hd_position % gate_degrees
-            ) / gate_degrees  # 0-1 within gate
-            line_number = int(gate_progress * 6) + 1  # 1-6
-            line_number = max(1, min(6, line_number))  # Ensure valid range
-
+        # Convert to Human Design gate/line using the I Ching wheel
+        # In Human Design, Gate 41 starts at 0° Aquarius (302° offset from standard astrology)  # noqa: E501
+        # All bodies are mapped in one kernel call (utils.jit_kernels)
+        gates, lines = gate_lines(
+            np.array(list(positions.values()), dtype=np.float64),
+            HD_OFFSET,
+            GATE_SEQUENCE,
+        )
+        for (planet_name, position), gate_number, line_number in zip(
+            positions.items(), gates.tolist(), lines.tolist()
+        ):
             activations[planet_name] = {
                 "gate": gate_number,
                 "line": line_number,
                 "position": position,
                 "center": get_gate_center(gate_number),
                 "planet": planet_name,
-                "planet_symbol": {
-                    "sun": "☉",
-                    "moon": "☽",
-                    "mercury": "☿",
-                    "venus": "♀",
-                    "mars": "♂",
-                    "jupiter": "♃",
-                    "saturn": "♄",
-                    "uranus": "♅",
-                    "neptune": "♆",
-                    "pluto": "♇",
-                    "north_node": "☊",
-                    "earth": "⊕",
-                }.get(planet_name, planet_name),
-            }
-
-        # Calculate Earth position (opposite of Sun)
-        if "sun" in activations:
-            sun_position: float = float(activations["sun"]["position"])
-            earth_position: float = (sun_position + 180.0) % 360.0
-
-            # Apply same gate calculation for Earth
-            hd_earth_position = (earth_position - hd_offset) % 360.0
-            earth_gate_index = int(hd_earth_position / gate_degrees)
-            earth_gate_number = gate_sequence[earth_gate_index]
-            earth_gate_progress = (
-                hd_earth_position % gate_degrees
-            ) / gate_degrees
-            earth_line_number = int(earth_gate_progress * 6) + 1
-            earth_line_number = max(1, min(6, earth_line_number))
-
-            activations["earth"] = {
-                "gate": earth_gate_number,
-                "line": earth_line_number,
-                "position": earth_position,
-                "center": get_gate_center(earth_gate_number),
-                "planet": "earth",
-                "planet_symbol": "⊕",
-            }
-
-        # Calculate South Node position (opposite of North Node)
-        if "north_node" in activations:
-            north_node_position: float = float(
-                activations["north_node"]["position"]
-            )
-            south_node_position: float = (north_node_position + 180.0) % 360.0
-
-            # Apply same gate calculation for South Node - use same calculated offset  # noqa: E501
-            hd_south_position = (south_node_position - hd_offset) % 360.0
-            south_gate_index = int(hd_south_position / gate_degrees)
-            south_gate_number = gate_sequence[south_gate_index]
-            south_gate_progress = (
-                hd_south_position % gate_degrees
-            ) / gate_degrees
-            south_line_number = int(south_gate_progress * 6) + 1
-            south_line_number = max(1, min(6, south_line_number))
-
-            activations["south_node"] = {
-                "gate": south_gate_number,
-                "line": south_line_number,
-                "position": south_node_position,
-                "center": get_gate_center(south_gate_number),
-                "planet": "south_node",
-                "planet_symbol": "☋",
+                "planet_symbol": PLANET_SYMBOLS.get(planet_name, planet_name),
             }
 
         # Cache results for 1 hour
@@ -0,0 +1,198 @@
+# backend/astro/calculations/lunar_events.py
+"""
+Exact lunar phase and moon ingress times.
+
+Phases are the moments the Moon's elongation from the Sun reaches each
+phase angle; ingresses are the moments the Moon's longitude reaches a
+multiple of 30 degrees. Both are found as crossings of daily samples,
+refined with Newton steps on the Hermite interpolant (see
+``transit_engine.crossing_times``).
+
+Events are computed per window of ``WINDOW_DAYS`` days and kept, sorted by
+time, in a bounded process-wide cache; range queries are answered by
+binary search over the cached windows.
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Sequence, TypedDict
+
+import numpy as np
+
+from .transit_engine import MotionSampler, crossing_times, interpolate_motion
+
+logger = logging.getLogger(__name__)
+
+WINDOW_DAYS = 366
+EPOCH_JD = 2415020.5  # 1900-01-01 0h UT, window 0 starts here
+MAX_CACHED_WINDOWS = 256
+
+
+class LunarEvent(TypedDict):
+    kind: str  # "phase" or "ingress"
+    name: str  # phase name or zodiac sign entered
+    jd: float
+    moon_longitude: float
+
+
+class _Window(NamedTuple):
+    """Events of one window, sorted by time."""
+
+    jds: np.ndarray
+    kinds: np.ndarray
+    names: np.ndarray
+    lons: np.ndarray
+
+
+class LunarCalendar:
+    """Cached lunation and moon ingress table."""
+
+    def __init__(
+        self,
+        sample_motion: MotionSampler,
+        phases: Dict[str, float],
+        signs: Sequence[str],
+        max_windows: int = MAX_CACHED_WINDOWS,
+    ):
+        """
+        Args:
+            sample_motion: Returns longitudes and speeds of "sun" or
+                "moon" at given Julian Days
+            phases: Elongation angle of each phase, by phase name
+            signs: Zodiac sign names from 0 degrees Aries
+            max_windows: Windows kept in the cache
+        """
+        self._sample_motion = sample_motion
+        self.phase_names = list(phases)
+        self._phase_angles = np.array(
+            [float(a) for a in phases.values()], dtype=np.float64
+        )
+        self.signs = list(signs)
+        self._sign_starts = 360.0 / len(self.signs) * np.arange(len(self.signs))  # noqa: E501
+        self.max_windows = max(1, max_windows)
+        self._windows: "OrderedDict[int, _Window]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"windows_built": 0, "queries": 0}
+
+    def _build_window(self, index: int) -> _Window:
+        start = EPOCH_JD + index * WINDOW_DAYS
+        end = start + WINDOW_DAYS
+        # One extra sample either side so events at the edges are found
+        grid = start - 1.0 + np.arange(WINDOW_DAYS + 3, dtype=np.float64)
+        sun_lon, sun_speed = self._sample_motion("sun", grid)
+        moon_lon, moon_speed = self._sample_motion("moon", grid)
+        elongation = (moon_lon - sun_lon) % 360.0
+
+        phase_cols, phase_jds = crossing_times(
+            grid, elongation, moon_speed - sun_speed, self._phase_angles
+        )
+        sign_cols, sign_jds = crossing_times(
+            grid, moon_lon, moon_speed, self._sign_starts
+        )
+        jds = np.concatenate([phase_jds, sign_jds])
+        kinds = np.concatenate(
+            [np.zeros(len(phase_jds), np.int8), np.ones(len(sign_jds), np.int8)]  # noqa: E501
+        )
+        names = np.concatenate([phase_cols, sign_cols])
+        keep = (jds >= start) & (jds < end)
+        order = np.argsort(jds[keep], kind="stable")
+        jds, kinds, names = jds[keep][order], kinds[keep][order], names[keep][order]  # noqa: E501
+
+        # Moon longitude at each event, from the daily samples
+        k = np.clip(np.floor(jds - grid[0]).astype(np.int64), 0, len(grid) - 2)  # noqa: E501
+        lons, _ = interpolate_motion(
+            moon_lon[k],
+            moon_lon[k + 1],
+            moon_speed[k],
+            moon_speed[k + 1],
+            1.0,
+            jds - grid[k],
+        )
+        # At an ingress the Moon is exactly on the sign boundary
+        ingress = kinds == 1
+        lons[ingress] = self._sign_starts[names[ingress]]
+        return _Window(jds, kinds, names, lons)
+
+    def _window(self, index: int) -> _Window:
+        with self._lock:
+            window = self._windows.get(index)
+            if window is not None:
+                self._windows.move_to_end(index)
+                return window
+        window = self._build_window(index)
+        with self._lock:
+            self._windows[index] = window
+            self._windows.move_to_end(index)
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+            self._stats["windows_built"] += 1
+        return window
+
+    def _window_range(self, start_jd: float, end_jd: float) -> range:
+        first = math.floor((start_jd - EPOCH_JD) / WINDOW_DAYS)
+        last = math.floor((end_jd - EPOCH_JD) / WINDOW_DAYS)
+        return range(first, last + 1)
+
+    def build(self, start_jd: float, end_jd: float) -> None:
+        """Precompute the windows covering a range of Julian Days."""
+        for index in self._window_range(start_jd, end_jd):
+            self._window(index)
+
+    def events(
+        self,
+        start_jd: float,
+        end_jd: float,
+        kinds: Sequence[str] = ("phase", "ingress"),
+    ) -> List[LunarEvent]:
+        """Events with ``start_jd <= jd < end_jd``, in time order."""
+        wanted = {"phase": 0, "ingress": 1}
+        codes = [wanted[kind] for kind in kinds]
+        events: List[LunarEvent] = []
+        self._stats["queries"] += 1
+        if end_jd <= start_jd:
+            return events
+        for index in self._window_range(start_jd, end_jd):
+            window = self._window(index)
+            lo, hi = np.searchsorted(window.jds, [start_jd, end_jd], side="left")  # noqa: E501
+            for i in range(int(lo), int(hi)):
+                kind = int(window.kinds[i])
+                if kind not in codes:
+                    continue
+                names = self.phase_names if kind == 0 else self.signs
+                events.append(
+                    {
+                        "kind": "phase" if kind == 0 else "ingress",
+                        "name": names[int(window.names[i])],
+                        "jd": float(window.jds[i]),
+                        "moon_longitude": float(window.lons[i]),
+                    }
+                )
+        return events
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["windows_cached"] = len(self._windows)
+        return stats
+
+
+def events_by_day(
+    events: List[LunarEvent], day_jds: Sequence[float]
+) -> Dict[int, LunarEvent]:
+    """Last event of each day, keyed by the index of the day in ``day_jds``.
+
+    ``day_jds`` are the ascending day starts; an event belongs to the day
+    whose start is the last one at or before it.
+    """
+    starts = np.asarray(day_jds, dtype=np.float64)
+    by_day: Dict[int, LunarEvent] = {}
+    if not len(starts):
+        return by_day
+    for event in events:
+        d = int(np.searchsorted(starts, event["jd"], side="right")) - 1
+        if 0 <= d < len(starts) and event["jd"] < starts[d] + 1.0:
+            by_day[d] = event
+    return by_day
+
@@ -0,0 +1,275 @@
+# backend/astro/calculations/natal_index.py
+"""
+Inverted index of natal positions for population-wide transit alerts.
+
+For every natal body the index holds all users' longitudes as one sorted
+array, with a parallel array of user rows. "Which users have natal body Y
+within ``orb`` of longitude ``t``" is then two binary searches plus a
+slice (two slices when the window wraps past 0 Aries), so a transit
+aspect query costs O(log n + k) for k matching users.
+
+A daily alert run makes one query per (transiting body, aspect, side,
+natal body) and never touches users outside the result slices.
+``load_natal_index`` builds the index from saved charts and
+``python -m astro.calculations.natal_index [YYYY-MM-DD]`` prints the
+day's alerts for every user with a saved natal chart as JSON lines.
+"""
+
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OrbFunction = Callable[[str, str, str], float]
+
+
+class AlertGroup(TypedDict):
+    transit_planet: str
+    aspect: str
+    natal_planet: str
+    user_rows: np.ndarray
+    orbs: np.ndarray
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+class NatalIndex:
+    """Per-body sorted natal longitudes of many users."""
+
+    def __init__(self, positions: Mapping[str, Mapping[str, float]]):
+        """
+        Args:
+            positions: Natal longitudes by body name, by user id
+        """
+        user_ids = list(positions)
+        bodies: List[str] = []
+        for natal in positions.values():
+            bodies.extend(b for b in natal if b not in bodies)
+        longitudes = np.full((len(user_ids), len(bodies)), np.nan)
+        for row, user_id in enumerate(user_ids):
+            for body, lon in positions[user_id].items():
+                longitudes[row, bodies.index(body)] = lon
+        self._build(user_ids, bodies, longitudes)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        user_ids: Sequence[str],
+        bodies: Sequence[str],
+        longitudes: np.ndarray,
+    ) -> "NatalIndex":
+        """Index from a (users, bodies) longitude array; NaN means missing."""
+        index = cls.__new__(cls)
+        index._build(list(user_ids), list(bodies), np.asarray(longitudes))
+        return index
+
+    def _build(
+        self, user_ids: List[str], bodies: List[str], longitudes: np.ndarray
+    ) -> None:
+        if longitudes.shape != (len(user_ids), len(bodies)):
+            raise ValueError(
+                f"Expected longitudes of shape ({len(user_ids)}, {len(bodies)}), got {longitudes.shape}"  # noqa: E501
+            )
+        self.user_ids = user_ids
+        self._lons: Dict[str, np.ndarray] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+        for col, body in enumerate(bodies):
+            column = longitudes[:, col].astype(np.float64)
+            rows = np.flatnonzero(~np.isnan(column))
+            lons = column[rows] % 360.0
+            order = np.argsort(lons, kind="stable")
+            self._lons[body] = lons[order]
+            self._rows[body] = rows[order]
+        logger.debug(
+            f"Natal index built: {len(self.user_ids)} users, {len(bodies)} bodies"  # noqa: E501
+        )
+
+    @property
+    def bodies(self) -> List[str]:
+        return list(self._lons)
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def users(self, rows: np.ndarray) -> List[str]:
+        """User ids of index rows."""
+        return [self.user_ids[int(r)] for r in rows]
+
+    def within(
+        self, body: str, longitude: float, orb: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """User rows with natal ``body`` within ``orb`` of ``longitude``.
+
+        Returns the rows and their orbs (absolute distance in degrees).
+        """
+        lons = self._lons.get(body)
+        if lons is None or orb <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        rows = self._rows[body]
+        if orb >= 180.0:
+            slices = [slice(0, len(lons))]
+        else:
+            lo = (longitude - orb) % 360.0
+            hi = (longitude + orb) % 360.0
+            a = np.searchsorted(lons, lo, side="left")
+            b = np.searchsorted(lons, hi, side="right")
+            if lo <= hi:
+                slices = [slice(int(a), int(b))]
+            else:
+                # The window wraps past 0 degrees
+                slices = [slice(int(a), len(lons)), slice(0, int(b))]
+        found = np.concatenate([rows[s] for s in slices])
+        orbs = np.abs(
+            _wrap180(np.concatenate([lons[s] for s in slices]) - longitude)
+        )
+        return found, orbs
+
+    def aspecting(
+        self, body: str, transit_longitude: float, angle: float, orb: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """User rows whose natal ``body`` is within ``orb`` of ``angle``
+        from ``transit_longitude``, and their orbs."""
+        targets = [transit_longitude + angle]
+        if angle % 180.0:
+            targets.append(transit_longitude - angle)
+        parts = [self.within(body, target, orb) for target in targets]
+        if len(parts) == 1:
+            return parts[0]
+        return (
+            np.concatenate([rows for rows, _ in parts]),
+            np.concatenate([orbs for _, orbs in parts]),
+        )
+
+
+def load_natal_index(
+    charts: Iterable[Tuple[str, Mapping[str, Any]]], bodies: Sequence[str]
+) -> NatalIndex:
+    """Index of saved natal charts, one row per user.
+
+    Args:
+        charts: (user id, saved chart) pairs as ``database.iter_natal_charts``
+            yields them; each user's newest chart (by ``created_at``) is used
+        bodies: Bodies to index, read from ``chart_data["planets"]``;
+            bodies missing from a chart are left out of its row
+    """
+    newest: Dict[str, Mapping[str, Any]] = {}
+    for user_id, chart in charts:
+        current = newest.get(user_id)
+        if current is None or str(chart.get("created_at", "")) > str(
+            current.get("created_at", "")
+        ):
+            newest[user_id] = chart
+    user_ids = list(newest)
+    longitudes = np.full((len(user_ids), len(bodies)), np.nan)
+    for row, user_id in enumerate(user_ids):
+        planets = (newest[user_id].get("chart_data") or {}).get("planets") or {}  # noqa: E501
+        for col, body in enumerate(bodies):
+            value = planets.get(body)
+            if isinstance(value, Mapping):
+                value = value.get("position")
+            if value is not None:
+                longitudes[row, col] = float(value)
+    return NatalIndex.from_arrays(user_ids, bodies, longitudes)
+
+
+def find_alerts(
+    index: NatalIndex,
+    transit_positions: Mapping[str, float],
+    aspect_angles: Mapping[str, float],
+    orb: OrbFunction,
+    natal_bodies: Sequence[str] = (),
+) -> List[AlertGroup]:
+    """All (user, transit, aspect, natal body) matches for one moment.
+
+    Args:
+        index: Natal index of the population
+        transit_positions: Transiting longitudes by body name
+        aspect_angles: Aspect angles by aspect name
+        orb: Orb for (aspect, transiting body, natal body); 0 skips it
+        natal_bodies: Natal bodies to check (default: all indexed)
+
+    Returns:
+        One group per (transiting body, aspect, natal body) with matches;
+        ``user_rows`` index ``index.user_ids``.
+    """
+    groups: List[AlertGroup] = []
+    for transit_planet, transit_lon in transit_positions.items():
+        for aspect, angle in aspect_angles.items():
+            for natal_planet in natal_bodies or index.bodies:
+                max_orb = orb(aspect, transit_planet, natal_planet)
+                rows, orbs = index.aspecting(
+                    natal_planet, transit_lon, angle, max_orb
+                )
+                if not len(rows):
+                    continue
+                groups.append(
+                    {
+                        "transit_planet": transit_planet,
+                        "aspect": aspect,
+                        "natal_planet": natal_planet,
+                        "user_rows": rows,
+                        "orbs": orbs,
+                    }
+                )
+    return groups
+
+
+def iter_alerts(
+    index: NatalIndex, groups: Iterable[AlertGroup]
+) -> Iterable[Tuple[str, str, str, str, float]]:
+    """Flatten alert groups to (user, transit, aspect, natal, orb) rows."""
+    for group in groups:
+        users = index.users(group["user_rows"])
+        for user_id, value in zip(users, group["orbs"]):
+            yield (
+                user_id,
+                group["transit_planet"],
+                group["aspect"],
+                group["natal_planet"],
+                float(value),
+            )
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+    from datetime import datetime
+
+    from database import iter_natal_charts
+
+    from .transits_clean import daily_transit_alerts
+
+    logging.basicConfig(level=logging.INFO)
+    day = (
+        datetime.fromisoformat(sys.argv[1])
+        if len(sys.argv) > 1
+        else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)  # noqa: E501
+    )
+    alerts = daily_transit_alerts(iter_natal_charts(), day)
+    for user_id, transit_planet, aspect, natal_planet, orb in alerts:
+        print(
+            json.dumps(
+                {
+                    "user_id": user_id,
+                    "transit_planet": transit_planet,
+                    "aspect": aspect,
+                    "natal_planet": natal_planet,
+                    "orb": round(orb, 4),
+                }
+            )
+        )
+    logger.info(f"{len(alerts)} transit alerts for {day.date()}")
@@ -28,6 +28,7 @@ class ChartData(TypedDict, total=False):
     planets: Dict[str, PlanetData]
     houses: List[HouseData]
     aspects: List[AspectData]
+    aspect_patterns: Dict[str, Any]
 
 
 class BirthInfo(TypedDict, total=False):
@@ -95,6 +96,8 @@ from reportlab.platypus import (  # noqa: E402
     TableStyle,
 )
 
+from .aspect_patterns import get_aspect_patterns  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -405,6 +408,49 @@ def create_chart_pdf(
             story.append(aspect_table)
             story.append(Spacer(1, 20))
 
+        # Aspect Patterns Section (computed with the chart when available)
+        patterns = (
+            get_aspect_patterns(chart_data)["patterns"]  # type: ignore
+            if chart_data.get("aspects")
+            else []
+        )
+        if patterns:
+            story.append(Paragraph("Aspect Patterns", heading_style))
+
+            pattern_data = [["Pattern", "Planets", "Apex", "Max Orb"]]
+            for pattern in patterns:
+                pattern_data.append(
+                    [
+                        pattern["type"].replace("_", " ").title(),
+                        ", ".join(p.title() for p in pattern["planets"]),
+                        (pattern["apex"] or "-").title(),
+                        f"{pattern['max_orb']:.2f}°",
+                    ]
+                )
+
+            pattern_table = Table(
+                pattern_data,
+                colWidths=[1.2 * inch, 2.8 * inch, 1 * inch, 0.8 * inch],
+            )
+            pattern_table.setStyle(
+                TableStyle(
+                    [
+                        ("BACKGROUND", (0, 0), (-1, 0), colors.lightcoral),
+                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                        ("FONTSIZE", (0, 0), (-1, 0), 11),
+                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                        ("BACKGROUND", (0, 1), (-1, -1), colors.lightpink),
+                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                        ("FONTSIZE", (0, 1), (-1, -1), 10),
+                    ]
+                )
+            )
+
+            story.append(pattern_table)
+            story.append(Spacer(1, 20))
+
         # Add interpretation section if available
         add_chart_interpretation(story, chart_data, styles)
 
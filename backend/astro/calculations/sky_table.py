@@ -0,0 +1,226 @@
+# backend/astro/calculations/sky_table.py
+"""
+Shared daily sky table.
+
+Longitudes and speeds of every transiting body at 0h UT on each day from
+1900-01-01 to 2100-12-31, held in one (days, bodies, 2) array indexed by
+day number (days since 1900-01-01 0h UT). Transit positions are the same
+for every user, so the table is process-wide: it is filled in blocks of
+``BLOCK_DAYS`` days on first use and every block is computed once. Times
+between samples are read off the cubic Hermite interpolant of the daily
+longitudes and speeds, so lookups never call the ephemeris.
+
+With ``SKY_TABLE_PATH`` set the table lives in memory-mapped ``.npy``
+files in that directory: worker processes share its pages and filled
+blocks survive restarts. ``python -m astro.calculations.sky_table`` fills
+the whole range ahead of time. A block is only marked filled when every
+position in it is finite, so ephemeris failures are retried rather than
+stored.
+"""
+
+import fcntl
+import logging
+import math
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .transit_engine import interpolate_motion
+
+logger = logging.getLogger(__name__)
+
+BodyMotion = Callable[[float, int], Tuple[float, float]]
+
+SKY_TABLE_START_JD = 2415020.5  # 1900-01-01 0h UT
+SKY_TABLE_END_JD = 2488433.5  # 2100-12-31 0h UT
+BLOCK_DAYS = 256
+
+
+class SkyTable:
+    """Daily longitudes and speeds of a fixed set of bodies."""
+
+    def __init__(
+        self,
+        bodies: Dict[str, int],
+        motion: BodyMotion,
+        start_jd: float = SKY_TABLE_START_JD,
+        end_jd: float = SKY_TABLE_END_JD,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            bodies: Ephemeris body ids by name, in column order
+            motion: Returns (longitude, speed) of a body id at a Julian Day
+            start_jd: Julian Day of day number 0
+            end_jd: Julian Day of the last day in the table
+            path: Directory for the memory-mapped table, or None to keep
+                it in process memory
+        """
+        self.bodies = dict(bodies)
+        self._columns = {name: i for i, name in enumerate(self.bodies)}
+        self._motion = motion
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+        self.n_days = int(round(self.end_jd - self.start_jd)) + 1
+        self.n_blocks = math.ceil(self.n_days / BLOCK_DAYS)
+        self.path = path
+        self._data: Optional[np.ndarray] = None
+        self._filled: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "blocks_built": 0,
+            "ephemeris_calls": 0,
+            "lookups": 0,
+        }
+
+    # Storage
+
+    def _file_names(self) -> Tuple[str, str]:
+        ids = "-".join(str(i) for i in self.bodies.values())
+        base = f"sky_{int(self.start_jd)}_{self.n_days}_{ids}"
+        assert self.path is not None
+        return (
+            os.path.join(self.path, f"{base}.npy"),
+            os.path.join(self.path, f"{base}_filled.npy"),
+        )
+
+    def _open_mmap(self) -> Tuple[np.ndarray, np.ndarray]:
+        shape = (self.n_days, len(self.bodies), 2)
+        data_file, filled_file = self._file_names()
+        os.makedirs(self.path or ".", exist_ok=True)
+        # Workers opening the table together must not truncate each
+        # other's files: check and create them under an exclusive lock
+        with open(f"{data_file}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if os.path.exists(data_file) and os.path.exists(filled_file):
+                data = np.lib.format.open_memmap(data_file, mode="r+")
+                filled = np.lib.format.open_memmap(filled_file, mode="r+")
+                if data.shape == shape and filled.shape == (self.n_blocks,):
+                    return data, filled
+                logger.warning(f"Rebuilding sky table with unexpected shape: {data_file}")  # noqa: E501
+            data = np.lib.format.open_memmap(
+                data_file, mode="w+", dtype=np.float64, shape=shape
+            )
+            filled = np.lib.format.open_memmap(
+                filled_file, mode="w+", dtype=np.bool_, shape=(self.n_blocks,)
+            )
+            return data, filled
+
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._data is None or self._filled is None:
+            with self._lock:
+                if self._data is None or self._filled is None:
+                    data: Optional[np.ndarray] = None
+                    filled: Optional[np.ndarray] = None
+                    if self.path:
+                        try:
+                            data, filled = self._open_mmap()
+                        except (OSError, ValueError) as e:
+                            logger.warning(
+                                f"Sky table mmap unavailable, using memory: {e}"  # noqa: E501
+                            )
+                    if data is None or filled is None:
+                        data = np.zeros((self.n_days, len(self.bodies), 2))
+                        filled = np.zeros(self.n_blocks, dtype=np.bool_)
+                    self._data, self._filled = data, filled
+        return self._data, self._filled
+
+    def _ensure(self, first_day: int, last_day: int) -> np.ndarray:
+        """The table, with every block covering the days filled."""
+        data, filled = self._arrays()
+        for block in range(first_day // BLOCK_DAYS, last_day // BLOCK_DAYS + 1):  # noqa: E501
+            if filled[block]:
+                continue
+            with self._lock:
+                if filled[block]:
+                    continue
+                first = block * BLOCK_DAYS
+                last = min(self.n_days, first + BLOCK_DAYS)
+                rows = np.empty((last - first, len(self.bodies), 2))
+                for day in range(first, last):
+                    jd = self.start_jd + day
+                    for col, body_id in enumerate(self.bodies.values()):
+                        rows[day - first, col] = self._motion(jd, body_id)
+                data[first:last] = rows
+                self._stats["ephemeris_calls"] += rows.shape[0] * rows.shape[1]  # noqa: E501
+                if not np.isfinite(rows).all():
+                    logger.warning(
+                        f"Sky table block {block} has missing positions, not marking it filled"  # noqa: E501
+                    )
+                    continue
+                # Set after the rows so readers never see a partial block
+                filled[block] = True
+                self._stats["blocks_built"] += 1
+        return data
+
+    # Public API
+
+    def day_number(self, jd: float) -> int:
+        """Row of the last sample at or before ``jd``."""
+        return int(math.floor(jd - self.start_jd))
+
+    def covers(self, jds: np.ndarray) -> bool:
+        """True if every Julian Day in ``jds`` is inside the table."""
+        jds = np.asarray(jds, dtype=np.float64)
+        return bool(
+            len(jds)
+            and jds.min() >= self.start_jd
+            and jds.max() <= self.end_jd
+        )
+
+    def sample(
+        self, body: str, jds: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Longitudes and speeds of ``body`` at the given Julian Days."""
+        jds = np.asarray(jds, dtype=np.float64)
+        if not self.covers(jds):
+            raise ValueError(
+                f"Julian Days outside the sky table ({self.start_jd} to {self.end_jd})"  # noqa: E501
+            )
+        col = self._columns[body]
+        x = jds - self.start_jd
+        k = np.clip(np.floor(x).astype(np.int64), 0, self.n_days - 2)
+        data = self._ensure(int(k.min()), int(k.max()) + 1)
+        self._stats["lookups"] += len(jds)
+        return interpolate_motion(
+            data[k, col, 0],
+            data[k + 1, col, 0],
+            data[k, col, 1],
+            data[k + 1, col, 1],
+            1.0,
+            x - k,
+        )
+
+    def build(
+        self, start_jd: Optional[float] = None, end_jd: Optional[float] = None
+    ) -> None:
+        """Fill the table between two Julian Days (default: all of it)."""
+        first = 0 if start_jd is None else self.day_number(start_jd)
+        last = self.n_days - 1 if end_jd is None else self.day_number(end_jd)
+        self._ensure(max(0, first), min(self.n_days - 1, last))
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+            self._filled.flush()  # type: ignore[union-attr]
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(self._stats)
+        filled = self._filled
+        stats["blocks_filled"] = int(filled.sum()) if filled is not None else 0  # noqa: E501
+        stats["blocks"] = self.n_blocks
+        stats["days"] = self.n_days
+        stats["backing"] = (
+            "mmap" if isinstance(self._data, np.memmap) else "memory"
+        )
+        return stats
+
+
+if __name__ == "__main__":
+    from .transits_clean import sky_table
+
+    logging.basicConfig(level=logging.INFO)
+    if not sky_table.path:
+        raise SystemExit("Set SKY_TABLE_PATH to prebuild the sky table")
+    sky_table.build()
+    logger.info(f"Sky table built: {sky_table.stats()}")
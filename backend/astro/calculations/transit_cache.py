@@ -0,0 +1,209 @@
+# backend/astro/calculations/transit_cache.py
+"""
+Two-tier result cache for transit calculations.
+
+Entries are JSON-serializable lists of result dicts. The first tier is
+an in-process LRU with a TTL, bounded both by entry count and by the
+size of the cached payloads (their compact JSON length), since whole
+range results can be megabytes; the optional second tier is Redis,
+where payloads are stored as zlib-compressed JSON so that year-long
+result sets stay small. Redis errors never fail a request: the tier is
+skipped for a while (see ``utils.redis_tier``) and the in-process tier
+keeps serving.
+
+``get_many``/``set_many`` use one ``MGET`` and one pipelined write so
+per-day entries can be reused without a round trip per day.
+"""
+
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.redis_tier import (
+    RedisTier,
+    compress_json,
+    decompress_json,
+    encode_json,
+)
+
+logger = logging.getLogger(__name__)
+
+CacheValue = List[Dict[str, Any]]
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("TRANSIT_CACHE_MAX_ENTRIES", "20000"))
+DEFAULT_MAX_BYTES = int(
+    os.getenv("TRANSIT_CACHE_MAX_BYTES", str(128 * 1024 * 1024))
+)
+DEFAULT_TTL_SECONDS = int(os.getenv("TRANSIT_CACHE_TTL", str(7 * 24 * 3600)))
+
+
+class TransitResultCache:
+    """Size-bounded in-process LRU plus an optional compressed Redis tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        redis_client_factory: Optional[Callable[[], Any]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires at, size in bytes, value)
+        self._entries: "OrderedDict[str, Tuple[float, int, CacheValue]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._redis = RedisTier(
+            redis_client_factory, "Transit cache", self._redis_error
+        )
+        self._stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "redis_errors": 0,
+            "compressed_bytes": 0,
+            "uncompressed_bytes": 0,
+        }
+
+    # In-process tier (callers hold the lock)
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _memory_get(self, key: str, now: float) -> Optional[CacheValue]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, _, value = entry
+        if expires <= now:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _memory_set(
+        self, key: str, value: CacheValue, size: int, now: float
+    ) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (now + self.ttl_seconds, size, value)
+        self._bytes += size
+        while (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self._stats["evictions"] += 1
+
+    def _redis_error(self) -> None:
+        self._stats["redis_errors"] += 1
+
+    # Public API
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, value: CacheValue) -> None:
+        self.set_many({key: value})
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, CacheValue]:
+        """Cached values for ``keys``; missing keys are left out."""
+        found: Dict[str, CacheValue] = {}
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                value = self._memory_get(key, now)
+                if value is not None:
+                    found[key] = value
+            self._stats["memory_hits"] += len(found)
+
+        missing = [key for key in keys if key not in found]
+        client = self._redis.client() if missing else None
+        if client is not None:
+            try:
+                payloads = client.mget(missing)
+            except Exception as e:
+                self._redis.failed(e)
+                payloads = []
+            with self._lock:
+                for key, payload in zip(missing, payloads):
+                    if payload is None:
+                        continue
+                    try:
+                        value, size = decompress_json(payload)
+                    except (zlib.error, ValueError) as e:
+                        logger.warning(f"Dropping corrupt cache entry {key}: {e}")  # noqa: E501
+                        continue
+                    found[key] = value
+                    self._memory_set(key, value, size, now)
+                    self._stats["redis_hits"] += 1
+
+        with self._lock:
+            self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, CacheValue]) -> None:
+        """Store values in both tiers (Redis writes are pipelined)."""
+        if not items:
+            return
+        client = self._redis.client()
+        # (payload, uncompressed size); payloads only when Redis is used
+        encoded = {
+            key: (
+                compress_json(value)
+                if client is not None
+                else (b"", len(encode_json(value)))
+            )
+            for key, value in items.items()
+        }
+        now = time.time()
+        with self._lock:
+            for key, value in items.items():
+                self._memory_set(key, value, encoded[key][1], now)
+            self._stats["sets"] += len(items)
+
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            for key, (payload, raw_size) in encoded.items():
+                self._stats["uncompressed_bytes"] += raw_size
+                self._stats["compressed_bytes"] += len(payload)
+                pipe.setex(key, self.ttl_seconds, payload)
+            pipe.execute()
+        except Exception as e:
+            self._redis.failed(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire by TTL)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        lookups = stats["memory_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["memory_hits"] + stats["redis_hits"]) / lookups
+            if lookups
+            else 0.0
+        )
+        stats["redis_enabled"] = self._redis.enabled
+        return stats
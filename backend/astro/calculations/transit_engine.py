@@ -0,0 +1,359 @@
+# backend/astro/calculations/transit_engine.py
+"""
+Vectorized transit search over a time grid.
+
+For each transiting body the longitude and speed are sampled on a regular
+grid around the requested days. Every aspect target is a column: natal
+longitude plus or minus the aspect angle (one column for conjunctions and
+oppositions). The signed deviation ``h`` from each target is built with
+NumPy broadcasting over (samples x natal points x aspects x sides), and
+
+- orb entry/exit are the sign changes of ``h -/+ orb``
+- exact hits are the sign changes of ``h``
+
+between consecutive samples. Crossing times are refined with Newton steps
+on the cubic Hermite interpolant of the longitude, which uses the sampled
+speeds, so slow bodies can be sampled sparsely without losing precision.
+
+The search window extends ``pad`` days either side of the requested days;
+pad depends on the body's mean motion and largest orb. Orb entry/exit
+times are clipped to ``pad`` days around each reported day, so a day's
+results do not depend on the rest of the requested range.
+"""
+
+import logging
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+import numpy as np
+
+from .ephemeris import _MEAN_DAILY_MOTION
+
+logger = logging.getLogger(__name__)
+
+# Longest orb entry/exit search either side of a reported day
+EVENT_SEARCH_DAYS = 183
+# Search window, in orb-crossing times at mean motion
+PAD_FACTOR = 3.0
+# Sampling: about 0.4 deg of mean motion per step, 1 to 8 days
+STEP_TARGET_DEGREES = 0.4
+MAX_STEP_DAYS = 8
+NEWTON_ITERATIONS = 5
+
+MotionSampler = Callable[[str, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+class TransitHit(TypedDict):
+    day_index: int
+    planet: str
+    natal_planet: str
+    aspect_index: int
+    longitude: float
+    speed: float
+    orb: float
+    max_orb: float
+    entry_jd: float
+    exit_jd: float
+    exact_jd: Optional[float]
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def _hermite(
+    h0: np.ndarray,
+    h1: np.ndarray,
+    m0: np.ndarray,
+    m1: np.ndarray,
+    s: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Cubic Hermite value and d/ds on [0, 1]; ``m`` are slopes per step."""
+    s2 = s * s
+    s3 = s2 * s
+    value = (
+        (2 * s3 - 3 * s2 + 1) * h0
+        + (s3 - 2 * s2 + s) * m0
+        + (-2 * s3 + 3 * s2) * h1
+        + (s3 - s2) * m1
+    )
+    slope = (
+        (6 * s2 - 6 * s) * h0
+        + (3 * s2 - 4 * s + 1) * m0
+        + (-6 * s2 + 6 * s) * h1
+        + (3 * s2 - 2 * s) * m1
+    )
+    return value, slope
+
+
+def interpolate_motion(
+    lon0: np.ndarray,
+    lon1: np.ndarray,
+    speed0: np.ndarray,
+    speed1: np.ndarray,
+    step: float,
+    s: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Longitude and speed at fraction ``s`` of a step between two samples."""
+    h1 = lon0 + _wrap180(lon1 - lon0)
+    value, slope = _hermite(lon0, h1, speed0 * step, speed1 * step, s)
+    return value % 360.0, slope / step
+
+
+def body_grid_params(body: str, max_orb: float) -> Tuple[int, int]:
+    """(step, pad) in days for sampling ``body``."""
+    motion = _MEAN_DAILY_MOTION.get(body, 0.05)
+    step = int(min(MAX_STEP_DAYS, max(1, STEP_TARGET_DEGREES // motion)))
+    pad = math.ceil(PAD_FACTOR * 2 * max_orb / motion) + step
+    return step, int(min(EVENT_SEARCH_DAYS, pad))
+
+
+def _grid(day_jds: np.ndarray, step: int, pad: int) -> np.ndarray:
+    """Grid ``phase + n * step`` covering the days +/- pad.
+
+    The phase is the fractional part of the day samples so that requests
+    with the same sampling time share grid points.
+    """
+    phase = float(day_jds[0]) % 1.0
+    first = math.floor((float(day_jds[0]) - pad - phase) / step) - 1
+    last = math.ceil((float(day_jds[-1]) + pad - phase) / step) + 1
+    return phase + step * np.arange(first, last + 1, dtype=np.float64)
+
+
+def _interpolate(
+    grid: np.ndarray,
+    lon: np.ndarray,
+    speed: np.ndarray,
+    step: int,
+    times: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Longitude and speed at ``times`` from the sampled grid."""
+    k = np.clip(((times - grid[0]) // step).astype(np.int64), 0, len(grid) - 2)
+    s = (times - grid[k]) / step
+    return interpolate_motion(
+        lon[k], lon[k + 1], speed[k], speed[k + 1], step, s
+    )
+
+
+def _crossings(
+    h: np.ndarray,
+    dh: np.ndarray,
+    slopes: np.ndarray,
+    grid: np.ndarray,
+    step: int,
+    level: np.ndarray,
+    valid: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Columns and refined times where ``h`` crosses ``level``.
+
+    ``h`` is (samples, columns); ``dh`` the unwrapped change per step and
+    ``slopes`` the longitude change per step implied by the speeds.
+    """
+    a = h[:-1] - level
+    b = a + dh[:, np.newaxis]
+    k, col = np.nonzero(((a > 0) != (b > 0)) & valid)
+    h0 = a[k, col]
+    h1 = b[k, col]
+    m0 = slopes[k]
+    m1 = slopes[k + 1]
+    s = np.clip(h0 / (h0 - h1), 0.0, 1.0)
+    for _ in range(NEWTON_ITERATIONS):
+        value, slope = _hermite(h0, h1, m0, m1, s)
+        safe = np.abs(slope) > 1e-12
+        s = np.where(safe, s - value / np.where(safe, slope, 1.0), s)
+        s = np.clip(s, 0.0, 1.0)
+    return col, grid[k] + s * step
+
+
+def crossing_times(
+    grid: np.ndarray,
+    lon: np.ndarray,
+    speed: np.ndarray,
+    targets: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Target indices and times where a sampled longitude reaches targets.
+
+    ``grid`` must be evenly spaced by whole days; crossings in either
+    direction are reported, ordered by sample interval.
+    """
+    step = int(round(grid[1] - grid[0]))
+    h = _wrap180(lon[:, np.newaxis] - targets[np.newaxis, :])
+    zeros = np.zeros(len(targets))
+    valid = np.ones(len(targets), dtype=bool)
+    return _crossings(
+        h, _wrap180(np.diff(lon)), speed * step, grid, step, zeros, valid
+    )
+
+
+def _sorted_events(
+    cols: np.ndarray, times: np.ndarray, span: float
+) -> np.ndarray:
+    """Sorted keys ordering events by column, then time."""
+    return np.sort(cols * span + times)
+
+
+def _neighbours(
+    events: np.ndarray,
+    query: np.ndarray,
+    cols: np.ndarray,
+    span: float,
+    offset: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Last event at or before, and first after, each query in its column.
+
+    Missing neighbours are -inf/+inf.
+    """
+    before = np.full(len(query), -np.inf)
+    after = np.full(len(query), np.inf)
+    if not len(events):
+        return before, after
+    i = np.searchsorted(events, query, side="right")
+    for idx, out in ((i - 1, before), (i, after)):
+        value = events[np.clip(idx, 0, len(events) - 1)]
+        ok = (idx >= 0) & (idx < len(events)) & ((value // span) == cols)
+        out[ok] = (value - cols * span + offset)[ok]
+    return before, after
+
+
+def find_transit_hits(
+    day_jds: Sequence[float],
+    bodies: Sequence[str],
+    natal: Dict[str, float],
+    aspect_angles: Sequence[float],
+    orbs: Dict[str, np.ndarray],
+    sample_motion: MotionSampler,
+) -> List[TransitHit]:
+    """Aspects in orb at each day sample, with their orb window and exact time.
+
+    Args:
+        day_jds: Julian Days of the reported samples, one per day, ascending
+        bodies: Transiting body names
+        natal: Natal longitudes by body name
+        aspect_angles: Aspect angles in priority order; when several are in
+            orb for a pair the first one is reported
+        orbs: Per transiting body, the (natal points, aspects) orb array;
+            0 disables an aspect
+        sample_motion: Returns longitudes and speeds of a body at given JDs
+
+    Returns:
+        One hit per (day, transiting body, natal point) in orb, ordered by
+        day, then body, then natal point.
+    """
+    days = np.asarray(day_jds, dtype=np.float64)
+    if not len(days) or not natal:
+        return []
+    natal_names = list(natal)
+    natal_lons = np.array([natal[n] for n in natal_names], dtype=np.float64)
+    angles = np.asarray(aspect_angles, dtype=np.float64)
+    n_natal, n_aspects = len(natal_names), len(angles)
+
+    # Targets: natal +/- angle, the minus side only where it is distinct
+    sides = np.array([1.0, -1.0])
+    targets = (
+        natal_lons[:, np.newaxis, np.newaxis]
+        + angles[np.newaxis, :, np.newaxis] * sides
+    )
+    distinct = np.ones((n_aspects, 2), dtype=bool)
+    distinct[:, 1] = (angles % 180.0) != 0.0
+    n_cols = n_natal * n_aspects * 2
+
+    hits: List[Tuple[int, int, int, TransitHit]] = []
+    for body_index, body in enumerate(bodies):
+        body_orbs = np.asarray(orbs[body], dtype=np.float64)
+        col_orbs = np.broadcast_to(
+            body_orbs[:, :, np.newaxis], (n_natal, n_aspects, 2)
+        ).reshape(-1)
+        valid = (
+            (col_orbs > 0)
+            & np.broadcast_to(distinct, (n_natal, n_aspects, 2)).reshape(-1)
+        )
+        if not valid.any():
+            continue
+
+        step, pad = body_grid_params(body, float(body_orbs.max()))
+        grid = _grid(days, step, pad)
+        lon, speed = sample_motion(body, grid)
+        lon = np.asarray(lon, dtype=np.float64)
+        speed = np.asarray(speed, dtype=np.float64)
+
+        # Signed deviation from every target: (samples, columns)
+        h = _wrap180(lon[:, np.newaxis] - targets.reshape(1, -1))
+        dh = _wrap180(np.diff(lon))
+        slopes = speed * step
+
+        bound_cols: List[np.ndarray] = []
+        bound_times: List[np.ndarray] = []
+        for sign in (-1.0, 1.0):
+            cols, times = _crossings(
+                h, dh, slopes, grid, step, sign * col_orbs, valid
+            )
+            bound_cols.append(cols)
+            bound_times.append(times)
+        exact_cols, exact_times = _crossings(
+            h, dh, slopes, grid, step, np.zeros(n_cols), valid
+        )
+
+        # Day status from the interpolated longitude
+        day_lon, day_speed = _interpolate(grid, lon, speed, step, days)
+        day_h = _wrap180(day_lon[:, np.newaxis] - targets.reshape(1, -1))
+        in_orb = (np.abs(day_h) <= col_orbs) & valid
+        # First aspect (then side) in orb per natal point
+        in_orb = in_orb.reshape(len(days), n_natal, n_aspects * 2)
+        found = in_orb.any(axis=2)
+        first = in_orb.argmax(axis=2)
+        d_idx, n_idx = np.nonzero(found)
+        if not len(d_idx):
+            continue
+        flat = first[d_idx, n_idx]
+        cols = n_idx * n_aspects * 2 + flat
+        t_day = days[d_idx]
+
+        span = float(grid[-1] - grid[0]) + 2.0 * step + 1.0
+        offset = float(grid[0]) - step
+        bounds = _sorted_events(
+            np.concatenate(bound_cols),
+            np.concatenate(bound_times) - offset,
+            span,
+        )
+        exacts = _sorted_events(exact_cols, exact_times - offset, span)
+        query = cols * span + (t_day - offset)
+
+        # Orb window around the day, clipped to the search pad
+        entry, exit_ = _neighbours(bounds, query, cols, span, offset)
+        entry = np.maximum(entry, t_day - pad)
+        exit_ = np.minimum(exit_, t_day + pad)
+
+        # Exact: the hit inside the orb window nearest to the day
+        exact = np.full(len(cols), np.nan)
+        best_gap = np.full(len(cols), np.inf)
+        for t in _neighbours(exacts, query, cols, span, offset):
+            gap = np.abs(t - t_day)
+            better = (t >= entry) & (t <= exit_) & (gap < best_gap)
+            exact = np.where(better, t, exact)
+            best_gap = np.where(better, gap, best_gap)
+
+        aspect_idx = flat // 2
+        for r in range(len(cols)):
+            n = int(n_idx[r])
+            a = int(aspect_idx[r])
+            d = int(d_idx[r])
+            hit: TransitHit = {
+                "day_index": d,
+                "planet": body,
+                "natal_planet": natal_names[n],
+                "aspect_index": a,
+                "longitude": float(day_lon[d]),
+                "speed": float(day_speed[d]),
+                "orb": float(abs(day_h[d, cols[r]])),
+                "max_orb": float(col_orbs[cols[r]]),
+                "entry_jd": float(entry[r]),
+                "exit_jd": float(exit_[r]),
+                "exact_jd": None if np.isnan(exact[r]) else float(exact[r]),
+            }
+            hits.append((d, body_index, n, hit))
+
+    hits.sort(key=lambda item: item[:3])
+    logger.debug(
+        f"Transit grid search: {len(days)} days, {len(bodies)} bodies, {len(hits)} hits"  # noqa: E501
+    )
+    return [hit for _, _, _, hit in hits]
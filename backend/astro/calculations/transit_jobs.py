@@ -0,0 +1,226 @@
+# backend/astro/calculations/transit_jobs.py
+"""
+Background jobs for long transit ranges.
+
+A job is an ordered list of chunks (one per month), each a callable
+returning a list of serialized results. Chunks run on a shared thread
+pool, so several jobs make progress side by side; callers poll the job
+status or iterate finished chunks in order while later ones are still
+running. Chunk callables are expected to use the result cache, so re-runs
+and overlapping jobs only compute chunks not seen before.
+
+Jobs live in process memory and are dropped ``JOB_TTL_SECONDS`` after
+they finish.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ChunkResult = List[Dict[str, Any]]
+Chunk = Tuple[str, Callable[[], ChunkResult]]
+
+JOB_WORKERS = int(os.getenv("TRANSIT_JOB_WORKERS", "4"))
+MAX_JOBS = int(os.getenv("TRANSIT_MAX_JOBS", "1000"))
+JOB_TTL_SECONDS = int(os.getenv("TRANSIT_JOB_TTL", "3600"))
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobFailed(RuntimeError):
+    """A job failed or was cancelled before the requested chunk finished."""
+
+
+class TransitJob:
+    """State of one background job."""
+
+    def __init__(self, kind: str, chunks: List[Chunk]):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.labels = [label for label, _ in chunks]
+        self.status = QUEUED
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._results: List[Optional[ChunkResult]] = [None] * len(chunks)
+        self._futures: List["Future[None]"] = []
+        self._done = 0
+        self._condition = threading.Condition()
+
+    @property
+    def chunks_done(self) -> int:
+        return self._done
+
+    def _finish(self, status: str, error: Optional[str] = None) -> None:
+        # Caller holds the condition
+        if self.status in FINISHED:
+            return
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+        for future in self._futures:
+            future.cancel()
+        self._condition.notify_all()
+
+    def _run_chunk(self, index: int, work: Callable[[], ChunkResult]) -> None:
+        with self._condition:
+            if self.status in FINISHED:
+                return
+            self.status = RUNNING
+        try:
+            result = work()
+        except Exception as e:
+            logger.error(
+                f"Transit job {self.job_id} chunk {self.labels[index]} failed: {str(e)}"  # noqa: E501
+            )
+            with self._condition:
+                self._finish(FAILED, f"{self.labels[index]}: {str(e)}")
+            return
+        with self._condition:
+            if self.status in FINISHED:
+                return
+            self._results[index] = result
+            self._done += 1
+            if self._done == len(self._results):
+                self._finish(COMPLETED)
+            self._condition.notify_all()
+
+    def cancel(self) -> bool:
+        """Stop the job; returns False if it had already finished."""
+        with self._condition:
+            if self.status in FINISHED:
+                return False
+            self._finish(CANCELLED, "Job cancelled")
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.status in FINISHED, timeout
+            )
+
+    def iter_chunks(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[Tuple[str, ChunkResult]]:
+        """Finished chunks in order, waiting for each one as needed.
+
+        Raises:
+            JobFailed: If the job fails or is cancelled first
+            TimeoutError: If a chunk takes longer than ``timeout`` seconds
+        """
+        for index, label in enumerate(self.labels):
+            with self._condition:
+                ready = self._condition.wait_for(
+                    lambda: self._results[index] is not None
+                    or self.status in (FAILED, CANCELLED),
+                    timeout,
+                )
+                if not ready:
+                    raise TimeoutError(f"Timed out waiting for {label}")
+                result = self._results[index]
+                if result is None:
+                    raise JobFailed(self.error or f"Job {self.status}")
+            yield label, result
+
+    def results(self) -> List[Dict[str, Any]]:
+        """All results of the finished chunks, in chunk order."""
+        with self._condition:
+            return [
+                item
+                for chunk in self._results
+                if chunk is not None
+                for item in chunk
+            ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "job_id": self.job_id,
+                "kind": self.kind,
+                "status": self.status,
+                "chunks_total": len(self.labels),
+                "chunks_done": self._done,
+                "result_count": sum(
+                    len(chunk) for chunk in self._results if chunk is not None
+                ),
+                "error": self.error,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class TransitJobManager:
+    """Submits jobs to a shared worker pool and keeps their state."""
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        max_jobs: int = MAX_JOBS,
+        ttl_seconds: int = JOB_TTL_SECONDS,
+    ):
+        self.max_jobs = max(1, max_jobs)
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="transit_jobs"  # noqa: E501
+        )
+        self._jobs: "OrderedDict[str, TransitJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self) -> None:
+        # Caller holds the lock
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.ttl_seconds:  # noqa: E501
+                del self._jobs[job_id]
+        finished = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status in FINISHED
+        ]
+        while len(self._jobs) >= self.max_jobs and finished:
+            del self._jobs[finished.pop(0)]
+
+    def submit(self, kind: str, chunks: List[Chunk]) -> TransitJob:
+        """Start a job; raises ValueError when the job table is full."""
+        job = TransitJob(kind, chunks)
+        with self._lock:
+            self._prune()
+            if len(self._jobs) >= self.max_jobs:
+                raise ValueError("Too many transit jobs in progress")
+            self._jobs[job.job_id] = job
+        if not chunks:
+            with job._condition:
+                job._finish(COMPLETED)
+            return job
+        with job._condition:
+            job._futures = [
+                self._executor.submit(job._run_chunk, index, work)
+                for index, (_, work) in enumerate(chunks)
+            ]
+        logger.info(f"Transit job {job.job_id} ({kind}) submitted: {len(chunks)} chunks")  # noqa: E501
+        return job
+
+    def get(self, job_id: str) -> Optional[TransitJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        stats = {"jobs": len(jobs)}
+        for status in (QUEUED, RUNNING) + FINISHED:
+            stats[status] = sum(1 for job in jobs if job.status == status)
+        return stats
@@ -6,15 +6,48 @@ This module implements Grok's comprehensive solution for transit calculations us
 PySwissEph, Redis caching, and optimized performance patterns.
 """
 
+import json
 import logging
+import math
 import os
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from utils.orb_profiles import (
+    get_orb_profile,
+    is_applying,
+    list_orb_profiles,
+)
+
+from .lunar_events import LunarCalendar, events_by_day
+from .natal_index import (
+    AlertGroup,
+    NatalIndex,
+    find_alerts,
+    iter_alerts,
+    load_natal_index,
+)
+from .sky_table import SkyTable
+from .transit_cache import TransitResultCache
+from .transit_engine import find_transit_hits
+from .transit_jobs import COMPLETED, TransitJob, TransitJobManager
+
 # Swiss Ephemeris imports with fallback
 swe_available = True
 try:
@@ -40,6 +73,29 @@ def get_redis_client() -> Any:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Streaming formats for /transits/stream and /lunar-transits/stream
+STREAM_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+# Longest /lunar-events range (ten years)
+MAX_LUNAR_EVENT_DAYS = 3660
+
+# Longest range of a background transit or lunar job (ten years)
+MAX_JOB_DAYS = 3660
+
+# Bump when the shape or meaning of cached transit results changes
+TRANSIT_CACHE_VERSION = "2"
+
+# Result cache for /transits; the Redis tier is used when REDIS_URL is set
+transit_cache = TransitResultCache(
+    redis_client_factory=get_redis_client if os.getenv("REDIS_URL") else None
+)
+
+# Background jobs for ranges beyond the synchronous limits
+transit_jobs = TransitJobManager()
+
 
 # Pydantic models for request/response
 class BirthData(BaseModel):
@@ -79,6 +135,7 @@ class TransitResult(BaseModel):
     intensity: float = Field(..., ge=0, le=100)
     energy: str
     duration_days: int
+    applying: Optional[bool] = None
     description: Optional[str] = None
 
 
@@ -93,12 +150,24 @@ class LunarTransitResult(BaseModel):
     description: Optional[str] = None
 
 
+class LunarEventResult(BaseModel):
+    event: str = Field(..., description="phase or ingress")
+    name: str
+    exact_time: str
+    degree: float
+    moon_sign: str
+    description: Optional[str] = None
+
+
 class TransitCalculationRequest(BaseModel):
     birth_data: BirthData
     date_range: DateRange
     include_minor_aspects: bool = Field(default=False)
     include_asteroids: bool = Field(default=False)
     orb: float = Field(default=2.0, ge=0.5, le=10.0)
+    orb_profile: str = Field(
+        default="transit", description="Orb profile name (see /aspects)"
+    )
 
 
 class LunarTransitRequest(BaseModel):
@@ -108,59 +177,89 @@ class LunarTransitRequest(BaseModel):
     include_daily_phases: bool = Field(default=True)
 
 
-# Aspect definitions with orbs and energies
+class TransitJobStatus(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    chunks_total: int
+    chunks_done: int
+    result_count: int
+    error: Optional[str] = None
+    created_at: float
+    finished_at: Optional[float] = None
+
+
+class LunarEventRequest(BaseModel):
+    date_range: DateRange
+    include_ingresses: bool = Field(default=True)
+
+
+DEFAULT_ORB_PROFILE = "transit"
+_TRANSIT_ORBS = get_orb_profile(DEFAULT_ORB_PROFILE)
+
+# Aspect definitions with orbs (default profile) and energies
 ASPECTS: Dict[str, Dict[str, Union[int, float, str]]] = {
     "conjunction": {
         "angle": 0,
-        "orb": 8,
+        "orb": _TRANSIT_ORBS.orb("conjunction"),
         "energy": "intense",
         "type": "major",
     },
     "opposition": {
         "angle": 180,
-        "orb": 8,
+        "orb": _TRANSIT_ORBS.orb("opposition"),
         "energy": "challenging",
         "type": "major",
     },
-    "trine": {"angle": 120, "orb": 6, "energy": "harmonious", "type": "major"},
+    "trine": {
+        "angle": 120,
+        "orb": _TRANSIT_ORBS.orb("trine"),
+        "energy": "harmonious",
+        "type": "major",
+    },
     "square": {
         "angle": 90,
-        "orb": 6,
+        "orb": _TRANSIT_ORBS.orb("square"),
         "energy": "challenging",
         "type": "major",
     },
     "sextile": {
         "angle": 60,
-        "orb": 4,
+        "orb": _TRANSIT_ORBS.orb("sextile"),
         "energy": "supportive",
         "type": "major",
     },
     "quincunx": {
         "angle": 150,
-        "orb": 3,
+        "orb": _TRANSIT_ORBS.orb("quincunx"),
         "energy": "adjusting",
         "type": "minor",
     },
     "semi-sextile": {
         "angle": 30,
-        "orb": 2,
+        "orb": _TRANSIT_ORBS.orb("semi_sextile"),
         "energy": "subtle",
         "type": "minor",
     },
     "semi-square": {
         "angle": 45,
-        "orb": 2,
+        "orb": _TRANSIT_ORBS.orb("semi_square"),
         "energy": "tension",
         "type": "minor",
     },
     "sesquiquadrate": {
         "angle": 135,
-        "orb": 2,
+        "orb": _TRANSIT_ORBS.orb("sesquiquadrate"),
         "energy": "friction",
         "type": "minor",
     },
 }
 
+# Orb registry key for each aspect name above
+_REGISTRY_KEYS: Dict[str, str] = {
+    name: name.replace("-", "_") for name in ASPECTS
+}
+
 # Planet definitions
 PLANETS: Dict[str, Dict[str, Union[int, str]]] = {
     "sun": {"id": 0, "name": "Sun"},
@@ -194,6 +293,14 @@ if swe_available and swe:
         # SwissEph constants not available
         pass
 
+# Daily positions shared by every transit request, mmap-backed when
+# SKY_TABLE_PATH is set. _ephemeris_motion is looked up at call time.
+sky_table = SkyTable(
+    {name: int(data["id"]) for name, data in PLANETS.items()},
+    lambda jd, planet_id: _ephemeris_motion(jd, planet_id),
+    path=os.getenv("SKY_TABLE_PATH") or None,
+)
+
 # Lunar phases with degrees and descriptions
 LUNAR_PHASES: Dict[str, Dict[str, Union[int, Tuple[int, int], str]]] = {
     "new_moon": {
@@ -262,6 +369,16 @@ ZODIAC_SIGNS = [
     "Pisces",
 ]
 
+# Phases whose exact time replaces the daily phase label
+PRINCIPAL_PHASES = ("new_moon", "first_quarter", "full_moon", "last_quarter")
+
+# Exact phase and moon ingress times, cached per year-long window
+lunar_calendar = LunarCalendar(
+    lambda body, jds: _sample_planet_motion(body, jds),
+    {name: float(data["angle"]) for name, data in LUNAR_PHASES.items()},  # type: ignore[arg-type]  # noqa: E501
+    ZODIAC_SIGNS,
+)
+
 
 def init_swisseph() -> bool:
     """Initialize SwissEph with proper ephemeris path."""
@@ -301,43 +418,163 @@ def julian_day(dt: datetime) -> float:
         return jdn + (dt.hour - 12) / 24.0 + dt.minute / 1440.0
 
 
-def calculate_planet_position(jd: float, planet_id: int) -> Tuple[float, bool]:
-    """Calculate planet position for given Julian Day."""
-    if swe:
+def jd_to_datetime(jd: float) -> datetime:
+    """Convert a Julian Day to a naive UT datetime (to the second)."""
+    return datetime(2000, 1, 1, 12) + timedelta(
+        seconds=round((jd - 2451545.0) * 86400)
+    )
+
+
+def _consecutive_runs(
+    days: List[Tuple[datetime, str]],
+) -> List[List[Tuple[datetime, str]]]:
+    """Split ascending (day, key) pairs into runs of consecutive days."""
+    runs: List[List[Tuple[datetime, str]]] = []
+    for item in days:
+        if runs and item[0] - runs[-1][-1][0] == timedelta(days=1):
+            runs[-1].append(item)
+        else:
+            runs.append([item])
+    return runs
+
+
+def _days_between(start_date: datetime, end_date: datetime) -> List[datetime]:
+    """Daily samples from ``start_date`` through ``end_date``."""
+    days: List[datetime] = []
+    current_date = start_date
+    while current_date <= end_date:
+        days.append(current_date)
+        current_date += timedelta(days=1)
+    return days
+
+
+def _month_ranges(
+    start_date: datetime, end_date: datetime
+) -> List[Tuple[datetime, datetime]]:
+    """Split a daily range into (first, last) sample pairs per month."""
+    ranges: List[Tuple[datetime, datetime]] = []
+    for day in _days_between(start_date, end_date):
+        if ranges and (day.year, day.month) == (
+            ranges[-1][0].year,
+            ranges[-1][0].month,
+        ):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+def _stream_months(
+    months: Iterator[Tuple[str, List[Dict[str, Any]]]],
+    stream_format: str,
+    event: str,
+) -> StreamingResponse:
+    """Stream per-month result lists as NDJSON lines or SSE events.
+
+    NDJSON sends one result per line. SSE sends one ``event`` per result,
+    a ``month`` event after each month and a final ``end`` event. Errors
+    after streaming has started are sent in-band as ``{"error": ...}``.
+    """
+    sse = stream_format == "sse"
+
+    def lines() -> Iterator[bytes]:
+        count = 0
         try:
-            result, flag = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)  # type: ignore  # noqa: E501
-            longitude = float(result[0])  # type: ignore
-            speed = float(result[3])  # type: ignore
-            retrograde = speed < 0
-            return longitude, retrograde
+            for month, items in months:
+                for item in items:
+                    data = json.dumps(item, separators=(",", ":"))
+                    if sse:
+                        yield f"event: {event}\ndata: {data}\n\n".encode()
+                    else:
+                        yield (data + "\n").encode()
+                count += len(items)
+                if sse:
+                    progress = json.dumps({"month": month, "count": len(items)})  # noqa: E501
+                    yield f"event: month\ndata: {progress}\n\n".encode()
         except Exception as e:
-            logger.error(
-                f"SwissEph calculation error for planet {planet_id}: {e}"
-            )
-            return 0.0, False
+            logger.error(f"Streaming {event} results failed: {str(e)}")
+            error = json.dumps({"error": str(e)})
+            yield (
+                f"event: error\ndata: {error}\n\n" if sse else error + "\n"
+            ).encode()
+            return
+        if sse:
+            done = json.dumps({"count": count})
+            yield f"event: end\ndata: {done}\n\n".encode()
+
+    return StreamingResponse(
+        lines(), media_type=STREAM_MEDIA_TYPES[stream_format]
+    )
+
+
+def calculate_planet_motion(jd: float, planet_id: int) -> Tuple[float, float]:
+    """Calculate planet longitude and longitude speed (degrees/day)."""
+    if swe:
+        longitude, speed = _ephemeris_motion(jd, planet_id)
+        if math.isnan(longitude):
+            return 0.0, 0.0
+        return longitude, speed
     else:
         # Mock calculation for testing
         mock_position = (jd * planet_id * 0.1) % 360
-        return mock_position, False
+        return mock_position, planet_id * 0.1
+
+
+def _ephemeris_motion(jd: float, planet_id: int) -> Tuple[float, float]:
+    """Planet longitude and speed from SwissEph, or NaN if it is unavailable.
+
+    Used by the sky table, which only keeps blocks whose positions are all
+    finite, so a failed ephemeris call is retried instead of being stored.
+    """
+    if not swe:
+        return math.nan, math.nan
+    try:
+        result, flag = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)  # type: ignore  # noqa: E501
+        return float(result[0]), float(result[3])  # type: ignore
+    except Exception as e:
+        logger.error(f"SwissEph calculation error for planet {planet_id}: {e}")  # noqa: E501
+        return math.nan, math.nan
+
+
+def calculate_planet_position(jd: float, planet_id: int) -> Tuple[float, bool]:
+    """Calculate planet position for given Julian Day."""
+    longitude, speed = calculate_planet_motion(jd, planet_id)
+    return longitude, speed < 0
 
 
 def calculate_aspect(
-    pos1: float, pos2: float, orb: float = 2.0
+    pos1: float,
+    pos2: float,
+    orb: float = 2.0,
+    profile: str = DEFAULT_ORB_PROFILE,
+    planet1: Optional[str] = None,
+    planet2: Optional[str] = None,
+    speed1: Optional[float] = None,
+    speed2: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
-    """Calculate aspect between two planetary positions."""
+    """Calculate aspect between two planetary positions.
+
+    Orbs come from the named orb profile (scaled for ``planet1``/``planet2``
+    when given) and are capped at ``orb``. With both speeds the result
+    includes whether the aspect is applying.
+    """
     angle = abs(pos1 - pos2) % 360
     if angle > 180:
         angle = 360 - angle
 
+    orb_profile = get_orb_profile(profile)
     for aspect_name, aspect_data in ASPECTS.items():
         aspect_angle = float(aspect_data["angle"])
-        aspect_orb = min(float(aspect_data["orb"]), orb)
+        aspect_orb = min(
+            orb_profile.orb(_REGISTRY_KEYS[aspect_name], planet1, planet2),
+            orb,
+        )
 
-        if abs(angle - aspect_angle) <= aspect_orb:
+        if aspect_orb > 0 and abs(angle - aspect_angle) <= aspect_orb:
             orb_diff = abs(angle - aspect_angle)
             intensity = max(0, 100 - (orb_diff / aspect_orb) * 50)
 
-            return {
+            result: Dict[str, Any] = {
                 "aspect": aspect_name,
                 "angle": angle,
                 "orb": orb_diff,
@@ -345,6 +582,10 @@ def calculate_aspect(
                 "energy": str(aspect_data["energy"]),
                 "type": str(aspect_data["type"]),
             }
+            applying = is_applying(pos1, pos2, speed1, speed2, aspect_angle)
+            if applying is not None:
+                result["applying"] = applying
+            return result
 
     return None
 
@@ -453,29 +694,256 @@ async def get_sample_transits():
     }
 
 
-@router.post("/transits", response_model=List[TransitResult])
-async def calculate_transits(
-    request: TransitCalculationRequest, background_tasks: BackgroundTasks
-):
-    """Calculate planetary transits for given birth data and date range."""
-    try:
-        # Initialize SwissEph if needed
-        if not init_swisseph() and swe_available:
-            logger.warning(
-                "SwissEph initialization failed, using mock calculations"
+def _sample_planet_motion(
+    planet: str, jds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Longitudes and speeds of a planet at the given Julian Days.
+
+    Read from the shared sky table; the ephemeris is only called outside
+    its date range, or for mock positions when SwissEph is missing.
+    """
+    if swe and sky_table.covers(jds):
+        return sky_table.sample(planet, jds)
+    planet_id = int(PLANETS[planet]["id"])
+    motion = np.array(
+        [calculate_planet_motion(float(jd), planet_id) for jd in jds],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    return motion[:, 0], motion[:, 1]
+
+
+def _transit_orbs(
+    natal_planets: List[str],
+    aspect_names: List[str],
+    request: TransitCalculationRequest,
+) -> Dict[str, np.ndarray]:
+    """Per transiting planet, orbs over (natal planets, aspects)."""
+    profile = get_orb_profile(request.orb_profile)
+    return {
+        planet: np.array(
+            [
+                [
+                    min(
+                        profile.orb(_REGISTRY_KEYS[name], planet, natal),
+                        request.orb,
+                    )
+                    for name in aspect_names
+                ]
+                for natal in natal_planets
+            ],
+            dtype=np.float64,
+        )
+        for planet in PLANETS
+    }
+
+
+def _transits_for_days(
+    days: List[datetime],
+    natal_positions: Dict[str, float],
+    request: TransitCalculationRequest,
+) -> List[List[TransitResult]]:
+    """Transit-to-natal aspects for consecutive days of a request.
+
+    Uses the grid search of ``find_transit_hits``: each result carries the
+    exact time of the aspect and the length of its orb window.
+    """
+    aspect_names = [
+        name
+        for name, data in ASPECTS.items()
+        if request.include_minor_aspects or data["type"] != "minor"
+    ]
+    hits = find_transit_hits(
+        [julian_day(day) for day in days],
+        list(PLANETS),
+        natal_positions,
+        [float(ASPECTS[name]["angle"]) for name in aspect_names],
+        _transit_orbs(list(natal_positions), aspect_names, request),
+        _sample_planet_motion,
+    )
+
+    results: List[List[TransitResult]] = [[] for _ in days]
+    day_ids = [day.strftime("%Y%m%d") for day in days]
+    day_dates = [day.strftime("%Y-%m-%d") for day in days]
+    for hit in hits:
+        d = hit["day_index"]
+        transit_planet = hit["planet"]
+        natal_planet = hit["natal_planet"]
+        aspect = aspect_names[hit["aspect_index"]]
+        aspect_data = ASPECTS[aspect]
+        intensity = max(0, 100 - (hit["orb"] / hit["max_orb"]) * 50)
+        duration_days = max(1, math.ceil(hit["exit_jd"] - hit["entry_jd"]))
+        exact_jd = hit["exact_jd"]
+
+        results[d].append(
+            TransitResult(
+                id=f"{transit_planet}_{aspect}_{natal_planet}_{day_ids[d]}",
+                planet=str(PLANETS[transit_planet]["name"]),
+                aspect=aspect,
+                natal_planet=str(PLANETS[natal_planet]["name"]),
+                date=day_dates[d],
+                degree=hit["longitude"],
+                exact_time=(
+                    jd_to_datetime(exact_jd).strftime("%Y-%m-%dT%H:%M:%SZ")
+                    if exact_jd is not None
+                    else None
+                ),
+                orb=hit["orb"],
+                intensity=intensity,
+                energy=str(aspect_data["energy"]),
+                duration_days=duration_days,
+                # Natal positions are fixed, so their speed is zero
+                applying=is_applying(
+                    hit["longitude"],
+                    natal_positions[natal_planet],
+                    hit["speed"],
+                    0.0,
+                    float(aspect_data["angle"]),
+                ),
+                description=f"{PLANETS[transit_planet]['name']} {aspect} natal {PLANETS[natal_planet]['name']}",  # noqa: E501
             )
+        )
+    return results
+
+
+def transit_alerts(
+    index: NatalIndex,
+    day: datetime,
+    orb: float = 2.0,
+    orb_profile: str = DEFAULT_ORB_PROFILE,
+    include_minor_aspects: bool = False,
+) -> List[AlertGroup]:
+    """Transit-to-natal aspects in orb at ``day`` for every indexed user.
+
+    Orbs follow ``_transits_for_days``: the profile orb, capped at ``orb``.
+    Index natal positions as returned by ``calculate_natal_chart``.
+    """
+    jd = np.array([julian_day(day)], dtype=np.float64)
+    positions = {
+        planet: float(_sample_planet_motion(planet, jd)[0][0])
+        for planet in PLANETS
+    }
+    # Bodies the ephemeris could not place have no alerts
+    positions = {
+        planet: lon for planet, lon in positions.items() if math.isfinite(lon)
+    }
+    aspects = {
+        name: float(data["angle"])
+        for name, data in ASPECTS.items()
+        if include_minor_aspects or data["type"] != "minor"
+    }
+    profile = get_orb_profile(orb_profile)
+    return find_alerts(
+        index,
+        positions,
+        aspects,
+        lambda aspect, planet, natal: min(
+            profile.orb(_REGISTRY_KEYS[aspect], planet, natal), orb
+        ),
+    )
+
 
-        # Generate cache key
-        cache_key = get_cache_key(
-            "transits",
+def daily_transit_alerts(
+    charts: Iterable[Tuple[str, Mapping[str, Any]]],
+    day: datetime,
+    **options: Any,
+) -> List[Tuple[str, str, str, str, float]]:
+    """``transit_alerts`` rows (user, transit, aspect, natal, orb) for
+    saved natal charts, e.g. ``database.iter_natal_charts()``."""
+    index = load_natal_index(charts, list(PLANETS))
+    return list(iter_alerts(index, transit_alerts(index, day, **options)))
+
+
+def _parse_date_range(
+    date_range: DateRange, max_days: int, label: str
+) -> Tuple[datetime, datetime]:
+    """Parse a request date range; 400 on bad dates or range."""
+    try:
+        start_date = datetime.fromisoformat(date_range.start_date)
+        end_date = datetime.fromisoformat(date_range.end_date)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {str(e)}")
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="End date must be after start date"
+        )
+    if (end_date - start_date).days > max_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{label} cannot exceed {max_days} days",
+        )
+    return start_date, end_date
+
+
+def _validate_transit_request(
+    request: TransitCalculationRequest, max_days: int = 365
+) -> Tuple[datetime, datetime]:
+    """Check orb profile and date range; returns the parsed range."""
+    # Initialize SwissEph if needed
+    if not init_swisseph() and swe_available:
+        logger.warning(
+            "SwissEph initialization failed, using mock calculations"
+        )
+
+    try:
+        get_orb_profile(request.orb_profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _parse_date_range(request.date_range, max_days, "Date range")
+
+
+def _transit_payload(
+    request: TransitCalculationRequest,
+    start_date: datetime,
+    end_date: datetime,
+) -> List[Dict[str, Any]]:
+    """Serialized transit results for a range, served from the cache.
+
+    Results are cached per range and per day, so repeated requests and
+    overlapping ranges (e.g. month-by-month calendar views) only compute
+    the days not seen before.
+    """
+    # Generate cache key
+    key_options: Dict[str, Any] = {
+        "include_minor": request.include_minor_aspects,
+        "include_asteroids": request.include_asteroids,
+        "orb": request.orb,
+        "orb_profile": request.orb_profile,
+        "v": TRANSIT_CACHE_VERSION,
+    }
+    cache_key = get_cache_key(
+        "transits",
+        request.birth_data,
+        DateRange(
+            start_date=start_date.isoformat(), end_date=end_date.isoformat()
+        ),
+        **key_options,
+    )
+    logger.debug(f"Transit calculation cache key: {cache_key}")
+
+    cached = transit_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Per-day entries let overlapping ranges reuse computed days
+    days = _days_between(start_date, end_date)
+    day_keys = [
+        get_cache_key(
+            "transits_day",
             request.birth_data,
-            request.date_range,
-            include_minor=request.include_minor_aspects,
-            include_asteroids=request.include_asteroids,
-            orb=request.orb,
+            DateRange(start_date=day.isoformat(), end_date=day.isoformat()),
+            **key_options,
         )
-        logger.debug(f"Transit calculation cache key: {cache_key}")
+        for day in days
+    ]
+    day_results = transit_cache.get_many(day_keys)
 
+    missing = [
+        (day, key)
+        for day, key in zip(days, day_keys)
+        if key not in day_results
+    ]
+    if missing:
         # Calculate natal chart
         natal_positions = calculate_natal_chart(
             request.birth_data.birth_date,
@@ -489,68 +957,35 @@ async def calculate_transits(
                 status_code=500, detail="Failed to calculate natal chart"
             )
 
-        # Parse date range
-        start_date = datetime.fromisoformat(request.date_range.start_date)
-        end_date = datetime.fromisoformat(request.date_range.end_date)
-
-        # Validate date range
-        if (end_date - start_date).days > 365:
-            raise HTTPException(
-                status_code=400, detail="Date range cannot exceed 365 days"
+        computed: Dict[str, List[Dict[str, Any]]] = {}
+        for run in _consecutive_runs(missing):
+            run_results = _transits_for_days(
+                [day for day, _ in run], natal_positions, request
             )
+            for (_, key), day_items in zip(run, run_results):
+                computed[key] = [item.model_dump() for item in day_items]
+        transit_cache.set_many(computed)
+        day_results.update(computed)
+
+    logger.debug(
+        f"Transit days reused from cache: {len(days) - len(missing)}/{len(days)}"  # noqa: E501
+    )
+    payload = [item for key in day_keys for item in day_results[key]]
+    transit_cache.set(cache_key, payload)
+    return payload
 
-        results: List[TransitResult] = []
-        current_date = start_date
-
-        # Calculate transits day by day
-        while current_date <= end_date:
-            jd = julian_day(current_date)
-
-            # Calculate current planetary positions
-            current_positions: Dict[str, float] = {}
-            for planet_name, planet_data in PLANETS.items():
-                planet_id = int(planet_data["id"])
-                position, _ = calculate_planet_position(jd, planet_id)
-                current_positions[planet_name] = position
-
-            # Check aspects between transiting and natal planets
-            for transit_planet, transit_pos in current_positions.items():
-                for natal_planet, natal_pos in natal_positions.items():
-                    aspect_info = calculate_aspect(
-                        transit_pos, natal_pos, request.orb
-                    )
 
-                    if aspect_info:
-                        # Skip minor aspects if not requested
-                        if (
-                            not request.include_minor_aspects
-                            and aspect_info["type"] == "minor"
-                        ):
-                            continue
-
-                        # Calculate duration (simplified)
-                        duration_days = (
-                            3 if aspect_info["type"] == "major" else 1
-                        )
-
-                        result = TransitResult(
-                            id=f"{transit_planet}_{aspect_info['aspect']}_{natal_planet}_{current_date.strftime('%Y%m%d')}",  # noqa: E501
-                            planet=str(PLANETS[transit_planet]["name"]),
-                            aspect=aspect_info["aspect"],
-                            natal_planet=str(PLANETS[natal_planet]["name"]),
-                            date=current_date.strftime("%Y-%m-%d"),
-                            degree=transit_pos,
-                            orb=aspect_info["orb"],
-                            intensity=aspect_info["intensity"],
-                            energy=aspect_info["energy"],
-                            duration_days=duration_days,
-                            description=f"{PLANETS[transit_planet]['name']} {aspect_info['aspect']} natal {PLANETS[natal_planet]['name']}",  # noqa: E501
-                        )
-                        results.append(result)
-
-            current_date += timedelta(days=1)
-
-        return results
+@router.post("/transits", response_model=List[TransitResult])
+async def calculate_transits(
+    request: TransitCalculationRequest, background_tasks: BackgroundTasks
+):
+    """Calculate planetary transits for given birth data and date range."""
+    try:
+        start_date, end_date = _validate_transit_request(request)
+        return [
+            TransitResult(**item)
+            for item in _transit_payload(request, start_date, end_date)
+        ]
 
     except HTTPException:
         raise
@@ -561,62 +996,118 @@ async def calculate_transits(
         )
 
 
-@router.post("/lunar-transits", response_model=List[LunarTransitResult])
-async def calculate_lunar_transits(
-    request: LunarTransitRequest, background_tasks: BackgroundTasks
-):
-    """Calculate lunar transits and phases for given date range."""
-    try:
-        # Initialize SwissEph if needed
-        if not init_swisseph() and swe_available:
-            logger.warning(
-                "SwissEph initialization failed, using mock calculations"
+@router.post("/transits/stream")
+async def stream_transits(
+    request: TransitCalculationRequest,
+    stream_format: str = Query(
+        "ndjson", alias="format", enum=list(STREAM_MEDIA_TYPES)
+    ),
+) -> StreamingResponse:
+    """Stream transit results month by month as NDJSON or server-sent events.
+
+    Each month is computed (or read from the cache) and sent before the
+    next one starts, so clients can render early weeks of long ranges
+    immediately and the server never holds the whole result set.
+    """
+    start_date, end_date = _validate_transit_request(request)
+
+    def months() -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        for month_start, month_end in _month_ranges(start_date, end_date):
+            yield month_start.strftime("%Y-%m"), _transit_payload(
+                request, month_start, month_end
             )
 
-        # Parse date range
-        start_date = datetime.fromisoformat(request.date_range.start_date)
-        end_date = datetime.fromisoformat(request.date_range.end_date)
+    return _stream_months(months(), stream_format, "transit")
+
+
+def _validate_lunar_request(
+    request: LunarTransitRequest, max_days: int = 90
+) -> Tuple[datetime, datetime]:
+    """Check the lunar date range; returns the parsed range."""
+    # Initialize SwissEph if needed
+    if not init_swisseph() and swe_available:
+        logger.warning(
+            "SwissEph initialization failed, using mock calculations"
+        )
+
+    return _parse_date_range(
+        request.date_range, max_days, "Lunar transit date range"
+    )
 
-        # Validate date range
-        if (end_date - start_date).days > 90:
-            raise HTTPException(
-                status_code=400,
-                detail="Lunar transit date range cannot exceed 90 days",
-            )
 
-        results: List[LunarTransitResult] = []
-        current_date = start_date
-
-        # Calculate lunar transits day by day
-        while current_date <= end_date:
-            jd = julian_day(current_date)
-
-            # Get Sun and Moon positions
-            sun_id = int(PLANETS["sun"]["id"])
-            moon_id = int(PLANETS["moon"]["id"])
-            sun_pos, _ = calculate_planet_position(jd, sun_id)
-            moon_pos, _ = calculate_planet_position(jd, moon_id)
-
-            # Calculate lunar phase
-            phase_info = calculate_lunar_phase(sun_pos, moon_pos)
-            moon_sign = get_moon_sign(moon_pos)
-
-            # Create lunar transit result
-            result = LunarTransitResult(
-                phase=phase_info["phase"].replace("_", " ").title(),
-                date=current_date.strftime("%Y-%m-%d"),
-                exact_time=current_date.strftime("%H:%M:%S"),
-                energy=phase_info["energy"],
-                degree=moon_pos,
-                moon_sign=moon_sign,
-                intensity=phase_info["intensity"],
-                description=phase_info["description"],
+def _lunar_payload(
+    start_date: datetime, end_date: datetime
+) -> List[Dict[str, Any]]:
+    """Serialized lunar phase results, one per day.
+
+    Days with an exact new, quarter or full moon report that phase at its
+    exact time; other days report the phase at the start of the day.
+    """
+    days = _days_between(start_date, end_date)
+    jds = np.array([julian_day(day) for day in days], dtype=np.float64)
+    sun_lons, _ = _sample_planet_motion("sun", jds)
+    moon_lons, _ = _sample_planet_motion("moon", jds)
+    exact_phases = events_by_day(
+        [
+            event
+            for event in lunar_calendar.events(
+                float(jds[0]), float(jds[-1]) + 1.0, kinds=("phase",)
             )
-            results.append(result)
+            if event["name"] in PRINCIPAL_PHASES
+        ]
+        if days
+        else [],
+        jds,
+    )
+    results: List[Dict[str, Any]] = []
+
+    for d, (current_date, sun, moon) in enumerate(
+        zip(days, sun_lons, moon_lons)
+    ):
+        sun_pos, moon_pos = float(sun), float(moon)
+        exact_time = current_date.strftime("%H:%M:%S")
+
+        # Calculate lunar phase
+        phase_info = calculate_lunar_phase(sun_pos, moon_pos)
+        event = exact_phases.get(d)
+        if event is not None:
+            phase_data = LUNAR_PHASES[event["name"]]
+            moon_pos = event["moon_longitude"]
+            exact_time = jd_to_datetime(event["jd"]).strftime("%H:%M:%S")
+            phase_info = {
+                "phase": event["name"],
+                "intensity": 100,
+                "energy": str(phase_data["energy"]),
+                "description": str(phase_data["description"]),
+            }
+
+        results.append(
+            {
+                "phase": phase_info["phase"].replace("_", " ").title(),
+                "date": current_date.strftime("%Y-%m-%d"),
+                "exact_time": exact_time,
+                "energy": phase_info["energy"],
+                "degree": moon_pos,
+                "moon_sign": get_moon_sign(moon_pos),
+                "intensity": phase_info["intensity"],
+                "description": phase_info["description"],
+            }
+        )
 
-            current_date += timedelta(days=1)
+    return results
 
-        return results
+
+@router.post("/lunar-transits", response_model=List[LunarTransitResult])
+async def calculate_lunar_transits(
+    request: LunarTransitRequest, background_tasks: BackgroundTasks
+):
+    """Calculate lunar transits and phases for given date range."""
+    try:
+        start_date, end_date = _validate_lunar_request(request)
+        return [
+            LunarTransitResult(**item)
+            for item in _lunar_payload(start_date, end_date)
+        ]
 
     except HTTPException:
         raise
@@ -630,11 +1121,180 @@ async def calculate_lunar_transits(
         )
 
 
+@router.post("/lunar-transits/stream")
+async def stream_lunar_transits(
+    request: LunarTransitRequest,
+    stream_format: str = Query(
+        "ndjson", alias="format", enum=list(STREAM_MEDIA_TYPES)
+    ),
+) -> StreamingResponse:
+    """Stream lunar phase results month by month as NDJSON or SSE."""
+    start_date, end_date = _validate_lunar_request(request)
+
+    def months() -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        for month_start, month_end in _month_ranges(start_date, end_date):
+            yield month_start.strftime("%Y-%m"), _lunar_payload(
+                month_start, month_end
+            )
+
+    return _stream_months(months(), stream_format, "lunar_transit")
+
+
+@router.post("/lunar-events", response_model=List[LunarEventResult])
+async def calculate_lunar_events(request: LunarEventRequest):
+    """Exact lunar phase and moon ingress times in a date range."""
+    start_date, end_date = _parse_date_range(
+        request.date_range, MAX_LUNAR_EVENT_DAYS, "Lunar event date range"
+    )
+
+    kinds = ("phase", "ingress") if request.include_ingresses else ("phase",)
+    try:
+        events = lunar_calendar.events(
+            julian_day(start_date),
+            julian_day(end_date) + 1.0,
+            kinds=kinds,
+        )
+    except Exception as e:
+        logger.error(f"Lunar event calculation error: {str(e)}", exc_info=True)  # noqa: E501
+        raise HTTPException(
+            status_code=500,
+            detail=f"Lunar event calculation failed: {str(e)}",
+        )
+
+    results: List[LunarEventResult] = []
+    for event in events:
+        if event["kind"] == "phase":
+            name = event["name"].replace("_", " ").title()
+            description = str(LUNAR_PHASES[event["name"]]["description"])
+        else:
+            name = event["name"]
+            description = f"Moon enters {event['name']}"
+        results.append(
+            LunarEventResult(
+                event=event["kind"],
+                name=name,
+                exact_time=jd_to_datetime(event["jd"]).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                ),
+                degree=event["moon_longitude"],
+                moon_sign=get_moon_sign(event["moon_longitude"]),
+                description=description,
+            )
+        )
+    return results
+
+
+def _cached_lunar_payload(
+    start_date: datetime, end_date: datetime
+) -> List[Dict[str, Any]]:
+    """``_lunar_payload`` through the result cache (used by jobs)."""
+    key = f"lunar:{TRANSIT_CACHE_VERSION}:{start_date.isoformat()}:{end_date.isoformat()}"  # noqa: E501
+    cached = transit_cache.get(key)
+    if cached is None:
+        cached = _lunar_payload(start_date, end_date)
+        transit_cache.set(key, cached)
+    return cached
+
+
+def _submit_job(kind: str, chunks: List[Any]) -> TransitJobStatus:
+    try:
+        job = transit_jobs.submit(kind, chunks)
+    except ValueError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return TransitJobStatus(**job.to_dict())
+
+
+def _get_job(job_id: str) -> TransitJob:
+    job = transit_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transit job not found")
+    return job
+
+
+@router.post("/transits/jobs", response_model=TransitJobStatus, status_code=202)  # noqa: E501
+async def submit_transit_job(
+    request: TransitCalculationRequest,
+) -> TransitJobStatus:
+    """Start a background transit calculation of up to ten years.
+
+    The range is computed month by month on the job worker pool; months
+    already in the result cache are not recomputed.
+    """
+    start_date, end_date = _validate_transit_request(request, MAX_JOB_DAYS)
+    chunks = [
+        (
+            month_start.strftime("%Y-%m"),
+            lambda s=month_start, e=month_end: _transit_payload(request, s, e),  # noqa: E501
+        )
+        for month_start, month_end in _month_ranges(start_date, end_date)
+    ]
+    return _submit_job("transits", chunks)
+
+
+@router.post("/lunar-transits/jobs", response_model=TransitJobStatus, status_code=202)  # noqa: E501
+async def submit_lunar_transit_job(
+    request: LunarTransitRequest,
+) -> TransitJobStatus:
+    """Start a background lunar phase calculation of up to ten years."""
+    start_date, end_date = _validate_lunar_request(request, MAX_JOB_DAYS)
+    chunks = [
+        (
+            month_start.strftime("%Y-%m"),
+            lambda s=month_start, e=month_end: _cached_lunar_payload(s, e),
+        )
+        for month_start, month_end in _month_ranges(start_date, end_date)
+    ]
+    return _submit_job("lunar_transits", chunks)
+
+
+@router.get("/transits/jobs/{job_id}", response_model=TransitJobStatus)
+async def get_transit_job(job_id: str) -> TransitJobStatus:
+    """Status and progress of a background job."""
+    return TransitJobStatus(**_get_job(job_id).to_dict())
+
+
+@router.get("/transits/jobs/{job_id}/results")
+async def get_transit_job_results(job_id: str) -> List[Dict[str, Any]]:
+    """Results of a completed background job."""
+    job = _get_job(job_id)
+    if job.status != COMPLETED:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Transit job is {job.status}"
+            + (f": {job.error}" if job.error else ""),
+        )
+    return job.results()
+
+
+@router.get("/transits/jobs/{job_id}/stream")
+async def stream_transit_job(
+    job_id: str,
+    stream_format: str = Query(
+        "ndjson", alias="format", enum=list(STREAM_MEDIA_TYPES)
+    ),
+) -> StreamingResponse:
+    """Stream a job's results month by month as the months finish."""
+    job = _get_job(job_id)
+    event = "transit" if job.kind == "transits" else "lunar_transit"
+    # A failed or cancelled job ends the stream with an in-band error
+    return _stream_months(job.iter_chunks(), stream_format, event)
+
+
+@router.delete("/transits/jobs/{job_id}", response_model=TransitJobStatus)
+async def cancel_transit_job(job_id: str) -> TransitJobStatus:
+    """Cancel a background job; finished months stay cached."""
+    job = _get_job(job_id)
+    job.cancel()
+    return TransitJobStatus(**job.to_dict())
+
+
 @router.get("/aspects")
 async def get_aspect_definitions() -> Dict[str, Any]:
-    """Get all aspect definitions with angles and orbs."""
+    """Get all aspect definitions with angles, orbs and orb profiles."""
     return {
         "aspects": ASPECTS,
+        "orb_profiles": list_orb_profiles(),
+        "default_orb_profile": DEFAULT_ORB_PROFILE,
         "description": "Standard astrological aspects with orbs and energies",
     }
 
@@ -671,5 +1331,9 @@ async def transit_health_check() -> Dict[str, Any]:
             if swe_status
             else "unavailable" if swe_available else "not_installed"
         ),
+        "cache": transit_cache.stats(),
+        "sky_table": sky_table.stats(),
+        "lunar_calendar": lunar_calendar.stats(),
+        "jobs": transit_jobs.stats(),
         "timestamp": datetime.now().isoformat(),
     }
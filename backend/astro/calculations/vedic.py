@@ -1,9 +1,11 @@
 # backend/astro/calculations/vedic.py
 import logging
-from typing import Any, Dict, Final, List, Tuple
+from typing import Any, Dict, Final, List
 
 import swisseph as swe
 
+from .house_systems import calculate_houses
+
 # Type-safe constants for swisseph bodies
 SUN: Final[int] = 0
 MOON: Final[int] = 1
@@ -270,19 +272,11 @@ def calculate_vedic_houses(
     """Calculate Vedic house cusps (sidereal)"""
     try:
         ayanamsa = get_ayanamsa(julian_day)
-        houses_ex = getattr(swe, "houses_ex", None)
-
-        if not houses_ex:
-            logger.error("Swiss Ephemeris houses_ex function not available")
-            return {"houses": [], "angles": {}}
-
-        # Calculate tropical houses first
-        houses: Tuple[List[float], List[float]] = houses_ex(
-            julian_day, lat, lon, b"P"
-        )  # Placidus system
-        house_cusps: List[float] = houses[0]
-        ascendant: float = houses[1][0]
-        mc: float = houses[1][1]
+        # Tropical Placidus houses, shared with the western chart cache
+        houses = calculate_houses(julian_day, lat, lon, "P")
+        house_cusps: List[float] = [h["cusp"] for h in houses["houses"]]
+        ascendant: float = houses["angles"]["ascendant"]
+        mc: float = houses["angles"]["mc"]
 
         # Convert to sidereal
         vedic_houses: List[Dict[str, Any]] = []
@@ -7,7 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 from uuid import uuid4
 
 from dotenv import load_dotenv
@@ -162,9 +162,16 @@ def get_firestore_client():
 
 
 def save_chart(
-    user_id: str, chart_type: str, birth_data: BirthData, chart_data: ChartData
+    user_id: str,
+    chart_type: str,
+    birth_data: BirthData,
+    chart_data: ChartData,
+    discoverable: bool = False,
 ) -> ChartData:
-    """Optimized chart saving with validation"""
+    """Optimized chart saving with validation
+
+    ``discoverable`` charts are candidates in compatibility search.
+    """
 
     def _inner() -> ChartData:
         birth_date = f"{birth_data['year']}-{birth_data['month']:02d}-{birth_data['day']:02d}"  # noqa: E501
@@ -180,6 +187,7 @@ def save_chart(
                 "chart_type": chart_type,
                 "birth_data": birth_data,
                 "chart_data": chart_data,
+                "discoverable": discoverable,
                 "created_at": datetime.now().isoformat(),
                 "updated_at": datetime.now().isoformat(),
             }
@@ -201,6 +209,7 @@ def save_chart(
             "chart_type": chart_type,
             "birth_data": birth_data,
             "chart_data": chart_data,
+            "discoverable": discoverable,
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
         }
@@ -290,6 +299,48 @@ def get_charts(
         return []
 
 
+def iter_natal_charts(
+    discoverable_only: bool = False,
+    updated_since: Optional[str] = None,
+) -> Iterator[Tuple[str, ChartData]]:
+    """(user id, saved chart) for every user's natal charts.
+
+    Streams the whole store, for rebuilding in-process indexes such as
+    the natal alert index and, with ``discoverable_only``, the
+    compatibility index. ``updated_since`` (an ISO timestamp) limits it
+    to charts updated since then. On Firestore this is a collection group
+    query over ``charts``, served by the collection-group indexes
+    declared in ``firestore.indexes.json``.
+    """
+    if use_memory_db:
+        for user_id, charts_map in list(memory_store.items()):
+            for chart in list(charts_map.values()):
+                if (
+                    chart.get("chart_type") == "natal"
+                    and (chart.get("discoverable") or not discoverable_only)
+                    and (
+                        updated_since is None
+                        or chart.get("updated_at", "") >= updated_since
+                    )
+                ):
+                    yield user_id, chart
+        return
+    db_client = get_firestore_client()
+    assert db_client is not None
+    query = db_client.collection_group("charts").where("chart_type", "==", "natal")  # type: ignore[misc]  # noqa: E501
+    if discoverable_only:
+        query = query.where("discoverable", "==", True)  # type: ignore[misc]
+    if updated_since is not None:
+        query = query.where("updated_at", ">=", updated_since)  # type: ignore[misc]  # noqa: E501
+    count = 0
+    for doc in query.stream():  # type: ignore
+        chart: ChartData = cast(ChartData, doc.to_dict())  # type: ignore
+        chart["id"] = cast(str, doc.id)  # type: ignore
+        count += 1
+        yield cast(str, doc.reference.parent.parent.id), chart  # type: ignore  # noqa: E501
+    logger.info(f"Streamed {count} natal charts")
+
+
 def delete_chart_by_id(user_id: str, chart_id: str) -> bool:
     """Optimized chart deletion with validation"""
 
@@ -1,4 +1,5 @@
 # backend/main.py
+import asyncio
 import json
 import logging
 import os
@@ -6,7 +7,7 @@ import uuid
 import time  # moved earlier so middleware can use it
 from contextlib import suppress
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional
 
 
 # Enhanced environment loading with proper error handling
@@ -114,6 +115,11 @@ import sys  # noqa: E402
 from logging.handlers import RotatingFileHandler  # noqa: E402
 
 from astro.calculations.chart import calculate_chart  # noqa: E402
+from api.utils.house_formatting import (  # noqa: E402
+    house_systems_as_dict,
+    houses_as_dict,
+    parse_house_systems,
+)
 from astro.calculations.human_design import (  # noqa: E402
     calculate_human_design
 )
@@ -481,10 +487,16 @@ from contextlib import asynccontextmanager  # noqa: E402
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # suppress benign CancelledError on shutdown
+    from api.charts import refresh_compatibility_index
+
+    # Each worker keeps its own compatibility index, loaded from storage
+    refresher = asyncio.create_task(refresh_compatibility_index())
     try:
         yield
     except Exception as e:  # log unexpected lifespan errors
         logger.warning(f"Lifespan exception: {e}")
+    finally:
+        refresher.cancel()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -583,7 +595,9 @@ class ChartResponse(BaseModel):
     planets: Dict[str, Any]
     houses: Dict[str, Any]
     aspects: List[Any]
+    aspect_patterns: Optional[Dict[str, Any]] = None
     angles: Optional[Dict[str, Any]] = None
+    house_systems: Optional[Dict[str, Any]] = None
     systems: Optional[Dict[str, Any]] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
@@ -602,9 +616,15 @@ async def calculate(
     request: Request,
     background_tasks: BackgroundTasks,
     house_system: str = Query("P", enum=["P", "E"]),
+    house_systems: Optional[str] = Query(
+        None,
+        description="Comma-separated house systems to include alongside the chart, or 'all'",  # noqa: E501
+    ),
 ):
     await rate_limiter(request)
 
+    extra_systems = parse_house_systems(house_systems)
+
     # Debug: Log incoming request data
     print(
         f"🔍 Backend received data: lat={data.lat}, lon={data.lon}, timezone={data.timezone}, city={data.city}"  # noqa: E501
@@ -621,6 +641,8 @@ async def calculate(
             lon=data.lon,
             city=data.city,
             timezone=data.timezone or "UTC",
+            house_system=house_system,
+            house_systems=extra_systems,
         )
 
     if otel_tracer:
@@ -636,15 +658,8 @@ async def calculate(
         chart = _run_calc()
 
     # Convert houses list to dictionary format if needed
-    houses_data: Any = chart.get("houses", {})
-    if isinstance(houses_data, list):
-        # Convert list of houses to dictionary format
-        houses_dict: Dict[str, Any] = {}
-        houses_list = cast(List[Dict[str, Any]], houses_data)
-        for house in houses_list:
-            if "house" in house:
-                houses_dict[f"house_{house['house']}"] = house
-        houses_data = houses_dict
+    houses_data: Any = houses_as_dict(chart.get("houses", {}))
+    systems_data = house_systems_as_dict(chart.get("house_systems"))
 
     # Provide multi-system expansion in background if desired
     background_tasks.add_task(
@@ -654,7 +669,9 @@ async def calculate(
         planets=chart.get("planets", {}),
         houses=houses_data,
         aspects=chart.get("aspects", []),
+        aspect_patterns=chart.get("aspect_patterns"),
         angles=chart.get("angles"),
+        house_systems=systems_data,
         systems=chart.get("systems") if "systems" in chart else None,
         latitude=chart.get(
             "latitude"
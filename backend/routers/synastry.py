@@ -1,5 +1,5 @@
 # apps/backend/src/routers/synastry.py
-from typing import Dict, List, TypedDict
+from typing import Dict, List, Optional, TypedDict
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
@@ -53,6 +53,10 @@ from utils.compatibility_utils import (  # noqa: E402
 from utils.house_overlay_utils import (  # noqa: E402
     analyze_house_overlays, get_key_overlays
 )
+from utils.compatibility_index import compatibility_index  # noqa: E402
+from utils.synastry_batch import (  # noqa: E402
+    score_candidates, stack_longitudes, top_k
+)
 
 # Check if vectorized operations are available
 vectorized_available = False
@@ -85,19 +89,52 @@ except Exception:  # pragma: no cover - import failure
     SYN_LATENCY = None  # type: ignore
     SYN_CACHE = None  # type: ignore
 
-# Simple in-memory cache (lightweight; future: unify with Redis service)
 from typing import Any as _Any  # noqa: E402
 
-_syn_cache: dict[str, tuple[float, dict[str, _Any]]] = {}
+from utils.synastry_cache import SynastryCache, pair_key  # noqa: E402
+
 _CACHE_TTL = int(getenv("SYNASTRY_CACHE_TTL", "900"))  # 15 min default
 
 
-def _make_pair_key(p1: "BirthData", p2: "BirthData") -> str:
-    # Order-independent key using datetimes (fallback to date+time)
-    k1 = p1.datetime or f"{p1.date}T{p1.time}"
-    k2 = p2.datetime or f"{p2.date}T{p2.time}"
-    a, b = sorted([k1, k2])
-    return f"syn:{a}|{b}"
+def _record_cache_event(event: str) -> None:
+    if SYN_CACHE:
+        try:
+            SYN_CACHE.labels(event).inc()  # type: ignore
+        except Exception:
+            pass
+
+
+def _redis_client() -> _Any:
+    import redis  # type: ignore
+
+    return redis.Redis.from_url(  # type: ignore[attr-defined]
+        getenv("REDIS_URL", "redis://localhost:6379"),
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+    )
+
+
+# Bounded result cache; the Redis tier is shared by workers when
+# REDIS_URL is set
+_syn_cache = SynastryCache(
+    max_entries=int(getenv("SYNASTRY_CACHE_MAX_ENTRIES", "2048")),
+    max_bytes=int(getenv("SYNASTRY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl_seconds=_CACHE_TTL,
+    redis_client_factory=_redis_client if getenv("REDIS_URL") else None,
+    on_event=_record_cache_event,
+)
+
+
+def _make_pair_key(
+    p1: "BirthData", p2: "BirthData", use_vectorized: bool = False
+) -> str:
+    # Same UT moment and place give the same key, whatever the time zone;
+    # the vectorized path builds a differently shaped payload
+    return pair_key(
+        (julian_day_ut(p1), p1.latitude, p1.longitude),
+        (julian_day_ut(p2), p2.latitude, p2.longitude),
+        variant="vec" if use_vectorized else "std",
+    )
 
 
 class BirthData(BaseModel):
@@ -130,6 +167,50 @@ class SynastryResponse(BaseModel):
     summary: Summary
 
 
+# One-vs-many requests; candidate charts are computed per request
+MAX_BATCH_CANDIDATES = int(getenv("SYNASTRY_BATCH_MAX_CANDIDATES", "5000"))
+MAX_BATCH_TOP_K = 100
+
+
+class SynastryCandidate(BaseModel):
+    id: str
+    birth_data: BirthData
+
+
+class SynastryBatchRequest(BaseModel):
+    person1: BirthData
+    candidates: List[SynastryCandidate]
+    top_k: int = 10
+    include_details: bool = False
+
+
+class SynastryMatch(BaseModel):
+    id: str
+    rank: int
+    overall_score: float
+    aspect_score: float
+    overlay_bonus: float
+    aspect_type_counts: Dict[str, int]
+    details: Optional[SynastryResponse] = None
+
+
+class SynastryBatchResponse(BaseModel):
+    total_candidates: int
+    matches: List[SynastryMatch]
+
+
+class CompatibilitySearchRequest(BaseModel):
+    person1: BirthData
+    top_k: int = 10
+    exclude_user_ids: List[str] = []
+
+
+class CompatibilitySearchResponse(BaseModel):
+    total_candidates: int
+    scored_candidates: int
+    matches: List[SynastryMatch]
+
+
 def parse_datetime(birth_data: BirthData) -> datetime:
     """Parse birth data into datetime object."""
     try:
@@ -155,23 +236,27 @@ def parse_datetime(birth_data: BirthData) -> datetime:
         )
 
 
-def calculate_planets(
-    birth_data: BirthData,
-) -> tuple[Dict[str, float], List[float]]:
-    """Calculate planetary positions and house cusps for a birth chart."""
+def julian_day_ut(birth_data: BirthData) -> float:
+    """Julian Day (UT) of the birth moment."""
     dt = parse_datetime(birth_data)
 
     # Convert to UTC for SwissEph
     utc_dt = dt.astimezone(timezone.utc)
 
-    # Calculate Julian day
-    jd: float = swe.julday(  # type: ignore
+    return swe.julday(  # type: ignore
         utc_dt.year,
         utc_dt.month,
         utc_dt.day,  # type: ignore
         utc_dt.hour + utc_dt.minute / 60.0,
     )
 
+
+def calculate_planets(
+    birth_data: BirthData,
+) -> tuple[Dict[str, float], List[float]]:
+    """Calculate planetary positions and house cusps for a birth chart."""
+    jd = julian_day_ut(birth_data)
+
     # Calculate planetary positions
     planets: Dict[str, float] = {}
     planet_nums: Dict[str, int] = {
@@ -269,6 +354,84 @@ def get_relationship_purpose(sun_sign: str) -> str:
     return purposes.get(sun_sign, "To grow and learn together")
 
 
+def _synastry_response(
+    planets1: Dict[str, float],
+    cusps1: List[float],
+    planets2: Dict[str, float],
+    cusps2: List[float],
+    use_vectorized: bool = False,
+) -> "SynastryResponse":
+    """Full synastry analysis from both charts' positions and cusps."""
+    overlays = analyze_house_overlays(planets1, cusps2, planets2, cusps1)
+    if use_vectorized and vectorized_available:
+        from utils.aspect_arrays import (
+            compatibility_score_from_arrays,
+            key_aspects_from_arrays,
+            relationship_summary_from_arrays,
+        )
+        from utils.vectorized_aspect_utils import build_aspect_arrays_fast
+
+        # Array-native path: no per-cell aspect dicts
+        arrays = build_aspect_arrays_fast(planets1, planets2)
+        compatibility = compatibility_score_from_arrays(arrays, overlays)
+        summary = relationship_summary_from_arrays(arrays, overlays)
+        interaspects_raw = key_aspects_from_arrays(arrays)
+    else:
+        aspect_matrix = build_aspect_matrix(planets1, planets2)
+        compatibility = calculate_compatibility_score(aspect_matrix, overlays)
+        summary = generate_relationship_summary(aspect_matrix, overlays)
+        interaspects_raw = get_key_aspects(aspect_matrix)
+
+    # Process and validate data types
+    interaspects: List[AspectData] = []
+    for item in interaspects_raw:
+        aspect_data: AspectData = {
+            "planet1": str(item.get("planet1", "")),
+            "planet2": str(item.get("planet2", "")),
+            "aspect_type": str(item.get("aspect_type", "")),
+            "orb": float(item.get("orb", 0.0)),
+            "influence": str(item.get("influence", "")),
+        }
+        interaspects.append(aspect_data)
+
+    house_overlays_raw = get_key_overlays(overlays)
+    house_overlays: List[HouseOverlay] = []
+    for item in house_overlays_raw:
+        overlay_data: HouseOverlay = {
+            "planet": str(item.get("planet", "")),
+            "house": int(item.get("house", 0)),
+            "influence": str(item.get("influence", "")),
+            "strength": float(item.get("strength", 0.0)),
+        }
+        house_overlays.append(overlay_data)
+
+    # Ensure compatibility score matches our TypedDict
+    compatibility_data: CompatibilityScore = {
+        "overall": float(compatibility.get("overall", 0.0)),
+        "emotional": float(compatibility.get("emotional", 0.0)),
+        "communication": float(compatibility.get("communication", 0.0)),
+        "values": float(compatibility.get("values", 0.0)),
+        "activities": float(compatibility.get("activities", 0.0)),
+        "growth": float(compatibility.get("growth", 0.0)),
+    }
+
+    # Ensure summary matches our TypedDict
+    summary_data: Summary = {
+        "strengths": summary.get("strengths", []),
+        "challenges": summary.get("challenges", []),
+        "advice": summary.get("advice", []),
+    }
+    composite = calculate_composite_midpoints(planets1, planets2)
+
+    return SynastryResponse(
+        compatibility_analysis=compatibility_data,
+        interaspects=interaspects,
+        house_overlays=house_overlays,
+        composite_chart=composite,
+        summary=summary_data,
+    )
+
+
 @router.post("/calculate-synastry", response_model=SynastryResponse)
 async def calculate_synastry(
     request: SynastryRequest,
@@ -279,115 +442,136 @@ async def calculate_synastry(
     """Calculate comprehensive synastry analysis between two birth charts."""
     try:
         start_time = time.time()
-        cache_key = _make_pair_key(request.person1, request.person2)
+        cache_key = _make_pair_key(
+            request.person1, request.person2, use_vectorized
+        )
 
-        # Cache lookup
-        if _CACHE_TTL > 0 and cache_key in _syn_cache:
-            ts, payload = _syn_cache[cache_key]
-            if (time.time() - ts) <= _CACHE_TTL:
-                if SYN_CACHE:
-                    try:
-                        SYN_CACHE.labels("hit").inc()  # type: ignore
-                    except Exception:
-                        pass
+        # Cache lookup (hit/miss/expired events are counted by the cache)
+        if _CACHE_TTL > 0:
+            cached = _syn_cache.get(cache_key)
+            if cached is not None:
                 if SYN_COUNTER:
                     try:
                         SYN_COUNTER.labels("cache").inc()  # type: ignore
                     except Exception:
                         pass
-                return payload  # type: ignore[return-value]
-            else:
-                if SYN_CACHE:
-                    try:
-                        SYN_CACHE.labels("expired").inc()  # type: ignore
-                    except Exception:
-                        pass
-                _syn_cache.pop(cache_key, None)
-        else:
-            if SYN_CACHE:
-                try:
-                    SYN_CACHE.labels("miss").inc()  # type: ignore
-                except Exception:
-                    pass
+                return cached  # type: ignore[return-value]
 
         # Core calculations
         planets1, cusps1 = calculate_planets(request.person1)
         planets2, cusps2 = calculate_planets(request.person2)
+        response_obj = _synastry_response(
+            planets1, cusps1, planets2, cusps2, use_vectorized
+        )
 
-        if use_vectorized and vectorized_available:
-            from ..utils.vectorized_aspect_utils import (
-                build_aspect_matrix_fast,
-            )
+        if _CACHE_TTL > 0:
+            _syn_cache.set(cache_key, response_obj.model_dump())
 
-            aspect_matrix = build_aspect_matrix_fast(planets1, planets2)
-        else:
-            aspect_matrix = build_aspect_matrix(planets1, planets2)
+        if SYN_COUNTER:
+            try:
+                SYN_COUNTER.labels("success").inc()  # type: ignore
+            except Exception:
+                pass
+        if SYN_LATENCY:
+            try:
+                SYN_LATENCY.observe(time.time() - start_time)  # type: ignore
+            except Exception:
+                pass
 
-        overlays = analyze_house_overlays(planets1, cusps2, planets2, cusps1)
-        compatibility = calculate_compatibility_score(aspect_matrix, overlays)
-        summary = generate_relationship_summary(aspect_matrix, overlays)
+        return response_obj
+    except HTTPException:
+        if SYN_COUNTER:
+            try:
+                SYN_COUNTER.labels("client_error").inc()  # type: ignore
+            except Exception:
+                pass
+        raise
+    except Exception as e:
+        if SYN_COUNTER:
+            try:
+                SYN_COUNTER.labels("error").inc()  # type: ignore
+            except Exception:
+                pass
+        raise HTTPException(
+            status_code=500, detail=f"Unexpected error: {str(e)}"
+        )
 
-        # Process and validate data types
-        interaspects_raw = get_key_aspects(aspect_matrix)
-        interaspects: List[AspectData] = []
-        for item in interaspects_raw:
-            aspect_data: AspectData = {
-                "planet1": str(item.get("planet1", "")),
-                "planet2": str(item.get("planet2", "")),
-                "aspect_type": str(item.get("aspect_type", "")),
-                "orb": float(item.get("orb", 0.0)),
-                "influence": str(item.get("influence", "")),
-            }
-            interaspects.append(aspect_data)
-
-        house_overlays_raw = get_key_overlays(overlays)
-        house_overlays: List[HouseOverlay] = []
-        for item in house_overlays_raw:
-            overlay_data: HouseOverlay = {
-                "planet": str(item.get("planet", "")),
-                "house": int(item.get("house", 0)),
-                "influence": str(item.get("influence", "")),
-                "strength": float(item.get("strength", 0.0)),
-            }
-            house_overlays.append(overlay_data)
-
-        # Ensure compatibility score matches our TypedDict
-        compatibility_data: CompatibilityScore = {
-            "overall": float(compatibility.get("overall", 0.0)),
-            "emotional": float(compatibility.get("emotional", 0.0)),
-            "communication": float(compatibility.get("communication", 0.0)),
-            "values": float(compatibility.get("values", 0.0)),
-            "activities": float(compatibility.get("activities", 0.0)),
-            "growth": float(compatibility.get("growth", 0.0)),
-        }
 
-        # Ensure summary matches our TypedDict
-        summary_data: Summary = {
-            "strengths": summary.get("strengths", []),
-            "challenges": summary.get("challenges", []),
-            "advice": summary.get("advice", []),
-        }
-        composite = calculate_composite_midpoints(planets1, planets2)
-
-        response_obj = SynastryResponse(
-            compatibility_analysis=compatibility_data,
-            interaspects=interaspects,
-            house_overlays=house_overlays,
-            composite_chart=composite,
-            summary=summary_data,
+@router.post(
+    "/calculate-synastry/batch", response_model=SynastryBatchResponse
+)
+async def calculate_synastry_batch(request: SynastryBatchRequest):
+    """Rank many candidate charts by compatibility with one person.
+
+    Person 1's chart is computed once; candidate charts are stacked and
+    scored in one vectorized pass, ranked by the unclipped score total. Only the top ``top_k`` matches get the
+    full pairwise analysis, and only when ``include_details`` is set.
+    """
+    if not request.candidates:
+        raise HTTPException(status_code=400, detail="No candidates given")
+    if len(request.candidates) > MAX_BATCH_CANDIDATES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_CANDIDATES} candidates per request",
+        )
+    if not 1 <= request.top_k <= MAX_BATCH_TOP_K:
+        raise HTTPException(
+            status_code=400,
+            detail=f"top_k must be between 1 and {MAX_BATCH_TOP_K}",
         )
 
-        if _CACHE_TTL > 0:
-            _syn_cache[cache_key] = (time.time(), response_obj.model_dump())
-            if SYN_CACHE:
-                try:
-                    SYN_CACHE.labels("store").inc()  # type: ignore
-                except Exception:
-                    pass
+    try:
+        start_time = time.time()
+        planets1, cusps1 = calculate_planets(request.person1)
+
+        charts: List[tuple[Dict[str, float], List[float]]] = []
+        for candidate in request.candidates:
+            try:
+                charts.append(calculate_planets(candidate.birth_data))
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail=f"Candidate {candidate.id}: {e.detail}",
+                )
+
+        scores = score_candidates(
+            planets1,
+            stack_longitudes([planets for planets, _ in charts]),
+            cusps1,
+            [cusps for _, cusps in charts],
+        )
+
+        matches: List[SynastryMatch] = []
+        for rank, index in enumerate(
+            top_k(scores["total_score"], request.top_k), start=1
+        ):
+            planets2, cusps2 = charts[index]
+            matches.append(
+                SynastryMatch(
+                    id=request.candidates[index].id,
+                    rank=rank,
+                    overall_score=round(
+                        float(scores["overall_score"][index]), 1
+                    ),
+                    aspect_score=float(scores["aspect_score"][index]),
+                    overlay_bonus=float(scores["overlay_bonus"][index]),
+                    aspect_type_counts={
+                        name: int(scores[name][index])
+                        for name in ("harmonious", "challenging", "neutral")
+                    },
+                    details=(
+                        _synastry_response(
+                            planets1, cusps1, planets2, cusps2, True
+                        )
+                        if request.include_details
+                        else None
+                    ),
+                )
+            )
 
         if SYN_COUNTER:
             try:
-                SYN_COUNTER.labels("success").inc()  # type: ignore
+                SYN_COUNTER.labels("batch_success").inc()  # type: ignore
             except Exception:
                 pass
         if SYN_LATENCY:
@@ -396,7 +580,9 @@ async def calculate_synastry(
             except Exception:
                 pass
 
-        return response_obj
+        return SynastryBatchResponse(
+            total_candidates=len(request.candidates), matches=matches
+        )
     except HTTPException:
         if SYN_COUNTER:
             try:
@@ -415,8 +601,63 @@ async def calculate_synastry(
         )
 
 
+@router.post(
+    "/compatibility-search", response_model=CompatibilitySearchResponse
+)
+async def compatibility_search(request: CompatibilitySearchRequest):
+    """Most compatible charts among users who opted in to discovery.
+
+    Searches the in-process compatibility index; candidates whose score
+    bound cannot reach the current top ``top_k`` are never scored.
+    """
+    if not 1 <= request.top_k <= MAX_BATCH_TOP_K:
+        raise HTTPException(
+            status_code=400,
+            detail=f"top_k must be between 1 and {MAX_BATCH_TOP_K}",
+        )
+    try:
+        planets1, cusps1 = calculate_planets(request.person1)
+        result = compatibility_index.search(
+            planets1,
+            cusps1,
+            k=request.top_k,
+            exclude=request.exclude_user_ids,
+        )
+        return CompatibilitySearchResponse(
+            total_candidates=result["candidates"],
+            scored_candidates=result["scored"],
+            matches=[
+                SynastryMatch(
+                    id=match["user_id"],
+                    rank=match["rank"],
+                    overall_score=match["overall_score"],
+                    aspect_score=match["aspect_score"],
+                    overlay_bonus=match["overlay_bonus"],
+                    aspect_type_counts=match["aspect_type_counts"],
+                )
+                for match in result["matches"]
+            ],
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        if SYN_COUNTER:
+            try:
+                SYN_COUNTER.labels("error").inc()  # type: ignore
+            except Exception:
+                pass
+        raise HTTPException(
+            status_code=500, detail=f"Unexpected error: {str(e)}"
+        )
+
+
 # Health check endpoint
 @router.get("/health")
 async def health_check():
     """Health check for synastry service."""
-    return {"status": "healthy", "service": "synastry"}
+    return {
+        "status": "healthy",
+        "service": "synastry",
+        "cache": _syn_cache.stats(),
+        "compatibility_index": compatibility_index.stats(),
+    }
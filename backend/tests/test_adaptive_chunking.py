@@ -0,0 +1,119 @@
+"""Tests for adaptive chunk sizing in the memory-optimized calculator."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils import vectorized_memory_optimization as vmo  # noqa: E402
+from utils.aspect_utils import PLANETS  # noqa: E402
+from utils.vectorized_memory_optimization import (  # noqa: E402
+    AdaptiveChunkSizer,
+    MemoryOptimizedVectorizedCalculator,
+    cgroup_memory_headroom_mb,
+)
+
+MB = 1024 * 1024
+
+
+def _write(root, name: str, value: str) -> None:
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(value + "\n")
+
+
+def test_cgroup_headroom(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(vmo, "CGROUP_ROOT", str(tmp_path))
+    assert cgroup_memory_headroom_mb() is None
+
+    # cgroup v1 without a limit
+    _write(tmp_path, "memory/memory.limit_in_bytes", str(2**63 - 4096))
+    _write(tmp_path, "memory/memory.usage_in_bytes", str(100 * MB))
+    assert cgroup_memory_headroom_mb() is None
+
+    _write(tmp_path, "memory/memory.limit_in_bytes", str(300 * MB))
+    assert cgroup_memory_headroom_mb() == 200.0
+
+    # cgroup v2 takes precedence
+    _write(tmp_path, "memory.max", str(512 * MB))
+    _write(tmp_path, "memory.current", str(500 * MB))
+    assert cgroup_memory_headroom_mb() == 12.0
+    _write(tmp_path, "memory.max", "max")
+    assert cgroup_memory_headroom_mb() == 200.0
+
+
+def test_budget_follows_available_memory(monkeypatch: pytest.MonkeyPatch):
+    calculator = MemoryOptimizedVectorizedCalculator(max_memory_mb=1000.0)
+    monkeypatch.setattr(vmo, "available_memory_mb", lambda: 300.0)
+    assert calculator.memory_budget_mb() == 300.0 * vmo.MEMORY_HEADROOM
+    monkeypatch.setattr(vmo, "available_memory_mb", lambda: None)
+    assert calculator.memory_budget_mb() == 1000.0
+
+
+def test_sizer_fits_budget_and_follows_throughput():
+    budget = [1.0]
+    sizer = AdaptiveChunkSizer(
+        bytes_per_item=MB / 100,
+        budget_mb=lambda: budget[0],
+        initial_size=1000,
+        target_seconds=1.0,
+    )
+    assert sizer.next_size() == 100
+
+    # Fast chunks grow at most twofold per step, within the budget
+    budget[0] = 100.0
+    sizer.record(100, seconds=0.001, peak_increase_mb=0.0)
+    assert sizer.next_size() == 200
+    # Slow chunks shrink towards the target duration
+    sizer.record(200, seconds=4.0, peak_increase_mb=0.0)
+    assert sizer.next_size() == 100
+
+    # A measured footprint above the estimate lowers the memory cap
+    sizer.record(100, seconds=1.0, peak_increase_mb=50.0)
+    assert sizer.bytes_per_item == MB / 2
+    assert sizer.next_size() == 100
+    budget[0] = 10.0
+    assert sizer.next_size() == 20
+    assert [entry["size"] for entry in sizer.history] == [100, 200, 100]
+
+
+def test_adaptive_batches_match_fixed(monkeypatch: pytest.MonkeyPatch):
+    rng = np.random.default_rng(0)
+    pairs = [
+        (
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+        )
+        for _ in range(40)
+    ]
+    fixed = MemoryOptimizedVectorizedCalculator(
+        chunk_size=7, adaptive_chunking=False
+    )
+    adaptive = MemoryOptimizedVectorizedCalculator(chunk_size=3)
+    progress = []
+    expected = fixed.calculate_large_batch_aspects(pairs)
+    result = adaptive.calculate_large_batch_aspects(
+        pairs, progress_callback=lambda *update: progress.append(update)
+    )
+    assert result == expected
+    assert progress[-1] == (100.0, 40, 40)
+
+    stats = adaptive.get_stats()
+    assert stats["chunk_sizes"][0] == 3
+    assert sum(stats["chunk_sizes"]) == 40
+    assert "chunk_sizes" not in fixed.get_stats()
+
+    # Separation grids shrink to fit a small budget
+    monkeypatch.setattr(vmo, "available_memory_mb", lambda: None)
+    adaptive.max_memory_mb = 100 * adaptive.dtypes.bytes_per_cell() * 4 / MB
+    charts = [pair[0] for pair in pairs[:5]]
+    shapes = [
+        grid.shape[:2]
+        for grid in adaptive.calculate_separation_matrix_chunked(
+            charts, charts
+        )
+    ]
+    assert shapes[0] == (2, 2) and len(shapes) == 9
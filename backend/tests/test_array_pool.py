@@ -0,0 +1,123 @@
+"""Tests for the bucketed array pool and its use by the vectorized kernels."""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.aspect_utils import PLANETS  # noqa: E402
+from utils import vectorized_aspect_utils  # noqa: E402
+from utils.vectorized_aspect_utils import vectorized_calculator  # noqa: E402
+from utils.vectorized_composite_utils import (  # noqa: E402
+    VectorizedCompositeCalculator,
+)
+from utils.vectorized_memory_optimization import (  # noqa: E402
+    SimpleArrayPool,
+    get_global_memory_pool,
+)
+
+
+def test_hits_misses_and_bytes_saved():
+    pool = SimpleArrayPool()
+    with pool.borrow((4, 4)) as first:
+        first.fill(7)
+    with pool.borrow((4, 4)) as second:
+        assert second is first and not second.any()
+    with pool.borrow((4, 4), np.float32):
+        pass
+
+    stats = pool.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["bytes_saved"] == first.nbytes
+    assert stats["hit_rate"] == 1 / 3
+    assert stats["buckets"] == 2 and stats["arrays_in_use"] == 0
+    assert stats["pooled_bytes"] == first.nbytes + 4 * 4 * 4
+
+
+def test_bucket_limits():
+    pool = SimpleArrayPool(max_arrays=3, max_bucket_bytes=2 * 800)
+    arrays = [pool.get_array((10, 10)) for _ in range(3)]
+    assert [pool.return_array(a) for a in arrays] == [True, True, False]
+    assert pool.get_stats()["arrays_dropped"] == 1
+
+    # Views and arrays already idle in the pool are not taken back
+    big = pool.get_array((20, 10))
+    assert not pool.return_array(big[:10])
+    assert not pool.return_array(arrays[0])
+    assert pool.get_stats()["pooled_bytes"] == 2 * 800
+
+    total = SimpleArrayPool(max_total_bytes=1000)
+    a, b = total.get_array((10, 10)), total.get_array((30,))
+    assert total.return_array(a) and not total.return_array(b)
+
+
+def test_threads_never_share_an_array():
+    pool = SimpleArrayPool()
+    borrowed = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(200):
+            with pool.borrow((64,), zero=False) as array:
+                with lock:
+                    assert all(array is not other for other in borrowed)
+                    borrowed.append(array)
+                with lock:
+                    borrowed.remove(array)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = pool.get_stats()
+    assert stats["hits"] + stats["misses"] == 1600
+    assert stats["misses"] <= 8 and stats["arrays_in_use"] == 0
+
+
+def test_kernels_reuse_pooled_temporaries():
+    pool = get_global_memory_pool()
+    rng = np.random.default_rng(0)
+    long1 = rng.uniform(0, 360, (300, len(PLANETS)))
+    long2 = rng.uniform(0, 360, (300, len(PLANETS)))
+    expected = vectorized_calculator.score_pairs(long1, long2)
+
+    before = pool.get_stats()
+    for _ in range(2):
+        scores, counts = vectorized_calculator.score_pairs(long1, long2)
+        np.testing.assert_array_equal(scores, expected[0])
+        np.testing.assert_array_equal(counts, expected[1])
+    composite = VectorizedCompositeCalculator("accurate")
+    for _ in range(2):
+        composite._calculate_midpoints_vectorized(
+            rng.uniform(0, 360, (1000, 11))
+        )
+    after = pool.get_stats()
+    # Eight score buffers and two composite buffers per repeat
+    assert after["hits"] - before["hits"] >= 10
+    assert after["arrays_in_use"] == before["arrays_in_use"]
+
+
+def test_small_batches_borrow_small_buffers(monkeypatch: pytest.MonkeyPatch):
+    shapes = []
+    borrow = vectorized_aspect_utils.scratch_array
+
+    def recording(stack, shape, dtype):
+        shapes.append(shape)
+        return borrow(stack, shape, dtype)
+
+    monkeypatch.setattr(vectorized_aspect_utils, "scratch_array", recording)
+    rng = np.random.default_rng(1)
+    for count in (3, 0):
+        shapes.clear()
+        vectorized_calculator.score_pairs(
+            rng.uniform(0, 360, (count, len(PLANETS))),
+            rng.uniform(0, 360, (count, len(PLANETS))),
+        )
+        assert {shape[0] for shape in shapes} == {max(count, 1)}
@@ -0,0 +1,99 @@
+"""Tests for array-native aspect matrices and their consumers."""
+
+import os
+import random
+import sys
+from typing import Dict
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.aspect_arrays import (  # noqa: E402
+    NO_TYPE,
+    compatibility_score_from_arrays,
+    key_aspects_from_arrays,
+    relationship_summary_from_arrays,
+)
+from utils.aspect_utils import (  # noqa: E402
+    PLANETS,
+    build_aspect_matrix,
+    get_key_aspects,
+)
+from utils.compatibility_utils import (  # noqa: E402
+    calculate_compatibility_score,
+    generate_relationship_summary,
+)
+from utils.vectorized_aspect_utils import (  # noqa: E402
+    build_aspect_arrays_fast,
+    build_aspect_matrix_fast,
+)
+
+
+def _chart(rng: random.Random) -> Dict[str, float]:
+    return {p: rng.uniform(0, 360) for p in PLANETS}
+
+
+def _overlays(rng: random.Random):
+    def houses():
+        return {
+            p: {"house": rng.randint(1, 12)} for p in ["venus", "mars", "moon"]
+        }
+
+    return {"p1_in_p2": houses(), "p2_in_p1": houses()}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_array_consumers_match_dict_matrix(seed: int):
+    rng = random.Random(seed)
+    for _ in range(100):
+        long1, long2 = _chart(rng), _chart(rng)
+        overlays = _overlays(rng)
+        matrix = build_aspect_matrix(long1, long2)
+        arrays = build_aspect_arrays_fast(long1, long2)
+
+        assert key_aspects_from_arrays(arrays) == get_key_aspects(matrix)
+        assert relationship_summary_from_arrays(
+            arrays, overlays
+        ) == generate_relationship_summary(matrix, overlays)
+
+        expected = calculate_compatibility_score(matrix, overlays)
+        result = compatibility_score_from_arrays(arrays, overlays)
+        assert result["breakdown"] == pytest.approx(expected["breakdown"])
+        del result["breakdown"], expected["breakdown"]
+        assert result == expected
+
+
+def test_to_matrix_round_trips_the_dict_format():
+    rng = random.Random(9)
+    long1, long2 = _chart(rng), _chart(rng)
+    arrays = build_aspect_arrays_fast(long1, long2)
+    assert arrays.to_matrix() == build_aspect_matrix_fast(long1, long2)
+    assert arrays.to_matrix() == build_aspect_matrix(long1, long2)
+
+    # Cells without an aspect carry no type and an infinite orb
+    assert np.all((arrays.type == NO_TYPE) == ~arrays.valid)
+    assert np.all(np.isinf(arrays.orb[~arrays.valid]))
+
+
+def test_consumers_handle_an_empty_grid():
+    arrays = build_aspect_arrays_fast(
+        {p: 0.0 for p in PLANETS}, {p: 0.0 for p in PLANETS}
+    )
+    empty = arrays._replace(
+        valid=np.zeros_like(arrays.valid),
+        orb=np.full_like(arrays.orb, np.inf),
+        type=np.full_like(arrays.type, NO_TYPE),
+    )
+    assert key_aspects_from_arrays(empty) == []
+    assert relationship_summary_from_arrays(
+        empty
+    ) == generate_relationship_summary(empty.to_matrix())
+    score = compatibility_score_from_arrays(empty)
+    assert score == calculate_compatibility_score(empty.to_matrix())
+    assert score["meta"]["aspect_type_counts"] == {
+        "harmonious": 0,
+        "challenging": 0,
+        "neutral": 0,
+    }
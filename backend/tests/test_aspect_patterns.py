@@ -0,0 +1,187 @@
+"""Tests for bitset-based aspect pattern detection."""
+
+import itertools
+import os
+import random
+import sys
+from collections import Counter
+from typing import Any, Dict, List, Set, Tuple
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations.ai_interpretations import (  # noqa: E402
+    analyze_integration_themes,
+)
+from astro.calculations.aspect_patterns import (  # noqa: E402
+    analyze_aspect_patterns,
+    detect_aspect_patterns,
+    get_aspect_patterns,
+)
+from astro.calculations.aspects import calculate_aspects_fast  # noqa: E402
+from astro.calculations.pdf_export import create_chart_pdf  # noqa: E402
+
+ASPECT_NAMES = ["Trine", "Square", "Opposition", "Sextile", "Quincunx"]
+
+
+def _aspect(p1: str, p2: str, name: str, orb: float = 1.0) -> Dict[str, Any]:
+    return {"point1": p1, "point2": p2, "aspect": name, "orb": orb}
+
+
+def _kinds(patterns: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+    return sorted(
+        (p["type"], (frozenset(p["planets"]), p["apex"])) for p in patterns
+    )
+
+
+def test_grand_trine_and_kite():
+    aspects = [
+        _aspect("sun", "jupiter", "Trine", 1.0),
+        _aspect("jupiter", "neptune", "Trine", 2.5),
+        _aspect("sun", "neptune", "Trine", 0.5),
+        _aspect("mars", "sun", "Opposition", 1.5),
+        _aspect("mars", "jupiter", "Sextile", 0.2),
+        _aspect("mars", "neptune", "Sextile", 3.0),
+    ]
+    patterns = detect_aspect_patterns(aspects)
+    assert [p["type"] for p in patterns] == ["grand_trine", "kite"]
+    grand_trine, kite = patterns
+    assert set(grand_trine["planets"]) == {"sun", "jupiter", "neptune"}
+    assert grand_trine["max_orb"] == 2.5
+    assert kite["apex"] == "mars"
+    assert kite["max_orb"] == 3.0
+
+
+def test_t_square_and_grand_cross():
+    aspects = [
+        _aspect("sun", "moon", "Opposition"),
+        _aspect("mars", "saturn", "Opposition"),
+        _aspect("sun", "mars", "Square"),
+        _aspect("sun", "saturn", "Square"),
+        _aspect("moon", "mars", "Square"),
+        _aspect("moon", "saturn", "Square", 4.0),
+    ]
+    patterns = detect_aspect_patterns(aspects)
+    t_squares = [p for p in patterns if p["type"] == "t_square"]
+    crosses = [p for p in patterns if p["type"] == "grand_cross"]
+    assert sorted(p["apex"] for p in t_squares) == [
+        "mars", "moon", "saturn", "sun",
+    ]  # fmt: skip
+    assert len(crosses) == 1
+    assert set(crosses[0]["planets"]) == {"sun", "moon", "mars", "saturn"}
+    assert crosses[0]["max_orb"] == 4.0
+
+
+def test_yod_uses_lowercase_names_too():
+    aspects = [
+        _aspect("venus", "saturn", "sextile"),
+        _aspect("venus", "pluto", "quincunx"),
+        _aspect("saturn", "pluto", "quincunx"),
+    ]
+    (yod,) = detect_aspect_patterns(aspects)
+    assert yod["type"] == "yod"
+    assert yod["apex"] == "pluto"
+
+
+def _brute_force(aspects: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+    edges: Dict[str, Set[frozenset]] = {n.lower(): set() for n in ASPECT_NAMES}
+    bodies: Set[str] = set()
+    for a in aspects:
+        edges[a["aspect"].lower()].add(frozenset((a["point1"], a["point2"])))
+        bodies.update((a["point1"], a["point2"]))
+
+    def has(kind: str, x: str, y: str) -> bool:
+        return frozenset((x, y)) in edges[kind]
+
+    found: List[Tuple[str, Any]] = []
+    for x, y, z in itertools.combinations(sorted(bodies), 3):
+        if has("trine", x, y) and has("trine", y, z) and has("trine", x, z):
+            found.append(("grand_trine", (frozenset((x, y, z)), None)))
+            for v, (p, q) in ((x, (y, z)), (y, (x, z)), (z, (x, y))):
+                for d in bodies:
+                    if (
+                        has("opposition", v, d)
+                        and has("sextile", p, d)
+                        and has("sextile", q, d)
+                    ):
+                        found.append(("kite", (frozenset((x, y, z, d)), d)))
+        for apex, (p, q) in ((x, (y, z)), (y, (x, z)), (z, (x, y))):
+            if has("opposition", p, q) and has("square", apex, p) and has(
+                "square", apex, q
+            ):
+                found.append(("t_square", (frozenset((x, y, z)), apex)))
+            if has("sextile", p, q) and has("quincunx", apex, p) and has(
+                "quincunx", apex, q
+            ):
+                found.append(("yod", (frozenset((x, y, z)), apex)))
+    for quad in itertools.combinations(sorted(bodies), 4):
+        for a, b, c, d in (
+            (quad[0], quad[1], quad[2], quad[3]),
+            (quad[0], quad[2], quad[1], quad[3]),
+            (quad[0], quad[3], quad[1], quad[2]),
+        ):
+            if (
+                has("opposition", a, b)
+                and has("opposition", c, d)
+                and all(has("square", s, t) for s in (a, b) for t in (c, d))
+            ):
+                found.append(("grand_cross", (frozenset(quad), None)))
+    return sorted(found)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_brute_force_search(seed: int):
+    rng = random.Random(seed)
+    bodies = [f"b{i}" for i in range(12)]
+    aspects = [
+        _aspect(p, q, rng.choice(ASPECT_NAMES), rng.uniform(0, 5))
+        for p, q in itertools.combinations(bodies, 2)
+        if rng.random() < 0.45
+    ]
+    assert _kinds(detect_aspect_patterns(aspects)) == _brute_force(aspects)  # type: ignore[arg-type]  # noqa: E501
+
+
+def test_counts_match_aspect_list():
+    rng = random.Random(7)
+    planets = {
+        b: {"position": rng.uniform(0, 360), "retrograde": False}
+        for b in ["sun", "moon", "mercury", "venus", "mars", "jupiter"]
+    }
+    aspects = calculate_aspects_fast(planets)
+    summary = analyze_aspect_patterns(aspects)
+    expected = Counter(
+        point for aspect in aspects for point in (aspect["point1"], aspect["point2"])  # noqa: E501
+    )
+    assert summary["planet_aspect_counts"] == dict(expected)
+
+
+def test_attached_patterns_are_reused(monkeypatch: pytest.MonkeyPatch):
+    summary = {
+        "patterns": [
+            {"type": "yod", "planets": ["venus", "saturn", "pluto"],
+             "apex": "pluto", "max_orb": 1.0},
+        ],
+        "planet_aspect_counts": {"venus": 2, "saturn": 2, "pluto": 2},
+    }  # fmt: skip
+    chart = {"planets": {}, "aspects": [], "aspect_patterns": summary}
+    assert get_aspect_patterns(chart) is summary
+
+    themes = analyze_integration_themes(chart)
+    assert themes["aspect_configurations"] == summary["patterns"]
+    assert themes["focal_planets"]["most_aspected"][0][1] == 2
+
+
+def test_pdf_includes_pattern_table():
+    aspects = [
+        _aspect("sun", "jupiter", "Trine"),
+        _aspect("jupiter", "neptune", "Trine"),
+        _aspect("sun", "neptune", "Trine"),
+    ]
+    chart = {
+        "planets": {"sun": {"position": 10.0, "retrograde": False}},
+        "houses": [],
+        "aspects": aspects,
+        "aspect_patterns": analyze_aspect_patterns(aspects),
+    }
+    assert create_chart_pdf(chart)  # type: ignore[arg-type]
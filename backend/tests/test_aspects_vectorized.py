@@ -0,0 +1,91 @@
+"""Parity tests for the vectorized natal aspect engine."""
+
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations.aspects import (  # noqa: E402
+    calculate_aspects,
+    calculate_aspects_fast,
+    get_house_for_planet,
+    get_houses_for_positions,
+)
+
+BODIES = [
+    "sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn",
+    "uranus", "neptune", "pluto", "chiron", "ceres", "pallas", "juno", "vesta",
+]  # fmt: skip
+
+
+def _planets(seed: int) -> Dict[str, Dict[str, Any]]:
+    rng = random.Random(seed)
+    return {
+        b: {"position": rng.uniform(0, 360), "retrograde": False}
+        for b in BODIES
+    }
+
+
+def _houses(seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = rng.uniform(0, 360)
+    widths = [rng.uniform(15, 45) for _ in range(12)]
+    scale = 360 / sum(widths)
+    cusps: List[Dict[str, Any]] = []
+    position = start
+    for i, width in enumerate(widths):
+        cusps.append({"house": i + 1, "cusp": position % 360})
+        position += width * scale
+    return cusps
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_aspects_match_loop_implementation(seed: int):
+    planets = _planets(seed)
+    assert calculate_aspects_fast(planets) == calculate_aspects(planets)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_aspects_with_houses_match(seed: int):
+    planets = _planets(seed)
+    houses = _houses(seed + 100)
+    assert calculate_aspects_fast(planets, houses) == calculate_aspects(
+        planets, houses
+    )
+
+
+def test_exact_and_boundary_orbs():
+    planets = {
+        "a": {"position": 0.0},
+        "b": {"position": 180.0},
+        "c": {"position": 358.0},
+        "d": {"position": 98.0},
+        "e": {"position": 60.0},
+    }
+    assert calculate_aspects_fast(planets) == calculate_aspects(planets)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_house_lookup_matches_linear_scan(seed: int):
+    houses = _houses(seed)
+    rng = random.Random(seed)
+    positions = [rng.uniform(0, 360) for _ in range(200)]
+    positions += [h["cusp"] for h in houses]  # exact cusp hits
+    expected = [get_house_for_planet(p, houses) for p in positions]
+    assert get_houses_for_positions(positions, houses) == expected
+
+
+def test_house_lookup_degenerate_cusps_fall_back():
+    houses = [{"house": i + 1, "cusp": 0.0 if i < 2 else i * 30.0} for i in range(12)]  # noqa: E501
+    positions = [0.0, 15.0, 200.0, 359.0]
+    expected = [get_house_for_planet(p, houses) for p in positions]
+    assert get_houses_for_positions(positions, houses) == expected
+
+
+def test_missing_position_raises_value_error():
+    with pytest.raises(ValueError, match="Error in aspect calculation"):
+        calculate_aspects_fast({"sun": {"position": 1.0}, "moon": {}})
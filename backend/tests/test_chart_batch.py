@@ -0,0 +1,140 @@
+"""Tests for bulk chart calculation (astro.calculations.chart_batch)."""
+
+import asyncio
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+import numpy as np
+import swisseph as swe  # type: ignore
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import astro.calculations.chart_batch as chart_batch  # noqa: E402
+from api.routers.calculations import (  # noqa: E402
+    BatchChartRequest,
+    BirthData,
+    calculate_charts_batch_endpoint,
+)
+from astro.calculations.chart import calculate_chart  # noqa: E402
+
+TIMEZONES = ["UTC", "America/New_York", "Europe/London", "Asia/Kolkata"]
+
+
+def _records(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "year": rng.randint(1900, 2100),
+            "month": rng.randint(1, 12),
+            "day": rng.randint(1, 28),
+            "hour": rng.randint(0, 23),
+            "minute": rng.randint(0, 59),
+            "lat": rng.uniform(-60, 60),
+            "lon": rng.uniform(-179, 179),
+            "timezone": rng.choice(TIMEZONES),
+            "city": "Test",
+        }
+        for _ in range(n)
+    ]
+
+
+def test_julian_days_match_utc_to_jd():
+    years = np.array([1900, 1972, 1990, 2016, 2024, 2100])
+    ones = np.ones_like(years)
+    jds = chart_batch.julian_days_from_local(
+        years, ones * 6, ones * 15, ones * 14, ones * 30, ones * 0.0
+    )
+    for year, jd in zip(years.tolist(), jds.tolist()):
+        expected = swe.utc_to_jd(year, 6, 15, 14, 30, 0, 1)[1]
+        assert abs(jd - expected) * 86400 < 0.01
+
+
+def test_batch_matches_single_chart():
+    records = _records(40)
+    results = chart_batch.calculate_charts_batch(records, chunk_size=16)
+    assert len(results) == len(records)
+
+    for record, batch in zip(records, results):
+        single = calculate_chart(
+            record["year"],
+            record["month"],
+            record["day"],
+            record["hour"],
+            record["minute"],
+            record["lat"],
+            record["lon"],
+            record["timezone"],
+            record["city"],
+        )
+        assert abs(batch["julian_day"] - single["julian_day"]) < 1e-6
+        assert batch["planets"] == single["planets"]
+        assert [a["aspect"] for a in batch["aspects"]] == [
+            a["aspect"] for a in single["aspects"]
+        ]
+        for h1, h2 in zip(batch["houses"], single["houses"]):
+            assert abs(h1["cusp"] - h2["cusp"]) < 1e-3
+
+
+def test_locations_geocoded_once_per_city(monkeypatch):
+    calls: List[str] = []
+
+    def fake_location(city: str) -> Dict[str, Any]:
+        calls.append(city)
+        if city == "Nowhere":
+            raise ValueError("Could not geocode city: Nowhere")
+        return {"latitude": 51.5, "longitude": -0.12, "timezone": "Europe/London"}  # noqa: E501
+
+    monkeypatch.setattr(chart_batch, "get_location", fake_location)
+    records = _records(6)
+    for record in records:
+        record.update(lat=None, lon=None, city="London")
+    records[2]["city"] = "Nowhere"
+    records[4]["city"] = "Nowhere"
+
+    results = chart_batch.calculate_charts_batch(records, chunk_size=2)
+
+    assert sorted(calls) == ["London", "Nowhere"]
+    assert "error" in results[2] and "error" in results[4]
+    assert results[0]["timezone"] == "Europe/London"
+    assert results[5]["latitude"] == 51.5
+
+
+def test_invalid_record_does_not_fail_batch():
+    records = _records(3)
+    records[1]["timezone"] = "Mars/Olympus_Mons"
+    results = chart_batch.calculate_charts_batch(records)
+    assert results[1] == {"error": "Invalid timezone: Mars/Olympus_Mons"}
+    assert "planets" in results[0] and "planets" in results[2]
+
+
+def _request(n: int) -> BatchChartRequest:
+    return BatchChartRequest(charts=[BirthData(**r) for r in _records(n)])
+
+
+def test_endpoint_pages_results():
+    response = asyncio.run(
+        calculate_charts_batch_endpoint(
+            _request(5), None, house_system="P", page=2, page_size=2, stream=False, orb_profile="natal"  # type: ignore[arg-type]  # noqa: E501
+        )
+    )
+    assert response["total"] == 5
+    assert response["total_pages"] == 3
+    assert response["has_more"] is True
+    assert [r["index"] for r in response["results"]] == [2, 3]
+    assert "house_1" in response["results"][0]["chart"]["houses"]
+
+
+def test_endpoint_streams_ndjson():
+    async def consume() -> List[Dict[str, Any]]:
+        response = await calculate_charts_batch_endpoint(
+            _request(5), None, house_system="P", page=1, page_size=2, stream=True, orb_profile="natal"  # type: ignore[arg-type]  # noqa: E501
+        )
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return [json.loads(line) for line in body.decode().splitlines()]
+
+    lines = asyncio.run(consume())
+    assert [item["index"] for item in lines] == [0, 1, 2, 3, 4]
+    assert all(item["error"] is None for item in lines)
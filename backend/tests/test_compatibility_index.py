@@ -0,0 +1,249 @@
+"""Tests for the indexed top-K compatibility search."""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils import compatibility_index as ci  # noqa: E402
+from utils.aspect_utils import PLANETS  # noqa: E402
+from utils.compatibility_index import (  # noqa: E402
+    CompatibilityIndex,
+    chart_positions,
+)
+from utils.synastry_batch import score_candidates, top_k  # noqa: E402
+
+
+def _cusps(rng: np.random.Generator, size: int) -> np.ndarray:
+    widths = rng.uniform(15, 45, (size, 12))
+    widths *= 360 / widths.sum(axis=1, keepdims=True)
+    starts = np.cumsum(widths, axis=1) - widths
+    return (rng.uniform(0, 360, (size, 1)) + starts) % 360
+
+
+def _brute_force(index_lons, ids, reference, k, cusps=None, ref_cusps=None):
+    scores = score_candidates(
+        reference, index_lons, ref_cusps if cusps is not None else None, cusps
+    )
+    return [ids[i] for i in top_k(scores["total_score"], k)], scores
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_search_matches_full_scan(monkeypatch: pytest.MonkeyPatch, seed: int):
+    monkeypatch.setattr(ci, "SEARCH_BLOCK", 256)
+    rng = np.random.default_rng(seed)
+    lons = rng.uniform(0, 360, (20000, len(PLANETS)))
+    ids = [f"user{i}" for i in range(len(lons))]
+    index = CompatibilityIndex()
+    index.upsert_many(ids, lons)
+
+    reference = dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS))))
+    result = index.search(reference, k=15)
+    expected, scores = _brute_force(lons, ids, reference, 15)
+    assert [m["user_id"] for m in result["matches"]] == expected
+    assert result["candidates"] == 20000
+    # The bounds prune at least half of the population
+    assert result["scored"] < 10000
+    first = result["matches"][0]
+    row = ids.index(first["user_id"])
+    assert first["total_score"] == pytest.approx(scores["total_score"][row])
+    assert first["overall_score"] == round(scores["overall_score"][row], 1)
+
+
+def test_search_with_overlays_and_exclusions():
+    rng = np.random.default_rng(11)
+    lons = rng.uniform(0, 360, (3000, len(PLANETS)))
+    cusps = _cusps(rng, len(lons))
+    ids = [f"user{i}" for i in range(len(lons))]
+    index = CompatibilityIndex()
+    index.upsert_many(ids, lons, cusps)
+    reference = dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS))))
+    ref_cusps = list(_cusps(rng, 1)[0])
+
+    expected, _ = _brute_force(lons, ids, reference, 6, cusps, ref_cusps)
+    result = index.search(reference, ref_cusps, k=5, exclude=[expected[0]])
+    assert [m["user_id"] for m in result["matches"]] == expected[1:]
+    assert result["candidates"] == 2999
+
+
+def test_bounds_never_undercut_exact_scores():
+    rng = np.random.default_rng(5)
+    lons = rng.uniform(0, 360, (5000, len(PLANETS)))
+    for profile in (None, "traditional"):
+        index = CompatibilityIndex(orb_profile=profile, bucket_degrees=5.0)
+        reference = dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS))))
+        table = index.bucket_bounds(reference)
+        buckets = index._bucket(lons % 360).astype(int)
+        bounds = table[buckets, np.arange(len(PLANETS))].sum(axis=1)
+        exact, _ = index.calculator.score_one_to_many(reference, lons)
+        assert np.all(bounds >= exact)
+
+
+def test_incremental_updates_reuse_rows():
+    index = CompatibilityIndex(capacity=2)
+    reference = {p: 0.0 for p in PLANETS}
+    index.upsert("a", {p: 0.0 for p in PLANETS})
+    index.upsert("b", {p: 45.0 for p in PLANETS})
+    index.upsert("c", {p: 90.0 for p in PLANETS})
+    assert len(index) == 3 and index.stats()["capacity"] >= 3
+    assert index.search(reference, k=1)["matches"][0]["user_id"] == "a"
+
+    # Replacing a chart moves the user, removing frees the row
+    index.upsert("a", {p: 90.0 for p in PLANETS})
+    index.upsert("b", {p: 0.5 for p in PLANETS}, chart_id="chart-b")
+    assert index.search(reference, k=1)["matches"][0]["user_id"] == "b"
+    assert not index.remove_chart("b", "other-chart")
+    assert index.remove_chart("b", "chart-b")
+    assert "b" not in index
+    index.upsert("d", {p: 1.0 for p in PLANETS})
+    assert index.stats()["capacity"] == 4
+    assert [m["user_id"] for m in index.search(reference, k=3)["matches"]] == [  # noqa: E501
+        "d",
+        "a",
+        "c",
+    ]
+    assert CompatibilityIndex().search(reference)["matches"] == []
+
+
+def test_chart_positions_reads_stored_payloads():
+    chart = {
+        "planets": {
+            "sun": {"position": 15.5, "retrograde": False},
+            "chiron": {"position": 3.0},
+            "Moon": {"position": 200.25},
+        },
+        "houses": [{"house": i + 1, "cusp": 30.0 * i} for i in range(12)],
+    }
+    planets, cusps = chart_positions(chart)
+    assert planets == {"sun": 15.5, "moon": 200.25}
+    assert cusps == [30.0 * i for i in range(12)]
+    assert chart_positions({"planets": {"sun": 1.0}, "houses": [{}]}) == (
+        {"sun": 1.0},
+        None,
+    )
+
+
+def test_saving_a_discoverable_chart_indexes_it(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from api import charts
+
+    index = CompatibilityIndex()
+    monkeypatch.setattr(charts, "compatibility_index", index)
+    request = charts.SaveChartRequest(
+        year=1990,
+        month=5,
+        day=17,
+        hour=8,
+        minute=45,
+        city="London",
+        lat=51.5,
+        lon=-0.12,
+        timezone="Europe/London",
+        discoverable=True,
+    )
+    saved = asyncio.run(charts.save_user_chart(request, user={"uid": "u1"}))
+    assert "u1" in index and index.stats()["with_cusps"] == 1
+
+    asyncio.run(charts.delete_user_chart(saved.id, user={"uid": "u1"}))
+    assert "u1" not in index
+
+
+def test_index_is_rebuilt_from_discoverable_saved_charts(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import database
+    from api import charts
+
+    monkeypatch.setattr(database, "memory_store", {})
+    index = CompatibilityIndex()
+    monkeypatch.setattr(charts, "compatibility_index", index)
+    saved = {}
+    for user_id, discoverable in (("u1", True), ("u2", False)):
+        request = charts.SaveChartRequest(
+            year=1990,
+            month=5,
+            day=17,
+            hour=8,
+            minute=45,
+            city="London",
+            lat=51.5,
+            lon=-0.12,
+            timezone="Europe/London",
+            discoverable=discoverable,
+        )
+        saved[user_id] = asyncio.run(
+            charts.save_user_chart(request, user={"uid": user_id})
+        )
+    assert saved["u1"].chart_data["discoverable"] is True
+    assert saved["u2"].chart_data["discoverable"] is False
+
+    # Another worker's index, rebuilt from the chart store
+    worker = CompatibilityIndex()
+    worker.upsert("gone", {"sun": 1.0})
+    monkeypatch.setattr(charts, "compatibility_index", worker)
+    asyncio.run(charts.refresh_compatibility_index(interval=0))
+    assert "u1" in worker and "u2" not in worker and "gone" not in worker
+    assert worker.stats()["with_cusps"] == 1
+    reference = chart_positions(saved["u1"].chart_data["chart_data"])[0]
+    result = worker.search(reference, k=1)
+    assert result["matches"][0]["user_id"] == "u1"
+    assert result["matches"][0]["total_score"] == pytest.approx(
+        index.search(reference, k=1)["matches"][0]["total_score"]
+    )
+
+    # The stored chart id is kept, so deleting the chart unindexes it
+    asyncio.run(charts.delete_user_chart(saved["u1"].id, user={"uid": "u1"}))
+    assert "u1" not in worker
+
+
+def test_failed_loads_are_logged_retried_and_visible(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    import database
+    from api import charts
+
+    monkeypatch.setattr(database, "memory_store", {})
+    index = CompatibilityIndex()
+    monkeypatch.setattr(charts, "compatibility_index", index)
+    monkeypatch.setattr(charts, "COMPATIBILITY_INDEX_RETRY_SECONDS", 0.0)
+    calls = []
+
+    def flaky(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RuntimeError("FAILED_PRECONDITION: missing index")
+        return iter(())
+
+    monkeypatch.setattr(charts, "iter_natal_charts", flaky)
+    assert index.stats()["loaded_at"] is None
+    asyncio.run(charts.refresh_compatibility_index(interval=0))
+    failures = [r for r in caplog.records if "load failed" in r.message]
+    assert len(failures) == 1 and failures[0].exc_info is not None
+    assert len(calls) == 2 and index.stats()["loaded_at"] is not None
+
+
+def test_change_reads_only_add_updated_charts(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import database
+    from api import charts
+
+    monkeypatch.setattr(database, "memory_store", {})
+    index = CompatibilityIndex()
+    index.upsert("elsewhere", {"sun": 1.0})
+    monkeypatch.setattr(charts, "compatibility_index", index)
+    chart = {"planets": {"sun": {"position": 10.0}}}
+    birth = {"year": 1990, "month": 1, "day": 1, "hour": 12, "minute": 0}
+    old = database.save_chart("old", "natal", birth, chart, discoverable=True)
+    old["updated_at"] = "2000-01-01T00:00:00"
+    database.save_chart("new", "natal", birth, chart, discoverable=True)
+
+    assert charts.rebuild_compatibility_index("2020-01-01T00:00:00") == 1
+    assert "new" in index and "old" not in index and "elsewhere" in index
+    assert charts.rebuild_compatibility_index() == 2
+    assert "old" in index and "elsewhere" not in index
@@ -0,0 +1,153 @@
+"""Tests for Davison composites in the vectorized composite calculator."""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations.house_systems import calculate_houses  # noqa: E402
+from utils import vectorized_composite_utils as composite  # noqa: E402
+from utils.vectorized_composite_utils import (  # noqa: E402
+    VectorizedChartData,
+    VectorizedCompositeCalculator,
+    davison_midpoints,
+)
+
+# (julian_day, latitude, longitude): London, New York, Paris, Tokyo
+BIRTHS = [
+    (2447892.5, 51.5, -0.1),
+    (2448257.75, 40.7, -74.0),
+    (2447285.25, 48.9, 2.3),
+    (2449000.25, 35.7, 139.7),
+]
+
+
+def _charts():
+    rng = np.random.default_rng(3)
+    return [
+        VectorizedChartData(
+            planets=rng.uniform(0, 360, 11),
+            houses=rng.uniform(0, 360, 12),
+            aspects=np.zeros((0, 4)),
+            angles=rng.uniform(0, 360, 4),
+            chart_id=str(i),
+            name=f"Person {i}",
+            birth_datetime=datetime(1990, 1, 1),
+            julian_day=jd,
+            latitude=lat,
+            longitude=lon,
+        )
+        for i, (jd, lat, lon) in enumerate(BIRTHS)
+    ]
+
+
+def _fake_ephemeris(calls):
+    def positions(julian_days):
+        calls.append(list(julian_days))
+        return [
+            {
+                name: {"position": (jd * (i + 1)) % 360, "retrograde": i == 2}
+                for i, name in enumerate(
+                    ["sun", "moon", "mercury", "venus", "mars", "jupiter"]
+                    + ["saturn", "uranus", "neptune", "pluto"]
+                )
+            }
+            for jd in julian_days
+        ]
+
+    return positions
+
+
+def test_midpoints_on_the_sphere():
+    jds, lats, lons = davison_midpoints([10.0, 20.0], [0.0, 0.0], [10.0, 30.0])  # noqa: E501
+    np.testing.assert_allclose([jds[0], lats[0], lons[0]], [15.0, 0.0, 20.0])
+
+    # Ragged groups in one call; longitudes wrap across the antimeridian
+    jds, lats, lons = davison_midpoints(
+        [1.0, 3.0, 5.0, 7.0, 9.0],
+        [10.0, 10.0, 0.0, 0.0, 90.0],
+        [170.0, -170.0, 0.0, 90.0, 0.0],
+        [2, 3],
+    )
+    np.testing.assert_allclose(jds, [2.0, 7.0])
+    assert abs(lons[0]) == pytest.approx(180.0)
+    assert lats[0] == pytest.approx(10.15, abs=0.01)
+    assert lons[1] == pytest.approx(45.0)
+    assert lats[1] == pytest.approx(np.rad2deg(np.arctan(1 / np.hypot(1, 1))))  # noqa: E501
+
+    # Two places on one meridian: the great circle runs over the pole
+    _, lats, lons = davison_midpoints([0.0, 0.0], [60.0, 60.0], [0.0, 180.0])
+    assert lats[0] == pytest.approx(90.0)
+
+    with pytest.raises(ValueError):
+        davison_midpoints([1.0, 2.0], [0.0, 0.0], [0.0, 0.0], [1, 2])
+
+
+def test_davison_groups_share_one_ephemeris_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = []
+    monkeypatch.setattr(
+        composite, "get_planetary_positions_batch", _fake_ephemeris(calls)
+    )
+    charts = _charts()
+    calculator = VectorizedCompositeCalculator("accurate")
+    groups = [charts[:2], charts[:3], [charts[0], charts[3]]]
+    results = calculator.calculate_davison_composites(groups)
+
+    assert len(calls) == 1 and len(calls[0]) == 3
+    jds, lats, lons = davison_midpoints(
+        [b[0] for b in BIRTHS[:2]], [b[1] for b in BIRTHS[:2]], [b[2] for b in BIRTHS[:2]]  # noqa: E501
+    )
+    first = results[0]
+    assert calls[0][0] == pytest.approx(jds[0])
+    assert first.calculation_metadata["davison_latitude"] == pytest.approx(lats[0])  # noqa: E501
+    assert first.calculation_metadata["midpoint_estimated_planets"] == ["North Node"]  # noqa: E501
+
+    # Planets come from the ephemeris, houses from the Davison place
+    planets = first.composite_planets
+    assert planets["Sun"]["longitude"] == pytest.approx(jds[0] % 360)
+    assert planets["Mercury"]["retrograde"] and not planets["Sun"]["retrograde"]  # noqa: E501
+    midpoints = calculator._calculate_midpoints_vectorized(
+        np.stack([chart.planets for chart in charts[:2]])
+    )
+    assert planets["North Node"]["longitude"] == pytest.approx(midpoints[10])
+    houses = calculate_houses(float(jds[0]), float(lats[0]), float(lons[0]))
+    assert first.composite_houses["House_10"]["cusp"] == pytest.approx(
+        houses["houses"][9]["cusp"]
+    )
+    assert first.composite_angles["Ascendant"]["longitude"] == pytest.approx(
+        houses["angles"]["ascendant"]
+    )
+    cusps = [house["cusp"] for house in houses["houses"]]
+    for planet in planets.values():
+        house = int(planet["house"])
+        start, end = cusps[house - 1], cusps[house % 12]
+        assert (planet["longitude"] - start) % 360 < (end - start) % 360
+
+    # The single-group entry point gives the same chart
+    single = calculator.calculate_composite_chart(charts[:2], method="davison")
+    assert single.composite_planets == planets
+    assert single.composite_houses == first.composite_houses
+
+    assert results[1].calculation_metadata["charts_count"] == 3
+    assert results[1].calculation_metadata["house_system"] == "P"
+    # London-Tokyo lands beyond the polar circle: Porphyry houses
+    assert results[2].calculation_metadata["davison_latitude"] > 67
+    assert results[2].calculation_metadata["house_system"] == "O"
+
+
+def test_davison_requires_birth_data(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        composite, "get_planetary_positions_batch", _fake_ephemeris([])
+    )
+    charts = _charts()
+    charts[1].julian_day = None
+    with pytest.raises(ValueError, match="birth"):
+        VectorizedCompositeCalculator().calculate_composite_chart(
+            charts[:2], method="davison"
+        )
@@ -0,0 +1,153 @@
+"""Tests for the compact/precise dtype policies of the vectorized engines."""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.aspect_utils import PLANETS  # noqa: E402
+from utils.dtype_policy import (  # noqa: E402
+    DTYPE_POLICIES,
+    DTYPE_POLICY_ENV,
+    get_dtype_policy,
+)
+from utils.optimized_vectorized_integration import (  # noqa: E402
+    OptimizedVectorizedAspectCalculator,
+)
+from utils.vectorized_aspect_utils import (  # noqa: E402
+    get_vectorized_calculator,
+    vectorized_calculator,
+)
+from utils.vectorized_composite_utils import (  # noqa: E402
+    VectorizedChartData,
+    VectorizedCompositeCalculator,
+)
+from utils.vectorized_memory_optimization import (  # noqa: E402
+    MemoryOptimizedVectorizedCalculator,
+)
+
+# float32 longitudes below 360 degrees are exact to about 2e-5 degrees
+TOLERANCE = 1e-4
+
+
+def test_policy_resolution(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(DTYPE_POLICY_ENV, raising=False)
+    assert get_dtype_policy().name == "precise"
+    monkeypatch.setenv(DTYPE_POLICY_ENV, "Compact")
+    assert get_dtype_policy() is DTYPE_POLICIES["compact"]
+    assert get_dtype_policy("precise").angle == np.float64
+    assert get_dtype_policy(DTYPE_POLICIES["precise"]).name == "precise"
+    assert get_vectorized_calculator().dtypes.name == "compact"
+    with pytest.raises(ValueError, match="Unknown dtype policy"):
+        get_dtype_policy("half")
+
+
+def test_compact_aspects_match_precise():
+    compact = get_vectorized_calculator(dtype_policy="compact")
+    precise = get_vectorized_calculator(dtype_policy="precise")
+    assert precise is vectorized_calculator
+
+    rng = np.random.default_rng(0)
+    separations = rng.uniform(0, 180, (2000, 10, 10))
+    p_codes, p_orbs, p_valid = precise.find_aspects_vectorized(separations)
+    c_codes, c_orbs, c_valid = compact.find_aspects_vectorized(separations)
+    assert c_codes.dtype == np.int8 and c_orbs.dtype == np.float32
+    assert c_valid.dtype == bool
+
+    # Only cells within float32 rounding of an orb limit may differ
+    near_limit = (
+        np.abs(
+            np.abs(separations[..., np.newaxis] - precise.aspect_degrees)
+            - precise.enabled_orbs
+        )
+        < TOLERANCE
+    ).any(axis=-1)
+    differs = (p_valid != c_valid) | (p_valid & (p_codes != c_codes))
+    assert not (differs & ~near_limit).any()
+    both = p_valid & c_valid & (p_codes == c_codes)
+    np.testing.assert_allclose(c_orbs[both], p_orbs[both], atol=TOLERANCE)
+
+
+def test_compact_scores_match_precise():
+    rng = np.random.default_rng(1)
+    reference = dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS))))
+    candidates = rng.uniform(0, 360, (20000, len(PLANETS)))
+    partners = rng.uniform(0, 360, candidates.shape)
+
+    compact = get_vectorized_calculator(dtype_policy="compact")
+    p_scores, p_counts = vectorized_calculator.score_one_to_many(
+        reference, candidates
+    )
+    c_scores, c_counts = compact.score_one_to_many(reference, candidates)
+    assert c_scores.dtype == np.float64 and c_counts.dtype == np.int16
+    same = (p_counts == c_counts).all(axis=1)
+    # Orb-limit flips are rare and every other score agrees closely
+    assert same.mean() > 0.999
+    np.testing.assert_allclose(c_scores[same], p_scores[same], atol=1e-3)
+
+    p_pairs, _ = vectorized_calculator.score_pairs(candidates, partners)
+    c_pairs, c_pair_counts = compact.score_pairs(candidates, partners)
+    assert np.mean(np.abs(c_pairs - p_pairs) < 1e-3) > 0.999
+
+
+def test_compact_composite_matches_accurate():
+    rng = np.random.default_rng(2)
+    charts = [
+        VectorizedChartData(
+            planets=rng.uniform(0, 360, 11),
+            houses=rng.uniform(0, 360, 12),
+            aspects=np.zeros((0, 4)),
+            angles=rng.uniform(0, 360, 4),
+            chart_id=str(i),
+            name=f"Person {i}",
+            birth_datetime=datetime(1990, 1, 1),
+        )
+        for i in range(3)
+    ]
+    fast = VectorizedCompositeCalculator("fast")
+    accurate = VectorizedCompositeCalculator("accurate")
+    assert fast._prepare_vectorized_data(charts)["planets"].dtype == np.float32  # noqa: E501
+    assert VectorizedCompositeCalculator("fast", "precise").precision is np.float64  # noqa: E501
+
+    for count in (2, 3):
+        expected = accurate.calculate_composite_chart(charts[:count])
+        result = fast.calculate_composite_chart(charts[:count])
+        for name, planet in expected.composite_planets.items():
+            assert result.composite_planets[name]["longitude"] == pytest.approx(  # noqa: E501
+                planet["longitude"], abs=TOLERANCE
+            )
+        for name, house in expected.composite_houses.items():
+            assert result.composite_houses[name]["cusp"] == pytest.approx(
+                house["cusp"], abs=TOLERANCE
+            )
+
+
+def test_compact_batches_halve_memory():
+    precise = MemoryOptimizedVectorizedCalculator(chunk_size=50)
+    compact = MemoryOptimizedVectorizedCalculator(
+        chunk_size=50, dtype_policy="compact"
+    )
+    full = precise.estimate_memory_usage(200, 200)["base_memory_mb"]
+    small = compact.estimate_memory_usage(200, 200)["base_memory_mb"]
+    assert small / full < 0.6
+
+    rng = np.random.default_rng(3)
+    charts = [dict(zip(PLANETS, rng.uniform(0, 360, 10))) for _ in range(4)]
+    expected = precise._calculate_chunk_separations(charts, charts)
+    result = compact._calculate_chunk_separations(charts, charts)
+    assert result.dtype == np.float32 and result.nbytes * 2 == expected.nbytes  # noqa: E501
+    np.testing.assert_allclose(result, expected, atol=TOLERANCE)
+
+    integration = OptimizedVectorizedAspectCalculator(
+        enable_caching=False, enable_monitoring=False, dtype_policy="compact"
+    )
+    assert integration.memory_calculator.dtypes.name == "compact"
+    matrix = integration._fallback_aspect_calculation(
+        {"sun": 0.0, "moon": 90.0}, {"sun": 2.0, "moon": 270.0}, 8.0
+    )
+    assert matrix.dtype == np.int8
+    assert matrix.tolist() == [[1, 3], [3, 5]]
@@ -0,0 +1,156 @@
+"""Tests for multi-system house calculation and the house cache."""
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict
+
+import pytest
+import swisseph as swe  # type: ignore
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi import BackgroundTasks  # noqa: E402
+
+from api.routers.calculations import (  # noqa: E402
+    BirthData,
+    HouseSystemsRequest,
+    calculate_chart_endpoint,
+    calculate_house_systems_endpoint,
+)
+from astro.calculations import house_systems as hs  # noqa: E402
+from astro.calculations.vedic import calculate_vedic_houses  # noqa: E402
+
+JD = 2448000.3
+LAT, LON = 40.7128, -74.0060
+
+
+def _reference(system: bytes, lat: float = LAT) -> Dict[str, Any]:
+    cusps, ascmc = swe.houses_ex(JD, lat, LON, flags=0, hsys=system)
+    return {
+        "cusps": [float(c) for c in cusps[:12]],
+        "ascendant": float(ascmc[0]),
+        "mc": float(ascmc[1]),
+    }
+
+
+@pytest.mark.parametrize("lat", [LAT, -33.87, 0.0, 51.5])
+def test_all_systems_match_swiss_ephemeris(lat: float):
+    results = hs.calculate_house_systems(JD, lat, LON)
+    assert list(results) == list(hs.HOUSE_SYSTEMS)
+    for name, result in results.items():
+        ref = _reference(hs.HOUSE_SYSTEMS[name], lat)
+        cusps = [h["cusp"] for h in result["houses"]]
+        assert cusps == pytest.approx(ref["cusps"], abs=1e-9), name
+        assert result["angles"]["ascendant"] == pytest.approx(
+            ref["ascendant"]
+        )
+        assert result["angles"]["mc"] == pytest.approx(ref["mc"])
+
+
+def test_subset_accepts_codes_and_matches_single_system():
+    results = hs.calculate_house_systems(JD, LAT, LON, ["W", "koch", "P"])
+    assert list(results) == ["whole", "koch", "placidus"]
+    assert results["koch"] == hs.calculate_houses(JD, LAT, LON, "koch")
+    assert results["placidus"] == hs.calculate_houses(JD, LAT, LON, "P")
+
+
+def test_unknown_system_is_rejected():
+    with pytest.raises(ValueError, match="Unknown house system"):
+        hs.calculate_house_systems(JD, LAT, LON, ["placidus", "nope"])
+
+
+def test_repeated_calls_hit_cache():
+    hs._houses_raw.cache_clear()
+    hs.calculate_house_systems(JD, LAT, LON)
+    misses = hs.house_cache_info()["misses"]
+    # Equal and whole sign houses are derived from the shared Ascendant
+    assert misses == len(hs.HOUSE_SYSTEMS) - 2
+
+    first = hs.calculate_houses(JD, LAT, LON, "R")
+    first["houses"][0]["cusp"] = -1.0
+    hs.calculate_house_systems(JD, LAT, LON, ["regiomontanus", "P"])
+    info = hs.house_cache_info()
+    assert info["misses"] == misses
+    assert info["hits"] >= 3
+    # Cached values are copied out, so callers cannot corrupt them
+    assert hs.calculate_houses(JD, LAT, LON, "R")["houses"][0]["cusp"] >= 0
+
+
+def test_vedic_houses_reuse_placidus_cache():
+    placidus = hs.calculate_houses(JD, LAT, LON, "P")
+    hits = hs.house_cache_info()["hits"]
+    vedic = calculate_vedic_houses(JD, LAT, LON)
+    assert hs.house_cache_info()["hits"] == hits + 1
+    assert len(vedic["houses"]) == 12
+    assert vedic["houses"][0]["cusp"] != placidus["houses"][0]["cusp"]
+
+
+def test_houses_endpoint_returns_requested_systems():
+    response = asyncio.run(
+        calculate_house_systems_endpoint(
+            HouseSystemsRequest(
+                julian_day=JD,
+                latitude=LAT,
+                longitude=LON,
+                systems=["equal", "P"],
+            ),
+            request=None,  # type: ignore[arg-type]
+        )
+    )
+    assert list(response["house_systems"]) == ["equal", "placidus"]
+    equal = response["house_systems"]["equal"]
+    assert set(equal["houses"]) == {f"house_{i}" for i in range(1, 13)}
+    assert equal["houses"]["house_1"]["cusp"] == pytest.approx(
+        equal["angles"]["ascendant"]
+    )
+
+
+def test_polar_latitude_keeps_systems_that_work():
+    results = hs.calculate_house_systems(JD, 70.0, 20.0)
+    assert list(results) == list(hs.HOUSE_SYSTEMS)
+    assert "error" in results["placidus"] and "error" in results["koch"]
+    for name in ("equal", "whole", "porphyry"):
+        assert len(results[name]["houses"]) == 12
+    assert results["equal"]["houses"][0]["cusp"] == pytest.approx(
+        results["porphyry"]["angles"]["ascendant"]
+    )
+
+    # Equal houses still come from the Ascendant when no quadrant
+    # system succeeds first
+    only = hs.calculate_house_systems(JD, 70.0, 20.0, ["P", "E"])
+    assert "error" in only["placidus"]
+    assert [h["cusp"] for h in only["equal"]["houses"]] == pytest.approx(
+        [h["cusp"] for h in results["equal"]["houses"]]
+    )
+
+    response = asyncio.run(
+        calculate_house_systems_endpoint(
+            HouseSystemsRequest(julian_day=JD, latitude=70.0, longitude=20.0),
+            request=None,  # type: ignore[arg-type]
+        )
+    )
+    systems = response["house_systems"]
+    assert systems["placidus"] == results["placidus"]
+    assert set(systems["whole"]["houses"]) == {
+        f"house_{i}" for i in range(1, 13)
+    }
+
+
+def test_polar_chart_with_all_house_systems():
+    chart = asyncio.run(
+        calculate_chart_endpoint(
+            BirthData(
+                year=1990, month=6, day=21, hour=12, minute=0,
+                city="Tromso", timezone="Europe/Oslo", lat=69.65, lon=18.96,
+            ),
+            request=None,  # type: ignore[arg-type]
+            background_tasks=BackgroundTasks(),
+            house_system="E",
+            orb_profile="natal",
+            house_systems="all",
+        )
+    )
+    assert set(chart.houses) == {f"house_{i}" for i in range(1, 13)}
+    assert "error" in chart.house_systems["placidus"]
+    assert set(chart.house_systems["porphyry"]["houses"]) == set(chart.houses)
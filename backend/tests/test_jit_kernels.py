@@ -0,0 +1,74 @@
+"""Tests for the optional JIT kernels and their NumPy fallbacks."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations.human_design import (  # noqa: E402
+    GATE_SEQUENCE,
+    HD_OFFSET,
+)
+from utils import jit_kernels  # noqa: E402
+
+KERNELS = [
+    "pair_midpoints",
+    "dial_separations",
+    "pair_aspect_orbs",
+    "gate_lines",
+    "area_scores",
+]
+
+
+def _inputs(name: str, rng: np.random.Generator):
+    pos = rng.uniform(0, 360, 19)
+    pos[:3] = [0.0, 180.0, 359.999]  # arc and wrap edge cases
+    if name == "pair_aspect_orbs":
+        angles = np.array([0.0, 60.0, 90.0, 120.0, 150.0, 180.0])
+        max_orbs = rng.choice([0.0, 2.0, 8.0], (len(pos) * 9, len(angles)))
+        return pos, angles, max_orbs
+    if name == "gate_lines":
+        return np.append(pos, [HD_OFFSET, HD_OFFSET - 1e-9]), HD_OFFSET, GATE_SEQUENCE  # noqa: E501
+    if name == "area_scores":
+        valid = rng.random(100) < 0.3
+        cells = rng.random((5, 100)) < 0.2
+        cells[4] = False  # an area without aspects averages to 0
+        return rng.normal(0, 5, 100), valid, cells
+    return (pos,)
+
+
+@pytest.mark.parametrize("name", KERNELS)
+def test_loop_and_numpy_versions_agree(name: str):
+    rng = np.random.default_rng(KERNELS.index(name))
+    for _ in range(5):
+        args = _inputs(name, rng)
+        loop = getattr(jit_kernels, f"_{name}_loop")(*args)
+        fallback = getattr(jit_kernels, f"_{name}_numpy")(*args)
+        public = getattr(jit_kernels, name)(*args)
+        for expected in (fallback, public):
+            for a, b in zip(np.atleast_1d(loop), np.atleast_1d(expected)):
+                np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
+
+
+def test_gate_lines_cover_the_wheel():
+    gates, lines = jit_kernels.gate_lines(
+        np.arange(0.0, 360.0, 360 / 64 / 6) + HD_OFFSET + 0.1,
+        HD_OFFSET,
+        GATE_SEQUENCE,
+    )
+    assert gates.tolist()[::6] == GATE_SEQUENCE.tolist()
+    assert lines.tolist() == [1, 2, 3, 4, 5, 6] * 64
+
+
+def test_numpy_fallback_without_numba(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(jit_kernels, "JIT_ENABLED", False)
+    fallback = jit_kernels._pair_midpoints_numpy
+    assert (
+        jit_kernels._select(jit_kernels._pair_midpoints_loop, fallback)
+        is fallback
+    )
+    assert jit_kernels.kernel_backend() == "numpy"
+    assert jit_kernels.pair_midpoints(np.array([10.0])).shape == (0,)
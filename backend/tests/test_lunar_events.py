@@ -0,0 +1,116 @@
+"""Tests for the exact lunation and moon ingress calendar."""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.lunar_events import (  # noqa: E402
+    LunarCalendar,
+    events_by_day,
+)
+
+SUN_ID = int(tc.PLANETS["sun"]["id"])
+MOON_ID = int(tc.PLANETS["moon"]["id"])
+
+
+def _calendar() -> LunarCalendar:
+    return LunarCalendar(
+        tc._sample_planet_motion,
+        {n: float(d["angle"]) for n, d in tc.LUNAR_PHASES.items()},  # type: ignore[arg-type]  # noqa: E501
+        tc.ZODIAC_SIGNS,
+    )
+
+
+def _events(start: str, end: str, **kwargs):
+    request = tc.LunarEventRequest(
+        date_range=tc.DateRange(start_date=start, end_date=end), **kwargs
+    )
+    return asyncio.run(tc.calculate_lunar_events(request))
+
+
+def test_phase_times_are_exact():
+    calendar = _calendar()
+    start = tc.julian_day(datetime(2024, 1, 1))
+    events = calendar.events(start, start + 120, kinds=("phase",))
+    # About 4 months of 8 phases each
+    assert 30 <= len(events) <= 34
+    for event in events:
+        sun, _ = tc.calculate_planet_motion(event["jd"], SUN_ID)
+        moon, _ = tc.calculate_planet_motion(event["jd"], MOON_ID)
+        angle = tc.LUNAR_PHASES[event["name"]]["angle"]
+        assert abs((moon - sun - angle + 180) % 360 - 180) < 1e-3  # type: ignore[operator]  # noqa: E501
+
+
+def test_known_full_and_new_moons():
+    events = _events("2024-04-01", "2024-04-30", include_ingresses=False)
+    by_name = {e.name: e.exact_time for e in events}
+    # Total solar eclipse of 2024-04-08 and the following full moon
+    assert by_name["New Moon"].startswith("2024-04-08T18:2")
+    assert by_name["Full Moon"].startswith("2024-04-23T23:4")
+    assert all(e.event == "phase" for e in events)
+
+
+def test_ingresses_are_on_sign_boundaries():
+    events = [e for e in _events("2024-06-01", "2024-06-30") if e.event == "ingress"]  # noqa: E501
+    assert 12 <= len(events) <= 15
+    for event in events:
+        assert event.moon_sign == event.name
+        assert event.degree % 30 == pytest.approx(0.0)
+        jd = tc.julian_day(
+            datetime.strptime(event.exact_time, "%Y-%m-%dT%H:%M:%SZ")
+        )
+        moon, _ = tc.calculate_planet_motion(jd, MOON_ID)
+        assert abs((moon - event.degree + 180) % 360 - 180) < 0.01
+
+
+def test_queries_across_windows_use_the_cache():
+    calendar = _calendar()
+    start = tc.julian_day(datetime(2023, 11, 1))
+    first = calendar.events(start, start + 90)
+    times = [e["jd"] for e in first]
+    assert times == sorted(times)
+
+    built = calendar.stats()["windows_built"]
+    middle = calendar.events(start + 30, start + 60)
+    assert middle == [e for e in first if start + 30 <= e["jd"] < start + 60]
+    assert calendar.stats()["windows_built"] == built
+
+
+def test_range_limit():
+    with pytest.raises(HTTPException) as exc_info:
+        _events("2000-01-01", "2020-01-01")
+    assert exc_info.value.status_code == 400
+
+
+def test_daily_lunar_transits_report_exact_phases():
+    request = tc.LunarTransitRequest(
+        birth_data=tc.BirthData(
+            birth_date="1990-01-01",
+            birth_time="00:00:00",
+            latitude=0.0,
+            longitude=0.0,
+        ),
+        date_range=tc.DateRange(start_date="2024-04-01", end_date="2024-04-30"),  # noqa: E501
+    )
+    days = asyncio.run(tc.calculate_lunar_transits(request, BackgroundTasks()))
+    assert len(days) == 30
+    exact = {d.date: d for d in days if d.exact_time != "00:00:00"}
+    assert sorted(exact) == ["2024-04-02", "2024-04-08", "2024-04-15", "2024-04-23"]  # noqa: E501
+    assert exact["2024-04-23"].phase == "Full Moon"
+    assert exact["2024-04-23"].exact_time.startswith("23:4")
+    assert exact["2024-04-08"].phase == "New Moon"
+
+
+def test_events_by_day():
+    events = [
+        {"kind": "phase", "name": "full_moon", "jd": 10.75, "moon_longitude": 0.0},  # noqa: E501
+        {"kind": "phase", "name": "new_moon", "jd": 13.0, "moon_longitude": 0.0},  # noqa: E501
+    ]
+    assert events_by_day(events, [10.5, 11.5]) == {0: events[0]}  # type: ignore[arg-type]  # noqa: E501
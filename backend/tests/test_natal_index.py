@@ -0,0 +1,185 @@
+"""Tests for the inverted natal-position index."""
+
+import os
+import random
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import database  # noqa: E402
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.natal_index import (  # noqa: E402
+    NatalIndex,
+    find_alerts,
+    iter_alerts,
+    load_natal_index,
+)
+
+BODIES = ["sun", "moon", "venus"]
+
+
+def _population(size: int, seed: int = 1):
+    rng = random.Random(seed)
+    return {
+        f"user{i}": {body: rng.uniform(0, 360) for body in BODIES}
+        for i in range(size)
+    }
+
+
+def _separation(a: float, b: float) -> float:
+    return abs((a - b + 180) % 360 - 180)
+
+
+def test_within_handles_wrap_around():
+    index = NatalIndex(
+        {"a": {"sun": 359.5}, "b": {"sun": 0.5}, "c": {"sun": 5.0}}
+    )
+    rows, orbs = index.within("sun", 0.0, 1.0)
+    assert sorted(index.users(rows)) == ["a", "b"]
+    assert orbs == pytest.approx([0.5, 0.5])
+    assert not len(index.within("mars", 0.0, 1.0)[0])
+    assert not len(index.within("sun", 0.0, 0.0)[0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(seed: int):
+    population = _population(500, seed)
+    index = NatalIndex(population)
+    rng = random.Random(seed)
+    transits = {"mars": rng.uniform(0, 360), "saturn": rng.uniform(0, 360)}
+    aspects = {"conjunction": 0.0, "square": 90.0, "trine": 120.0}
+
+    def orb(aspect: str, planet: str, natal: str) -> float:
+        return 3.0 if aspect == "conjunction" else 2.0
+
+    found = sorted(
+        (user, planet, aspect, natal, round(value, 9))
+        for user, planet, aspect, natal, value in iter_alerts(
+            index, find_alerts(index, transits, aspects, orb)
+        )
+    )
+    expected = []
+    for user, natal in population.items():
+        for planet, lon in transits.items():
+            for aspect, angle in aspects.items():
+                for body, natal_lon in natal.items():
+                    gap = abs(_separation(lon, natal_lon) - angle)
+                    if gap <= orb(aspect, planet, body):
+                        expected.append(
+                            (user, planet, aspect, body, round(gap, 9))
+                        )
+    assert found == sorted(expected)
+
+
+def test_orb_zero_skips_pairs():
+    index = NatalIndex(_population(200))
+    groups = find_alerts(
+        index,
+        {"mars": 100.0},
+        {"conjunction": 0.0},
+        lambda aspect, planet, natal: 10.0 if natal == "sun" else 0.0,
+    )
+    assert {g["natal_planet"] for g in groups} == {"sun"}
+    assert np.all(groups[0]["orbs"] <= 10.0)
+
+
+def test_transit_alerts_agree_with_per_user_transits():
+    births = [
+        ("1985-06-15", "14:30:00", 51.5, -0.12),
+        ("1979-11-03", "06:15:00", 40.4, -3.7),
+        ("2001-02-28", "23:05:00", -33.9, 151.2),
+    ]
+    natal = {
+        f"user{i}": tc.calculate_natal_chart(*birth)
+        for i, birth in enumerate(births)
+    }
+    index = NatalIndex(natal)
+    day = datetime(2024, 3, 1)
+    alerts = {
+        (user, planet, aspect, body)
+        for user, planet, aspect, body, _ in iter_alerts(
+            index, tc.transit_alerts(index, day)
+        )
+    }
+
+    request = tc.TransitCalculationRequest(
+        birth_data=tc.BirthData(
+            birth_date="2000-01-01",
+            birth_time="12:00:00",
+            latitude=0.0,
+            longitude=0.0,
+        ),
+        date_range=tc.DateRange(start_date="2024-03-01", end_date="2024-03-01"),  # noqa: E501
+    )
+    expected = set()
+    for user, positions in natal.items():
+        (results,) = tc._transits_for_days([day], positions, request)
+        for result in results:
+            planet, aspect, body = result.id.split("_")[:3]
+            expected.add((user, planet, aspect, body))
+    assert alerts == expected
+    assert alerts
+
+
+def test_from_arrays_matches_mapping_constructor():
+    population = _population(300)
+    population["partial"] = {"sun": 12.0}
+    ids = list(population)
+    longitudes = np.array(
+        [[population[u].get(b, np.nan) for b in BODIES] for u in ids]
+    )
+    from_arrays = NatalIndex.from_arrays(ids, BODIES, longitudes)
+    from_mapping = NatalIndex(population)
+    for body in BODIES:
+        for lon in (0.0, 12.0, 200.0):
+            a_rows, a_orbs = from_arrays.within(body, lon, 8.0)
+            b_rows, b_orbs = from_mapping.within(body, lon, 8.0)
+            assert list(a_rows) == list(b_rows)
+            assert list(a_orbs) == list(b_orbs)
+    assert "partial" in from_arrays.users(from_arrays.within("sun", 12.0, 0.1)[0])  # noqa: E501
+    with pytest.raises(ValueError, match="shape"):
+        NatalIndex.from_arrays(ids, BODIES[:2], longitudes)
+
+
+def test_index_and_daily_alerts_from_saved_charts(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(database, "memory_store", {})
+    population = _population(20, seed=4)
+    birth = {"year": 1990, "month": 1, "day": 1, "hour": 12, "minute": 0}
+    for user_id, natal in population.items():
+        database.save_chart(
+            user_id,
+            "natal",
+            birth,
+            {"planets": {b: {"position": lon} for b, lon in natal.items()}},
+        )
+    # Only each user's newest natal chart is indexed
+    stale = database.save_chart(
+        "user0", "natal", birth, {"planets": {"sun": {"position": 1.0}}}
+    )
+    stale["created_at"] = "1999-01-01T00:00:00"
+    database.save_chart(
+        "user1", "synastry", birth, {"planets": {"sun": {"position": 1.0}}}
+    )
+
+    charts = list(database.iter_natal_charts())
+    assert len(charts) == 21
+    index = load_natal_index(charts, BODIES)
+    assert sorted(index.user_ids) == sorted(population)
+    expected = NatalIndex(population)
+    for body in BODIES:
+        rows, orbs = index.within(body, 100.0, 30.0)
+        expected_rows, expected_orbs = expected.within(body, 100.0, 30.0)
+        assert sorted(index.users(rows)) == sorted(expected.users(expected_rows))  # noqa: E501
+        assert sorted(orbs) == pytest.approx(sorted(expected_orbs))
+
+    day = datetime(2024, 3, 1)
+    alerts = tc.daily_transit_alerts(database.iter_natal_charts(), day)
+    assert alerts and sorted(alerts) == sorted(
+        iter_alerts(expected, tc.transit_alerts(expected, day))
+    )
@@ -0,0 +1,196 @@
+"""Tests for the shared orb profile registry and applying/separating flags."""
+
+import os
+import random
+import sys
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.aspects import (  # noqa: E402
+    ASPECT_TYPES,
+    calculate_aspects,
+    calculate_aspects_fast,
+)
+from utils.aspect_utils import ORBS, build_aspect_matrix  # noqa: E402
+from utils.orb_profiles import (  # noqa: E402
+    OrbProfile,
+    applying_flags,
+    compile_orb_profile,
+    get_orb_profile,
+    is_applying,
+    register_orb_profile,
+)
+from utils.vectorized_aspect_utils import (  # noqa: E402
+    VectorizedAspectCalculator,
+    build_aspect_matrix_fast,
+)
+
+BODIES = [
+    "sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn",
+    "uranus", "neptune", "pluto", "chiron", "ceres",
+]  # fmt: skip
+
+SYNASTRY_BODIES = BODIES[:10]
+
+
+def _planets(seed: int) -> Dict[str, Dict[str, Any]]:
+    rng = random.Random(seed)
+    return {
+        b: {
+            "position": rng.uniform(0, 360),
+            "retrograde": False,
+            "speed": rng.uniform(-1.5, 14.0),
+        }
+        for b in BODIES
+    }
+
+
+def _longitudes(seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    return {b: rng.uniform(0, 360) for b in SYNASTRY_BODIES}
+
+
+def test_builtin_profiles_reproduce_legacy_tables():
+    assert [(a, n, o) for a, n, o in ASPECT_TYPES][0] == (0, "Conjunction", 10.0)  # noqa: E501
+    assert dict((n, o) for _, n, o in ASPECT_TYPES)["Quincunx"] == 2.0
+    assert ORBS == {
+        "conjunction": 10,
+        "opposition": 10,
+        "trine": 8,
+        "square": 8,
+        "sextile": 6,
+        "quincunx": 3,
+        "semi_sextile": 2,
+    }
+    assert tc.ASPECTS["conjunction"]["orb"] == 8
+    assert tc.ASPECTS["sextile"]["orb"] == 4
+    assert tc.ASPECTS["semi-square"]["orb"] == 2
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown orb profile"):
+        get_orb_profile("nope")
+    with pytest.raises(ValueError):
+        calculate_aspects_fast(_planets(0), orb_profile="nope")
+
+
+def test_pair_orb_uses_larger_class_factor():
+    profile = get_orb_profile("traditional")
+    assert profile.orb("trine", "sun", "pluto") == pytest.approx(7.0 * 1.25)
+    assert profile.orb("trine", "pluto", "neptune") == pytest.approx(7.0 * 0.85)  # noqa: E501
+    assert profile.orb("trine", "ceres", "chiron") == pytest.approx(7.0 * 0.75)  # noqa: E501
+
+    compiled = compile_orb_profile("traditional", ("trine", "square"))
+    grid = compiled.pair_orbs(["sun", "pluto"], ["neptune", "ceres"])
+    assert grid.shape == (2, 2, 2)
+    assert grid[0, 1, 0] == pytest.approx(profile.orb("trine", "sun", "ceres"))
+    assert grid[1, 0, 1] == pytest.approx(
+        profile.orb("square", "pluto", "neptune")
+    )
+
+
+def test_register_custom_profile():
+    register_orb_profile(
+        OrbProfile(
+            name="test-majors",
+            orbs={"conjunction": 3.0, "opposition": 3.0},
+        )
+    )
+    planets = {
+        "sun": {"position": 10.0, "retrograde": False},
+        "moon": {"position": 12.0, "retrograde": False},
+        "mars": {"position": 70.0, "retrograde": False},
+    }
+    aspects = calculate_aspects_fast(planets, orb_profile="test-majors")
+    assert [a["aspect"] for a in aspects] == ["Conjunction"]
+
+    with pytest.raises(ValueError, match="Unknown aspect keys"):
+        register_orb_profile(OrbProfile(name="bad", orbs={"novile": 1.0}))
+
+
+@pytest.mark.parametrize(
+    "pos1, speed1, pos2, speed2, angle, expected",
+    [
+        # Moon 2° behind Sun and faster: conjunction perfecting
+        (8.0, 13.0, 10.0, 1.0, 0.0, True),
+        # Moon 2° past Sun and faster: moving away
+        (12.0, 13.0, 10.0, 1.0, 0.0, False),
+        # Trine at 118°: separation growing towards 120°
+        (0.0, 0.0, 118.0, 1.0, 120.0, True),
+        # Trine at 122°: separation still growing, past exact
+        (0.0, 0.0, 122.0, 1.0, 120.0, False),
+        # Retrograde body backing into an opposition across 0°
+        (359.0, -0.5, 181.0, 0.0, 180.0, False),
+        (1.0, 0.5, 179.0, 0.0, 180.0, False),
+        (1.0, -0.5, 179.0, 0.0, 180.0, True),
+    ],
+)
+def test_applying_flag(pos1, speed1, pos2, speed2, angle, expected):
+    assert is_applying(pos1, pos2, speed1, speed2, angle) is expected
+    applying, known = applying_flags(pos1, pos2, speed1, speed2, angle)
+    assert bool(known) and bool(applying) is expected
+
+
+def test_applying_unknown_without_speed():
+    assert is_applying(8.0, 10.0, None, 1.0, 0.0) is None
+    _, known = applying_flags(8.0, 10.0, np.nan, 1.0, 0.0)
+    assert not bool(known)
+
+
+@pytest.mark.parametrize("profile", ["natal", "traditional", "tight"])
+@pytest.mark.parametrize("seed", range(10))
+def test_natal_engines_agree_per_profile(profile: str, seed: int):
+    planets = _planets(seed)
+    fast = calculate_aspects_fast(planets, orb_profile=profile)
+    assert fast == calculate_aspects(planets, orb_profile=profile)
+    assert all("applying" in a for a in fast)
+
+
+def test_applying_omitted_when_speed_missing():
+    planets = _planets(3)
+    del planets["sun"]["speed"]
+    aspects = calculate_aspects_fast(planets)
+    assert aspects == calculate_aspects(planets)
+    for aspect in aspects:
+        has_sun = "sun" in (aspect["point1"], aspect["point2"])
+        assert ("applying" in aspect) is not has_sun
+
+
+@pytest.mark.parametrize("profile", ["synastry", "traditional", "tight"])
+@pytest.mark.parametrize("seed", range(10))
+def test_synastry_matrix_engines_agree_per_profile(profile: str, seed: int):
+    long1, long2 = _longitudes(seed), _longitudes(seed + 100)
+    loop = build_aspect_matrix(long1, long2, orb_profile=profile)
+    fast = build_aspect_matrix_fast(long1, long2, orb_profile=profile)
+    for row_loop, row_fast in zip(loop, fast):
+        for cell_loop, cell_fast in zip(row_loop, row_fast):
+            assert (cell_loop is None) == (cell_fast is None)
+            if cell_loop and cell_fast:
+                assert cell_loop["aspect"] == cell_fast["aspect"]
+                assert cell_loop["orb"] == pytest.approx(cell_fast["orb"])
+
+
+def test_default_synastry_calculator_unchanged():
+    calculator = VectorizedAspectCalculator()
+    assert calculator.orbs.tolist() == [10, 6, 8, 8, 10, 3, 2]
+    long1, long2 = _longitudes(1), _longitudes(2)
+    assert build_aspect_matrix_fast(long1, long2) == build_aspect_matrix(
+        long1, long2
+    )
+
+
+def test_transit_aspect_reports_applying():
+    # Mars at 98° moving forward onto a natal square at 190° (92° apart)
+    info = tc.calculate_aspect(
+        98.0, 190.0, 5.0, planet1="mars", planet2="sun", speed1=0.6,
+        speed2=0.0,
+    )  # fmt: skip
+    assert info is not None and info["aspect"] == "square"
+    assert info["applying"] is True
+
+    assert "applying" not in (tc.calculate_aspect(98.0, 190.0, 5.0) or {})
@@ -0,0 +1,93 @@
+"""Tests for the multi-process batch synastry mode."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils import optimized_vectorized_integration as integration  # noqa: E402
+from utils.aspect_utils import PLANETS  # noqa: E402
+from utils.parallel_synastry import (  # noqa: E402
+    aspect_code_matrices,
+    parallel_aspect_codes,
+)
+
+
+def _pairs(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_shared_memory_shards_match_kernel():
+    rng = np.random.default_rng(1)
+    long1 = rng.uniform(0, 360, (1500, 10))
+    long2 = rng.uniform(0, 360, (1500, 7))
+    finished = []
+    codes = parallel_aspect_codes(
+        long1, long2, 8.0, np.int8, workers=2, progress=finished.append
+    )
+    expected = aspect_code_matrices(long1, long2, 8.0, np.int8)
+    np.testing.assert_array_equal(codes, expected)
+    assert codes.dtype == np.int8 and sum(finished) == 1500
+    assert parallel_aspect_codes(long1[:0], long2[:0], 8.0, np.int8).shape == (0, 10, 7)  # noqa: E501
+
+
+def test_parallel_batch_matches_serial(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(integration, "PARALLEL_MIN_PAIRS", 10)
+    pairs = _pairs(600)
+    # A pair with other planets forms its own group
+    pairs.insert(7, ({"Sun": 10.0, "Moon": 200.0}, {"Sun": 70.0}))
+
+    serial = integration.OptimizedVectorizedAspectCalculator(
+        enable_caching=False, enable_monitoring=False
+    )
+    parallel = integration.OptimizedVectorizedAspectCalculator(
+        enable_caching=False, enable_monitoring=False, workers=2
+    )
+    progress = []
+    expected = serial.calculate_large_batch_synastry(pairs)
+    results = parallel.calculate_large_batch_synastry(
+        pairs, progress_callback=lambda *update: progress.append(update)
+    )
+
+    assert len(results) == len(expected)
+    for result, reference in zip(results, expected):
+        assert result.dtype == reference.dtype
+        np.testing.assert_array_equal(result, reference)
+    assert results[7].tolist() == [[2], [0]]
+    done = [update[1] for update in progress]
+    assert done == sorted(done) and progress[-1] == (100.0, 601, 601)
+
+
+def test_parallel_batch_serves_cache_hits(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(integration, "PARALLEL_MIN_PAIRS", 1)
+    calculator = integration.OptimizedVectorizedAspectCalculator(
+        enable_monitoring=False, workers=2
+    )
+    calculator.clear_cache()
+    pairs = _pairs(3, seed=2)
+    first = calculator.calculate_large_batch_synastry(pairs)
+    # Cached matrices do not pin the batch array they were computed in
+    assert all(matrix.base is None for matrix in first)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached pairs must not be recomputed")
+
+    monkeypatch.setattr(integration, "parallel_aspect_codes", fail)
+    progress = []
+    second = calculator.calculate_large_batch_synastry(
+        pairs, progress_callback=lambda *update: progress.append(update)
+    )
+    for cached, computed in zip(second, first):
+        np.testing.assert_array_equal(cached, computed)
+    assert progress == [(100.0, 3, 3)]
+    calculator.clear_cache()
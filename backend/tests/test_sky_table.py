@@ -0,0 +1,140 @@
+"""Tests for the shared daily sky table."""
+
+import os
+import sys
+from typing import Dict, Tuple
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.sky_table import BLOCK_DAYS, SkyTable  # noqa: E402
+
+START_JD = 2460310.5  # 2024-01-01 0h UT
+BODIES = {name: int(tc.PLANETS[name]["id"]) for name in ("sun", "moon", "mars")}  # noqa: E501
+
+
+def _counting_motion(calls: Dict[str, int]):
+    def motion(jd: float, planet_id: int) -> Tuple[float, float]:
+        calls["count"] += 1
+        return tc.calculate_planet_motion(jd, planet_id)
+
+    return motion
+
+
+def _table(calls: Dict[str, int], path: str = "") -> SkyTable:
+    return SkyTable(
+        BODIES,
+        _counting_motion(calls),
+        start_jd=START_JD,
+        end_jd=START_JD + 2 * BLOCK_DAYS + 10,
+        path=path or None,
+    )
+
+
+def test_day_samples_match_ephemeris():
+    table = _table({"count": 0})
+    jds = START_JD + np.arange(0, 300, 7, dtype=np.float64)
+    for body, body_id in BODIES.items():
+        lon, speed = table.sample(body, jds)
+        expected = np.array(
+            [tc.calculate_planet_motion(float(jd), body_id) for jd in jds]
+        )
+        assert lon == pytest.approx(expected[:, 0], abs=1e-9)
+        assert speed == pytest.approx(expected[:, 1], abs=1e-9)
+
+
+def test_times_between_samples_are_interpolated():
+    table = _table({"count": 0})
+    jds = START_JD + 3.0 + np.linspace(0.0, 40.0, 97)
+    lon, speed = table.sample("moon", jds)
+    moon_id = BODIES["moon"]
+    for jd, value, rate in zip(jds, lon, speed):
+        expected, expected_speed = tc.calculate_planet_motion(float(jd), moon_id)  # noqa: E501
+        assert abs((value - expected + 180) % 360 - 180) < 1e-3
+        assert rate == pytest.approx(expected_speed, abs=1e-2)
+
+
+def test_blocks_are_built_once():
+    calls = {"count": 0}
+    table = _table(calls)
+    table.sample("sun", START_JD + np.array([1.0, 20.5, 100.0]))
+    assert calls["count"] == BLOCK_DAYS * len(BODIES)
+    table.sample("mars", START_JD + np.arange(0.0, 200.0))
+    assert calls["count"] == BLOCK_DAYS * len(BODIES)
+    stats = table.stats()
+    assert stats["blocks_built"] == 1
+    assert stats["backing"] == "memory"
+
+
+def test_outside_range_is_rejected_and_sampler_falls_back():
+    table = _table({"count": 0})
+    with pytest.raises(ValueError, match="outside the sky table"):
+        table.sample("sun", np.array([START_JD - 1.0]))
+
+    jds = np.array([2378496.5, 2378497.5])  # 1800
+    lon, _ = tc._sample_planet_motion("sun", jds)
+    assert lon[0] == pytest.approx(
+        tc.calculate_planet_motion(float(jds[0]), BODIES["sun"])[0]
+    )
+
+
+def test_mmap_backing_is_reused(tmp_path):
+    calls = {"count": 0}
+    table = _table(calls, str(tmp_path))
+    table.build()
+    built = calls["count"]
+    assert built == table.n_days * len(BODIES)
+    assert table.stats()["backing"] == "mmap"
+
+    reopened = _table(calls, str(tmp_path))
+    jds = START_JD + np.arange(0.0, 500.0, 3.0)
+    expected = table.sample("moon", jds)
+    assert reopened.sample("moon", jds)[0] == pytest.approx(expected[0])
+    assert calls["count"] == built
+
+
+def test_blocks_with_failed_positions_are_not_stored(tmp_path):
+    calls = {"count": 0}
+    failing = {"on": True}
+
+    def motion(jd: float, planet_id: int) -> Tuple[float, float]:
+        calls["count"] += 1
+        if failing["on"] and planet_id == BODIES["mars"]:
+            return np.nan, np.nan
+        return tc.calculate_planet_motion(jd, planet_id)
+
+    table = SkyTable(
+        BODIES, motion, start_jd=START_JD, end_jd=START_JD + 100,
+        path=str(tmp_path),
+    )
+    jds = START_JD + np.array([1.0, 50.0])
+    assert np.isnan(table.sample("mars", jds)[0]).all()
+    assert table.stats()["blocks_filled"] == 0
+
+    failing["on"] = False
+    reopened = SkyTable(
+        BODIES, motion, start_jd=START_JD, end_jd=START_JD + 100,
+        path=str(tmp_path),
+    )
+    assert np.isfinite(reopened.sample("mars", jds)[0]).all()
+    assert reopened.stats()["blocks_filled"] == 1
+
+
+def test_ephemeris_failures_are_nan_for_the_table(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    class FailingEphemeris:
+        FLG_SWIEPH = FLG_SPEED = 0
+
+        def calc_ut(self, *args):
+            raise RuntimeError("no ephemeris files")
+
+    monkeypatch.setattr(tc, "swe", FailingEphemeris())
+    assert np.isnan(tc._ephemeris_motion(START_JD, BODIES["sun"])).all()
+    assert tc.calculate_planet_motion(START_JD, BODIES["sun"]) == (0.0, 0.0)
+
+    monkeypatch.setattr(tc, "swe", None)
+    assert np.isnan(tc._ephemeris_motion(START_JD, BODIES["sun"])).all()
@@ -0,0 +1,114 @@
+"""Tests for one-vs-many synastry scoring."""
+
+import os
+import random
+import sys
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.aspect_utils import PLANETS, build_aspect_matrix  # noqa: E402
+from utils.compatibility_utils import (  # noqa: E402
+    calculate_compatibility_score,
+)
+from utils.house_overlay_utils import (  # noqa: E402
+    analyze_house_overlays,
+    find_house,
+)
+from utils.synastry_batch import (  # noqa: E402
+    houses_for,
+    score_candidates,
+    stack_longitudes,
+    top_k,
+)
+from utils.vectorized_aspect_utils import vectorized_calculator  # noqa: E402
+
+
+def _chart(rng: random.Random) -> Dict[str, float]:
+    return {p: rng.uniform(0, 360) for p in PLANETS}
+
+
+def _cusps(rng: random.Random) -> List[float]:
+    start = rng.uniform(0, 360)
+    widths = [rng.uniform(15, 45) for _ in range(12)]
+    scale = 360 / sum(widths)
+    cusps, offset = [], 0.0
+    for width in widths:
+        cusps.append((start + offset) % 360)
+        offset += width * scale
+    return cusps
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_scores_match_pairwise_compatibility(seed: int):
+    rng = random.Random(seed)
+    reference, reference_cusps = _chart(rng), _cusps(rng)
+    charts = [_chart(rng) for _ in range(200)]
+    cusps = [_cusps(rng) for _ in charts]
+
+    scores = score_candidates(
+        reference, stack_longitudes(charts), reference_cusps, cusps
+    )
+    for i, chart in enumerate(charts):
+        expected = calculate_compatibility_score(
+            build_aspect_matrix(reference, chart),
+            analyze_house_overlays(reference, cusps[i], chart, reference_cusps),  # noqa: E501
+        )
+        assert round(scores["overall_score"][i], 1) == expected["overall_score"]  # noqa: E501
+        meta = expected["meta"]
+        assert scores["overlay_bonus"][i] == meta["overlay_bonus_applied"]
+        assert {
+            name: int(scores[name][i]) for name in meta["aspect_type_counts"]
+        } == meta["aspect_type_counts"]
+
+
+def test_chunking_does_not_change_scores():
+    rng = np.random.default_rng(4)
+    candidates = rng.uniform(0, 360, (1000, len(PLANETS)))
+    reference = dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS))))
+    whole = vectorized_calculator.score_one_to_many(
+        reference, candidates, chunk_size=5000
+    )
+    chunked = vectorized_calculator.score_one_to_many(
+        reference, candidates, chunk_size=7
+    )
+    np.testing.assert_allclose(whole[0], chunked[0])
+    np.testing.assert_array_equal(whole[1], chunked[1])
+    with pytest.raises(ValueError, match="shape"):
+        vectorized_calculator.score_one_to_many(reference, candidates[:, :3])
+
+
+def test_houses_match_find_house():
+    rng = random.Random(7)
+    cusps = [_cusps(rng) for _ in range(50)]
+    longitudes = np.array([[rng.uniform(0, 360) for _ in range(4)] for _ in cusps])  # noqa: E501
+    houses = houses_for(longitudes, np.array(cusps))
+    for i, row in enumerate(longitudes):
+        assert list(houses[i]) == [find_house(lon, cusps[i]) for lon in row]
+
+    # The 12th house may be the one that crosses 0 degrees
+    wrapped = [10.0 + 30 * i for i in range(11)] + [350.0]
+    assert find_house(5.0, wrapped) == 12
+    assert houses_for(np.array([[5.0, 10.0]]), np.array(wrapped)).tolist() == [[12, 1]]  # noqa: E501
+
+
+def test_batched_aspects_match_single_matrices():
+    rng = np.random.default_rng(2)
+    separations = rng.uniform(0, 180, (5, 10, 10))
+    batched = vectorized_calculator.find_aspects_vectorized(separations)
+    for i in range(5):
+        single = vectorized_calculator.find_aspects_vectorized(separations[i])
+        for a, b in zip(batched, single):
+            np.testing.assert_array_equal(a[i], b)
+
+
+def test_top_k_orders_best_first_with_stable_ties():
+    scores = np.array([1.0, 3.0, 3.0, 2.0, 3.0])
+    assert top_k(scores, 2) == [1, 2]
+    assert top_k(scores, 4) == [1, 2, 4, 3]
+    assert top_k(scores, 10) == [1, 2, 4, 3, 0]
+    assert top_k(scores, 0) == []
+    assert stack_longitudes([]).shape == (0, len(PLANETS))
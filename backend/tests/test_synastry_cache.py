@@ -0,0 +1,127 @@
+"""Tests for the bounded synastry result cache."""
+
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.synastry_cache import SynastryCache, pair_key  # noqa: E402
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        assert ttl > 0
+        self.store[key] = value
+
+
+class BrokenRedis:
+    def get(self, key: str) -> Optional[bytes]:
+        raise ConnectionError("redis down")
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        raise ConnectionError("redis down")
+
+
+def _payload(size: int = 10) -> Dict[str, str]:
+    return {"summary": "x" * size}
+
+
+def _size(value: Dict[str, str]) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def test_pair_key_is_canonical_and_ordered():
+    a = (2448000.25, 51.50001, -0.12)
+    b = (2450000.5, 40.7128, -74.006)
+    assert pair_key(a, b) == pair_key((2448000.2500000004, 51.5, -0.12), b)
+    assert pair_key(a, b) != pair_key(b, a)
+    # Coordinates are part of the key
+    assert pair_key(a, b) != pair_key((a[0], 48.85, 2.35), b)
+    # So are the options that change the payload
+    assert pair_key(a, b, variant="vec") != pair_key(a, b, variant="std")
+
+
+def test_entry_limit_evicts_least_recently_used():
+    events: List[str] = []
+    cache = SynastryCache(max_entries=2, on_event=events.append)
+    cache.set("a", _payload())
+    cache.set("b", _payload())
+    assert cache.get("a") == _payload()
+    cache.set("c", _payload())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert events.count("evict") == 1
+    assert events.count("store") == 3
+    stats = cache.stats()
+    assert stats["hit"] == 3 and stats["miss"] == 1
+    assert stats["entries"] == 2
+
+
+def test_byte_limit_accounts_payload_sizes():
+    small, large = _payload(100), _payload(700)
+    cache = SynastryCache(max_bytes=_size(large) + 2 * _size(small))
+    cache.set("s1", small)
+    cache.set("s2", small)
+    cache.set("big", large)
+    assert cache.stats()["bytes"] == _size(large) + 2 * _size(small)
+    cache.set("s3", small)
+    # The oldest entry makes room
+    assert cache.get("s1") is None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+    # Payloads larger than the whole budget are not kept in memory
+    cache.set("huge", _payload(10_000))
+    assert cache.get("huge") is None
+    assert len(cache) == 3
+
+
+def test_expired_entries_are_dropped():
+    events: List[str] = []
+    cache = SynastryCache(ttl_seconds=0, on_event=events.append)
+    cache.set("k", _payload())
+    assert cache.get("k") is None
+    assert events == ["store", "expired"]
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_redis_tier_is_shared_between_workers():
+    redis = FakeRedis()
+    worker1 = SynastryCache(redis_client_factory=lambda: redis)
+    worker2 = SynastryCache(redis_client_factory=lambda: redis)
+    worker1.set("pair", _payload(500))
+    assert len(redis.store["pair"]) < _size(_payload(500))
+
+    assert worker2.get("pair") == _payload(500)
+    stats = worker2.stats()
+    assert stats["redis_hit"] == 1 and stats["hit"] == 1
+    # Now also in worker 2's memory tier
+    assert len(worker2) == 1
+
+
+def test_redis_errors_fall_back_to_memory():
+    cache = SynastryCache(redis_client_factory=BrokenRedis)
+    cache.set("k", _payload())
+    assert cache.get("k") == _payload()
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert stats["redis_error"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_metric_hook_errors_are_ignored():
+    def broken(event: str) -> None:
+        raise RuntimeError("metrics down")
+
+    cache = SynastryCache(on_event=broken)
+    cache.set("k", _payload())
+    assert cache.get("k") == _payload()
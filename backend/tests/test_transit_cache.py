@@ -0,0 +1,195 @@
+"""Tests for the /transits result cache and partial-range reuse."""
+
+import asyncio
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pytest
+from fastapi import BackgroundTasks
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.transit_cache import TransitResultCache  # noqa: E402
+from utils.redis_tier import compress_json, decompress_json  # noqa: E402
+
+
+class FakeRedis:
+    """Minimal MGET/pipeline subset of the redis client."""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+        self.mget_calls = 0
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self) -> "FakeRedis":
+        return self
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        assert ttl > 0
+        self.store[key] = value
+
+    def execute(self) -> None:
+        pass
+
+
+class BrokenRedis:
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        raise ConnectionError("redis down")
+
+    def pipeline(self) -> "BrokenRedis":
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[TransitResultCache]:
+    fresh = TransitResultCache(max_entries=5000)
+    monkeypatch.setattr(tc, "transit_cache", fresh)
+    yield fresh
+
+
+def _request(start: str, end: str, **kwargs: Any) -> tc.TransitCalculationRequest:  # noqa: E501
+    return tc.TransitCalculationRequest(
+        birth_data=tc.BirthData(
+            birth_date="1985-06-15",
+            birth_time="14:30:00",
+            latitude=51.5,
+            longitude=-0.12,
+        ),
+        date_range=tc.DateRange(start_date=start, end_date=end),
+        **kwargs,
+    )
+
+
+def _run(request: tc.TransitCalculationRequest) -> List[tc.TransitResult]:
+    return asyncio.run(tc.calculate_transits(request, BackgroundTasks()))
+
+
+def _count_searched_days(monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
+    calls = {"count": 0}
+    original = tc.find_transit_hits
+
+    def counting(day_jds: Sequence[float], *args: Any) -> Any:
+        calls["count"] += len(day_jds)
+        return original(day_jds, *args)
+
+    monkeypatch.setattr(tc, "find_transit_hits", counting)
+    return calls
+
+
+def test_payload_roundtrip_is_compressed():
+    value = [{"id": f"mars_trine_sun_{i}", "orb": 0.5} for i in range(200)]
+    payload, size = compress_json(value)
+    assert decompress_json(payload) == (value, size)
+    assert len(payload) < size / 4
+
+
+def test_repeat_request_is_served_from_cache(
+    cache: TransitResultCache, monkeypatch: pytest.MonkeyPatch
+):
+    first = _run(_request("2024-03-01", "2024-03-10"))
+    calls = _count_searched_days(monkeypatch)
+    second = _run(_request("2024-03-01", "2024-03-10"))
+    assert calls["count"] == 0
+    assert [r.model_dump() for r in second] == [r.model_dump() for r in first]
+
+
+def test_overlapping_range_only_computes_new_days(
+    cache: TransitResultCache, monkeypatch: pytest.MonkeyPatch
+):
+    _run(_request("2024-03-01", "2024-03-31"))
+    calls = _count_searched_days(monkeypatch)
+    combined = _run(_request("2024-03-20", "2024-04-05"))
+    reused_calls = calls["count"]
+
+    cache.clear()
+    calls["count"] = 0
+    fresh = _run(_request("2024-03-20", "2024-04-05"))
+    # Only the five April days are searched when March is cached
+    assert reused_calls == 5
+    assert calls["count"] == 17
+    assert [r.model_dump() for r in combined] == [
+        r.model_dump() for r in fresh
+    ]
+
+
+def test_options_are_part_of_the_key(cache: TransitResultCache):
+    majors = _run(_request("2024-03-01", "2024-03-05"))
+    with_minor = _run(
+        _request("2024-03-01", "2024-03-05", include_minor_aspects=True)
+    )
+    assert len(with_minor) >= len(majors)
+    tight = _run(_request("2024-03-01", "2024-03-05", orb_profile="tight"))
+    assert len(tight) <= len(majors)
+
+
+def test_redis_tier_shares_results_between_instances(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    redis = FakeRedis()
+    writer = TransitResultCache(redis_client_factory=lambda: redis)
+    monkeypatch.setattr(tc, "transit_cache", writer)
+    expected = _run(_request("2024-05-01", "2024-05-07"))
+    assert redis.store and writer.stats()["compressed_bytes"] > 0
+
+    reader = TransitResultCache(redis_client_factory=lambda: redis)
+    monkeypatch.setattr(tc, "transit_cache", reader)
+    redis.mget_calls = 0
+    calls = _count_searched_days(monkeypatch)
+    assert [r.model_dump() for r in _run(_request("2024-05-03", "2024-05-06"))] == [  # noqa: E501
+        r.model_dump() for r in expected if "2024-05-03" <= r.date <= "2024-05-06"  # noqa: E501
+    ]
+    assert calls["count"] == 0
+    assert reader.stats()["redis_hits"] == 4
+    # One lookup for the request key, one for all of its days
+    assert redis.mget_calls == 2
+
+
+def test_redis_failure_falls_back_to_memory():
+    cache = TransitResultCache(redis_client_factory=BrokenRedis)
+    cache.set("k", [{"a": 1}])
+    assert cache.get("k") == [{"a": 1}]
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert stats["redis_errors"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_lru_eviction_and_ttl():
+    cache = TransitResultCache(max_entries=2)
+    cache.set("a", [])
+    cache.set("b", [])
+    cache.get("a")
+    cache.set("c", [])
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["evictions"] == 1
+
+    expired = TransitResultCache(ttl_seconds=0)
+    expired.set("a", [])
+    assert expired.get("a") is None
+
+
+def test_memory_tier_is_bounded_by_payload_size():
+    day = [{"id": f"mars_trine_sun_{i}", "orb": 0.5} for i in range(10)]
+    day_bytes = len(json.dumps(day, separators=(",", ":")))
+    cache = TransitResultCache(max_bytes=3 * day_bytes)
+    cache.set_many({f"day{i}": day for i in range(3)})
+    assert cache.stats()["bytes"] == 3 * day_bytes
+
+    # A fourth entry evicts the least recently used one
+    cache.get("day0")
+    cache.set("day3", day)
+    keys = [f"day{i}" for i in range(4)]
+    assert set(cache.get_many(keys)) == {"day0", "day2", "day3"}
+    # A range result larger than the whole tier is not kept in memory
+    cache.set("range", day * 4)
+    assert cache.get("range") is None
+    stats = cache.stats()
+    assert stats["bytes"] == 3 * day_bytes and stats["evictions"] == 1
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,169 @@
+"""Tests for the vectorized transit grid search."""
+
+import asyncio
+import math
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Tuple
+
+import numpy as np
+import pytest
+from fastapi import BackgroundTasks
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.transit_cache import TransitResultCache  # noqa: E402
+from astro.calculations.transit_engine import (  # noqa: E402
+    body_grid_params,
+    find_transit_hits,
+)
+
+
+def _linear(speed: float, start: float = 0.0):
+    def sample(body: str, jds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return (start + speed * jds) % 360.0, np.full(len(jds), speed)
+
+    return sample
+
+
+def test_linear_motion_window_and_exact_time():
+    # 1 deg/day from 0 deg: the square to 100 deg (at 10 deg) is exact on
+    # day 10 and within the 2 deg orb from day 8 to day 12
+    hits = find_transit_hits(
+        day_jds=[9.0, 10.0, 11.5, 13.0],
+        bodies=["sun"],
+        natal={"moon": 100.0},
+        aspect_angles=[0.0, 90.0],
+        orbs={"sun": np.array([[2.0, 2.0]])},
+        sample_motion=_linear(1.0),
+    )
+    assert [h["day_index"] for h in hits] == [0, 1, 2]
+    for hit in hits:
+        assert hit["aspect_index"] == 1
+        assert hit["entry_jd"] == pytest.approx(8.0)
+        assert hit["exit_jd"] == pytest.approx(12.0)
+        assert hit["exact_jd"] == pytest.approx(10.0)
+    assert hits[2]["orb"] == pytest.approx(1.5)
+
+
+def test_retrograde_loop_reports_nearest_exact_pass():
+    # Longitude 10 + 3 sin(t / 10): crosses a conjunction with 10 deg
+    # many times; the reported exact is the crossing nearest the day
+    def sample(body: str, jds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return 10 + 3 * np.sin(jds / 10), 0.3 * np.cos(jds / 10)
+
+    hits = find_transit_hits(
+        day_jds=[30.0],
+        bodies=["jupiter"],
+        natal={"sun": 10.0},
+        aspect_angles=[0.0],
+        orbs={"jupiter": np.array([[5.0]])},
+        sample_motion=sample,
+    )
+    (hit,) = hits
+    assert hit["exact_jd"] == pytest.approx(10 * np.pi, abs=1e-4)
+    # Always within 3 deg of the natal point: the window is the full pad
+    _, pad = body_grid_params("jupiter", 5.0)
+    assert hit["exit_jd"] - hit["entry_jd"] == pytest.approx(2 * pad)
+
+
+def _legacy_rows(request: tc.TransitCalculationRequest, days):
+    natal = tc.calculate_natal_chart(
+        request.birth_data.birth_date,
+        request.birth_data.birth_time,
+        request.birth_data.latitude,
+        request.birth_data.longitude,
+    )
+    rows = {}
+    for day in days:
+        jd = tc.julian_day(day)
+        for planet, data in tc.PLANETS.items():
+            motion = tc._ephemeris_motion if tc.swe else tc.calculate_planet_motion  # noqa: E501
+            lon, speed = motion(jd, int(data["id"]))
+            if math.isnan(lon):
+                # Bodies without ephemeris data have no transits
+                continue
+            for natal_planet, natal_lon in natal.items():
+                info = tc.calculate_aspect(
+                    lon, natal_lon, request.orb,
+                    profile=request.orb_profile, planet1=planet,
+                    planet2=natal_planet, speed1=speed, speed2=0.0,
+                )  # fmt: skip
+                if info is None or (
+                    info["type"] == "minor"
+                    and not request.include_minor_aspects
+                ):
+                    continue
+                key = f"{planet}_{info['aspect']}_{natal_planet}_{day.strftime('%Y%m%d')}"  # noqa: E501
+                rows[key] = info
+    return rows
+
+
+@pytest.mark.parametrize(
+    "orb, minor, profile",
+    [(2.0, False, "transit"), (6.0, True, "transit"), (8.0, True, "tight")],
+)
+def test_matches_per_day_aspect_checks(
+    orb: float, minor: bool, profile: str, monkeypatch: pytest.MonkeyPatch
+):
+    request = tc.TransitCalculationRequest(
+        birth_data=tc.BirthData(
+            birth_date="1979-11-03",
+            birth_time="06:15:00",
+            latitude=40.4,
+            longitude=-3.7,
+        ),
+        date_range=tc.DateRange(
+            start_date="2023-02-01", end_date="2023-03-15"
+        ),
+        include_minor_aspects=minor,
+        orb=orb,
+        orb_profile=profile,
+    )
+    monkeypatch.setattr(tc, "transit_cache", TransitResultCache())
+    results = asyncio.run(tc.calculate_transits(request, BackgroundTasks()))
+    days = [datetime(2023, 2, 1) + timedelta(days=i) for i in range(43)]
+    legacy = _legacy_rows(request, days)
+
+    assert {r.id for r in results} == set(legacy)
+    for result in results:
+        info = legacy[result.id]
+        assert result.orb == pytest.approx(info["orb"], abs=1e-3)
+        assert result.applying == info.get("applying")
+        assert result.duration_days >= 1
+
+
+def test_exact_time_is_exact():
+    natal = {"sun": 123.4, "saturn": 301.0}
+    days = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+    request = tc.TransitCalculationRequest(
+        birth_data=tc.BirthData(
+            birth_date="2000-01-01",
+            birth_time="12:00:00",
+            latitude=0.0,
+            longitude=0.0,
+        ),
+        date_range=tc.DateRange(start_date="2024-01-01", end_date="2024-02-29"),  # noqa: E501
+        orb=4.0,
+    )
+    checked = 0
+    for day_results in tc._transits_for_days(days, natal, request):
+        for result in day_results:
+            if result.exact_time is None:
+                continue
+            planet = result.id.split("_")[0]
+            natal_planet = result.id.split("_")[-2]
+            jd = tc.julian_day(
+                datetime.strptime(result.exact_time, "%Y-%m-%dT%H:%M:%SZ")
+            )
+            lon, _ = tc.calculate_planet_motion(
+                jd, int(tc.PLANETS[planet]["id"])
+            )
+            separation = abs((lon - natal[natal_planet] + 180) % 360 - 180)
+            assert separation == pytest.approx(
+                tc.ASPECTS[result.aspect]["angle"], abs=0.02
+            )
+            checked += 1
+    assert checked > 10
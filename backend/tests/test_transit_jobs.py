@@ -0,0 +1,187 @@
+"""Tests for background transit and lunar jobs."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.transit_cache import TransitResultCache  # noqa: E402
+from astro.calculations.transit_jobs import (  # noqa: E402
+    JobFailed,
+    TransitJobManager,
+)
+
+BIRTH = tc.BirthData(
+    birth_date="1985-06-15",
+    birth_time="14:30:00",
+    latitude=51.5,
+    longitude=-0.12,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch: pytest.MonkeyPatch) -> Iterator[TransitJobManager]:
+    monkeypatch.setattr(tc, "transit_cache", TransitResultCache())
+    manager = TransitJobManager(max_workers=3)
+    monkeypatch.setattr(tc, "transit_jobs", manager)
+    yield manager
+
+
+def _transit_request(start: str, end: str) -> tc.TransitCalculationRequest:
+    return tc.TransitCalculationRequest(
+        birth_data=BIRTH,
+        date_range=tc.DateRange(start_date=start, end_date=end),
+    )
+
+
+def _run_job(status: tc.TransitJobStatus) -> List[Dict[str, Any]]:
+    job = tc.transit_jobs.get(status.job_id)
+    assert job is not None and job.wait(timeout=120)
+    return asyncio.run(tc.get_transit_job_results(status.job_id))
+
+
+def test_transit_job_matches_monthly_requests():
+    # Longer than the synchronous limit but within the job limit
+    long_request = _transit_request("2024-11-10", "2026-02-05")
+    with pytest.raises(HTTPException):
+        tc._validate_transit_request(long_request)
+    assert len(tc._month_ranges(
+        *tc._validate_transit_request(long_request, tc.MAX_JOB_DAYS)
+    )) == 16
+
+    request = _transit_request("2024-12-10", "2025-02-05")
+    status = asyncio.run(tc.submit_transit_job(request))
+    assert status.chunks_total == 3
+    results = _run_job(status)
+
+    progress = asyncio.run(tc.get_transit_job(status.job_id))
+    assert progress.status == "completed"
+    assert progress.chunks_done == 3
+    assert progress.result_count == len(results)
+
+    expected = [
+        item
+        for month_start, month_end in tc._month_ranges(
+            *tc._validate_transit_request(request, tc.MAX_JOB_DAYS)
+        )
+        for item in tc._transit_payload(request, month_start, month_end)
+    ]
+    assert results == expected
+    assert results[0]["date"] == "2024-12-10"
+    assert results[-1]["date"] == "2025-02-05"
+
+
+def test_rerun_and_overlap_reuse_cached_chunks(monkeypatch: pytest.MonkeyPatch):  # noqa: E501
+    _run_job(asyncio.run(tc.submit_transit_job(_transit_request("2024-01-01", "2024-01-31"))))  # noqa: E501
+
+    searched = {"days": 0}
+    original = tc.find_transit_hits
+
+    def counting(day_jds: Any, *args: Any) -> Any:
+        searched["days"] += len(day_jds)
+        return original(day_jds, *args)
+
+    monkeypatch.setattr(tc, "find_transit_hits", counting)
+    _run_job(asyncio.run(tc.submit_transit_job(_transit_request("2024-01-01", "2024-01-31"))))  # noqa: E501
+    assert searched["days"] == 0
+    _run_job(asyncio.run(tc.submit_transit_job(_transit_request("2024-01-01", "2024-02-29"))))  # noqa: E501
+    # Only February is new
+    assert searched["days"] == 29
+
+
+def test_lunar_job_streams_months_in_order():
+    request = tc.LunarTransitRequest(
+        birth_data=BIRTH,
+        date_range=tc.DateRange(start_date="2024-01-15", end_date="2024-08-14"),  # noqa: E501
+    )
+    with pytest.raises(HTTPException):
+        tc._validate_lunar_request(request)
+    status = asyncio.run(tc.submit_lunar_transit_job(request))
+    response = asyncio.run(
+        tc.stream_transit_job(status.job_id, stream_format="sse")
+    )
+
+    async def read() -> str:
+        return b"".join([chunk async for chunk in response.body_iterator]).decode()  # type: ignore[misc]  # noqa: E501
+
+    body = asyncio.run(read())
+    months = [
+        json.loads(block.split("data: ", 1)[1])["month"]
+        for block in body.split("\n\n")
+        if block.startswith("event: month")
+    ]
+    assert months == [f"2024-{m:02d}" for m in range(1, 9)]
+    assert body.count("event: lunar_transit\n") == 213
+    assert json.loads(body.split("event: end\ndata: ")[1]) == {"count": 213}
+
+
+def test_failed_chunk_fails_the_job():
+    manager = TransitJobManager(max_workers=1)
+
+    def broken() -> List[Dict[str, Any]]:
+        raise RuntimeError("ephemeris down")
+
+    job = manager.submit("transits", [("2024-01", lambda: [{"a": 1}]), ("2024-02", broken)])  # noqa: E501
+    assert job.wait(timeout=10)
+    assert job.status == "failed"
+    assert "2024-02: ephemeris down" in (job.error or "")
+    chunks = job.iter_chunks()
+    assert next(chunks) == ("2024-01", [{"a": 1}])
+    with pytest.raises(JobFailed):
+        next(chunks)
+
+
+def test_cancel_and_unknown_job(isolated: TransitJobManager):
+    gate = threading.Event()
+
+    def slow() -> List[Dict[str, Any]]:
+        gate.wait(10)
+        return []
+
+    job = isolated.submit("transits", [("2024-01", slow), ("2024-02", slow)])
+    status = asyncio.run(tc.cancel_transit_job(job.job_id))
+    gate.set()
+    assert status.status == "cancelled"
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tc.get_transit_job_results(job.job_id))
+    assert exc_info.value.status_code == 409
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tc.get_transit_job("missing"))
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "start, end", [("not-a-date", "2024-02-01"), ("2024-03-01", "2024-02-01")]
+)
+def test_jobs_reject_bad_dates(start: str, end: str):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tc.submit_transit_job(_transit_request(start, end)))
+    assert exc_info.value.status_code == 400
+    lunar = tc.LunarTransitRequest(
+        birth_data=BIRTH, date_range=tc.DateRange(start_date=start, end_date=end)  # noqa: E501
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tc.submit_lunar_transit_job(lunar))
+    assert exc_info.value.status_code == 400
+
+
+def test_job_table_limit():
+    manager = TransitJobManager(max_workers=1, max_jobs=1)
+    gate = threading.Event()
+
+    def slow() -> List[Dict[str, Any]]:
+        gate.wait(10)
+        return []
+
+    manager.submit("transits", [("2024-01", slow)])
+    with pytest.raises(ValueError, match="Too many"):
+        manager.submit("transits", [])
+    gate.set()
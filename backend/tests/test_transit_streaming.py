@@ -0,0 +1,154 @@
+"""Tests for streamed /transits and /lunar-transits results."""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from fastapi.responses import StreamingResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations import transits_clean as tc  # noqa: E402
+from astro.calculations.transit_cache import TransitResultCache  # noqa: E402
+
+BIRTH = tc.BirthData(
+    birth_date="1992-09-21",
+    birth_time="08:45:00",
+    latitude=-33.87,
+    longitude=151.21,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tc, "transit_cache", TransitResultCache())
+
+
+def _body(response: StreamingResponse) -> str:
+    async def collect() -> str:
+        chunks: List[bytes] = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode())  # noqa: E501
+        return b"".join(chunks).decode()
+
+    return asyncio.run(collect())
+
+
+def _sse_events(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events: List[Tuple[str, Dict[str, Any]]] = []
+    for block in body.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append((name[len("event: "):], json.loads(data[len("data: "):])))  # noqa: E501
+    return events
+
+
+def _transit_request(start: str, end: str) -> tc.TransitCalculationRequest:
+    return tc.TransitCalculationRequest(
+        birth_data=BIRTH,
+        date_range=tc.DateRange(start_date=start, end_date=end),
+        include_minor_aspects=True,
+    )
+
+
+def test_month_ranges_split_on_calendar_months():
+    ranges = tc._month_ranges(datetime(2024, 1, 30), datetime(2024, 3, 2))
+    assert ranges == [
+        (datetime(2024, 1, 30), datetime(2024, 1, 31)),
+        (datetime(2024, 2, 1), datetime(2024, 2, 29)),
+        (datetime(2024, 3, 1), datetime(2024, 3, 2)),
+    ]
+
+
+def test_ndjson_stream_matches_list_endpoint():
+    request = _transit_request("2024-01-20", "2024-02-10")
+    response = asyncio.run(tc.stream_transits(request, stream_format="ndjson"))
+    assert response.media_type == "application/x-ndjson"
+    streamed = [json.loads(line) for line in _body(response).splitlines()]
+
+    expected = asyncio.run(tc.calculate_transits(request, BackgroundTasks()))
+    assert streamed and streamed == [r.model_dump() for r in expected]
+
+
+def test_sse_stream_reports_months_and_end():
+    request = _transit_request("2024-01-20", "2024-02-10")
+    response = asyncio.run(tc.stream_transits(request, stream_format="sse"))
+    assert response.media_type == "text/event-stream"
+    events = _sse_events(_body(response))
+
+    months = [data for name, data in events if name == "month"]
+    assert [m["month"] for m in months] == ["2024-01", "2024-02"]
+    transits = [data for name, data in events if name == "transit"]
+    assert len(transits) == sum(m["count"] for m in months)
+    assert events[-1] == ("end", {"count": len(transits)})
+    # Results of a month arrive before that month's progress event
+    first_month = events.index(("month", months[0]))
+    assert all(e[1]["date"] < "2024-02-01" for e in events[:first_month])
+
+
+def test_month_chunks_are_cached_for_calendar_views():
+    request = _transit_request("2024-01-20", "2024-02-10")
+    _body(asyncio.run(tc.stream_transits(request, stream_format="ndjson")))
+    hits = tc.transit_cache.stats()["memory_hits"]
+    february = _transit_request("2024-02-01", "2024-02-10")
+    asyncio.run(tc.calculate_transits(february, BackgroundTasks()))
+    assert tc.transit_cache.stats()["memory_hits"] == hits + 1
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ("2024-01-01", "2025-06-01"),
+        ("2024-13-01", "2024-02-01"),
+        ("2024-03-01", "2024-02-01"),
+    ],
+)
+def test_invalid_range_fails_before_streaming(start: str, end: str):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(
+            tc.stream_transits(
+                _transit_request(start, end), stream_format="ndjson"
+            )
+        )
+    assert exc_info.value.status_code == 400
+    lunar = tc.LunarTransitRequest(
+        birth_data=BIRTH, date_range=tc.DateRange(start_date=start, end_date=end)  # noqa: E501
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tc.stream_lunar_transits(lunar, stream_format="sse"))
+    assert exc_info.value.status_code == 400
+
+
+def test_errors_after_start_are_sent_in_band(monkeypatch: pytest.MonkeyPatch):
+    def failing_payload(*args: Any) -> List[Dict[str, Any]]:
+        raise RuntimeError("ephemeris unavailable")
+
+    monkeypatch.setattr(tc, "_transit_payload", failing_payload)
+    response = asyncio.run(
+        tc.stream_transits(
+            _transit_request("2024-01-01", "2024-01-05"), stream_format="sse"
+        )
+    )
+    assert _sse_events(_body(response)) == [
+        ("error", {"error": "ephemeris unavailable"})
+    ]
+
+
+def test_lunar_stream_matches_list_endpoint():
+    request = tc.LunarTransitRequest(
+        birth_data=BIRTH,
+        date_range=tc.DateRange(start_date="2024-03-25", end_date="2024-04-04"),  # noqa: E501
+    )
+    response = asyncio.run(
+        tc.stream_lunar_transits(request, stream_format="ndjson")
+    )
+    streamed = [json.loads(line) for line in _body(response).splitlines()]
+    expected = asyncio.run(
+        tc.calculate_lunar_transits(request, BackgroundTasks())
+    )
+    assert streamed == [r.model_dump() for r in expected]
+    assert len(streamed) == 11
@@ -80,26 +80,22 @@ async def test_lunar_transits_date_range_exceeds_limit() -> None:
 
 @pytest.mark.asyncio
 async def test_minor_aspects_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
-    # For deterministic behavior monkeypatch calculate_aspect to yield a minor aspect in range  # noqa: E501
+    # Count grid searches; a fresh cache makes sure both requests compute
     from astro.calculations import transits_clean as tc
+    from astro.calculations.transit_cache import TransitResultCache
 
     calls = {"count": 0}
+    original = tc.find_transit_hits
 
-    def fake_calculate_aspect(
-        pos1: float, pos2: float, orb: float = 2.0
-    ) -> Dict[str, Any]:  # noqa: D401
-        # always return a minor aspect so filtering matters
+    def counting_find_transit_hits(*args: Any, **kwargs: Any) -> Any:
         calls["count"] += 1
-        return {
-            "aspect": "semi-square",
-            "angle": 45.0,
-            "orb": 0.5,
-            "intensity": 80.0,
-            "energy": "tension",
-            "type": "minor",
-        }
+        return original(*args, **kwargs)
 
-    monkeypatch.setattr(tc, "calculate_aspect", fake_calculate_aspect)
+    monkeypatch.setattr(tc, "find_transit_hits", counting_find_transit_hits)
+    monkeypatch.setattr(tc, "transit_cache", TransitResultCache())
+    minor = {
+        name for name, data in tc.ASPECTS.items() if data["type"] == "minor"
+    }
 
     # Mock background tasks
     from fastapi import BackgroundTasks
@@ -118,10 +114,7 @@ async def test_minor_aspects_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
     )
     transit_request_1 = TransitCalculationRequest(**payload_no_minor)
     data1 = await calculate_transits(transit_request_1, mock_background_tasks)
-    assert (
-        all(item.aspect != "semi-square" for item in data1)  # type: ignore
-        or len(data1) == 0
-    )
+    assert all(item.aspect not in minor for item in data1)  # type: ignore
 
     # With minor aspects
     payload_minor: Dict[str, Any] = dict(
@@ -14,12 +14,14 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from utils import vectorized_caching  # noqa: E402
 from utils.vectorized_caching import (  # noqa: E402
     ChartDataHasher,
     InMemoryCache,
     PersistentCache,
     TieredCacheManager,
     cached_calculation,
+    estimate_size_bytes,
 )
 
 
@@ -97,6 +99,15 @@ class TestChartDataHasher:
         assert hash1 == hash2
 
 
+class Slotted:
+    """Picklable value without a ``__dict__``."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
 class TestInMemoryCache:
     """Test in-memory caching functionality."""
 
@@ -190,6 +201,68 @@ class TestInMemoryCache:
         assert stats["hits"] == 0
         assert stats["misses"] == 0
 
+    def test_memory_limit_evicts_lru_first(self):
+        """Test byte accounting and LRU order under the memory limit."""
+        cache = InMemoryCache(max_size=100, max_memory_mb=1.0)
+        quarter = np.zeros(256 * 1024 // 8)  # 0.25 MB
+        for i in range(4):
+            cache.put(f"key{i}", quarter.copy())
+        assert cache.get_stats()["size_mb"] == 1.0
+
+        cache.get("key0")
+        cache.put("key4", quarter.copy())
+        assert list(cache.cache) == ["key2", "key3", "key0", "key4"]
+        assert cache.get_stats()["evictions"] == 1
+
+        # Replacing an entry re-counts its size and makes it most recent
+        cache.put("key2", np.zeros(8))
+        assert list(cache.cache) == ["key3", "key0", "key4", "key2"]
+        assert cache.size_bytes == 3 * quarter.nbytes + 64
+        cache.put("big", np.zeros(2 * 1024 * 1024 // 8))
+        assert len(cache.cache) == 0 and cache.size_bytes == 0
+
+    def test_size_estimates_avoid_pickling(self, monkeypatch):
+        """Test that sizes come from nbytes and sampling, not pickling."""
+        array = np.zeros((10, 10))
+        aspects = [
+            {"planet1": "Sun", "planet2": "Moon", "orb": float(i)}
+            for i in range(1000)
+        ]
+        assert estimate_size_bytes(array) == array.nbytes
+        assert estimate_size_bytes({"matrix": array}) > array.nbytes
+        # Long containers scale up the size of a sample of their items
+        assert estimate_size_bytes(aspects) == sys.getsizeof(
+            aspects
+        ) + 1000 * estimate_size_bytes(aspects[0])
+
+        class Result:
+            def __init__(self, value):
+                self.value = value
+
+        pickled = []
+        dumps = vectorized_caching.pickle.dumps
+        monkeypatch.setattr(
+            vectorized_caching.pickle,
+            "dumps",
+            lambda value: pickled.append(value) or dumps(value),
+        )
+        cache = InMemoryCache()
+        cache.put("array", array)
+        cache.put("aspects", aspects)
+        cache.put("first", Result(1))
+        cache.put("second", Result(2))
+        assert pickled == []
+
+        # Objects are sized per value, from their attributes or by pickling
+        small, large = Result(np.zeros(10)), Result(np.zeros(10000))
+        assert estimate_size_bytes(large) - estimate_size_bytes(small) == (
+            large.value.nbytes - small.value.nbytes
+        )
+        assert estimate_size_bytes(Slotted("x" * 10000)) > estimate_size_bytes(  # noqa: E501
+            Slotted("x")
+        ) + 9000
+        assert [type(value) for value in pickled] == [Slotted, Slotted]
+
 
 class TestPersistentCache:
     """Test persistent disk-based caching."""
@@ -0,0 +1,81 @@
+"""Parity tests for the vectorized multi-system chart engine."""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from astro.calculations.chart import calculate_multi_system_chart  # noqa: E402
+from astro.calculations.uranian import (  # noqa: E402
+    calculate_90_degree_dial,
+    calculate_midpoints,
+    calculate_uranian_planets_positions,
+)
+from astro.calculations.vedic import (  # noqa: E402
+    calculate_vedic_planets,
+    get_ayanamsa,
+)
+from utils.vectorized_multi_system_utils import (  # noqa: E402
+    calculate_90_degree_dial_vectorized,
+    calculate_midpoints_vectorized,
+    calculate_multi_system_chart_fast,
+    calculate_uranian_planets_vectorized,
+    calculate_vedic_planets_vectorized,
+)
+
+BIRTHS = [
+    (1990, 6, 15, 14, 30, 40.7128, -74.0060, "America/New_York", "New York"),
+    (1955, 1, 3, 2, 5, -33.87, 151.21, "Australia/Sydney", "Sydney"),
+    (2020, 12, 21, 18, 20, 51.5074, -0.1278, "Europe/London", "London"),
+]
+
+
+def _random_planets(seed: int) -> dict[str, dict[str, float]]:
+    rng = random.Random(seed)
+    names = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn"]
+    return {n: {"position": rng.uniform(0, 360)} for n in names}
+
+
+@pytest.mark.parametrize("house_system", ["P", "E"])
+@pytest.mark.parametrize("birth", BIRTHS)
+def test_multi_system_chart_matches_traditional(birth, house_system):
+    traditional = calculate_multi_system_chart(
+        *birth, house_system=house_system
+    )
+    vectorized = calculate_multi_system_chart_fast(
+        *birth, house_system=house_system
+    )
+    assert vectorized == traditional
+
+
+@pytest.mark.parametrize("jd", [2415021.0, 2448058.27, 2459205.5])
+def test_vedic_planets_match(jd: float):
+    assert calculate_vedic_planets_vectorized(
+        jd, get_ayanamsa(jd)
+    ) == calculate_vedic_planets(jd)
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42, 2024])
+def test_uranian_components_match(seed: int):
+    planets = _random_planets(seed)
+    jd = 2440000.0 + seed
+    uranian = calculate_uranian_planets_positions(jd)
+
+    assert calculate_uranian_planets_vectorized(jd) == uranian
+    assert calculate_midpoints_vectorized(planets) == calculate_midpoints(
+        planets
+    )
+    assert calculate_90_degree_dial_vectorized(
+        planets, uranian
+    ) == calculate_90_degree_dial(planets, uranian)
+
+
+def test_midpoints_skip_bodies_without_position():
+    planets = {"sun": {"position": 10.0}, "moon": {}, "mars": {"position": 350.0}}  # noqa: E501
+    assert calculate_midpoints_vectorized(planets) == calculate_midpoints(
+        planets
+    )
+    assert calculate_midpoints_vectorized({"sun": {"position": 1.0}}) == {}
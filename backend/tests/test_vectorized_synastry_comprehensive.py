@@ -16,6 +16,10 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from utils.aspect_utils import PLANETS, build_aspect_matrix  # noqa: E402
+from utils.compatibility_utils import (  # noqa: E402
+    calculate_compatibility_score,
+    normalize_compatibility_score,
+)
 from utils.vectorized_aspect_utils import VectorizedAspectCalculator  # noqa: E501, E402
 
 
@@ -123,5 +127,34 @@ def test_vectorized_vs_traditional_build():
     assert all(len(r) == len(v) for r, v in zip(trad, vect))
 
 
+def test_batched_scores_mirror_compatibility_score():
+    rng = np.random.default_rng(8)
+    long1 = rng.uniform(0, 360, (300, len(PLANETS)))
+    long2 = rng.uniform(0, 360, (300, len(PLANETS)))
+    calc = VectorizedAspectCalculator()
+    scores, counts = calc.score_pairs(long1, long2, chunk_size=64)
+    for i in range(len(long1)):
+        p1, p2 = to_planet_dict(list(long1[i])), to_planet_dict(list(long2[i]))  # noqa: E501
+        expected = calculate_compatibility_score(build_aspect_matrix(p1, p2))
+        assert (
+            round(normalize_compatibility_score(scores[i]), 1)
+            == expected["overall_score"]
+        )
+        assert list(counts[i]) == list(
+            expected["meta"]["aspect_type_counts"].values()
+        )
+
+    pairs = [
+        (to_planet_dict(list(a)), to_planet_dict(list(b)))
+        for a, b in zip(long1[:20], long2[:20])
+    ]
+    np.testing.assert_allclose(
+        calc.batch_compatibility_scores(pairs), scores[:20]
+    )
+    assert calc.batch_compatibility_scores([]) == []
+    with pytest.raises(ValueError, match="same shape"):
+        calc.score_pairs(long1, long2[:5])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-q"])
@@ -0,0 +1,179 @@
+# backend/utils/aspect_arrays.py
+"""
+Array-native synastry aspect matrices.
+
+``AspectArrays`` holds the (10, 10) aspect grid of a chart pair as
+parallel arrays (aspect code, orb, type code, validity mask) instead of
+a list of per-cell dicts. The consumers below mirror ``get_key_aspects``,
+``calculate_compatibility_score`` and ``generate_relationship_summary``
+on those arrays and return the same payloads, so the synastry hot path
+never materializes per-cell dicts. ``AspectArrays.to_matrix`` converts
+to the classic ``List[List[Optional[AspectData]]]`` when needed.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .aspect_utils import (
+    ASPECT_DEGREES,
+    ORBS,
+    PLANETS,
+    AspectData,
+    KeyAspectData,
+    get_aspect_interpretation,
+)
+from .compatibility_utils import (
+    ASPECT_SCORES,
+    BREAKDOWN_AREAS,
+    PLANET_WEIGHTS,
+    STRONG_ASPECT_ORB,
+    calculate_overlay_bonus,
+    compatibility_result,
+    relationship_summary,
+)
+from .jit_kernels import area_scores
+
+# Aspect codes index ASPECT_NAMES, type codes index ASPECT_TYPES
+ASPECT_NAMES: List[str] = list(ASPECT_DEGREES)
+ASPECT_TYPES = ("harmonious", "challenging", "neutral")
+NO_TYPE = -1
+
+
+def aspect_type(aspect: str) -> str:
+    """Harmonious / challenging / neutral class of an aspect name."""
+    if aspect in ["conjunction", "trine", "sextile"]:
+        return "harmonious"
+    elif aspect in ["square", "opposition", "quincunx"]:
+        return "challenging"
+    else:
+        return "neutral"
+
+
+ASPECT_TYPE_CODES = np.array(
+    [ASPECT_TYPES.index(aspect_type(a)) for a in ASPECT_NAMES]
+)
+
+# Scoring tables in aspect-code / PLANETS order
+_BASE_SCORES = np.array([ASPECT_SCORES.get(a, 0) for a in ASPECT_NAMES])
+_SCORE_ORBS = np.array([ORBS.get(a, 10) for a in ASPECT_NAMES], dtype=float)
+_WEIGHTS = np.array([PLANET_WEIGHTS.get(p, 1) for p in PLANETS])
+_WEIGHTS_FLAT = ((_WEIGHTS[:, np.newaxis] + _WEIGHTS) / 2).ravel()
+
+
+def _cells(rows: List[str], cols: List[str]) -> np.ndarray:
+    """Flat (100,) mask of the grid cells in ``rows`` x ``cols``."""
+    return np.outer(np.isin(PLANETS, rows), np.isin(PLANETS, cols)).ravel()
+
+
+def _involving(names: List[str]) -> np.ndarray:
+    """Flat mask of cells whose row or column planet is in ``names``."""
+    return _cells(names, PLANETS) | _cells(PLANETS, names)
+
+
+# One flat row per breakdown area (area_scores kernel)
+_AREA_CELLS = np.array([_cells(p, p) for p in BREAKDOWN_AREAS.values()])
+_LUMINARY_CELLS = _involving(["sun", "moon"])
+_ROMANTIC_CELLS = _involving(["venus", "mars"])
+_SOUL_ASPECTS = np.isin(ASPECT_NAMES, ["conjunction", "trine"])
+_CHALLENGING = ASPECT_TYPES.index("challenging")
+
+
+class AspectArrays(NamedTuple):
+    """Aspect grid of one chart pair: row planet (person 1) to column."""
+
+    aspect: np.ndarray  # aspect codes; 0 where not valid
+    orb: np.ndarray  # orbs in degrees; inf where not valid
+    type: np.ndarray  # type codes, NO_TYPE where not valid
+    valid: np.ndarray  # True where an aspect is within orb
+
+    def to_matrix(self) -> List[List[Optional[AspectData]]]:
+        """Classic per-cell dict matrix (build_aspect_matrix format)."""
+        matrix: List[List[Optional[AspectData]]] = []
+        for codes, orbs, types, valid in zip(
+            self.aspect.tolist(),
+            self.orb.tolist(),
+            self.type.tolist(),
+            self.valid.tolist(),
+        ):
+            row: List[Optional[AspectData]] = []
+            for code, orb, kind, ok in zip(codes, orbs, types, valid):
+                if ok:
+                    row.append(
+                        {
+                            "aspect": ASPECT_NAMES[code],
+                            "orb": orb,
+                            "type": ASPECT_TYPES[kind],
+                        }
+                    )
+                else:
+                    row.append(None)
+            matrix.append(row)
+        return matrix
+
+
+def _orb_weighted_scores(arrays: AspectArrays) -> np.ndarray:
+    """Flat base score times orb factor per cell, 0 where no aspect."""
+    cells = np.flatnonzero(arrays.valid)
+    codes = arrays.aspect.ravel()[cells]
+    scores = np.zeros(arrays.valid.size)
+    scores[cells] = _BASE_SCORES[codes] * (
+        1 - arrays.orb.ravel()[cells] / _SCORE_ORBS[codes]
+    )
+    return scores
+
+
+def key_aspects_from_arrays(
+    arrays: AspectArrays, max_orb: float = 3.0
+) -> List[KeyAspectData]:
+    """``get_key_aspects`` on aspect arrays (same order and payload)."""
+    rows, cols = np.nonzero(arrays.valid & (arrays.orb <= max_orb))
+    codes = arrays.aspect[rows, cols].tolist()
+    orbs = arrays.orb[rows, cols].tolist()
+    key_aspects: List[KeyAspectData] = []
+    for i, j, code, orb in zip(rows.tolist(), cols.tolist(), codes, orbs):
+        p1, p2, aspect = PLANETS[i], PLANETS[j], ASPECT_NAMES[code]
+        key_aspects.append(
+            {
+                "person1_planet": p1,
+                "person2_planet": p2,
+                "aspect": aspect,
+                "orb": orb,
+                "strength": "strong" if orb <= 1.5 else "moderate",
+                "interpretation": get_aspect_interpretation(p1, p2, aspect),
+            }
+        )
+    return key_aspects
+
+
+def compatibility_score_from_arrays(
+    arrays: AspectArrays, overlays: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """``calculate_compatibility_score`` on aspect arrays."""
+    cell_scores = _orb_weighted_scores(arrays)
+    valid = arrays.valid.ravel()
+    counts = np.bincount(
+        arrays.type.ravel()[valid], minlength=len(ASPECT_TYPES)
+    ).tolist()
+    areas = area_scores(cell_scores, valid, _AREA_CELLS).tolist()
+
+    return compatibility_result(
+        float(_WEIGHTS_FLAT @ cell_scores),
+        calculate_overlay_bonus(overlays),
+        dict(zip(ASPECT_TYPES, counts)),
+        dict(zip(BREAKDOWN_AREAS, areas)),
+    )
+
+
+def relationship_summary_from_arrays(
+    arrays: AspectArrays, overlays: Optional[Dict[str, Any]] = None
+) -> Dict[str, List[str]]:
+    """``generate_relationship_summary`` on aspect arrays."""
+    # Invalid cells carry an infinite orb, so this is the tight-orb mask
+    strong = (arrays.orb <= STRONG_ASPECT_ORB).ravel()
+    soul = strong & _SOUL_ASPECTS[arrays.aspect.ravel()]
+    return relationship_summary(
+        soul_connection=bool((soul & _LUMINARY_CELLS).any()),
+        romantic_chemistry=bool((strong & _ROMANTIC_CELLS).any()),
+        challenging=bool((strong & (arrays.type.ravel() == _CHALLENGING)).any()),  # noqa: E501
+    )
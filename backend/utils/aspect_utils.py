@@ -1,8 +1,10 @@
 # apps/backend/src/utils/aspect_utils.py
-from typing import Dict, List, Literal, Optional, Sequence, TypedDict
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, TypedDict
 
 from pydantic import BaseModel, Field
 
+from .orb_profiles import get_orb_profile
+
 
 class Aspect(BaseModel):
     aspect: Optional[str] = Field(
@@ -54,23 +56,27 @@ ASPECT_DEGREES = {
     "semi_sextile": 30,  # Modern
 }
 
-ORBS = {
-    "conjunction": 10,
-    "opposition": 10,
-    "trine": 8,
-    "square": 8,
-    "sextile": 6,
-    "quincunx": 3,
-    "semi_sextile": 2,
+SYNASTRY_ORB_PROFILE = "synastry"
+
+# Maximum orbs under the default synastry profile
+ORBS: Dict[str, float] = {
+    aspect: get_orb_profile(SYNASTRY_ORB_PROFILE).orb(aspect)
+    for aspect in ASPECT_DEGREES
 }
 
 
-def calculate_aspect(sep: float) -> Optional[AspectData]:
-    """Calculate aspect between two planetary positions."""
+def calculate_aspect(
+    sep: float, orbs: Optional[Mapping[str, float]] = None
+) -> Optional[AspectData]:
+    """Calculate aspect between two planetary positions.
+
+    ``orbs`` overrides the default maximum orb per aspect.
+    """
+    orbs = orbs or ORBS
     for aspect, deg in ASPECT_DEGREES.items():
-        orb_max = ORBS[aspect]
+        orb_max = orbs[aspect]
         orb = min(abs(sep - deg), abs(sep - (360 - deg)))
-        if orb <= orb_max:
+        if orb_max > 0 and orb <= orb_max:
             aspect_type = (
                 "harmonious"
                 if aspect in ["conjunction", "trine", "sextile"]
@@ -88,18 +94,21 @@ def build_aspect_matrix(
     long1: Dict[str, float],
     long2: Dict[str, float],
     planets: Optional[List[str]] = None,
+    orb_profile: Optional[str] = None,
 ) -> List[List[Optional[AspectData]]]:
     """Build the mutable aspect matrix for two charts.
 
     This function is backward-compatible: callers may pass an explicit
     list of planet keys as the third argument; if omitted the module-level
-    ``PLANETS`` list is used.
+    ``PLANETS`` list is used. ``orb_profile`` selects a registered orb
+    profile (scaled per planet pair) instead of the default ``ORBS``.
 
     Returns a list of rows (one per planet in ``planets``). Each row is a
     list of AspectData or None entries corresponding to aspects from the
     row planet (person1) to the column planet (person2).
     """
     planets = planets or PLANETS
+    profile = get_orb_profile(orb_profile) if orb_profile else None
 
     matrix: List[List[Optional[AspectData]]] = []
     for p1 in planets:
@@ -110,7 +119,12 @@ def build_aspect_matrix(
             sep = abs(lon1 - lon2) % 360
             if sep > 180:
                 sep = 360 - sep
-            aspect_data = calculate_aspect(sep)
+            pair_orbs = (
+                {a: profile.orb(a, p1, p2) for a in ASPECT_DEGREES}
+                if profile
+                else None
+            )
+            aspect_data = calculate_aspect(sep, pair_orbs)
             row.append(aspect_data)
         matrix.append(row)
     return matrix
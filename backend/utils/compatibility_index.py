@@ -0,0 +1,525 @@
+# backend/utils/compatibility_index.py
+"""
+Indexed top-K compatibility search over stored natal charts.
+
+Each indexed user has one row of planet longitudes (``PLANETS`` order),
+optional house cusps and precomputed degree buckets per planet (1 degree
+by default, so 30 buckets per sign). A query builds a small table with
+an upper bound on each candidate planet's score contribution for every
+bucket, given the reference chart. Summing the table over a row's
+buckets bounds the row's total score, so candidates are visited in
+descending bound order and scored exactly in blocks
+(``VectorizedAspectCalculator.score_one_to_many``) until the next bound
+falls below the current k-th best score. The results are identical to
+scoring every row.
+
+Rows are updated in place as charts are saved (``upsert`` /
+``upsert_chart``); removed rows are reused. ``load`` fills the index
+from saved discoverable charts. The index lives in process memory, so
+each worker process holds its own copy, loaded once at startup; see
+``api.charts.refresh_compatibility_index`` for picking up charts saved
+through other workers.
+"""
+
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
+
+import numpy as np
+
+from .aspect_utils import PLANETS
+from .compatibility_utils import (
+    MAX_POSSIBLE_SCORE,
+    OVERLAY_BONUS,
+    OVERLAY_PLANETS,
+)
+from .synastry_batch import overlay_bonus, top_k
+from .vectorized_aspect_utils import ASPECT_TYPES, get_vectorized_calculator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_DEGREES = 1.0
+# Candidates scored exactly per pass over the bound order
+SEARCH_BLOCK = 4096
+# Slack so float rounding never prunes a candidate that ties
+BOUND_EPSILON = 1e-9
+# Largest possible overlay bonus: each overlay planet in a key house,
+# in both directions
+MAX_OVERLAY_BONUS = 2 * len(OVERLAY_PLANETS) * OVERLAY_BONUS
+
+
+class CompatibilityMatch(TypedDict):
+    user_id: str
+    rank: int
+    overall_score: float
+    total_score: float
+    aspect_score: float
+    overlay_bonus: float
+    aspect_type_counts: Dict[str, int]
+
+
+class SearchResult(TypedDict):
+    matches: List[CompatibilityMatch]
+    candidates: int
+    scored: int
+
+
+def chart_positions(
+    chart_data: Mapping[str, Any],
+) -> Tuple[Dict[str, float], Optional[List[float]]]:
+    """Planet longitudes and house cusps from a stored chart payload.
+
+    Accepts ``calculate_chart`` output (``{"planets": {name: {"position":
+    ...}}, "houses": [{"house": n, "cusp": ...}]}``) or plain
+    ``{name: longitude}`` planet maps. Cusps are None unless all 12 exist.
+    """
+    planets: Dict[str, float] = {}
+    for name, value in (chart_data.get("planets") or {}).items():
+        if isinstance(value, Mapping):
+            value = value.get("position")
+        if value is not None and name.lower() in PLANETS:
+            planets[name.lower()] = float(value)
+
+    houses = chart_data.get("houses") or []
+    cusps: Optional[List[float]] = None
+    try:
+        by_house = {
+            int(h.get("house", h.get("number"))): float(h["cusp"])
+            for h in houses
+        }
+        if sorted(by_house) == list(range(1, 13)):
+            cusps = [by_house[n] for n in range(1, 13)]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        cusps = None
+    return planets, cusps
+
+
+class CompatibilityIndex:
+    """Growable per-user chart arrays with bucket score bounds."""
+
+    def __init__(
+        self,
+        orb_profile: Optional[str] = None,
+        bucket_degrees: float = DEFAULT_BUCKET_DEGREES,
+        capacity: int = 1024,
+    ):
+        self.n_buckets = int(round(360 / bucket_degrees))
+        if self.n_buckets < 1 or self.n_buckets > 65535:
+            raise ValueError(f"Invalid bucket size: {bucket_degrees}")
+        self.bucket_degrees = 360 / self.n_buckets
+        # Bucket bounds are only sound against full-precision scores
+        self.calculator = get_vectorized_calculator(orb_profile, "precise")
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._chart_ids: Dict[str, str] = {}
+        # time.time() of the last successful load, None before the first
+        self._loaded_at: Optional[float] = None
+        self._ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        self._lons = np.zeros((capacity, len(PLANETS)))
+        self._cusps = np.zeros((capacity, 12))
+        self._has_cusps = np.zeros(capacity, dtype=bool)
+        self._buckets = np.zeros((capacity, len(PLANETS)), dtype=np.uint16)
+        self._active = np.zeros(capacity, dtype=bool)
+
+    def _grow(self, needed: int) -> None:
+        # Caller holds the lock
+        capacity = len(self._active)
+        if needed <= capacity:
+            return
+        old = (
+            self._lons,
+            self._cusps,
+            self._has_cusps,
+            self._buckets,
+            self._active,
+        )
+        self._allocate(max(needed, capacity * 2))
+        for new, previous in zip(
+            (
+                self._lons,
+                self._cusps,
+                self._has_cusps,
+                self._buckets,
+                self._active,
+            ),
+            old,
+        ):
+            new[:capacity] = previous
+
+    def _bucket(self, longitudes: np.ndarray) -> np.ndarray:
+        buckets = np.floor(longitudes / self.bucket_degrees).astype(np.int64)
+        return (buckets % self.n_buckets).astype(np.uint16)
+
+    # Updates
+
+    def upsert_many(
+        self,
+        user_ids: Sequence[str],
+        longitudes: np.ndarray,
+        cusps: Optional[np.ndarray] = None,
+    ) -> None:
+        """Add or replace users from an (N, 10) longitude array.
+
+        ``cusps`` is an optional (N, 12) array; rows containing NaN are
+        stored without cusps.
+        """
+        longitudes = np.asarray(longitudes, dtype=float) % 360
+        if longitudes.shape != (len(user_ids), len(PLANETS)):
+            raise ValueError(
+                f"longitudes must have shape ({len(user_ids)}, {len(PLANETS)}), got {longitudes.shape}"  # noqa: E501
+            )
+        if cusps is not None:
+            cusps = np.asarray(cusps, dtype=float)
+            if cusps.shape != (len(user_ids), 12):
+                raise ValueError(
+                    f"cusps must have shape ({len(user_ids)}, 12), got {cusps.shape}"  # noqa: E501
+                )
+
+        with self._lock:
+            rows = np.empty(len(user_ids), dtype=np.int64)
+            new_rows = 0
+            for i, user_id in enumerate(user_ids):
+                row = self._rows.get(user_id)
+                if row is None:
+                    if self._free:
+                        row = self._free.pop()
+                        self._ids[row] = user_id
+                    else:
+                        row = len(self._ids) + new_rows
+                        new_rows += 1
+                    self._rows[user_id] = row
+                rows[i] = row
+            self._grow(len(self._ids) + new_rows)
+            self._ids.extend([None] * new_rows)
+            for user_id, row in zip(user_ids, rows):
+                self._ids[row] = user_id
+
+            self._lons[rows] = longitudes
+            self._buckets[rows] = self._bucket(longitudes)
+            if cusps is None:
+                self._has_cusps[rows] = False
+            else:
+                valid = ~np.isnan(cusps).any(axis=1)
+                self._cusps[rows] = np.where(valid[:, np.newaxis], cusps, 0.0)
+                self._has_cusps[rows] = valid
+            self._active[rows] = True
+
+    def upsert(
+        self,
+        user_id: str,
+        planets: Mapping[str, float],
+        cusps: Optional[Sequence[float]] = None,
+        chart_id: Optional[str] = None,
+    ) -> None:
+        """Add or replace one user's chart (missing planets count as 0)."""
+        self.upsert_many(
+            [user_id],
+            np.array([[planets.get(p, 0.0) for p in PLANETS]]),
+            None if cusps is None else np.array([cusps], dtype=float),
+        )
+        with self._lock:
+            if chart_id is None:
+                self._chart_ids.pop(user_id, None)
+            else:
+                self._chart_ids[user_id] = chart_id
+
+    def upsert_chart(
+        self,
+        user_id: str,
+        chart_data: Mapping[str, Any],
+        chart_id: Optional[str] = None,
+    ) -> bool:
+        """Index a stored chart payload; False if it has no planets."""
+        planets, cusps = chart_positions(chart_data)
+        if not planets:
+            return False
+        self.upsert(user_id, planets, cusps, chart_id)
+        return True
+
+    def load(
+        self,
+        charts: Iterable[Tuple[str, Mapping[str, Any]]],
+        replace: bool = True,
+    ) -> int:
+        """Index saved charts; returns the number of users indexed.
+
+        ``charts`` yields (user id, saved chart) pairs as
+        ``database.iter_natal_charts(discoverable_only=True)`` does. Each
+        user's newest chart (by ``created_at``) is indexed. With
+        ``replace`` users without a chart are removed; without it the
+        charts are applied as updates, e.g. those changed since the last
+        load.
+        """
+        newest: Dict[str, Mapping[str, Any]] = {}
+        for user_id, chart in charts:
+            current = newest.get(user_id)
+            if current is None or str(chart.get("created_at", "")) > str(
+                current.get("created_at", "")
+            ):
+                newest[user_id] = chart
+
+        user_ids: List[str] = []
+        chart_ids: Dict[str, str] = {}
+        longitudes: List[List[float]] = []
+        cusps: List[Sequence[float]] = []
+        for user_id, chart in newest.items():
+            planets, chart_cusps = chart_positions(chart.get("chart_data") or {})  # noqa: E501
+            if not planets:
+                continue
+            user_ids.append(user_id)
+            longitudes.append([planets.get(p, 0.0) for p in PLANETS])
+            cusps.append([np.nan] * 12 if chart_cusps is None else chart_cusps)  # noqa: E501
+            if chart.get("id"):
+                chart_ids[user_id] = str(chart["id"])
+
+        if replace:
+            loaded = set(user_ids)
+            with self._lock:
+                stale = [user for user in self._rows if user not in loaded]
+            for user_id in stale:
+                self.remove(user_id)
+        if user_ids:
+            self.upsert_many(
+                user_ids, np.array(longitudes), np.array(cusps, dtype=float)
+            )
+        with self._lock:
+            for user_id in user_ids:
+                if user_id in chart_ids:
+                    self._chart_ids[user_id] = chart_ids[user_id]
+                else:
+                    self._chart_ids.pop(user_id, None)
+            self._loaded_at = time.time()
+        logger.info(
+            f"Compatibility index loaded {len(user_ids)} charts ({len(self)} users indexed)"  # noqa: E501
+        )
+        return len(user_ids)
+
+    def remove(self, user_id: str) -> bool:
+        with self._lock:
+            row = self._rows.pop(user_id, None)
+            self._chart_ids.pop(user_id, None)
+            if row is None:
+                return False
+            self._active[row] = False
+            self._ids[row] = None
+            self._free.append(row)
+            return True
+
+    def remove_chart(self, user_id: str, chart_id: str) -> bool:
+        """Remove the user only if ``chart_id`` is the indexed chart."""
+        with self._lock:
+            indexed = self._chart_ids.get(user_id) == chart_id
+        return self.remove(user_id) if indexed else False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._rows
+
+    # Search
+
+    def bucket_bounds(self, reference: Mapping[str, float]) -> np.ndarray:
+        """Upper bound of each candidate planet's score contribution.
+
+        Returns (buckets, 10): entry [b, j] bounds the summed contribution
+        of all reference planets to candidate planet j lying in bucket b.
+        """
+        calc = self.calculator
+        ref = np.array([reference.get(p, 0.0) for p in PLANETS]) % 360
+        lo = np.arange(self.n_buckets) * self.bucket_degrees
+
+        # Longitudes exactly at each aspect angle from each reference planet
+        angles = calc.aspect_degrees
+        targets = np.concatenate(
+            [ref[:, np.newaxis] + angles, ref[:, np.newaxis] - angles],
+            axis=1,
+        ) % 360  # (10, 2 * aspects)
+
+        # Distance from every target to every bucket arc [lo, lo + width)
+        into = (targets - lo[:, np.newaxis, np.newaxis]) % 360
+        inside = into < self.bucket_degrees
+        distance = np.where(
+            inside,
+            0.0,
+            np.minimum(360 - into, into - self.bucket_degrees),
+        )
+        # Smallest orb per aspect: (buckets, 10, aspects)
+        min_orbs = np.minimum(
+            distance[:, :, : len(angles)], distance[:, :, len(angles):]
+        )
+
+        # Largest contribution of each aspect within the bucket: at the
+        # tightest orb for positive scores, the widest allowed orb otherwise
+        tightest = calc.aspect_scores * (1 - min_orbs / calc.score_orbs)
+        widest = calc.aspect_scores * (1 - calc.enabled_orbs / calc.score_orbs)  # noqa: E501
+        best = np.where(
+            calc.aspect_scores > 0,
+            tightest[:, :, np.newaxis, :],  # (buckets, 10, 1, aspects)
+            widest,
+        )
+        best = np.where(
+            min_orbs[:, :, np.newaxis, :] <= calc.enabled_orbs, best, 0.0
+        )
+        # Best contribution of (reference i, candidate j) per bucket
+        per_pair = np.maximum(best.max(axis=-1), 0.0) * calc.weight_matrix
+        return per_pair.sum(axis=1) + BOUND_EPSILON
+
+    def _score_rows(
+        self,
+        ref: np.ndarray,
+        reference_cusps: Optional[Sequence[float]],
+        rows: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Exact (total, aspect score, overlay bonus, type counts) of rows."""
+        # Caller holds the lock
+        aspect, counts = self.calculator.score_one_to_many(
+            dict(zip(PLANETS, ref)), self._lons[rows]
+        )
+        bonus = np.zeros(len(rows))
+        if reference_cusps is not None:
+            with_cusps = self._has_cusps[rows]
+            if with_cusps.any():
+                bonus[with_cusps] = overlay_bonus(
+                    ref,
+                    reference_cusps,
+                    self._lons[rows[with_cusps]],
+                    self._cusps[rows[with_cusps]],
+                )
+        return aspect + bonus, aspect, bonus, counts
+
+    def search(
+        self,
+        reference: Mapping[str, float],
+        reference_cusps: Optional[Sequence[float]] = None,
+        k: int = 10,
+        exclude: Iterable[str] = (),
+    ) -> SearchResult:
+        """Top ``k`` users by compatibility with ``reference``.
+
+        Scores equal ``score_candidates`` for each user; overlay bonuses
+        apply to users with stored cusps when ``reference_cusps`` is given.
+        """
+        table = self.bucket_bounds(reference)
+        ref = np.array([reference.get(p, 0.0) for p in PLANETS]) % 360
+        use_overlays = reference_cusps is not None
+
+        with self._lock:
+            size = len(self._ids)
+            active = self._active[:size].copy()
+            for user_id in exclude:
+                row = self._rows.get(user_id)
+                if row is not None:
+                    active[row] = False
+
+            bounds = np.zeros(size)
+            buckets = self._buckets[:size]
+            for j in range(len(PLANETS)):
+                bounds += table[buckets[:, j], j]
+            if use_overlays:
+                bounds += self._has_cusps[:size] * MAX_OVERLAY_BONUS
+            candidates = np.flatnonzero(active)
+            candidate_bounds = bounds[candidates]
+
+            # Score the block with the highest bounds first; afterwards only
+            # candidates whose bound reaches the k-th best score are sorted
+            first = min(len(candidates), max(k, SEARCH_BLOCK))
+            if first < len(candidates):
+                top = np.argpartition(-candidate_bounds, first - 1)[:first]
+            else:
+                top = np.arange(len(candidates))
+            top = top[np.argsort(-candidate_bounds[top], kind="stable")]
+            scored_rows: List[np.ndarray] = []
+            parts: List[Tuple[np.ndarray, ...]] = []
+            threshold = -np.inf
+
+            def score(rows: np.ndarray) -> None:
+                nonlocal threshold
+                scored_rows.append(rows)
+                parts.append(self._score_rows(ref, reference_cusps, rows))
+                totals = np.concatenate([part[0] for part in parts])
+                if len(totals) >= k:
+                    threshold = totals[top_k(totals, k)[-1]]
+
+            if len(top):
+                score(candidates[top])
+            visited = np.zeros(len(candidates), dtype=bool)
+            visited[top] = True
+            rest = np.flatnonzero((candidate_bounds >= threshold) & ~visited)
+            rest = rest[np.argsort(-candidate_bounds[rest], kind="stable")]
+            for start in range(0, len(rest), SEARCH_BLOCK):
+                block = rest[start : start + SEARCH_BLOCK]
+                if candidate_bounds[block[0]] < threshold:
+                    break
+                score(candidates[block])
+
+            ids = list(self._ids)
+
+        if not parts:
+            return {"matches": [], "candidates": len(candidates), "scored": 0}
+
+        best_rows = np.concatenate(scored_rows)
+        best_totals, aspect, bonus, counts = (
+            np.concatenate(values) for values in zip(*parts)
+        )
+        matches: List[CompatibilityMatch] = []
+        # Ties rank by row so results match a full scan
+        ranked = np.lexsort((best_rows, -best_totals))[:k]
+        for rank, i in enumerate(ranked, start=1):
+            total = float(best_totals[i])
+            overall = (
+                (total + MAX_POSSIBLE_SCORE / 4) / (MAX_POSSIBLE_SCORE / 2)
+            ) * 100
+            matches.append(
+                {
+                    "user_id": str(ids[best_rows[i]]),
+                    "rank": rank,
+                    "overall_score": round(max(0.0, min(100.0, overall)), 1),
+                    "total_score": total,
+                    "aspect_score": float(aspect[i]),
+                    "overlay_bonus": float(bonus[i]),
+                    "aspect_type_counts": {
+                        name: int(counts[i, t])
+                        for t, name in enumerate(ASPECT_TYPES)
+                    },
+                }
+            )
+        return {
+            "matches": matches,
+            "candidates": len(candidates),
+            "scored": len(best_rows),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "users": len(self._rows),
+                "with_cusps": int(
+                    self._has_cusps[: len(self._ids)][
+                        self._active[: len(self._ids)]
+                    ].sum()
+                ),
+                "capacity": len(self._active),
+                "bucket_degrees": self.bucket_degrees,
+                # None until the index has been loaded from storage
+                "loaded_at": self._loaded_at,
+            }
+
+
+# Opted-in users' natal charts, updated as charts are saved
+compatibility_index = CompatibilityIndex()
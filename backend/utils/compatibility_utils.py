@@ -13,6 +13,26 @@ ASPECT_SCORES: Dict[str, int] = {
     "quincunx": -1,
 }
 
+# Rough maximum raw score, used to normalize totals to 0-100
+MAX_POSSIBLE_SCORE = len(PLANETS) * len(PLANETS) * 4
+
+# Overlay bonus for these planets in the partner's key houses
+OVERLAY_BONUS = 5
+OVERLAY_PLANETS = ["venus", "mars", "moon"]
+KEY_HOUSES = [1, 4, 5, 7, 8, 10]
+
+# Tight aspects (degrees) that define the relationship summary themes
+STRONG_ASPECT_ORB = 2.0
+
+# Thematic areas scored from aspects between their planets
+BREAKDOWN_AREAS: Dict[str, List[str]] = {
+    "emotional": ["sun", "moon"],
+    "communication": ["mercury", "venus"],
+    "physical": ["mars", "venus"],
+    "spiritual": ["jupiter", "neptune", "pluto"],
+    "stability": ["saturn", "jupiter"],
+}
+
 PLANET_WEIGHTS: Dict[str, float] = {
     "sun": 3,
     "moon": 3,
@@ -43,7 +63,6 @@ def calculate_compatibility_score(
 
     total = 0.0
     aspect_count = {"harmonious": 0, "challenging": 0, "neutral": 0}
-    breakdown: Dict[str, float] = {}
 
     # Calculate aspect scores
     for i, row in enumerate(matrix):
@@ -67,9 +86,23 @@ def calculate_compatibility_score(
                 aspect_count[aspect["type"]] += 1
 
     # Add overlay bonuses
+    overlay_bonus = calculate_overlay_bonus(overlays)
+
+    # Calculate breakdown scores
+    breakdown = {
+        area: calculate_area_score(matrix, planets)
+        for area, planets in BREAKDOWN_AREAS.items()
+    }
+
+    return compatibility_result(
+        total, overlay_bonus, aspect_count, breakdown
+    )
+
+
+def calculate_overlay_bonus(overlays: Optional[Dict[str, Any]]) -> int:
+    """Bonus for Venus, Mars and Moon in the partner's key houses."""
     overlay_bonus = 0
     if overlays:
-        key_houses = [1, 4, 5, 7, 8, 10]
         for direction in ["p1_in_p2", "p2_in_p1"]:
             if direction in overlays:
                 for planet, overlay in overlays[direction].items():
@@ -78,36 +111,24 @@ def calculate_compatibility_score(
                         if hasattr(overlay, "house")
                         else overlay.get("house", 0)
                     )
-                    if house in key_houses and planet in [
-                        "venus",
-                        "mars",
-                        "moon",
-                    ]:
-                        overlay_bonus += 5
+                    if house in KEY_HOUSES and planet in OVERLAY_PLANETS:
+                        overlay_bonus += OVERLAY_BONUS
+    return overlay_bonus
 
-    total += overlay_bonus
 
-    # Calculate breakdown scores
-    breakdown = {
-        "emotional": calculate_area_score(matrix, ["sun", "moon"]),
-        "communication": calculate_area_score(matrix, ["mercury", "venus"]),
-        "physical": calculate_area_score(matrix, ["mars", "venus"]),
-        "spiritual": calculate_area_score(
-            matrix, ["jupiter", "neptune", "pluto"]
-        ),
-        "stability": calculate_area_score(matrix, ["saturn", "jupiter"]),
-    }
+def compatibility_result(
+    aspect_total: float,
+    overlay_bonus: int,
+    aspect_count: Dict[str, int],
+    breakdown: Dict[str, float],
+) -> Dict[str, Any]:
+    """Assemble the compatibility payload from raw totals.
 
+    ``breakdown`` holds the average area scores; they are shifted and
+    clamped to 0-100 here.
+    """
     # Normalize to 0-100 scale
-    max_possible_score = len(PLANETS) * len(PLANETS) * 4  # Rough maximum
-    normalized = max(
-        0,
-        min(
-            100,
-            ((total + (max_possible_score / 4)) / (max_possible_score / 2))
-            * 100,
-        ),
-    )
+    normalized = normalize_compatibility_score(aspect_total + overlay_bonus)
 
     return {
         "overall_score": round(normalized, 1),
@@ -126,6 +147,14 @@ def calculate_compatibility_score(
     }
 
 
+def normalize_compatibility_score(total: float) -> float:
+    """Map a raw aspect plus overlay total onto the 0-100 scale."""
+    scaled = (
+        (total + (MAX_POSSIBLE_SCORE / 4)) / (MAX_POSSIBLE_SCORE / 2)
+    ) * 100
+    return max(0, min(100, scaled))
+
+
 def calculate_area_score(matrix: Matrix, focus_planets: List[str]) -> float:
     """Calculate average score for a thematic area.
 
@@ -197,42 +226,52 @@ def generate_relationship_summary(
     if overlays is None:
         overlays = {}
 
-    summary: Dict[str, List[str]] = {
-        "key_themes": [],
-        "strengths": [],
-        "challenges": [],
-        "advice": [],
-    }
-
     # Analyze key themes based on strongest aspects
     strong_aspects: List[StrongAspect] = []
     for i, row in enumerate(matrix):
         p1 = PLANETS[i] if i < len(PLANETS) else "unknown"
         for j, aspect in enumerate(row):
-            if aspect and aspect["orb"] <= 2.0:  # Tight orbs only
+            if aspect and aspect["orb"] <= STRONG_ASPECT_ORB:
                 p2 = PLANETS[j] if j < len(PLANETS) else "unknown"
                 strong_aspects.append((p1, p2, aspect))
 
+    return relationship_summary(
+        soul_connection=any(
+            a[2]["aspect"] in ["conjunction", "trine"]
+            and set([a[0], a[1]]) & {"sun", "moon"}
+            for a in strong_aspects
+        ),
+        romantic_chemistry=any(
+            set([a[0], a[1]]) & {"venus", "mars"} for a in strong_aspects
+        ),
+        challenging=any(a[2]["type"] == "challenging" for a in strong_aspects),  # noqa: E501
+    )
+
+
+def relationship_summary(
+    soul_connection: bool, romantic_chemistry: bool, challenging: bool
+) -> Dict[str, List[str]]:
+    """Summary buckets from the themes found among tight aspects."""
+    summary: Dict[str, List[str]] = {
+        "key_themes": [],
+        "strengths": [],
+        "challenges": [],
+        "advice": [],
+    }
+
     # Determine themes
-    if any(
-        a[2]["aspect"] in ["conjunction", "trine"]
-        and set([a[0], a[1]]) & {"sun", "moon"}
-        for a in strong_aspects
-    ):
+    if soul_connection:
         summary["key_themes"].append("Soul Connection")
         summary["strengths"].append(
             "Deep emotional understanding and natural harmony"
         )
 
-    if any(set([a[0], a[1]]) & {"venus", "mars"} for a in strong_aspects):
+    if romantic_chemistry:
         summary["key_themes"].append("Romantic Chemistry")
         summary["strengths"].append("Strong physical and romantic attraction")
 
     # Identify challenges
-    challenging_aspects = [
-        a for a in strong_aspects if a[2]["type"] == "challenging"
-    ]
-    if challenging_aspects:
+    if challenging:
         summary["challenges"].append(
             "Need to work through conflicting needs and desires"
         )
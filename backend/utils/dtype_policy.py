@@ -0,0 +1,80 @@
+# backend/utils/dtype_policy.py
+"""
+Array dtype policies for the vectorized engines.
+
+A policy fixes the dtypes the batch kernels allocate for angles
+(longitudes, separations, orbs), small integer codes (aspect indices,
+aspect type codes), per-pair counts and boolean masks:
+
+- ``precise``: float64 angles and native integers. Results match the
+  scalar code paths exactly.
+- ``compact``: float32 angles, int8 codes and int16 counts. Large
+  batches need about half the memory and bandwidth, with angles
+  accurate to about 1e-4 degrees.
+
+The process-wide default comes from ``VECTORIZED_DTYPE_POLICY``
+(``precise`` when unset). Engines also accept a policy name or a
+``DtypePolicy`` instance.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+DTYPE_POLICY_ENV = "VECTORIZED_DTYPE_POLICY"
+DEFAULT_DTYPE_POLICY = "precise"
+
+
+@dataclass(frozen=True)
+class DtypePolicy:
+    """Dtypes for angles, integer codes, counts and masks."""
+
+    name: str
+    angle: np.dtype
+    code: np.dtype
+    count: np.dtype
+    mask: np.dtype = np.dtype(bool)
+
+    def angles(self, values: Any) -> np.ndarray:
+        """``values`` as an angle array (no copy if already in dtype)."""
+        return np.asarray(values, dtype=self.angle)
+
+    def bytes_per_cell(self) -> int:
+        """Bytes per cell of a separation grid plus its aspect results.
+
+        Covers the separation and orb (angles), the aspect code and the
+        validity mask.
+        """
+        return 2 * self.angle.itemsize + self.code.itemsize + self.mask.itemsize  # noqa: E501
+
+
+DTYPE_POLICIES: Dict[str, DtypePolicy] = {
+    "precise": DtypePolicy(
+        name="precise",
+        angle=np.dtype(np.float64),
+        code=np.dtype(np.intp),
+        count=np.dtype(np.int64),
+    ),
+    "compact": DtypePolicy(
+        name="compact",
+        angle=np.dtype(np.float32),
+        code=np.dtype(np.int8),
+        count=np.dtype(np.int16),
+    ),
+}
+
+
+def get_dtype_policy(
+    policy: Optional[Union[str, DtypePolicy]] = None,
+) -> DtypePolicy:
+    """Resolve a policy name (or the environment default) to a policy."""
+    if isinstance(policy, DtypePolicy):
+        return policy
+    name = (policy or os.getenv(DTYPE_POLICY_ENV) or DEFAULT_DTYPE_POLICY).lower()  # noqa: E501
+    if name not in DTYPE_POLICIES:
+        raise ValueError(
+            f"Unknown dtype policy '{name}'. Available: {sorted(DTYPE_POLICIES)}"  # noqa: E501
+        )
+    return DTYPE_POLICIES[name]
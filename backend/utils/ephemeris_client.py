@@ -26,6 +26,9 @@ class PlanetPosition(BaseModel):
     retrograde: bool = Field(
         ..., description="Whether the planet is retrograde"
     )
+    speed: Optional[float] = Field(
+        None, description="Longitude speed in degrees per day"
+    )
 
 
 class CalculationRequest(BaseModel):
@@ -15,12 +15,11 @@ def find_house(lon: float, cusps: List[float]) -> int:
     # Handle 360-degree wrap-around
     lon = lon % 360
 
-    # Create extended cusps array to handle wrap-around
-    extended_cusps = cusps + [cusps[0] + 360]
-
     for i in range(len(cusps)):
         cusp_start = cusps[i]
-        cusp_end = extended_cusps[i + 1]
+        # The 12th house ends at the 1st cusp; whichever house crosses
+        # 0 degrees takes the wrap-around branch below
+        cusp_end = cusps[(i + 1) % len(cusps)]
 
         # Handle wrap-around at 0/360 degrees
         if cusp_start <= cusp_end:
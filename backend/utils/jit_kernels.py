@@ -0,0 +1,232 @@
+# backend/utils/jit_kernels.py
+"""
+Optional JIT-compiled kernels for the aspect and midpoint hot loops.
+
+Each kernel has two implementations with the same results:
+
+- a plain loop (``_*_loop``) compiled with ``numba.njit`` when Numba is
+  installed;
+- a NumPy version (``_*_numpy``) used otherwise.
+
+The public kernels (``pair_midpoints``, ``dial_separations``,
+``pair_aspect_orbs``, ``gate_lines`` and ``area_scores``) are bound to
+one of the two at import, so Numba is never a hard dependency. Set
+``COSMICHUB_DISABLE_JIT=1`` to force the NumPy versions.
+
+Pair kernels return one entry per body pair ``i < j`` in nested-loop
+order (``np.triu_indices(n, k=1)``).
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DISABLE_JIT_ENV = "COSMICHUB_DISABLE_JIT"
+
+# Import numba with fallback
+NUMBA_AVAILABLE: bool = False
+try:
+    import numba  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is not available
+    numba = None
+
+JIT_ENABLED: bool = NUMBA_AVAILABLE and os.getenv(
+    DISABLE_JIT_ENV, "0"
+).lower() not in ("1", "true", "yes")
+
+# Human Design wheel: 64 gates of 5.625 degrees each
+HD_GATE_COUNT = 64
+HD_LINES_PER_GATE = 6
+
+
+def _select(
+    loop: Callable[..., Any], fallback: Callable[..., Any]
+) -> Callable[..., Any]:
+    """Compiled ``loop`` when JIT is enabled, else the NumPy ``fallback``."""
+    if JIT_ENABLED:
+        return numba.njit(cache=True)(loop)
+    return fallback
+
+
+@lru_cache(maxsize=64)
+def _pairs(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.triu_indices(n, k=1)
+
+
+# Midpoints
+
+
+def _pair_midpoints_loop(pos: np.ndarray) -> np.ndarray:
+    """Midpoint of every pair, past 0 degrees when the arc exceeds 180."""
+    n = pos.shape[0]
+    out = np.empty(n * (n - 1) // 2)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            total = pos[i] + pos[j]
+            if abs(pos[i] - pos[j]) > 180:
+                out[k] = ((total + 360) / 2) % 360
+            else:
+                out[k] = total / 2
+            k += 1
+    return out
+
+
+def _pair_midpoints_numpy(pos: np.ndarray) -> np.ndarray:
+    i_idx, j_idx = _pairs(len(pos))
+    total = pos[i_idx] + pos[j_idx]
+    return np.where(
+        np.abs(pos[i_idx] - pos[j_idx]) > 180,
+        ((total + 360) / 2) % 360,
+        total / 2,
+    )
+
+
+# 90-degree dial
+
+
+def _dial_separations_loop(pos: np.ndarray) -> np.ndarray:
+    """Pair separations folded onto the 90-degree dial (0-45)."""
+    n = pos.shape[0]
+    out = np.empty(n * (n - 1) // 2)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            diff = abs(pos[i] - pos[j]) % 90
+            if diff > 45:
+                diff = 90 - diff
+            out[k] = diff
+            k += 1
+    return out
+
+
+def _dial_separations_numpy(pos: np.ndarray) -> np.ndarray:
+    i_idx, j_idx = _pairs(len(pos))
+    diff = np.abs(pos[i_idx] - pos[j_idx]) % 90
+    return np.where(diff > 45, 90 - diff, diff)
+
+
+# Aspect orbs
+
+
+def _pair_aspect_orbs_loop(
+    pos: np.ndarray, angles: np.ndarray, max_orbs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(pairs, aspects) orbs and matches.
+
+    Orbs are measured against both arcs of each aspect angle. A pair
+    matches an aspect when either arc is within its positive
+    ``max_orbs`` entry, itself a (pairs, aspects) array.
+    """
+    n = pos.shape[0]
+    n_aspects = angles.shape[0]
+    orbs = np.empty((n * (n - 1) // 2, n_aspects))
+    matches = np.zeros((n * (n - 1) // 2, n_aspects), dtype=np.bool_)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            angle = abs((pos[i] - pos[j] + 180) % 360 - 180)
+            for a in range(n_aspects):
+                direct = abs(angle - angles[a])
+                reflex = abs(angle - (360 - angles[a]))
+                limit = max_orbs[k, a]
+                orbs[k, a] = min(direct, reflex)
+                matches[k, a] = limit > 0 and (
+                    direct <= limit or reflex <= limit
+                )
+            k += 1
+    return orbs, matches
+
+
+def _pair_aspect_orbs_numpy(
+    pos: np.ndarray, angles: np.ndarray, max_orbs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    i_idx, j_idx = _pairs(len(pos))
+    angle = np.abs((pos[i_idx] - pos[j_idx] + 180) % 360 - 180)
+    direct = np.abs(angle[:, np.newaxis] - angles)
+    reflex = np.abs(angle[:, np.newaxis] - (360 - angles))
+    matches = ((direct <= max_orbs) | (reflex <= max_orbs)) & (max_orbs > 0)
+    return np.minimum(direct, reflex), matches
+
+
+# Human Design gates
+
+
+def _gate_lines_loop(
+    positions: np.ndarray, offset: float, gate_sequence: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Human Design gate and line (1-6) of each longitude."""
+    gate_degrees = 360.0 / HD_GATE_COUNT
+    gates = np.empty(positions.shape[0], dtype=np.int64)
+    lines = np.empty(positions.shape[0], dtype=np.int64)
+    for k in range(positions.shape[0]):
+        hd_position = (positions[k] - offset) % 360.0
+        gates[k] = gate_sequence[int(hd_position / gate_degrees) % HD_GATE_COUNT]  # noqa: E501
+        progress = (hd_position % gate_degrees) / gate_degrees
+        line = int(progress * HD_LINES_PER_GATE) + 1
+        lines[k] = max(1, min(HD_LINES_PER_GATE, line))
+    return gates, lines
+
+
+def _gate_lines_numpy(
+    positions: np.ndarray, offset: float, gate_sequence: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    gate_degrees = 360.0 / HD_GATE_COUNT
+    hd_positions = (positions - offset) % 360.0
+    gate_index = (hd_positions / gate_degrees).astype(np.int64) % HD_GATE_COUNT  # noqa: E501
+    progress = (hd_positions % gate_degrees) / gate_degrees
+    lines = (progress * HD_LINES_PER_GATE).astype(np.int64) + 1
+    return (
+        np.asarray(gate_sequence, dtype=np.int64)[gate_index],
+        np.clip(lines, 1, HD_LINES_PER_GATE),
+    )
+
+
+# Thematic area scores
+
+
+def _area_scores_loop(
+    cell_scores: np.ndarray, valid: np.ndarray, area_cells: np.ndarray
+) -> np.ndarray:
+    """Average cell score per area over valid cells.
+
+    ``area_cells`` is an (areas, cells) mask over the flattened grid.
+    """
+    out = np.empty(area_cells.shape[0])
+    for a in range(area_cells.shape[0]):
+        total = 0.0
+        count = 0
+        for c in range(cell_scores.shape[0]):
+            if area_cells[a, c] and valid[c]:
+                total += cell_scores[c]
+                count += 1
+        out[a] = total / max(count, 1)
+    return out
+
+
+def _area_scores_numpy(
+    cell_scores: np.ndarray, valid: np.ndarray, area_cells: np.ndarray
+) -> np.ndarray:
+    cells = area_cells.astype(np.float64)
+    totals = cells @ np.where(valid, cell_scores, 0.0)
+    return totals / np.maximum(cells @ valid, 1)
+
+
+pair_midpoints = _select(_pair_midpoints_loop, _pair_midpoints_numpy)
+dial_separations = _select(_dial_separations_loop, _dial_separations_numpy)
+pair_aspect_orbs = _select(_pair_aspect_orbs_loop, _pair_aspect_orbs_numpy)
+gate_lines = _select(_gate_lines_loop, _gate_lines_numpy)
+area_scores = _select(_area_scores_loop, _area_scores_numpy)
+
+
+def kernel_backend() -> str:
+    """Name of the active kernel backend ("numba" or "numpy")."""
+    return "numba" if JIT_ENABLED else "numpy"
@@ -7,10 +7,17 @@ into the main application workflows.
 
 import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from utils.dtype_policy import DtypePolicy, get_dtype_policy
+from utils.parallel_synastry import (
+    aspect_code_matrices,
+    parallel_aspect_codes,
+    resolve_workers,
+)
 from utils.vectorized_caching import (
     ChartDataHasher,
     TieredCacheManager,
@@ -31,6 +38,18 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# Aspects of the integration layer's aspect matrices (default cache key)
+DEFAULT_SYNASTRY_ASPECTS = [
+    "conjunction",
+    "opposition",
+    "trine",
+    "square",
+    "sextile",
+]
+
+# Smaller batches stay in-process: starting workers costs more
+PARALLEL_MIN_PAIRS = 2000
+
 
 class OptimizedVectorizedAspectCalculator:
     """
@@ -50,6 +69,8 @@ class OptimizedVectorizedAspectCalculator:
         enable_caching: bool = True,
         enable_monitoring: bool = True,
         cache_manager: Optional[TieredCacheManager] = None,
+        dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+        workers: int = 1,
     ):
         """
         Initialize the optimized calculator.
@@ -60,11 +81,17 @@ class OptimizedVectorizedAspectCalculator:
             enable_caching: Whether to cache calculation results
             enable_monitoring: Whether to collect performance metrics
             cache_manager: Custom cache manager (uses global if None)
+            dtype_policy: Array dtype policy (uses process default if None)
+            workers: Processes for large batches (1: in-process, 0: one
+                per CPU)
         """
 
         # Initialize components
+        self.dtypes = get_dtype_policy(dtype_policy)
         self.memory_calculator = MemoryOptimizedVectorizedCalculator(
-            chunk_size=chunk_size, enable_memory_pooling=enable_memory_pooling
+            chunk_size=chunk_size,
+            enable_memory_pooling=enable_memory_pooling,
+            dtype_policy=self.dtypes,
         )
 
         self.performance_monitor = (
@@ -80,6 +107,7 @@ class OptimizedVectorizedAspectCalculator:
 
         # Settings
         self.chunk_size = chunk_size
+        self.workers = workers
 
         logger.info(
             f"Initialized OptimizedVectorizedAspectCalculator with "
@@ -120,31 +148,15 @@ class OptimizedVectorizedAspectCalculator:
         """
 
         if aspects is None:
-            aspects = [
-                "conjunction",
-                "opposition",
-                "trine",
-                "square",
-                "sextile",
-            ]
+            aspects = list(DEFAULT_SYNASTRY_ASPECTS)
 
         operation_name = "synastry_aspects"
 
         # Try cache first
-        if self.enable_caching and self.cache_manager:
-            chart1_hash, chart2_hash = self._get_cache_key_data(chart1, chart2)
-
-            cached_result = self.cache_manager.get(
-                operation_name,
-                chart_data=chart1,  # Use first chart as primary key
-                chart2_hash=chart2_hash,
-                orb=orb,
-                aspects=aspects,
-            )
-
-            if cached_result is not None:
-                logger.debug("Cache hit for synastry calculation")
-                return cached_result
+        cached_result = self._get_cached_synastry(chart1, chart2, orb, aspects)  # noqa: E501
+        if cached_result is not None:
+            logger.debug("Cache hit for synastry calculation")
+            return cached_result
 
         # Calculate with monitoring
         if self.enable_monitoring and self.performance_monitor:
@@ -161,20 +173,51 @@ class OptimizedVectorizedAspectCalculator:
             )
 
         # Cache result
-        if self.enable_caching and self.cache_manager:
-            chart1_hash, chart2_hash = self._get_cache_key_data(chart1, chart2)
-            self.cache_manager.put(
-                result,
-                operation_name,
-                chart_data=chart1,
-                chart2_hash=chart2_hash,
-                orb=orb,
-                aspects=aspects,
-            )
-            logger.debug("Cached synastry calculation result")
+        self._cache_synastry(result, chart1, chart2, orb, aspects)
 
         return result
 
+    def _get_cached_synastry(
+        self,
+        chart1: Dict[str, float],
+        chart2: Dict[str, float],
+        orb: float,
+        aspects: List[str],
+    ) -> Optional[np.ndarray]:
+        """Cached aspect matrix of a chart pair (None on a miss)."""
+        if not (self.enable_caching and self.cache_manager):
+            return None
+        chart1_hash, chart2_hash = self._get_cache_key_data(chart1, chart2)
+        return self.cache_manager.get(
+            "synastry_aspects",
+            chart_data=chart1,  # Use first chart as primary key
+            chart2_hash=chart2_hash,
+            orb=orb,
+            aspects=aspects,
+        )
+
+    def _cache_synastry(
+        self,
+        result: np.ndarray,
+        chart1: Dict[str, float],
+        chart2: Dict[str, float],
+        orb: float,
+        aspects: List[str],
+    ) -> None:
+        """Cache the aspect matrix of a chart pair."""
+        if not (self.enable_caching and self.cache_manager):
+            return
+        chart1_hash, chart2_hash = self._get_cache_key_data(chart1, chart2)
+        self.cache_manager.put(
+            result,
+            "synastry_aspects",
+            chart_data=chart1,
+            chart2_hash=chart2_hash,
+            orb=orb,
+            aspects=aspects,
+        )
+        logger.debug("Cached synastry calculation result")
+
     def _compute_synastry_aspects(
         self,
         chart1: Dict[str, float],
@@ -201,33 +244,10 @@ class OptimizedVectorizedAspectCalculator:
     ) -> np.ndarray:
         """Fallback aspect calculation method."""
         # Simple implementation for when main calculator is not available
-        planets1 = list(chart1.keys())
-        planets2 = list(chart2.keys())
-
-        matrix = np.zeros((len(planets1), len(planets2)))
-
-        for i, planet1 in enumerate(planets1):
-            for j, planet2 in enumerate(planets2):
-                pos1 = chart1[planet1]
-                pos2 = chart2[planet2]
-
-                # Calculate angular separation
-                diff = abs(pos1 - pos2)
-                diff = min(diff, 360 - diff)  # Handle wraparound
-
-                # Check for major aspects
-                if diff <= orb:  # Conjunction
-                    matrix[i, j] = 1
-                elif abs(diff - 60) <= orb:  # Sextile
-                    matrix[i, j] = 2
-                elif abs(diff - 90) <= orb:  # Square
-                    matrix[i, j] = 3
-                elif abs(diff - 120) <= orb:  # Trine
-                    matrix[i, j] = 4
-                elif abs(diff - 180) <= orb:  # Opposition
-                    matrix[i, j] = 5
-
-        return matrix
+        # Aspect codes 0-5 fit the policy's code dtype
+        long1 = np.array([list(chart1.values())], dtype=np.float64)
+        long2 = np.array([list(chart2.values())], dtype=np.float64)
+        return aspect_code_matrices(long1, long2, orb, self.dtypes.code)[0]
 
     def calculate_large_batch_synastry(
         self,
@@ -238,6 +258,10 @@ class OptimizedVectorizedAspectCalculator:
         """
         Calculate synastry for large batches with memory optimization.
 
+        With ``workers`` above 1, batches of at least
+        ``PARALLEL_MIN_PAIRS`` pairs are sharded across a process pool
+        (see ``_process_batch_parallel``).
+
         Args:
             chart_pairs: List of (chart1, chart2) tuples
             orb: Orb tolerance for aspects
@@ -249,27 +273,41 @@ class OptimizedVectorizedAspectCalculator:
 
         operation_name = "batch_synastry"
         total_pairs = len(chart_pairs)
+        workers = resolve_workers(self.workers)
+        # The main calculator's matrices are only computed in-process
+        parallel = (
+            workers > 1
+            and total_pairs >= PARALLEL_MIN_PAIRS
+            and VectorizedAspectCalculator is None
+        )
 
         logger.info(
             f"Starting batch synastry calculation for {total_pairs} chart pairs"  # noqa: E501
+            + (f" on {workers} processes" if parallel else "")
         )
 
         # Use memory-optimized processing
         with memory_optimized_processing(
             chunk_size=self.chunk_size,
             enable_pooling=self.memory_calculator.enable_memory_pooling,
+            dtype_policy=self.dtypes,
         ) as (calculator, monitor):
 
-            if self.enable_monitoring and self.performance_monitor:
-                with self.performance_monitor.time_operation(operation_name):
-                    results = self._process_batch_with_caching(
-                        chart_pairs, orb, progress_callback, calculator
+            def process() -> List[np.ndarray]:
+                if parallel:
+                    return self._process_batch_parallel(
+                        chart_pairs, orb, progress_callback
                     )
-            else:
-                results = self._process_batch_with_caching(
+                return self._process_batch_with_caching(
                     chart_pairs, orb, progress_callback, calculator
                 )
 
+            if self.enable_monitoring and self.performance_monitor:
+                with self.performance_monitor.time_operation(operation_name):
+                    results = process()
+            else:
+                results = process()
+
             # Log final memory stats (MemoryMonitor may use different key names)  # noqa: E501
             memory_stats = monitor.get_memory_stats()
             current_mb = memory_stats.get(
@@ -334,6 +372,70 @@ class OptimizedVectorizedAspectCalculator:
 
         return results
 
+    def _process_batch_parallel(
+        self,
+        chart_pairs: List[Tuple[Dict[str, float], Dict[str, float]]],
+        orb: float,
+        progress_callback: Optional[Callable],
+    ) -> List[np.ndarray]:
+        """Process a batch on ``workers`` processes.
+
+        Cache hits are served here; the remaining pairs are grouped by
+        planet keys, packed into (pairs, planets) longitude arrays and
+        computed by ``parallel_aspect_codes`` over shared memory.
+        Results are merged back in input order and cached; progress is
+        reported as shards finish.
+        """
+        total = len(chart_pairs)
+        aspects = list(DEFAULT_SYNASTRY_ASPECTS)
+        results: List[Optional[np.ndarray]] = [None] * total
+        # (chart1 keys, chart2 keys) -> indices of uncached pairs
+        groups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[int]] = {}
+        for i, (chart1, chart2) in enumerate(chart_pairs):
+            results[i] = self._get_cached_synastry(chart1, chart2, orb, aspects)  # noqa: E501
+            if results[i] is None:
+                groups.setdefault((tuple(chart1), tuple(chart2)), []).append(i)
+
+        cache_hits = total - sum(len(indices) for indices in groups.values())
+        done = cache_hits
+
+        def advance(count: int) -> None:
+            nonlocal done
+            done += count
+            if progress_callback:
+                progress_callback(done / total * 100, done, total)
+
+        for (keys1, keys2), indices in groups.items():
+            long1, long2 = (
+                np.fromiter(
+                    chain.from_iterable(
+                        chart_pairs[i][side].values() for i in indices
+                    ),
+                    dtype=np.float64,
+                    count=len(indices) * len(keys),
+                ).reshape(len(indices), len(keys))
+                for side, keys in ((0, keys1), (1, keys2))
+            )
+            codes = parallel_aspect_codes(
+                long1, long2, orb, self.dtypes.code, self.workers, advance
+            )
+            # Own copies: views would keep the whole batch array alive in
+            # the cache for as long as any one pair stays cached
+            for i, matrix in zip(indices, codes):
+                results[i] = matrix.copy()
+            if self.enable_caching and self.cache_manager:
+                for i in indices:
+                    chart1, chart2 = chart_pairs[i]
+                    self._cache_synastry(results[i], chart1, chart2, orb, aspects)  # noqa: E501
+
+        if progress_callback and not groups:
+            progress_callback(100.0, total, total)
+
+        logger.info(
+            f"Parallel batch processing: {cache_hits}/{total} cache hits"
+        )
+        return results  # type: ignore[return-value]
+
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get comprehensive performance metrics."""
         metrics = {}
@@ -454,6 +556,7 @@ def optimized_calculation_session(
     chunk_size: int = 100,
     enable_caching: bool = True,
     enable_monitoring: bool = True,
+    workers: int = 1,
 ):
     """
     Context manager for optimized calculation sessions.
@@ -468,6 +571,7 @@ def optimized_calculation_session(
         chunk_size=chunk_size,
         enable_caching=enable_caching,
         enable_monitoring=enable_monitoring,
+        workers=workers,
     )
 
     try:
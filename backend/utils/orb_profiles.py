@@ -0,0 +1,369 @@
+# backend/utils/orb_profiles.py
+"""
+Orb profile registry shared by the aspect engines.
+
+A profile gives each aspect a maximum orb and each planet class
+(luminaries, personal, social and outer planets, other points) an orb
+multiplier. For a pair of bodies the larger of the two class multipliers
+applies, so any aspect to the Sun or Moon gets the luminary allowance.
+
+Profiles are compiled once per ordered aspect list into NumPy lookup
+arrays (``compile_orb_profile``) so the vectorized engines can broadcast
+them directly; scalar code paths use ``OrbProfile.orb``.
+
+Built-in profiles reproduce the tables each engine used before the
+registry existed:
+
+- ``natal``: natal chart aspects (``astro.calculations.aspects``)
+- ``synastry``: aspect matrices and compatibility scoring
+- ``transit``: transit search (``astro.calculations.transits_clean``)
+
+``traditional`` and ``tight`` are additional user-selectable profiles
+that scale orbs by planet class.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Canonical aspect keys and their exact angles in degrees
+ASPECT_ANGLES: Dict[str, float] = {
+    "conjunction": 0.0,
+    "semi_sextile": 30.0,
+    "semi_square": 45.0,
+    "sextile": 60.0,
+    "quintile": 72.0,
+    "square": 90.0,
+    "trine": 120.0,
+    "sesquiquadrate": 135.0,
+    "quincunx": 150.0,
+    "opposition": 180.0,
+}
+
+PLANET_CLASS_NAMES: Tuple[str, ...] = (
+    "luminary",
+    "personal",
+    "social",
+    "outer",
+    "point",
+)
+
+PLANET_CLASSES: Dict[str, str] = {
+    "sun": "luminary",
+    "moon": "luminary",
+    "mercury": "personal",
+    "venus": "personal",
+    "mars": "personal",
+    "jupiter": "social",
+    "saturn": "social",
+    "uranus": "outer",
+    "neptune": "outer",
+    "pluto": "outer",
+}
+
+DEFAULT_PLANET_CLASS = "point"
+
+
+def get_planet_class(body: str) -> str:
+    """Planet class for a body name; unknown bodies count as points."""
+    return PLANET_CLASSES.get(body.lower(), DEFAULT_PLANET_CLASS)
+
+
+@dataclass(frozen=True)
+class OrbProfile:
+    """Maximum orb per aspect plus orb multipliers per planet class.
+
+    Aspects missing from ``orbs`` are disabled for the profile; classes
+    missing from ``class_factors`` use a multiplier of 1.
+    """
+
+    name: str
+    orbs: Mapping[str, float]
+    class_factors: Mapping[str, float] = field(default_factory=dict)
+    description: str = ""
+
+    def pair_factor(
+        self, body1: Optional[str] = None, body2: Optional[str] = None
+    ) -> float:
+        """Orb multiplier for a pair of bodies (the larger class factor)."""
+        factors = [
+            float(self.class_factors.get(get_planet_class(body), 1.0))
+            for body in (body1, body2)
+            if body
+        ]
+        return max(factors) if factors else 1.0
+
+    def orb(
+        self,
+        aspect: str,
+        body1: Optional[str] = None,
+        body2: Optional[str] = None,
+    ) -> float:
+        """Maximum orb for ``aspect`` between two (optional) bodies."""
+        return float(self.orbs.get(aspect, 0.0)) * self.pair_factor(
+            body1, body2
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "orbs": dict(self.orbs),
+            "class_factors": {
+                name: float(self.class_factors.get(name, 1.0))
+                for name in PLANET_CLASS_NAMES
+            },
+        }
+
+
+class CompiledOrbProfile:
+    """NumPy lookup arrays for one profile over an ordered aspect list."""
+
+    def __init__(self, profile: OrbProfile, aspects: Sequence[str]):
+        unknown = [a for a in aspects if a not in ASPECT_ANGLES]
+        if unknown:
+            raise ValueError(f"Unknown aspect keys: {unknown}")
+
+        self.profile = profile
+        self.aspects: Tuple[str, ...] = tuple(aspects)
+        self.angles = np.array(
+            [ASPECT_ANGLES[a] for a in self.aspects], dtype=np.float64
+        )
+        self.orbs = np.array(
+            [float(profile.orbs.get(a, 0.0)) for a in self.aspects],
+            dtype=np.float64,
+        )
+        self.class_factors = np.array(
+            [
+                float(profile.class_factors.get(name, 1.0))
+                for name in PLANET_CLASS_NAMES
+            ],
+            dtype=np.float64,
+        )
+        self.uniform = bool(np.all(self.class_factors == 1.0))
+        self._factor_cache: Dict[Tuple[str, ...], np.ndarray] = {}
+
+    def body_factors(self, bodies: Sequence[str]) -> np.ndarray:
+        """Class multiplier per body, cached per body list."""
+        key = tuple(bodies)
+        factors = self._factor_cache.get(key)
+        if factors is None:
+            class_index = {
+                name: i for i, name in enumerate(PLANET_CLASS_NAMES)
+            }
+            factors = self.class_factors[
+                [class_index[get_planet_class(body)] for body in key]
+            ]
+            self._factor_cache[key] = factors
+        return factors
+
+    def pair_orbs(
+        self, bodies1: Sequence[str], bodies2: Sequence[str]
+    ) -> np.ndarray:
+        """Maximum orbs for every body pair: shape (len1, len2, aspects)."""
+        if self.uniform:
+            return np.broadcast_to(
+                self.orbs, (len(bodies1), len(bodies2), len(self.aspects))
+            )
+        factors = np.maximum.outer(
+            self.body_factors(bodies1), self.body_factors(bodies2)
+        )
+        return factors[:, :, np.newaxis] * self.orbs
+
+    def orbs_for_pairs(
+        self,
+        bodies: Sequence[str],
+        i_idx: np.ndarray,
+        j_idx: np.ndarray,
+    ) -> np.ndarray:
+        """Maximum orbs for index pairs into ``bodies``: (pairs, aspects)."""
+        if self.uniform:
+            return np.broadcast_to(self.orbs, (len(i_idx), len(self.aspects)))
+        factors = self.body_factors(bodies)
+        pair_factors = np.maximum(factors[i_idx], factors[j_idx])
+        return pair_factors[:, np.newaxis] * self.orbs
+
+
+_BUILTIN_PROFILES: List[OrbProfile] = [
+    OrbProfile(
+        name="natal",
+        description="Natal chart aspects with wide major-aspect orbs",
+        orbs={
+            "conjunction": 10.0,
+            "semi_sextile": 2.0,
+            "semi_square": 2.0,
+            "sextile": 6.0,
+            "quintile": 2.0,
+            "square": 8.0,
+            "trine": 8.0,
+            "sesquiquadrate": 2.0,
+            "quincunx": 2.0,
+            "opposition": 10.0,
+        },
+    ),
+    OrbProfile(
+        name="synastry",
+        description="Chart-to-chart aspects used for compatibility scoring",
+        orbs={
+            "conjunction": 10.0,
+            "semi_sextile": 2.0,
+            "semi_square": 2.0,
+            "sextile": 6.0,
+            "quintile": 2.0,
+            "square": 8.0,
+            "trine": 8.0,
+            "sesquiquadrate": 2.0,
+            "quincunx": 3.0,
+            "opposition": 10.0,
+        },
+    ),
+    OrbProfile(
+        name="transit",
+        description="Transiting planets to natal positions",
+        orbs={
+            "conjunction": 8.0,
+            "semi_sextile": 2.0,
+            "semi_square": 2.0,
+            "sextile": 4.0,
+            "quintile": 1.0,
+            "square": 6.0,
+            "trine": 6.0,
+            "sesquiquadrate": 2.0,
+            "quincunx": 3.0,
+            "opposition": 8.0,
+        },
+    ),
+    OrbProfile(
+        name="traditional",
+        description="Moderate orbs widened for the luminaries",
+        orbs={
+            "conjunction": 8.0,
+            "semi_sextile": 1.5,
+            "semi_square": 1.5,
+            "sextile": 5.0,
+            "quintile": 1.5,
+            "square": 7.0,
+            "trine": 7.0,
+            "sesquiquadrate": 1.5,
+            "quincunx": 2.0,
+            "opposition": 8.0,
+        },
+        class_factors={
+            "luminary": 1.25,
+            "personal": 1.0,
+            "social": 1.0,
+            "outer": 0.85,
+            "point": 0.75,
+        },
+    ),
+    OrbProfile(
+        name="tight",
+        description="Narrow orbs for precise work",
+        orbs={
+            "conjunction": 5.0,
+            "semi_sextile": 1.0,
+            "semi_square": 1.0,
+            "sextile": 3.0,
+            "quintile": 1.0,
+            "square": 4.0,
+            "trine": 4.0,
+            "sesquiquadrate": 1.0,
+            "quincunx": 1.5,
+            "opposition": 5.0,
+        },
+        class_factors={"luminary": 1.2, "outer": 0.9, "point": 0.6},
+    ),
+]
+
+_PROFILES: Dict[str, OrbProfile] = {p.name: p for p in _BUILTIN_PROFILES}
+
+
+def register_orb_profile(profile: OrbProfile) -> None:
+    """Add or replace a profile; compiled lookups are rebuilt lazily."""
+    unknown = [a for a in profile.orbs if a not in ASPECT_ANGLES]
+    if unknown:
+        raise ValueError(f"Unknown aspect keys: {unknown}")
+    unknown = [c for c in profile.class_factors if c not in PLANET_CLASS_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown planet classes: {unknown}")
+    _PROFILES[profile.name] = profile
+    compile_orb_profile.cache_clear()
+    logger.debug(f"Registered orb profile: {profile.name}")
+
+
+def get_orb_profile(name: str) -> OrbProfile:
+    """Look up a profile by name."""
+    try:
+        return _PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown orb profile '{name}'. Available: {sorted(_PROFILES)}"
+        )
+
+
+def list_orb_profiles() -> List[Dict[str, object]]:
+    """Serializable description of every registered profile."""
+    return [profile.to_dict() for profile in _PROFILES.values()]
+
+
+@lru_cache(maxsize=64)
+def compile_orb_profile(
+    name: str, aspects: Tuple[str, ...] = tuple(ASPECT_ANGLES)
+) -> CompiledOrbProfile:
+    """Compiled lookup arrays for profile ``name`` over ``aspects``."""
+    return CompiledOrbProfile(get_orb_profile(name), aspects)
+
+
+def applying_flags(
+    pos1: Union[float, np.ndarray],
+    pos2: Union[float, np.ndarray],
+    speed1: Union[float, np.ndarray],
+    speed2: Union[float, np.ndarray],
+    aspect_angles: Union[float, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Applying/separating state for aspects from longitudes and speeds.
+
+    Speeds are in degrees per day (negative when retrograde); a NaN speed
+    means unknown. An aspect is applying when its orb is shrinking, i.e.
+    the time derivative of ``|separation - aspect angle|`` is negative.
+
+    Returns:
+        ``(applying, known)`` boolean arrays broadcast over the inputs;
+        ``applying`` is only meaningful where ``known`` is True.
+    """
+    p1 = np.asarray(pos1, dtype=np.float64)
+    p2 = np.asarray(pos2, dtype=np.float64)
+    delta = (p2 - p1 + 180.0) % 360.0 - 180.0
+    # d|delta|/dt: the arc widens when body 2 outruns body 1 in its direction
+    separation_rate = np.sign(delta) * (
+        np.asarray(speed2, dtype=np.float64)
+        - np.asarray(speed1, dtype=np.float64)
+    )
+    orb_rate = np.sign(np.abs(delta) - aspect_angles) * separation_rate
+    return orb_rate < 0, ~np.isnan(orb_rate)
+
+
+def is_applying(
+    pos1: float,
+    pos2: float,
+    speed1: Optional[float],
+    speed2: Optional[float],
+    aspect_angle: float,
+) -> Optional[bool]:
+    """Scalar ``applying_flags``; None when either speed is unknown."""
+    if speed1 is None or speed2 is None:
+        return None
+    delta = (pos2 - pos1 + 180.0) % 360.0 - 180.0
+    orb_rate = _sign(abs(delta) - aspect_angle) * _sign(delta) * (
+        speed2 - speed1
+    )
+    return orb_rate < 0
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
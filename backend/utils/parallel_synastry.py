@@ -0,0 +1,161 @@
+# backend/utils/parallel_synastry.py
+"""
+Multi-core synastry aspect codes over shared-memory arrays.
+
+``parallel_aspect_codes`` copies the chart longitudes of a batch once
+into shared memory and shards the rows across a process pool. Workers
+attach to the same blocks (no pickling of chart data) and write their
+rows of the (pairs, planets1, planets2) code array straight into a
+shared output block, so only shard bounds cross process boundaries.
+
+Aspect codes follow ``OptimizedVectorizedAspectCalculator``'s fallback
+calculation: 0 for no aspect, then 1-5 for conjunction, sextile,
+square, trine and opposition, the first aspect within ``orb`` winning.
+"""
+
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Aspect angles in code order (code = index + 1)
+MAJOR_ASPECT_ANGLES = (0.0, 60.0, 90.0, 120.0, 180.0)
+
+# Shards per worker, so faster workers pick up more of the batch
+SHARDS_PER_WORKER = 4
+MIN_SHARD_PAIRS = 256
+
+
+class SharedArraySpec(NamedTuple):
+    """What a worker needs to attach to a shared array."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def aspect_code_matrices(
+    long1: np.ndarray, long2: np.ndarray, orb: float, dtype: np.dtype
+) -> np.ndarray:
+    """(pairs, P1, P2) aspect codes for row-paired longitudes.
+
+    ``long1`` is (pairs, P1) and ``long2`` (pairs, P2).
+    """
+    diff = np.abs(long1[:, :, np.newaxis] - long2[:, np.newaxis, :])
+    diff = np.minimum(diff, 360 - diff)
+    codes = np.zeros(diff.shape, dtype=dtype)
+    # Assign in reverse so the first matching aspect overwrites the rest
+    for code in range(len(MAJOR_ASPECT_ANGLES), 0, -1):
+        angle = MAJOR_ASPECT_ANGLES[code - 1]
+        codes[np.abs(diff - angle) <= orb] = code
+    return codes
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Process count for ``workers`` (0 or None: one per CPU)."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def _create_shared(
+    stack: ExitStack, shape: Tuple[int, ...], dtype: np.dtype
+) -> Tuple[SharedMemory, SharedArraySpec]:
+    """Shared memory block for an array, unlinked when ``stack`` closes."""
+    dtype = np.dtype(dtype)
+    shm = SharedMemory(create=True, size=max(1, math.prod(shape) * dtype.itemsize))  # noqa: E501
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    return shm, SharedArraySpec(shm.name, shape, dtype.str)
+
+
+def _view(block: SharedMemory, spec: SharedArraySpec) -> np.ndarray:
+    """Array over a shared block.
+
+    Views export the block's buffer, so they must not outlive the
+    statement that uses them or ``close()`` fails.
+    """
+    return np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+
+
+def _aspect_codes_shard(
+    long1: SharedArraySpec,
+    long2: SharedArraySpec,
+    out: SharedArraySpec,
+    start: int,
+    stop: int,
+    orb: float,
+) -> int:
+    """Worker: write codes for rows ``start:stop`` into ``out``."""
+    specs = (long1, long2, out)
+    blocks = [SharedMemory(name=spec.name) for spec in specs]
+    lons1 = lons2 = codes = None
+    try:
+        lons1, lons2, codes = (
+            _view(block, spec) for block, spec in zip(blocks, specs)
+        )
+        codes[start:stop] = aspect_code_matrices(
+            lons1[start:stop], lons2[start:stop], orb, codes.dtype
+        )
+    finally:
+        lons1 = lons2 = codes = None
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+def parallel_aspect_codes(
+    long1: np.ndarray,
+    long2: np.ndarray,
+    orb: float,
+    dtype: np.dtype,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> np.ndarray:
+    """``aspect_code_matrices`` sharded across a process pool.
+
+    ``progress`` is called in this process with the number of pairs of
+    each finished shard. Returns a regular (not shared) array.
+    """
+    pairs = len(long1)
+    if not pairs:
+        return np.zeros((0, long1.shape[1], long2.shape[1]), dtype=dtype)
+    workers = resolve_workers(workers)
+    shard = max(MIN_SHARD_PAIRS, -(-pairs // (workers * SHARDS_PER_WORKER)))
+    bounds: List[Tuple[int, int]] = [
+        (start, min(start + shard, pairs)) for start in range(0, pairs, shard)
+    ]
+
+    with ExitStack() as stack:
+        block1, spec1 = _create_shared(stack, long1.shape, np.float64)
+        block2, spec2 = _create_shared(stack, long2.shape, np.float64)
+        out_block, out = _create_shared(
+            stack, (pairs, long1.shape[1], long2.shape[1]), dtype
+        )
+        _view(block1, spec1)[:] = long1
+        _view(block2, spec2)[:] = long2
+
+        with ProcessPoolExecutor(min(workers, len(bounds))) as pool:
+            futures = [
+                pool.submit(
+                    _aspect_codes_shard, spec1, spec2, out, start, stop, orb
+                )
+                for start, stop in bounds
+            ]
+            for future in as_completed(futures):
+                done = future.result()
+                if progress:
+                    progress(done)
+
+        result = _view(out_block, out).copy()
+    logger.debug(
+        f"Computed {pairs} aspect matrices in {len(bounds)} shards on {workers} workers"  # noqa: E501
+    )
+    return result
@@ -0,0 +1,90 @@
+# backend/utils/redis_tier.py
+"""
+Shared Redis tier for the two-tier result caches.
+
+``RedisTier`` creates the client lazily and, after any Redis error, skips
+the tier for ``REDIS_RETRY_SECONDS`` so a down or slow Redis never fails
+a request. Payloads are compact JSON compressed with zlib; both codec
+functions also return the uncompressed size, which the caches use for
+their byte accounting.
+"""
+
+import json
+import logging
+import time
+import zlib
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_SECONDS = 60.0
+COMPRESSION_LEVEL = 6
+
+
+def encode_json(value: Any) -> bytes:
+    """Compact JSON encoding of ``value``."""
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def compress_json(value: Any) -> Tuple[bytes, int]:
+    """Compressed compact JSON of ``value`` and its uncompressed size."""
+    raw = encode_json(value)
+    return zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def decompress_json(payload: bytes) -> Tuple[Any, int]:
+    """Value of a ``compress_json`` payload and its uncompressed size.
+
+    Raises ``zlib.error`` or ``ValueError`` for corrupt payloads.
+    """
+    raw = zlib.decompress(payload)
+    return json.loads(raw.decode("utf-8")), len(raw)
+
+
+class RedisTier:
+    """Lazily connected Redis client that backs off after errors."""
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[], Any]],
+        name: str,
+        on_error: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            client_factory: Returns a Redis client, or None to disable
+                the tier
+            name: Cache name used in log messages
+            on_error: Called once for every Redis error
+        """
+        self._factory = client_factory
+        self._name = name
+        self._on_error = on_error
+        self._client: Any = None
+        self._retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._factory is not None
+
+    def client(self) -> Any:
+        """The Redis client, or None while disabled or backing off."""
+        if self._factory is None:
+            return None
+        if time.monotonic() < self._retry_at:
+            return None
+        if self._client is None:
+            try:
+                self._client = self._factory()
+            except Exception as e:
+                self.failed(e)
+                return None
+        return self._client
+
+    def failed(self, error: Exception) -> None:
+        """Drop the client and skip the tier for ``REDIS_RETRY_SECONDS``."""
+        logger.warning(f"{self._name} Redis tier unavailable: {error}")
+        if self._on_error is not None:
+            self._on_error()
+        self._client = None
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
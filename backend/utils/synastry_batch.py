@@ -0,0 +1,132 @@
+# backend/utils/synastry_batch.py
+"""
+One-vs-many synastry scoring for matchmaking workloads.
+
+Candidate charts are stacked into an (N, 10) longitude array in
+``PLANETS`` order and scored against one reference chart in a few array
+operations per chunk (``VectorizedAspectCalculator.score_one_to_many``).
+House overlay bonuses are computed the same way from stacked cusps, so
+``overall_score`` equals ``calculate_compatibility_score(...)["overall_score"]``
+for the pair, without building any per-pair aspect matrix.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .aspect_utils import PLANETS
+from .compatibility_utils import (
+    KEY_HOUSES,
+    MAX_POSSIBLE_SCORE,
+    OVERLAY_BONUS,
+    OVERLAY_PLANETS,
+)
+from .vectorized_aspect_utils import ASPECT_TYPES, get_vectorized_calculator
+
+_OVERLAY_COLUMNS = [PLANETS.index(p) for p in OVERLAY_PLANETS]
+
+
+def stack_longitudes(charts: Sequence[Mapping[str, float]]) -> np.ndarray:
+    """Stack planet longitudes into an (N, 10) array; missing planets are 0."""  # noqa: E501
+    return np.array(
+        [[chart.get(p, 0.0) for p in PLANETS] for chart in charts],
+        dtype=float,
+    ).reshape(len(charts), len(PLANETS))
+
+
+def houses_for(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """House (1-12) of each longitude, vectorized ``find_house``.
+
+    ``longitudes`` is (N, k) and ``cusps`` (N, 12), one cusp row per chart
+    (or a single (12,) row for all). The house is the cusp with the
+    smallest forward distance to the longitude.
+    """
+    cusps = np.asarray(cusps, dtype=float)
+    offsets = (
+        np.asarray(longitudes, dtype=float)[..., np.newaxis]
+        - cusps[..., np.newaxis, :]
+    ) % 360
+    return np.argmin(offsets, axis=-1) + 1
+
+
+def overlay_bonus(
+    reference: np.ndarray,
+    reference_cusps: Sequence[float],
+    candidates: np.ndarray,
+    candidate_cusps: np.ndarray,
+) -> np.ndarray:
+    """Overlay bonus per candidate, as in ``calculate_compatibility_score``."""  # noqa: E501
+    key_houses = np.array(KEY_HOUSES)
+    # Reference planets in each candidate's houses
+    ref_houses = houses_for(
+        np.broadcast_to(
+            reference[_OVERLAY_COLUMNS], (len(candidates), len(_OVERLAY_COLUMNS))  # noqa: E501
+        ),
+        candidate_cusps,
+    )
+    # Candidate planets in the reference houses
+    cand_houses = houses_for(
+        candidates[:, _OVERLAY_COLUMNS], np.asarray(reference_cusps)
+    )
+    hits = np.isin(ref_houses, key_houses).sum(axis=1) + np.isin(
+        cand_houses, key_houses
+    ).sum(axis=1)
+    return hits * float(OVERLAY_BONUS)
+
+
+def score_candidates(
+    reference: Mapping[str, float],
+    candidates: np.ndarray,
+    reference_cusps: Optional[Sequence[float]] = None,
+    candidate_cusps: Optional[Sequence[Sequence[float]]] = None,
+    orb_profile: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """Compatibility of one chart with N stacked candidate charts.
+
+    Overlay bonuses are included when both cusp sets are given. Returns
+    arrays of length N: ``overall_score`` (0-100, unrounded),
+    ``total_score`` (unclipped, for ranking past the 100 cap),
+    ``aspect_score``, ``overlay_bonus`` and one count per aspect type.
+    """
+    candidates = np.asarray(candidates, dtype=float)
+    calculator = get_vectorized_calculator(orb_profile)
+    aspect_score, type_counts = calculator.score_one_to_many(
+        dict(reference), candidates
+    )
+    bonus = np.zeros(len(candidates))
+    if reference_cusps is not None and candidate_cusps is not None:
+        ref = np.array([reference.get(p, 0.0) for p in PLANETS])
+        bonus = overlay_bonus(
+            ref, reference_cusps, candidates, np.asarray(candidate_cusps)
+        )
+    total = aspect_score + bonus
+    overall = np.clip(
+        (total + MAX_POSSIBLE_SCORE / 4) / (MAX_POSSIBLE_SCORE / 2) * 100,
+        0,
+        100,
+    )
+    result = {
+        "overall_score": overall,
+        "total_score": total,
+        "aspect_score": aspect_score,
+        "overlay_bonus": bonus,
+    }
+    for t, name in enumerate(ASPECT_TYPES):
+        result[name] = type_counts[:, t]
+    return result
+
+
+def top_k(scores: np.ndarray, k: int) -> List[int]:
+    """Indices of the ``k`` highest scores, best first (ties by index)."""
+    scores = np.asarray(scores)
+    k = max(0, min(k, len(scores)))
+    if k == 0:
+        return []
+    if k < len(scores):
+        # Keep every candidate tied with the k-th best so ties stay stable
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return [int(i) for i in candidates[order][:k]]
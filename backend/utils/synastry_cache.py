@@ -0,0 +1,208 @@
+# backend/utils/synastry_cache.py
+"""
+Bounded two-tier cache for synastry results.
+
+The in-process tier is an LRU bounded both by entry count and by the
+size of the cached payloads (their compact JSON length), with a TTL per
+entry. The optional Redis tier stores zlib-compressed JSON so results are
+shared across workers; Redis errors never fail a request, the tier is
+just skipped for a while (see ``utils.redis_tier``).
+
+Cache events are reported through ``on_event`` using the labels of the
+``synastry_cache_events_total`` counter: ``hit``, ``miss``, ``expired`` and
+``store``, plus ``evict``, ``redis_hit`` and ``redis_error``.
+"""
+
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .redis_tier import (
+    RedisTier,
+    compress_json,
+    decompress_json,
+    encode_json,
+)
+
+logger = logging.getLogger(__name__)
+
+Payload = Dict[str, Any]
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+KEY_VERSION = "3"
+
+CACHE_EVENTS = (
+    "hit",
+    "miss",
+    "expired",
+    "store",
+    "evict",
+    "redis_hit",
+    "redis_error",
+)
+
+
+def pair_key(
+    person1: Tuple[float, float, float],
+    person2: Tuple[float, float, float],
+    variant: str = "",
+) -> str:
+    """Cache key for an ordered pair of (Julian Day UT, latitude, longitude).
+
+    The JD is rounded to about 0.1 s and coordinates to about 10 m, so
+    equivalent inputs (e.g. the same moment in different time zones)
+    share a key. Order matters: the response is from person 1's side.
+    ``variant`` names the calculation options that change the payload,
+    so results from different code paths never share a key.
+    """
+    parts = [
+        f"{jd:.6f},{lat:.4f},{lon:.4f}" for jd, lat, lon in (person1, person2)
+    ]
+    return f"syn:v{KEY_VERSION}:{variant}:{parts[0]}|{parts[1]}"
+
+
+class SynastryCache:
+    """Size-bounded LRU with a TTL plus an optional compressed Redis tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: int = 900,
+        redis_client_factory: Optional[Callable[[], Any]] = None,
+        on_event: Optional[Callable[[str], None]] = None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires at, size in bytes, payload)
+        self._entries: "OrderedDict[str, Tuple[float, int, Payload]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._redis = RedisTier(
+            redis_client_factory,
+            "Synastry cache",
+            lambda: self._event("redis_error"),
+        )
+        self._on_event = on_event
+        self._events: Dict[str, int] = {event: 0 for event in CACHE_EVENTS}
+
+    def _event(self, event: str, count: int = 1) -> None:
+        self._events[event] += count
+        if self._on_event is not None:
+            for _ in range(count):
+                try:
+                    self._on_event(event)
+                except Exception:
+                    pass
+
+    # In-process tier
+
+    def _remove(self, key: str) -> None:
+        # Caller holds the lock
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _store(self, key: str, value: Payload, size: int, now: float) -> None:
+        # Caller holds the lock
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (now + self.ttl_seconds, size, value)
+        self._bytes += size
+        evicted = 0
+        while (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            evicted += 1
+        if evicted:
+            self._event("evict", evicted)
+
+    # Public API
+
+    def get(self, key: str) -> Optional[Payload]:
+        """Cached payload for ``key``, or None."""
+        now = time.time()
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, _, value = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self._event("hit")
+                    return value
+                self._remove(key)
+                expired = True
+
+        client = self._redis.client()
+        if client is not None:
+            try:
+                payload = client.get(key)
+            except Exception as e:
+                self._redis.failed(e)
+                payload = None
+            if payload is not None:
+                try:
+                    value, size = decompress_json(payload)
+                except (zlib.error, ValueError) as e:
+                    logger.warning(f"Dropping corrupt synastry cache entry {key}: {e}")  # noqa: E501
+                else:
+                    with self._lock:
+                        self._store(key, value, size, now)
+                        self._event("redis_hit")
+                        self._event("hit")
+                    return value
+
+        with self._lock:
+            # Each lookup is counted once: hit, expired or miss
+            self._event("expired" if expired else "miss")
+        return None
+
+    def set(self, key: str, value: Payload) -> None:
+        """Store ``value`` in both tiers."""
+        client = self._redis.client()
+        if client is None:
+            payload, size = b"", len(encode_json(value))
+        else:
+            payload, size = compress_json(value)
+        with self._lock:
+            self._store(key, value, size, time.time())
+            self._event("store")
+
+        if client is None:
+            return
+        try:
+            client.setex(key, self.ttl_seconds, payload)
+        except Exception as e:
+            self._redis.failed(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire by TTL)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._events)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        lookups = stats["hit"] + stats["miss"] + stats["expired"]
+        stats["hit_rate"] = stats["hit"] / lookups if lookups else 0.0
+        stats["redis_enabled"] = self._redis.enabled
+        return stats
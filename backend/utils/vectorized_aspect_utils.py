@@ -1,27 +1,78 @@
 # Vectorized implementation for synastry calculations
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
-from .aspect_utils import ASPECT_DEGREES, ORBS, PLANETS, AspectData
+from .aspect_utils import (
+    ASPECT_DEGREES,
+    ORBS,
+    PLANETS,
+    SYNASTRY_ORB_PROFILE,
+    AspectData,
+)
+from .aspect_arrays import (
+    ASPECT_TYPE_CODES,
+    ASPECT_TYPES,
+    NO_TYPE,
+    AspectArrays,
+    aspect_type,
+)
+from .compatibility_utils import ASPECT_SCORES, PLANET_WEIGHTS
+from .dtype_policy import DtypePolicy, get_dtype_policy
+from .orb_profiles import compile_orb_profile
+from .vectorized_memory_optimization import scratch_array
+
+# Chart pairs scored per chunk; each temporary is (chunk, planets, planets)
+# floats, about 800 KB at this size, so chunks stay cache resident
+SCORE_CHUNK = 1024
 
 
 class VectorizedAspectCalculator:
     """High-performance vectorized aspect calculations for batch processing."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        orb_profile: str = SYNASTRY_ORB_PROFILE,
+        dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+    ):
+        compiled = compile_orb_profile(orb_profile, tuple(ASPECT_DEGREES))
+        self.orb_profile = orb_profile
+        # Every table is stored in the policy's dtypes so kernels never
+        # upcast compact batches back to float64
+        self.dtypes = get_dtype_policy(dtype_policy)
+        angle = self.dtypes.angle
         self.planets = np.array(PLANETS)
-        self.aspect_degrees = np.array(list(ASPECT_DEGREES.values()))
+        self.aspect_degrees = compiled.angles.astype(angle)
         self.aspect_names: List[str] = list(ASPECT_DEGREES.keys())
-        self.orbs = np.array([ORBS[name] for name in self.aspect_names])
+        self.orbs = compiled.orbs
+        # (planets, planets, aspects) maximum orbs for every pair
+        self.pair_orbs = compiled.pair_orbs(PLANETS, PLANETS)
+        # Disabled aspects (zero orb) can never match
+        self.enabled_orbs = np.where(
+            self.pair_orbs > 0, self.pair_orbs, -1.0
+        ).astype(angle)
+        # Scoring tables in PLANETS / aspect order (compatibility_utils)
+        self.aspect_scores = np.array(
+            [ASPECT_SCORES.get(a, 0) for a in self.aspect_names], dtype=angle
+        )
+        self.score_orbs = np.array(
+            [ORBS.get(a, 10) for a in self.aspect_names], dtype=angle
+        )
+        self.aspect_type_index = ASPECT_TYPE_CODES.astype(self.dtypes.code)
+        weights = np.array([PLANET_WEIGHTS.get(p, 1) for p in PLANETS])
+        self.weight_matrix = ((weights[:, np.newaxis] + weights) / 2).astype(
+            angle
+        )
 
     def calculate_separation_matrix(
         self, long1: Dict[str, float], long2: Dict[str, float]
     ) -> np.ndarray:
         """Calculate all planet-to-planet separations in one vectorized operation."""  # noqa: E501
         # Extract longitudes for all planets
-        lons1 = np.array([long1.get(p, 0.0) for p in PLANETS])
-        lons2 = np.array([long2.get(p, 0.0) for p in PLANETS])
+        lons1 = self.dtypes.angles([long1.get(p, 0.0) for p in PLANETS])
+        lons2 = self.dtypes.angles([long2.get(p, 0.0) for p in PLANETS])
 
         # Broadcast calculation: (10, 1) - (1, 10) = (10, 10) matrix
         diff_matrix = np.abs(lons1[:, np.newaxis] - lons2[np.newaxis, :])
@@ -34,31 +85,57 @@ class VectorizedAspectCalculator:
     def find_aspects_vectorized(
         self, separations: np.ndarray
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Find all aspects using vectorized operations."""
-        # Create 3D array: (10, 10, num_aspects)
-        sep_expanded = separations[:, :, np.newaxis]
-        aspect_expanded = self.aspect_degrees[np.newaxis, np.newaxis, :]
-        orb_expanded = self.orbs[np.newaxis, np.newaxis, :]
-
-        # Calculate orbs for all combinations
-        orbs_matrix = np.abs(sep_expanded - aspect_expanded)
+        """Find all aspects using vectorized operations.
 
-        # Find valid aspects (within orb)
-        valid_aspects = orbs_matrix <= orb_expanded
-
-        # Get the best aspect for each planet pair (minimum orb)
-        best_aspect_indices = np.argmin(
-            np.where(valid_aspects, orbs_matrix, np.inf), axis=2
-        )
-
-        # Get minimum orbs
-        min_orbs = np.min(np.where(valid_aspects, orbs_matrix, np.inf), axis=2)
+        ``separations`` is a (10, 10) matrix or a stack of them with
+        leading batch axes; results keep the same leading shape.
+        """
+        separations = self.dtypes.angles(separations)
+        shape = separations.shape
+        min_orbs = np.empty(shape, dtype=self.dtypes.angle)
+        best_aspect_indices = np.empty(shape, dtype=self.dtypes.code)
+        with ExitStack() as stack:
+            orbs, better, closer = (
+                scratch_array(stack, shape, dtype)
+                for dtype in (self.dtypes.angle, bool, bool)
+            )
+            self._closest_aspects(
+                separations, min_orbs, best_aspect_indices, orbs, better, closer  # noqa: E501
+            )
 
         # Mask for valid aspects
-        has_aspect = np.any(valid_aspects, axis=2)
+        has_aspect = np.isfinite(min_orbs)
 
         return best_aspect_indices, min_orbs, has_aspect
 
+    def _closest_aspects(
+        self,
+        separations: np.ndarray,
+        min_orbs: np.ndarray,
+        best_aspect_indices: np.ndarray,
+        orbs: np.ndarray,
+        better: np.ndarray,
+        closer: np.ndarray,
+    ) -> None:
+        """Fill ``min_orbs`` and ``best_aspect_indices`` in place.
+
+        One pass per aspect over (..., 10, 10) arrays instead of a
+        (..., 10, 10, num_aspects) temporary; ties keep the first aspect.
+        ``orbs``, ``better`` and ``closer`` are scratch arrays of the
+        same shape. Cells without an aspect keep an infinite orb.
+        """
+        min_orbs.fill(np.inf)
+        best_aspect_indices.fill(0)
+        for a, angle in enumerate(self.aspect_degrees):
+            np.subtract(separations, angle, out=orbs)
+            np.abs(orbs, out=orbs)
+            # Valid within the pair's orb for that aspect, closest so far
+            np.less_equal(orbs, self.enabled_orbs[..., a], out=better)
+            np.less(orbs, min_orbs, out=closer)
+            better &= closer
+            np.copyto(min_orbs, orbs, where=better)
+            np.copyto(best_aspect_indices, a, where=better)
+
     def build_aspect_matrix_vectorized(
         self, long1: Dict[str, float], long2: Dict[str, float]
     ) -> List[List[Optional[AspectData]]]:
@@ -68,109 +145,215 @@ class VectorizedAspectCalculator:
         consumer that only reads should type its parameter as Matrix for
         covariance with other potential sequence-like containers.
         """
+        return self.build_aspect_arrays(long1, long2).to_matrix()
+
+    def build_aspect_arrays(
+        self, long1: Dict[str, float], long2: Dict[str, float]
+    ) -> AspectArrays:
+        """Aspect grid as arrays, without per-cell dicts (see aspect_arrays)."""  # noqa: E501
         separations = self.calculate_separation_matrix(long1, long2)
         aspect_indices, orbs, has_aspect = self.find_aspects_vectorized(
             separations
         )
-
-        # Convert back to the expected format
-        matrix: List[List[Optional[AspectData]]] = []
-        for i in range(len(PLANETS)):
-            row: List[Optional[AspectData]] = []
-            for j in range(len(PLANETS)):
-                if has_aspect[i, j] and not np.isinf(orbs[i, j]):
-                    aspect_name: str = self.aspect_names[aspect_indices[i, j]]  # type: ignore[index]  # noqa: E501
-                    aspect_type: str = self._get_aspect_type(aspect_name)  # type: ignore[arg-type]  # noqa: E501
-                    row.append(
-                        {
-                            "aspect": aspect_name,
-                            "orb": float(orbs[i, j]),
-                            "type": aspect_type,
-                        }
-                    )
-                else:
-                    row.append(None)
-            matrix.append(row)
-        return matrix
+        return AspectArrays(
+            aspect=aspect_indices,
+            orb=orbs,
+            type=np.where(has_aspect, self.aspect_type_index[aspect_indices], NO_TYPE),  # noqa: E501
+            valid=has_aspect,
+        )
 
     def batch_compatibility_scores(
         self, chart_pairs: List[Tuple[Dict[str, float], Dict[str, float]]]
     ) -> List[float]:
         """Calculate compatibility scores for multiple chart pairs in one operation."""  # noqa: E501
-        scores: List[float] = []
-
-        # Process all separations at once
-        all_separations = np.array(
-            [
-                self.calculate_separation_matrix(long1, long2)
-                for long1, long2 in chart_pairs
-            ]
+        long1 = self.dtypes.angles(
+            [[l1.get(p, 0.0) for p in PLANETS] for l1, _ in chart_pairs]
+        ).reshape(len(chart_pairs), len(PLANETS))
+        long2 = self.dtypes.angles(
+            [[l2.get(p, 0.0) for p in PLANETS] for _, l2 in chart_pairs]
+        ).reshape(len(chart_pairs), len(PLANETS))
+        scores, _ = self.score_pairs(long1, long2)
+        return [float(score) for score in scores]
+
+    def score_pairs(
+        self,
+        long1: np.ndarray,
+        long2: np.ndarray,
+        chunk_size: int = SCORE_CHUNK,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score B chart pairs given as two (B, 10) longitude arrays.
+
+        Rows are in PLANETS order. Returns the raw aspect score per pair,
+        weighted as in ``calculate_compatibility_score``, and the (B, 3)
+        aspect counts per type in ``ASPECT_TYPES`` order.
+        """
+        long1 = self._as_longitudes(long1, "long1")
+        long2 = self._as_longitudes(long2, "long2")
+        if long1.shape != long2.shape:
+            raise ValueError(
+                f"long1 and long2 must have the same shape, got {long1.shape} and {long2.shape}"  # noqa: E501
+            )
+        return self._score_chunks(
+            len(long1),
+            lambda start, stop, out: np.subtract(
+                long1[start:stop, :, np.newaxis],
+                long2[start:stop, np.newaxis, :],
+                out=out,
+            ),
+            chunk_size,
         )
 
-        # Vectorized aspect finding for all pairs
-        for separations in all_separations:
-            aspect_indices, orbs, has_aspect = self.find_aspects_vectorized(
-                separations
-            )
-            score = self._calculate_score_vectorized(
-                aspect_indices, orbs, has_aspect
+    def score_one_to_many(
+        self,
+        reference: Dict[str, float],
+        candidates: np.ndarray,
+        chunk_size: int = SCORE_CHUNK,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score one chart against N stacked charts.
+
+        ``candidates`` holds longitudes in PLANETS order, shape (N, 10).
+        Returns the same arrays as ``score_pairs``.
+        """
+        candidates = self._as_longitudes(candidates, "candidates")
+        ref = self.dtypes.angles([reference.get(p, 0.0) for p in PLANETS]) % 360  # noqa: E501
+        return self._score_chunks(
+            len(candidates),
+            # Reference planet i to candidate planet j
+            lambda start, stop, out: np.subtract(
+                ref[:, np.newaxis],
+                candidates[start:stop, np.newaxis, :],
+                out=out,
+            ),
+            chunk_size,
+        )
+
+    def _as_longitudes(self, values: np.ndarray, name: str) -> np.ndarray:
+        values = self.dtypes.angles(values)
+        if values.ndim != 2 or values.shape[1] != len(PLANETS):
+            raise ValueError(
+                f"{name} must have shape (N, {len(PLANETS)}), got {values.shape}"  # noqa: E501
             )
-            scores.append(score)
+        return values % 360
 
-        return scores
+    def _score_chunks(
+        self,
+        count: int,
+        differences: Callable[[int, int, np.ndarray], np.ndarray],
+        chunk_size: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score ``count`` pairs from (chunk, 10, 10) longitude differences.
+
+        ``differences(start, stop, out)`` writes the differences of pairs
+        ``start:stop`` into ``out``. Temporaries in the policy dtypes are
+        borrowed once per call (see ``scratch_array``) and reused by every
+        chunk; per-pair scores are summed and returned as float64.
+        """
+        chunk_size = max(1, chunk_size)
+        scores = np.zeros(count)
+        type_counts = np.zeros(
+            (count, len(ASPECT_TYPES)), dtype=self.dtypes.count
+        )
+        # Single matrices and small batches only borrow what they use
+        shape = (min(chunk_size, max(count, 1)), len(PLANETS), len(PLANETS))
+        dtypes = [self.dtypes.angle] * 4 + [self.dtypes.code] * 2 + [bool] * 2
+        with ExitStack() as stack:
+            buffers = [scratch_array(stack, shape, dtype) for dtype in dtypes]
+            for start in range(0, count, chunk_size):
+                stop = min(start + chunk_size, count)
+                (
+                    separations,
+                    spare,
+                    orbs,
+                    min_orbs,
+                    aspect_indices,
+                    types,
+                    mask,
+                    no_aspect,
+                ) = (buffer[: stop - start] for buffer in buffers)
+
+                differences(start, stop, separations)
+                np.abs(separations, out=separations)
+                np.subtract(360, separations, out=spare)
+                np.minimum(separations, spare, out=separations)
+                self._closest_aspects(
+                    separations, min_orbs, aspect_indices, orbs, mask, no_aspect  # noqa: E501
+                )
+                np.isfinite(min_orbs, out=no_aspect)
+                np.logical_not(no_aspect, out=no_aspect)
+
+                # Orb factor 1 - orb / scoring orb, 0 without an aspect
+                np.take(self.score_orbs, aspect_indices, out=orbs, mode="clip")  # noqa: E501
+                np.divide(min_orbs, orbs, out=orbs)
+                np.subtract(1, orbs, out=orbs)
+                np.copyto(orbs, 0, where=no_aspect)
+                # Weighted contribution of every cell
+                np.take(self.aspect_scores, aspect_indices, out=spare, mode="clip")  # noqa: E501
+                np.multiply(self.weight_matrix, spare, out=spare)
+                spare *= orbs
+                scores[start:stop] = spare.sum(axis=(1, 2), dtype=np.float64)
+
+                np.take(self.aspect_type_index, aspect_indices, out=types, mode="clip")  # noqa: E501
+                np.copyto(types, NO_TYPE, where=no_aspect)
+                for t in range(len(ASPECT_TYPES)):
+                    np.equal(types, t, out=mask)
+                    type_counts[start:stop, t] = np.count_nonzero(
+                        mask, axis=(1, 2)
+                    )
+        return scores, type_counts
 
     def _get_aspect_type(self, aspect: str) -> str:
         """Get aspect type for scoring."""
-        if aspect in ["conjunction", "trine", "sextile"]:
-            return "harmonious"
-        elif aspect in ["square", "opposition", "quincunx"]:
-            return "challenging"
-        else:
-            return "neutral"
-
-    def _calculate_score_vectorized(
-        self,
-        aspect_indices: np.ndarray,
-        orbs: np.ndarray,
-        has_aspect: np.ndarray,
-    ) -> float:
-        """Vectorized compatibility score calculation."""
-        # Define scoring arrays
-        aspect_scores = np.array(
-            [4, 3, 2, 1, -2, -3, -1]
-        )  # matches ASPECT_SCORES order
-        planet_weights = np.array(
-            [3, 3, 2, 3, 3, 2, 1.5, 1, 1, 1]
-        )  # PLANET_WEIGHTS order
+        return aspect_type(aspect)
 
-        # Calculate weights matrix
-        weight_matrix = (
-            planet_weights[:, np.newaxis] + planet_weights[np.newaxis, :]
-        ) / 2
 
-        # Calculate orb factors
-        max_orbs = self.orbs[aspect_indices]
-        orb_factors = np.where(has_aspect, 1 - (orbs / max_orbs), 0)
+# Global instance for reuse
+vectorized_calculator = VectorizedAspectCalculator()
 
-        # Get scores for each aspect
-        scores = np.where(has_aspect, aspect_scores[aspect_indices], 0)
 
-        # Final score calculation
-        weighted_scores = weight_matrix * scores * orb_factors
-        total_score = np.sum(weighted_scores)
+def get_vectorized_calculator(
+    orb_profile: Optional[str] = None,
+    dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+) -> VectorizedAspectCalculator:
+    """Shared calculator for an orb profile (default: synastry).
 
-        return float(total_score)
+    ``dtype_policy`` defaults to the process-wide policy (see
+    ``utils.dtype_policy``).
+    """
+    return _shared_calculator(
+        orb_profile or SYNASTRY_ORB_PROFILE, get_dtype_policy(dtype_policy)
+    )
 
 
-# Global instance for reuse
-vectorized_calculator = VectorizedAspectCalculator()
+@lru_cache(maxsize=16)
+def _shared_calculator(
+    orb_profile: str, dtypes: DtypePolicy
+) -> VectorizedAspectCalculator:
+    if (
+        orb_profile == SYNASTRY_ORB_PROFILE
+        and dtypes == vectorized_calculator.dtypes
+    ):
+        return vectorized_calculator
+    return VectorizedAspectCalculator(orb_profile, dtypes)
 
 
 def build_aspect_matrix_fast(
-    long1: Dict[str, float], long2: Dict[str, float]
+    long1: Dict[str, float],
+    long2: Dict[str, float],
+    orb_profile: Optional[str] = None,
 ) -> List[List[Optional[AspectData]]]:
     """Drop-in replacement for build_aspect_matrix with vectorized performance."""  # noqa: E501
-    return vectorized_calculator.build_aspect_matrix_vectorized(long1, long2)
+    calculator = get_vectorized_calculator(orb_profile)
+    return calculator.build_aspect_matrix_vectorized(long1, long2)
+
+
+def build_aspect_arrays_fast(
+    long1: Dict[str, float],
+    long2: Dict[str, float],
+    orb_profile: Optional[str] = None,
+) -> AspectArrays:
+    """Array-native counterpart of build_aspect_matrix_fast."""
+    calculator = get_vectorized_calculator(orb_profile)
+    return calculator.build_aspect_arrays(long1, long2)
 
 
 def batch_synastry_analysis(
@@ -5,22 +5,91 @@ This module provides intelligent caching strategies for astrological calculation
 including LRU caching, cache invalidation, and persistent storage options.
 """
 
+import datetime
 import hashlib
 import logging
 import os
 import pickle
+import sys
 import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import wraps
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_MB = 1024 * 1024
+
+# Containers are sized from this many items and scaled to their length
+SIZE_SAMPLE_ITEMS = 8
+# Deeper nesting is counted shallowly (sys.getsizeof)
+MAX_SIZE_DEPTH = 4
+DEFAULT_VALUE_BYTES = 100 * 1024
+
+# Types whose size is sys.getsizeof: scalars, strings and fixed-size
+# value types with no references to other objects
+_FLAT_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, bytearray}
+    | {datetime.date, datetime.datetime, datetime.time, datetime.timedelta}
+)
+_CONTAINER_TYPES = frozenset({list, tuple, set, frozenset})
+
+
+def _items_bytes(items: List[Any], depth: int) -> int:
+    total = sum(map(sys.getsizeof, items))
+    for item in items:
+        if type(item) not in _FLAT_TYPES:
+            total += estimate_size_bytes(item, depth) - sys.getsizeof(item)
+    return total
+
+
+def estimate_size_bytes(value: Any, _depth: int = 0) -> int:
+    """Cheap estimate of a cached value's footprint in bytes.
+
+    Arrays count their ``nbytes`` and scalars and strings their
+    ``sys.getsizeof``. Lists, tuples, sets and dicts add up their items,
+    extrapolated from the first ``SIZE_SAMPLE_ITEMS`` for longer ones.
+    Objects add up their ``__dict__`` the same way; anything else is
+    measured by pickling it.
+    """
+    cls = type(value)
+    if cls in _FLAT_TYPES:
+        return sys.getsizeof(value)
+    if cls is np.ndarray:
+        return value.nbytes
+    if cls is dict or cls in _CONTAINER_TYPES:
+        shallow = sys.getsizeof(value)
+        if not value or _depth >= MAX_SIZE_DEPTH:
+            return shallow
+        if cls is dict:
+            keys = list(islice(value, SIZE_SAMPLE_ITEMS))
+            sample = list(islice(value.values(), SIZE_SAMPLE_ITEMS))
+            sampled = _items_bytes(keys, _depth + 1) + _items_bytes(
+                sample, _depth + 1
+            )
+        else:
+            sample = list(islice(value, SIZE_SAMPLE_ITEMS))
+            sampled = _items_bytes(sample, _depth + 1)
+        return shallow + sampled * len(value) // len(sample)
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    attributes = getattr(value, "__dict__", None)
+    if type(attributes) is dict:
+        return sys.getsizeof(value) + estimate_size_bytes(attributes, _depth)
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return DEFAULT_VALUE_BYTES
+
 
 @dataclass
 class CacheStats:
@@ -87,58 +156,40 @@ class ChartDataHasher:
 
 
 class InMemoryCache:
-    """High-performance in-memory cache with LRU eviction."""
+    """High-performance in-memory cache with LRU eviction.
+
+    Entries are kept in least to most recently used order, so lookups,
+    inserts and evictions are O(1).
+    """
 
     def __init__(self, max_size: int = 1000, max_memory_mb: float = 100.0):
         self.max_size = max_size
         self.max_memory_mb = max_memory_mb
-        self.cache: Dict[str, Any] = {}
-        self.access_times: Dict[str, float] = {}
-        self.memory_usage: Dict[str, float] = {}
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.memory_usage: Dict[str, int] = {}
+        self.size_bytes = 0
         self.stats = CacheStats()
         self.lock = threading.RLock()
         # Internal flag used to suppress counting the immediate next get() after a clear()  # noqa: E501
         self._suppress_next_stats = False
 
-    def _calculate_memory_usage(self, value: Any) -> float:
-        """Estimate memory usage of cached value in MB."""
-        try:
-            if isinstance(value, np.ndarray):
-                return value.nbytes / (1024 * 1024)
-            else:
-                # Rough estimate using pickle serialization
-                serialized = pickle.dumps(value)
-                return len(serialized) / (1024 * 1024)
-        except Exception:
-            return 0.1  # Default estimate
-
     def _evict_lru(self):
         """Evict least recently used items."""
         with self.lock:
-            while (
-                len(self.cache) > self.max_size
-                or self.stats.size_mb > self.max_memory_mb
+            max_bytes = self.max_memory_mb * _MB
+            while self.cache and (
+                len(self.cache) > self.max_size or self.size_bytes > max_bytes
             ):
-                if not self.cache:
-                    break
-
-                # Find least recently used item
-                lru_key = min(self.access_times, key=self.access_times.get)
-
-                # Remove from all tracking structures
-                self.cache.pop(lru_key, None)
-                self.access_times.pop(lru_key, None)
-                memory_used = self.memory_usage.pop(lru_key, 0)
-
-                # Update stats
-                self.stats.size_mb -= memory_used
+                lru_key, _ = self.cache.popitem(last=False)
+                self.size_bytes -= self.memory_usage.pop(lru_key, 0)
                 self.stats.evictions += 1
+            self.stats.size_mb = self.size_bytes / _MB
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         with self.lock:
             if key in self.cache:
-                self.access_times[key] = time.time()
+                self.cache.move_to_end(key)
                 # Update stats unless suppression flag is set
                 if not self._suppress_next_stats:
                     self.stats.hits += 1
@@ -158,19 +209,14 @@ class InMemoryCache:
     def put(self, key: str, value: Any):
         """Put value in cache with automatic eviction."""
         with self.lock:
-            # Calculate memory usage
-            memory_mb = self._calculate_memory_usage(value)
-
-            # Remove existing entry if present
-            if key in self.cache:
-                old_memory = self.memory_usage.get(key, 0)
-                self.stats.size_mb -= old_memory
+            size = estimate_size_bytes(value)
 
-            # Add new entry
+            # Replace any existing entry as the most recently used
+            self.size_bytes -= self.memory_usage.get(key, 0)
             self.cache[key] = value
-            self.access_times[key] = time.time()
-            self.memory_usage[key] = memory_mb
-            self.stats.size_mb += memory_mb
+            self.cache.move_to_end(key)
+            self.memory_usage[key] = size
+            self.size_bytes += size
 
             # Evict if necessary
             self._evict_lru()
@@ -179,8 +225,8 @@ class InMemoryCache:
         """Clear all cached data."""
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
             self.memory_usage.clear()
+            self.size_bytes = 0
             self.stats = CacheStats()
             # Suppress the next get() stats update so tests that call get() immediately  # noqa: E501
             # after clear() don't see a miss counted.
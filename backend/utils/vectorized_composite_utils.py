@@ -31,12 +31,24 @@ import logging
 
 # ThreadPoolExecutor removed (unused)
 import warnings
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from .dtype_policy import DtypePolicy, get_dtype_policy
+from .vectorized_memory_optimization import scratch_array
+
+# Ephemeris and houses for Davison charts
+try:
+    from astro.calculations.ephemeris import get_planetary_positions_batch
+    from astro.calculations.house_systems import calculate_houses
+except Exception:
+    get_planetary_positions_batch = None  # type: ignore[assignment]
+    calculate_houses = None  # type: ignore[assignment]
+
 # Suppress NumPy warnings for production
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
@@ -54,6 +66,10 @@ class VectorizedChartData:
     chart_id: str
     name: str
     birth_datetime: datetime
+    # Birth moment (UT Julian Day) and place, required by Davison charts
+    julian_day: Optional[float] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 @dataclass
@@ -69,6 +85,49 @@ class CompositeChartResult:
     performance_stats: Dict[str, float]
 
 
+def davison_midpoints(
+    julian_days: Sequence[float],
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    group_sizes: Optional[Sequence[int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Davison moments and places for groups of charts
+
+    Charts are given flat, group after group, and ``group_sizes`` splits
+    them (a single group by default). A group's moment is its mean Julian
+    Day and its place the mean of the birth places as unit vectors on
+    the sphere: the great-circle midpoint for two charts. Antipodal
+    places have no midpoint.
+
+    Returns:
+        (julian_days, latitudes, longitudes), one entry per group
+    """
+    jds = np.asarray(julian_days, dtype=np.float64)
+    sizes = np.asarray(
+        [len(jds)] if group_sizes is None else group_sizes, dtype=np.intp
+    )
+    if not len(sizes) or sizes.min() < 1 or sizes.sum() != len(jds):
+        raise ValueError("Group sizes must be positive and cover all charts")
+    starts = np.cumsum(sizes) - sizes
+
+    lat = np.deg2rad(np.asarray(latitudes, dtype=np.float64))
+    lon = np.deg2rad(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    vectors = np.stack(
+        (cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)), axis=1
+    )
+    # Per-group sums of the ragged groups in one pass
+    x, y, z = np.add.reduceat(vectors, starts, axis=0).T
+    mean_jds = np.add.reduceat(jds, starts) / sizes
+
+    return (
+        mean_jds,
+        np.rad2deg(np.arctan2(z, np.hypot(x, y))),
+        np.rad2deg(np.arctan2(y, x)),
+    )
+
+
 class VectorizedCompositeCalculator:
     """
     High-performance vectorized composite chart calculator
@@ -77,12 +136,18 @@ class VectorizedCompositeCalculator:
     the speed of composite chart calculations for relationship astrology.
     """
 
-    def __init__(self, optimization_level: str = "balanced"):
+    def __init__(
+        self,
+        optimization_level: str = "balanced",
+        dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+    ):
         """
         Initialize the vectorized composite calculator
 
         Args:
             optimization_level: "fast", "balanced", or "accurate"
+            dtype_policy: Array dtype policy; defaults to "compact" for
+                "fast" and to the process-wide policy otherwise
         """
         self.optimization_level = optimization_level
         self.planet_names = [
@@ -99,22 +164,25 @@ class VectorizedCompositeCalculator:
             "North Node",
         ]
         self.angle_names = ["Ascendant", "Midheaven", "Descendant", "IC"]
-        self.aspect_angles = np.array([0, 60, 90, 120, 180])  # Major aspects
-        self.aspect_orbs = np.array([8, 6, 8, 8, 8])  # Orbs for each aspect
 
         # Performance optimization settings
         if optimization_level == "fast":
-            self.precision = np.float32
+            self.dtypes = get_dtype_policy(dtype_policy or "compact")
             self.use_threading = True
             self.batch_size = 1000
         elif optimization_level == "accurate":
-            self.precision = np.float64
+            self.dtypes = get_dtype_policy(dtype_policy or "precise")
             self.use_threading = False
             self.batch_size = 100
         else:  # balanced
-            self.precision = np.float64
+            self.dtypes = get_dtype_policy(dtype_policy)
             self.use_threading = True
             self.batch_size = 500
+        self.precision = self.dtypes.angle.type
+
+        # Major aspects and their orbs
+        self.aspect_angles = self.dtypes.angles([0, 60, 90, 120, 180])
+        self.aspect_orbs = self.dtypes.angles([8, 6, 8, 8, 8])
 
         logger.info(
             f"VectorizedCompositeCalculator initialized with "
@@ -129,7 +197,8 @@ class VectorizedCompositeCalculator:
 
         Args:
             charts: List of individual chart data
-            method: "midpoint" or "davison" composite method
+            method: "midpoint" or "davison" composite method; Davison
+                charts need each chart's julian_day, latitude and longitude
 
         Returns:
             CompositeChartResult with all calculated components
@@ -145,6 +214,9 @@ class VectorizedCompositeCalculator:
                 f"using {method} method"
             )
 
+            if method == "davison":
+                return self.calculate_davison_composites([charts])[0]
+
             # Convert charts to NumPy arrays for vectorized operations
             vectorized_data = self._prepare_vectorized_data(charts)
 
@@ -199,6 +271,202 @@ class VectorizedCompositeCalculator:
             # Graceful fallback would go here in production
             raise
 
+    def calculate_davison_composites(
+        self,
+        chart_groups: Sequence[Sequence[VectorizedChartData]],
+        house_system: str = "P",
+    ) -> List[CompositeChartResult]:
+        """
+        Davison composite charts for several groups of charts at once
+
+        Each group's midpoint moment and place come from one vectorized
+        pass (see ``davison_midpoints``); planets for all groups come from
+        one batched ephemeris fetch and houses are cast for each moment
+        and place. Bodies the ephemeris does not provide (North Node, or
+        all of them if the fetch failed) take the group's midpoint
+        positions and are listed in the result metadata.
+
+        Args:
+            chart_groups: Groups of two or more charts with julian_day,
+                latitude and longitude
+            house_system: House system code passed to ``calculate_houses``
+
+        Returns:
+            One CompositeChartResult per group, in order
+        """
+        start_time = datetime.now()
+
+        if get_planetary_positions_batch is None or calculate_houses is None:
+            raise RuntimeError("Davison composites require the ephemeris module")  # noqa: E501
+        if any(len(charts) < 2 for charts in chart_groups):
+            raise ValueError("At least 2 charts required for composite calculation")  # noqa: E501
+        charts = [chart for group in chart_groups for chart in group]
+        missing = [
+            chart.chart_id
+            for chart in charts
+            if None in (chart.julian_day, chart.latitude, chart.longitude)
+        ]
+        if missing:
+            raise ValueError(
+                f"Davison composite requires birth julian_day, latitude and longitude: {missing}"  # noqa: E501
+            )
+
+        julian_days, latitudes, longitudes = davison_midpoints(
+            [chart.julian_day for chart in charts],
+            [chart.latitude for chart in charts],
+            [chart.longitude for chart in charts],
+            [len(group) for group in chart_groups],
+        )
+        positions = get_planetary_positions_batch(julian_days.tolist())
+
+        results = [
+            self._build_davison_result(
+                group,
+                float(jd),
+                float(lat),
+                float(lon),
+                planets or {},
+                *self._davison_houses(float(jd), float(lat), float(lon), house_system),  # noqa: E501
+            )
+            for group, jd, lat, lon, planets in zip(
+                chart_groups, julian_days, latitudes, longitudes, positions
+            )
+        ]
+
+        calculation_time = (datetime.now() - start_time).total_seconds()
+        for result in results:
+            result.performance_stats["calculation_time_seconds"] = (
+                calculation_time
+            )
+            result.performance_stats["composites_in_batch"] = len(results)
+        logger.info(
+            f"{len(results)} Davison composites calculated in "
+            f"{calculation_time:.3f} seconds"
+        )
+        return results
+
+    def _build_davison_result(
+        self,
+        charts: Sequence[VectorizedChartData],
+        julian_day: float,
+        latitude: float,
+        longitude: float,
+        planets: Dict[str, Any],
+        houses_data: Dict[str, Any],
+        house_system: str,
+    ) -> CompositeChartResult:
+        """Composite result for the chart cast at a Davison moment/place"""
+        vectorized_data = self._prepare_vectorized_data(list(charts))
+        midpoints = self._calculate_midpoints_vectorized(
+            vectorized_data["planets"]
+        )
+
+        names = self.planet_names[: len(midpoints)]
+        bodies = [planets.get(name.lower()) for name in names]
+        estimated = [name for name, body in zip(names, bodies) if body is None]
+        planet_positions = self.dtypes.angles(
+            [
+                midpoint if body is None else body["position"]
+                for midpoint, body in zip(midpoints.tolist(), bodies)
+            ]
+        ) % 360
+        cusps = self.dtypes.angles(
+            [house["cusp"] for house in houses_data["houses"]]
+        )
+        planet_houses = self._houses_from_cusps(planet_positions, cusps)
+
+        composite_planets = {
+            name: {
+                "longitude": float(position),
+                "sign": self._get_zodiac_sign(float(position)),
+                "degree": float(position) % 30,
+                "house": str(house),
+                "retrograde": bool(body and body["retrograde"]),
+            }
+            for name, position, house, body in zip(
+                names, planet_positions, planet_houses.tolist(), bodies
+            )
+        }
+        composite_houses = {
+            f"House_{i + 1}": {
+                "cusp": float(cusp),
+                "sign": self._get_zodiac_sign(float(cusp)),
+                "degree": float(cusp) % 30,
+            }
+            for i, cusp in enumerate(cusps)
+        }
+        ascendant = float(houses_data["angles"]["ascendant"])
+        mc = float(houses_data["angles"]["mc"])
+        composite_angles = {
+            name: {
+                "longitude": position,
+                "sign": self._get_zodiac_sign(position),
+                "degree": position % 30,
+            }
+            for name, position in zip(
+                self.angle_names,
+                [ascendant, mc, (ascendant + 180) % 360, (mc + 180) % 360],
+            )
+        }
+
+        return CompositeChartResult(
+            composite_planets=composite_planets,
+            composite_houses=composite_houses,
+            composite_aspects=self._calculate_composite_aspects(
+                composite_planets
+            ),
+            composite_angles=composite_angles,
+            relationship_metrics=self._calculate_relationship_metrics(
+                vectorized_data, composite_planets
+            ),
+            calculation_metadata={
+                "method": "davison",
+                "charts_count": len(charts),
+                "calculation_timestamp": datetime.now().isoformat(),
+                "davison_julian_day": julian_day,
+                "davison_latitude": latitude,
+                "davison_longitude": longitude,
+                "house_system": house_system,
+                "midpoint_estimated_planets": estimated,
+            },
+            performance_stats={
+                "charts_processed": len(charts),
+                "method_used": "davison",
+                "optimization_level": self.optimization_level,
+                "vectorization_enabled": True,
+                "memory_efficiency_score": self._calculate_memory_efficiency(
+                    vectorized_data
+                ),
+            },
+        )
+
+    def _davison_houses(
+        self, julian_day: float, lat: float, lon: float, house_system: str
+    ) -> Tuple[Dict[str, Any], str]:
+        """Houses and the system used; Porphyry where the system fails"""
+        # Midpoints of distant places often land at polar latitudes, where
+        # Placidus and Koch cusps are undefined
+        try:
+            return (
+                calculate_houses(julian_day, lat, lon, house_system),
+                house_system,
+            )
+        except ValueError:
+            logger.warning(
+                f"House system {house_system} failed at latitude {lat:.2f}, using Porphyry"  # noqa: E501
+            )
+            return calculate_houses(julian_day, lat, lon, "O"), "O"
+
+    def _houses_from_cusps(
+        self, longitudes: np.ndarray, cusps: np.ndarray
+    ) -> np.ndarray:
+        """House numbers (1-12) of longitudes within the given cusps"""
+        # Measure from the first cusp so the cusps increase monotonically
+        offsets = (cusps - cusps[0]) % 360
+        return np.searchsorted(
+            offsets, (longitudes - cusps[0]) % 360, side="right"
+        )
+
     def _prepare_vectorized_data(
         self, charts: List[VectorizedChartData]
     ) -> Dict[str, np.ndarray]:
@@ -210,9 +478,9 @@ class VectorizedCompositeCalculator:
         all_angles = np.stack([chart.angles for chart in charts])
 
         return {
-            "planets": all_planets.astype(self.precision),
-            "houses": all_houses.astype(self.precision),
-            "angles": all_angles.astype(self.precision),
+            "planets": self.dtypes.angles(all_planets),
+            "houses": self.dtypes.angles(all_houses),
+            "angles": self.dtypes.angles(all_angles),
             "chart_count": len(charts),
         }
 
@@ -224,13 +492,8 @@ class VectorizedCompositeCalculator:
         planets_array = vectorized_data["planets"]
         composite_planets = {}
 
-        if method == "midpoint":
-            # Vectorized midpoint calculation across all charts
-            composite_positions = self._calculate_midpoints_vectorized(planets_array)  # noqa: E501
-        else:  # davison method
-            composite_positions = self._calculate_davison_positions_vectorized(
-                planets_array
-            )
+        # Vectorized midpoint calculation across all charts
+        composite_positions = self._calculate_midpoints_vectorized(planets_array)  # noqa: E501
 
         # Convert back to dictionary format
         for i, planet_name in enumerate(self.planet_names[: len(composite_positions)]):  # noqa: E501
@@ -264,34 +527,26 @@ class VectorizedCompositeCalculator:
 
             # Calculate zodiac midpoints handling 0°/360° wrap
             diff = np.abs(chart2 - chart1)
-            simple_avg = (chart1 + chart2) / 2
-            wrap_avg = (chart1 + chart2 + 360) / 2
-            midpoints = np.where(diff <= 180, simple_avg, wrap_avg) % 360
+            total = chart1 + chart2
+            midpoints = (np.where(diff <= 180, total, total + 360) / 2) % 360
         # Multiple charts - use circular mean
         else:
-            # Convert to unit vectors on the unit circle
-            angles_rad = np.deg2rad(planets_array)
+            # Radians and unit vector components in pooled temporaries
+            dtype = np.result_type(planets_array, 1.0)
+            with ExitStack() as stack:
+                angles_rad = scratch_array(stack, planets_array.shape, dtype)
+                components = scratch_array(stack, planets_array.shape, dtype)
+                np.deg2rad(planets_array, out=angles_rad)
 
-            # Calculate mean of unit vectors
-            mean_x = np.mean(np.cos(angles_rad), axis=0)
-            mean_y = np.mean(np.sin(angles_rad), axis=0)
+                # Calculate mean of unit vectors
+                mean_x = np.cos(angles_rad, out=components).mean(axis=0)
+                mean_y = np.sin(angles_rad, out=components).mean(axis=0)
 
             # Convert back to angles
             midpoints = np.rad2deg(np.arctan2(mean_y, mean_x)) % 360
 
         return midpoints
 
-    def _calculate_davison_positions_vectorized(
-        self, planets_array: np.ndarray
-    ) -> np.ndarray:
-        """
-        Vectorized Davison composite calculation
-        (Based on averaged birth times and locations)
-        """
-        # For now, implement as enhanced midpoint
-        # Full Davison would require birth time/location averaging
-        return self._calculate_midpoints_vectorized(planets_array)
-
     def _calculate_composite_houses(
         self, vectorized_data: Dict[str, np.ndarray], method: str
     ) -> Dict[str, Dict[str, Any]]:
@@ -347,7 +602,7 @@ class VectorizedCompositeCalculator:
         Returns list of aspect dictionaries with planet1, planet2, aspect details  # noqa: E501
         """
 
-        planet_positions = np.array(
+        planet_positions = self.dtypes.angles(
             [data["longitude"] for data in composite_planets.values()]
         )
         planet_names = list(composite_planets.keys())
@@ -404,7 +659,7 @@ class VectorizedCompositeCalculator:
         ) / len(composite_planets)
 
         # Composite chart strength (concentration of planets)
-        planet_positions = np.array(
+        planet_positions = self.dtypes.angles(
             [data["longitude"] for data in composite_planets.values()]
         )
         concentration_score = self._calculate_concentration_score(planet_positions)  # noqa: E501
@@ -485,12 +740,10 @@ class VectorizedCompositeCalculator:
         Returns a float between 0 and 1 (1 = most efficient)
         """
         # Calculate total memory usage (only for ndarray values)
-        total_elements = sum(
-            array.size for array in vectorized_data.values() if hasattr(array, "size")  # noqa: E501
+        total_bytes = sum(
+            array.nbytes for array in vectorized_data.values() if hasattr(array, "nbytes")  # noqa: E501
         )
-
-        # Convert to MB assuming float64 (8 bytes per element)
-        mem_usage_mb = float(total_elements * 8) / (1024 * 1024)
+        mem_usage_mb = float(total_bytes) / (1024 * 1024)
 
         # Efficiency score (100MB baseline, lower is better)
         score = float(np.clip(1 - (mem_usage_mb / 100), 0, 1))
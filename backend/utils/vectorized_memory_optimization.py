@@ -8,12 +8,15 @@ and memory usage minimization.
 
 import gc
 import logging
+import math
+import os
 import threading
-from contextlib import contextmanager
-from queue import Empty, Queue
+import time
+from contextlib import ExitStack, contextmanager
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     Iterator,
     List,
@@ -25,10 +28,41 @@ from typing import (
 
 import numpy as np
 
+from utils.dtype_policy import DtypePolicy, get_dtype_policy
+
 logger = logging.getLogger(__name__)
 
+_MB = 1024 * 1024
+
+# Adaptive chunking: share of available memory a batch may use, chunk
+# size bounds and the work each chunk should take
+MEMORY_HEADROOM = 0.5
+MIN_CHUNK_SIZE = 1
+MAX_CHUNK_SIZE = 100_000
+TARGET_CHUNK_SECONDS = 0.25
+
+# Idle bytes an array pool may hold per (shape, dtype) bucket and in all
+POOL_BUCKET_BYTES = 64 * _MB
+POOL_TOTAL_BYTES = 256 * _MB
+# Kernel temporaries with fewer cells are cheaper to allocate than to pool
+POOL_MIN_CELLS = 10_000
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+# cgroup v1 reports "no limit" as a huge page-aligned value
+_CGROUP_UNLIMITED = 1 << 60
+
 
 class _PoolStats(TypedDict):
+    hits: int
+    misses: int
+    hit_rate: float
+    bytes_saved: int
+    arrays_returned: int
+    arrays_dropped: int
+    arrays_in_use: int
+    pooled_bytes: int
+    buckets: int
+    # Earlier names, kept for existing callers
     arrays_allocated: int
     arrays_reused: int
     pools_created: int
@@ -36,137 +70,195 @@ class _PoolStats(TypedDict):
 
 
 class SimpleArrayPool:
-    """Simple thread-safe array pooling with basic memory management."""
+    """
+    Thread-safe array pool bucketed by shape and dtype.
 
-    def __init__(self, max_arrays: int = 100):
+    Each (shape, dtype) bucket keeps at most ``max_arrays`` idle arrays
+    and ``max_bucket_bytes`` bytes, and all buckets together at most
+    ``max_total_bytes``; arrays returned beyond a limit are dropped for
+    the garbage collector. Buckets are LIFO so the most recently used
+    (cache-warm) array is handed out first.
+
+    Metrics count real reuse: a hit is a request served from a bucket
+    (``bytes_saved`` is the allocation it avoided), a miss is a fresh
+    allocation.
+    """
+
+    def __init__(
+        self,
+        max_arrays: int = 100,
+        max_bucket_bytes: int = POOL_BUCKET_BYTES,
+        max_total_bytes: int = POOL_TOTAL_BYTES,
+    ):
         self.max_arrays = max_arrays
-        # Map key -> queue of reusable numpy arrays
-        self.pools: Dict[str, Queue[np.ndarray]] = {}
+        self.max_bucket_bytes = max_bucket_bytes
+        self.max_total_bytes = max_total_bytes
+        # (shape, dtype) -> idle arrays, most recently returned last
+        self.pools: Dict[Tuple[Tuple[int, ...], str], List[np.ndarray]] = {}
+        self.pool_bytes: Dict[Tuple[Tuple[int, ...], str], int] = {}
+        self.total_bytes = 0
         self.lock = threading.Lock()
-        self.stats: _PoolStats = {
-            "arrays_allocated": 0,
-            "arrays_reused": 0,
-            "pools_created": 0,
-            "memory_saved_mb": 0.0,
-        }
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.arrays_returned = 0
+        self.arrays_dropped = 0
+        self.arrays_in_use = 0
+        self.buckets_created = 0
 
     def get_array(
         self,
         shape: Tuple[int, ...],
         dtype: Union[np.dtype, type, str] = np.float64,
+        zero: bool = True,
     ) -> np.ndarray:
         """Get an array from the pool or create a new one.
 
         dtype may be a numpy dtype, a numpy scalar type, or a string understood by numpy.  # noqa: E501
+        Reused arrays are zeroed unless ``zero`` is False (for callers
+        that overwrite every element).
         """
-        # Normalize dtype to numpy dtype for key generation
         np_dtype = np.dtype(dtype)
-        key = f"{shape}_{np_dtype.str}"
+        key = (tuple(shape), np_dtype.str)
 
         with self.lock:
-            if key not in self.pools:
-                self.pools[key] = Queue(maxsize=self.max_arrays)
-                self.stats["pools_created"] += 1
-
-            pool = self.pools[key]
-
-            try:
-                array = pool.get_nowait()
-            except Empty:
-                array = np.zeros(shape, dtype=np_dtype)
-                self.stats["arrays_allocated"] += 1
-                return array
-        # Outside lock: reset and update stats (to keep lock hold time small)
-        array.fill(0)
-        self.stats["arrays_reused"] += 1
-        self.stats["memory_saved_mb"] += array.nbytes / (1024 * 1024)
+            bucket = self.pools.get(key)
+            if bucket is None:
+                bucket = self.pools[key] = []
+                self.pool_bytes[key] = 0
+                self.buckets_created += 1
+            self.arrays_in_use += 1
+            if bucket:
+                array = bucket.pop()
+                self.pool_bytes[key] -= array.nbytes
+                self.total_bytes -= array.nbytes
+                self.hits += 1
+                self.bytes_saved += array.nbytes
+            else:
+                array = None
+                self.misses += 1
+
+        # Allocate and reset outside the lock to keep hold times small
+        if array is None:
+            return np.zeros(key[0], np_dtype) if zero else np.empty(key[0], np_dtype)  # noqa: E501
+        if zero:
+            array.fill(0)
         return array
 
     def return_array(self, array: np.ndarray) -> bool:
-        """Return an array to the pool for reuse."""
-        key = f"{array.shape}_{array.dtype.str}"
+        """Return an array to the pool for reuse.
+
+        Views are rejected (their memory belongs to another array), as
+        are arrays already idle in the pool and arrays over the bucket
+        limits; those are left to the garbage collector.
+        """
+        if array.base is not None or not array.flags.c_contiguous:
+            return False
+        key = (array.shape, array.dtype.str)
         with self.lock:
-            pool = self.pools.get(key)
-            if pool is None:
+            bucket = self.pools.setdefault(key, [])
+            self.pool_bytes.setdefault(key, 0)
+            if any(idle is array for idle in bucket):
                 return False
-            try:
-                pool.put_nowait(array)
-                return True
-            except Exception:
+            self.arrays_in_use = max(self.arrays_in_use - 1, 0)
+            if (
+                len(bucket) >= self.max_arrays
+                or self.pool_bytes[key] + array.nbytes > self.max_bucket_bytes  # noqa: E501
+                or self.total_bytes + array.nbytes > self.max_total_bytes
+            ):
+                self.arrays_dropped += 1
                 return False
+            bucket.append(array)
+            self.pool_bytes[key] += array.nbytes
+            self.total_bytes += array.nbytes
+            self.arrays_returned += 1
+            return True
+
+    @contextmanager
+    def borrow(
+        self,
+        shape: Tuple[int, ...],
+        dtype: Union[np.dtype, type, str] = np.float64,
+        zero: bool = True,
+    ) -> Iterator[np.ndarray]:
+        """Context manager lending an array that is returned on exit."""
+        array = self.get_array(shape, dtype, zero)
+        try:
+            yield array
+        finally:
+            self.return_array(array)
 
     def get_stats(self) -> _PoolStats:
         """Get current pool statistics."""
         with self.lock:
-            return self.stats.copy()  # type: ignore[return-value]
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "arrays_returned": self.arrays_returned,
+                "arrays_dropped": self.arrays_dropped,
+                "arrays_in_use": self.arrays_in_use,
+                "pooled_bytes": self.total_bytes,
+                "buckets": len(self.pools),
+                "arrays_allocated": self.misses,
+                "arrays_reused": self.hits,
+                "pools_created": self.buckets_created,
+                "memory_saved_mb": self.bytes_saved / _MB,
+            }
 
     def force_cleanup(self) -> None:
         """Force cleanup of all pools."""
         with self.lock:
-            for pool in self.pools.values():
-                while not pool.empty():
-                    try:
-                        pool.get_nowait()
-                    except Empty:
-                        break
             self.pools.clear()
+            self.pool_bytes.clear()
+            self.total_bytes = 0
         gc.collect()
 
 
 class ArrayMemoryPool:
     """Memory pool manager for numpy arrays with context manager support."""
 
-    def __init__(self, max_arrays: int = 100):
-        self.pool = SimpleArrayPool(max_arrays)
-        self._active_arrays: List[np.ndarray] = (
-            []
-        )  # Track arrays instead of WeakSet
+    def __init__(
+        self,
+        max_arrays: int = 100,
+        max_bucket_bytes: int = POOL_BUCKET_BYTES,
+    ):
+        self.pool = SimpleArrayPool(max_arrays, max_bucket_bytes)
 
     def get_array(
         self,
         shape: Tuple[int, ...],
         dtype: Union[np.dtype, type, str] = np.float64,
+        zero: bool = True,
     ) -> np.ndarray:
         """Get an array from the pool."""
-        return self.pool.get_array(shape, dtype)
+        return self.pool.get_array(shape, dtype, zero)
 
     def return_array(self, array: np.ndarray) -> bool:
         """Return an array to the pool."""
-        # Remove from active arrays if present
-        if array in self._active_arrays:
-            self._active_arrays.remove(array)
         return self.pool.return_array(array)
 
-    @contextmanager
     def get_temp_array(
         self,
         shape: Tuple[int, ...],
         dtype: Union[np.dtype, type, str] = np.float64,
-    ) -> Iterator[np.ndarray]:
+        zero: bool = True,
+    ) -> ContextManager[np.ndarray]:
         """Context manager for temporary arrays that are automatically returned."""  # noqa: E501
-        array = self.get_array(shape, dtype)
-        self._active_arrays.append(array)
-        try:
-            yield array
-        except Exception as exc:  # noqa: BLE001
-            # Log and re-raise; ensures we still return array to pool
-            logger.exception("Error while using temporary array: %s", exc)
-            raise
-        finally:
-            self.return_array(array)
+        return self.pool.borrow(shape, dtype, zero)
+
+    def get_stats(self) -> _PoolStats:
+        """Get pool statistics (see ``SimpleArrayPool.get_stats``)."""
+        return self.pool.get_stats()
 
     def force_cleanup(self) -> None:
-        """Force cleanup of all pools and active arrays."""
-        # Clean up active arrays
-        for array in self._active_arrays[
-            :
-        ]:  # Copy list to avoid modification during iteration
-            self.return_array(array)
-        self._active_arrays.clear()
+        """Force cleanup of all pooled arrays."""
         self.pool.force_cleanup()
 
 
-class GlobalArrayMemoryPool:
+class GlobalArrayMemoryPool(ArrayMemoryPool):
     """Global singleton array memory pool for NumPy arrays."""
 
     _instance: Optional["GlobalArrayMemoryPool"] = None
@@ -183,42 +275,126 @@ class GlobalArrayMemoryPool:
         if hasattr(self, "_initialized"):
             return
         self._initialized = True
+        super().__init__()
 
-        self.pool = SimpleArrayPool()
-        self._active_arrays: List[np.ndarray] = []
 
-    @contextmanager
-    def get_temp_array(
-        self,
-        shape: Tuple[int, ...],
-        dtype: Union[np.dtype, type, str] = np.float64,
-    ) -> Iterator[np.ndarray]:
-        """Context manager for temporary arrays that are automatically returned to pool."""  # noqa: E501
-        array = self.pool.get_array(shape, dtype)
-        self._active_arrays.append(array)
-        try:
-            yield array
-        finally:
-            if array in self._active_arrays:
-                self._active_arrays.remove(array)
-            self.pool.return_array(array)
+def _read_cgroup_bytes(name: str) -> Optional[int]:
+    """Integer value of a cgroup memory file, None if unset or missing."""
+    try:
+        with open(os.path.join(CGROUP_ROOT, name)) as handle:
+            value = handle.read().strip()
+    except OSError:
+        return None
+    # cgroup v2 writes "max" when there is no limit
+    return int(value) if value.isdigit() else None
 
-    def get_array(
-        self,
-        shape: Tuple[int, ...],
-        dtype: Union[np.dtype, type, str] = np.float64,
-    ) -> np.ndarray:
-        """Get a pooled array - caller is responsible for returning it."""
-        return self.pool.get_array(shape, dtype)
 
-    def return_array(self, array: np.ndarray) -> bool:
-        """Return array to pool."""
-        return self.pool.return_array(array)
+def cgroup_memory_headroom_mb() -> Optional[float]:
+    """Memory left under this process's cgroup limit in MB.
+
+    Reads cgroup v2 (``memory.max``/``memory.current``) or v1
+    (``memory.limit_in_bytes``/``memory.usage_in_bytes``). Returns None
+    when there is no limit.
+    """
+    for limit_name, usage_name in (
+        ("memory.max", "memory.current"),
+        ("memory/memory.limit_in_bytes", "memory/memory.usage_in_bytes"),
+    ):
+        limit = _read_cgroup_bytes(limit_name)
+        usage = _read_cgroup_bytes(usage_name)
+        if limit is not None and usage is not None:
+            if limit < _CGROUP_UNLIMITED:
+                return max(limit - usage, 0) / _MB
+    return None
 
-    def force_cleanup(self):
-        """Force cleanup of all arrays and pools."""
-        self._active_arrays.clear()
-        self.pool.force_cleanup()
+
+def available_memory_mb() -> Optional[float]:
+    """Memory available to this process in MB, container limit aware.
+
+    The smaller of the cgroup headroom and the host's available memory
+    (via psutil); None when neither can be read.
+    """
+    candidates: List[float] = []
+    headroom = cgroup_memory_headroom_mb()
+    if headroom is not None:
+        candidates.append(headroom)
+    try:
+        import psutil
+
+        candidates.append(psutil.virtual_memory().available / _MB)
+    except ImportError:
+        pass
+    return min(candidates) if candidates else None
+
+
+class AdaptiveChunkSizer:
+    """
+    Chunk sizes from a memory budget and measured throughput.
+
+    ``next_size`` caps each chunk so ``size * bytes_per_item`` fits the
+    current budget. ``record`` feeds back how long a chunk took and its
+    peak memory increase (from ``MemoryMonitor``):
+
+    - a measured per-item footprint above the estimate replaces it for
+      the next chunk, so chunks shrink when memory grows faster than
+      estimated;
+    - the next chunk aims at ``target_seconds`` of work at the measured
+      rate, at most doubling or halving per step. Long chunks amortize
+      the per-chunk overhead (gc, callbacks, pooled buffers).
+    """
+
+    def __init__(
+        self,
+        bytes_per_item: float,
+        budget_mb: Callable[[], float],
+        initial_size: int,
+        min_size: int = MIN_CHUNK_SIZE,
+        max_size: int = MAX_CHUNK_SIZE,
+        target_seconds: float = TARGET_CHUNK_SECONDS,
+    ):
+        self.estimated_bytes_per_item = max(float(bytes_per_item), 1.0)
+        self.bytes_per_item = self.estimated_bytes_per_item
+        self.budget_mb = budget_mb
+        self.min_size = max(1, min_size)
+        self.max_size = max(max_size, self.min_size)
+        self.target_seconds = target_seconds
+        self.size = self._clamp(initial_size)
+        self.items_per_second = 0.0
+        self.history: List[Dict[str, float]] = []
+
+    def _clamp(self, size: float) -> int:
+        return int(min(max(size, self.min_size), self.max_size))
+
+    def memory_cap(self) -> int:
+        """Largest chunk whose footprint fits the current budget."""
+        return self._clamp(self.budget_mb() * _MB / self.bytes_per_item)
+
+    def next_size(self) -> int:
+        """Size of the next chunk."""
+        self.size = min(self.size, self.memory_cap())
+        return self.size
+
+    def record(
+        self, items: int, seconds: float, peak_increase_mb: float
+    ) -> None:
+        """Adjust the next chunk size from a finished chunk."""
+        if items <= 0:
+            return
+        measured = peak_increase_mb * _MB / items
+        self.bytes_per_item = max(self.estimated_bytes_per_item, measured)
+        if seconds > 0:
+            self.items_per_second = items / seconds
+            target = self.items_per_second * self.target_seconds
+            self.size = self._clamp(min(max(target, items / 2), items * 2))
+        self.history.append(
+            {
+                "size": items,
+                "seconds": seconds,
+                "items_per_second": self.items_per_second,
+                "peak_increase_mb": peak_increase_mb,
+                "bytes_per_item": self.bytes_per_item,
+            }
+        )
 
 
 class MemoryOptimizedVectorizedCalculator:
@@ -227,6 +403,7 @@ class MemoryOptimizedVectorizedCalculator:
 
     Features:
     - Chunked processing for large datasets
+    - Adaptive chunk sizes from available memory and throughput
     - Memory pool usage for temporary arrays
     - Garbage collection optimization
     - Memory usage monitoring
@@ -237,10 +414,18 @@ class MemoryOptimizedVectorizedCalculator:
         chunk_size: int = 1000,
         enable_memory_pooling: bool = True,
         max_memory_mb: float = 1000.0,
+        dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+        adaptive_chunking: bool = True,
     ):
+        # First chunk size when adaptive, otherwise the fixed chunk size
         self.chunk_size = chunk_size
         self.enable_memory_pooling = enable_memory_pooling
         self.max_memory_mb = max_memory_mb
+        self.adaptive_chunking = adaptive_chunking
+        # Dtypes of longitude and separation arrays (see dtype_policy)
+        self.dtypes = get_dtype_policy(dtype_policy)
+        self.monitor = MemoryMonitor()
+        self.chunk_sizer: Optional[AdaptiveChunkSizer] = None
 
         if enable_memory_pooling:
             self.memory_pool = ArrayMemoryPool()
@@ -248,12 +433,20 @@ class MemoryOptimizedVectorizedCalculator:
             self.memory_pool = None
 
         # Load aspect configuration
-        from utils.aspect_utils import ASPECT_DEGREES, ORBS, PLANETS
+        from utils.aspect_utils import (
+            ASPECT_DEGREES,
+            PLANETS,
+            SYNASTRY_ORB_PROFILE,
+        )
+        from utils.orb_profiles import compile_orb_profile
 
+        compiled = compile_orb_profile(
+            SYNASTRY_ORB_PROFILE, tuple(ASPECT_DEGREES)
+        )
         self.planets = np.array(PLANETS)
-        self.aspect_degrees = np.array(list(ASPECT_DEGREES.values()))
+        self.aspect_degrees = compiled.angles
         self.aspect_names = list(ASPECT_DEGREES.keys())
-        self.orbs = np.array([ORBS[name] for name in self.aspect_names])
+        self.orbs = compiled.orbs
 
     def calculate_separation_matrix_chunked(
         self,
@@ -270,12 +463,19 @@ class MemoryOptimizedVectorizedCalculator:
         Yields:
             Separation matrices for each chunk
         """
+        side = self.chunk_size
+        if self.adaptive_chunking:
+            # Largest square chunk whose grid fits the memory budget
+            cell_bytes = len(self.planets) ** 2 * self.dtypes.bytes_per_cell()
+            fitting = math.isqrt(int(self.memory_budget_mb() * _MB / cell_bytes))  # noqa: E501
+            side = max(MIN_CHUNK_SIZE, min(side, fitting))
+
         # Process in chunks to manage memory
-        for i in range(0, len(longitudes1), self.chunk_size):
-            chunk1 = longitudes1[i : i + self.chunk_size]  # noqa: E203
+        for i in range(0, len(longitudes1), side):
+            chunk1 = longitudes1[i : i + side]  # noqa: E203
 
-            for j in range(0, len(longitudes2), self.chunk_size):
-                chunk2 = longitudes2[j : j + self.chunk_size]  # noqa: E203
+            for j in range(0, len(longitudes2), side):
+                chunk2 = longitudes2[j : j + side]  # noqa: E203
 
                 # Calculate separation matrix for this chunk
                 chunk_matrix = self._calculate_chunk_separations(
@@ -284,7 +484,7 @@ class MemoryOptimizedVectorizedCalculator:
                 yield chunk_matrix
 
                 # Force garbage collection periodically
-                if (i * len(longitudes2) + j) % (self.chunk_size * 10) == 0:
+                if (i * len(longitudes2) + j) % (side * 10) == 0:
                     gc.collect()
 
     def _calculate_chunk_separations(
@@ -293,13 +493,14 @@ class MemoryOptimizedVectorizedCalculator:
         """Calculate separation matrix for a chunk of charts."""
         n_charts1, n_charts2 = len(chunk1), len(chunk2)
         n_planets = len(self.planets)
+        angle = self.dtypes.angle
 
         if self.memory_pool:
             with self.memory_pool.get_temp_array(
-                (n_charts1, n_planets)
+                (n_charts1, n_planets), angle
             ) as lons1_array:
                 with self.memory_pool.get_temp_array(
-                    (n_charts2, n_planets)
+                    (n_charts2, n_planets), angle
                 ) as lons2_array:
                     # Fill longitude arrays
                     for i, chart in enumerate(chunk1):
@@ -311,8 +512,11 @@ class MemoryOptimizedVectorizedCalculator:
                             lons2_array[i, j] = chart.get(planet, 0.0)
 
                     # Calculate separations using broadcasting
+                    # Every cell is written below, so skip zeroing
                     with self.memory_pool.get_temp_array(
-                        (n_charts1, n_charts2, n_planets, n_planets)
+                        (n_charts1, n_charts2, n_planets, n_planets),
+                        angle,
+                        zero=False,
                     ) as separations:
                         for i in range(n_charts1):
                             for j in range(n_charts2):
@@ -329,8 +533,8 @@ class MemoryOptimizedVectorizedCalculator:
                         )  # Return copy as original will be recycled
         else:
             # Standard implementation without memory pooling
-            lons1_array = np.zeros((n_charts1, n_planets))
-            lons2_array = np.zeros((n_charts2, n_planets))
+            lons1_array = np.zeros((n_charts1, n_planets), dtype=angle)
+            lons2_array = np.zeros((n_charts2, n_planets), dtype=angle)
 
             # Fill arrays
             for i, chart in enumerate(chunk1):
@@ -343,7 +547,7 @@ class MemoryOptimizedVectorizedCalculator:
 
             # Calculate separations
             separations = np.zeros(
-                (n_charts1, n_charts2, n_planets, n_planets)
+                (n_charts1, n_charts2, n_planets, n_planets), dtype=angle
             )
             for i in range(n_charts1):
                 for j in range(n_charts2):
@@ -365,15 +569,38 @@ class MemoryOptimizedVectorizedCalculator:
         """Calculate aspects for a large batch of chart pairs with memory optimization."""  # noqa: E501
         results: List[Any] = []  # Aspect matrices may not be strictly ndarrays
         total_pairs = len(chart_pairs)
+        sizer = None
+        if self.adaptive_chunking:
+            sizer = self.chunk_sizer = AdaptiveChunkSizer(
+                bytes_per_item=self.estimate_memory_usage(1, 1)[
+                    "base_memory_mb"
+                ]
+                * _MB,
+                budget_mb=self.memory_budget_mb,
+                initial_size=self.chunk_size,
+            )
 
         # Process in chunks to manage memory
-        for start_idx in range(0, total_pairs, self.chunk_size):
-            end_idx = min(start_idx + self.chunk_size, total_pairs)
+        start_idx = 0
+        chunks_done = 0
+        while start_idx < total_pairs:
+            size = sizer.next_size() if sizer else self.chunk_size
+            end_idx = min(start_idx + size, total_pairs)
             chunk = chart_pairs[start_idx:end_idx]
 
             # Process chunk
+            if sizer:
+                self.monitor.start_monitoring()
+            started = time.perf_counter()
             chunk_results = self._process_chunk(chunk)
             results.extend(chunk_results)
+            if sizer:
+                self.monitor.update_peak()
+                sizer.record(
+                    len(chunk),
+                    time.perf_counter() - started,
+                    self.monitor.peak_memory_mb - self.monitor.start_memory_mb,
+                )
 
             # Progress callback
             if progress_callback:
@@ -381,18 +608,52 @@ class MemoryOptimizedVectorizedCalculator:
                 progress_callback(progress_percent, end_idx, total_pairs)
 
             # Memory management
-            if end_idx % (self.chunk_size * 5) == 0:
+            start_idx = end_idx
+            chunks_done += 1
+            if chunks_done % 5 == 0:
                 gc.collect()
 
         return results
 
+    def memory_budget_mb(self) -> float:
+        """Memory a chunk may use in MB.
+
+        ``max_memory_mb``, lowered to ``MEMORY_HEADROOM`` of the memory
+        currently available (cgroup limit aware).
+        """
+        available = available_memory_mb()
+        if available is None:
+            return self.max_memory_mb
+        return min(self.max_memory_mb, available * MEMORY_HEADROOM)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Chunking settings and the last batch's adaptive chunk history."""
+        stats: Dict[str, Any] = {
+            "adaptive_chunking": self.adaptive_chunking,
+            "chunk_size": self.chunk_size,
+            "memory_budget_mb": self.memory_budget_mb(),
+        }
+        if self.chunk_sizer:
+            stats.update(
+                {
+                    "chunk_sizes": [
+                        int(entry["size"])
+                        for entry in self.chunk_sizer.history
+                    ],
+                    "items_per_second": self.chunk_sizer.items_per_second,
+                    "bytes_per_item": self.chunk_sizer.bytes_per_item,
+                    "next_chunk_size": self.chunk_sizer.size,
+                }
+            )
+        return stats
+
     def _process_chunk(
         self, chunk: List[Tuple[Dict[str, float], Dict[str, float]]]
     ) -> List[Any]:
         """Process a chunk of chart pairs."""
-        from utils.vectorized_aspect_utils import VectorizedAspectCalculator
+        from utils.vectorized_aspect_utils import get_vectorized_calculator
 
-        calculator = VectorizedAspectCalculator()
+        calculator = get_vectorized_calculator(dtype_policy=self.dtypes)
         chunk_results: List[Any] = []
 
         for chart1, chart2 in chunk:
@@ -415,13 +676,14 @@ class MemoryOptimizedVectorizedCalculator:
         Returns:
             Memory usage estimates in MB
         """
-        # Array sizes
-        longitudes_size = num_charts1 * num_planets * 8  # float64
-        separations_size = (
-            num_charts1 * num_charts2 * num_planets * num_planets * 8
-        )
-        aspects_size = (
-            separations_size  # Roughly same size for aspect matrices
+        # Array sizes in the policy dtypes
+        angle_bytes = self.dtypes.angle.itemsize
+        cells = num_charts1 * num_charts2 * num_planets * num_planets
+        longitudes_size = num_charts1 * num_planets * angle_bytes
+        separations_size = cells * angle_bytes
+        # Orbs, aspect codes and the validity mask per cell
+        aspects_size = cells * (
+            self.dtypes.bytes_per_cell() - angle_bytes
         )
 
         # Total memory estimates
@@ -434,15 +696,15 @@ class MemoryOptimizedVectorizedCalculator:
         effective_charts2 = min(num_charts2, self.chunk_size)
 
         chunked_longitudes = (
-            effective_charts1 * num_planets * 8
-            + effective_charts2 * num_planets * 8
+            effective_charts1 * num_planets * angle_bytes
+            + effective_charts2 * num_planets * angle_bytes
         )
         chunked_separations = (
             effective_charts1
             * effective_charts2
             * num_planets
             * num_planets
-            * 8
+            * angle_bytes
         )
         chunked_memory_mb = (chunked_longitudes + chunked_separations) / (
             1024 * 1024
@@ -509,6 +771,8 @@ def memory_optimized_processing(
     chunk_size: int = 1000,
     enable_pooling: bool = True,
     max_memory_mb: float = 1000.0,
+    dtype_policy: Optional[Union[str, DtypePolicy]] = None,
+    adaptive_chunking: bool = True,
 ) -> Iterator[Tuple[MemoryOptimizedVectorizedCalculator, MemoryMonitor]]:
     """
     Context manager for memory-optimized vectorized processing.
@@ -517,11 +781,15 @@ def memory_optimized_processing(
         chunk_size: Size of processing chunks
         enable_pooling: Whether to use memory pooling
         max_memory_mb: Maximum memory usage limit
+        dtype_policy: Array dtype policy name (default: process-wide)
+        adaptive_chunking: Whether to tune chunk sizes while processing
     """
     calculator = MemoryOptimizedVectorizedCalculator(
         chunk_size=chunk_size,
         enable_memory_pooling=enable_pooling,
         max_memory_mb=max_memory_mb,
+        dtype_policy=dtype_policy,
+        adaptive_chunking=adaptive_chunking,
     )
 
     monitor = MemoryMonitor()
@@ -543,11 +811,32 @@ def memory_optimized_processing(
 
 # Global memory pool instance
 _global_memory_pool: Optional[ArrayMemoryPool] = None
+_global_memory_pool_lock = threading.Lock()
 
 
 def get_global_memory_pool() -> ArrayMemoryPool:
-    """Get the global memory pool instance."""
+    """Get the global memory pool instance.
+
+    Shared by the vectorized kernels for their per-call temporaries.
+    """
     global _global_memory_pool
     if _global_memory_pool is None:
-        _global_memory_pool = ArrayMemoryPool()
+        with _global_memory_pool_lock:
+            if _global_memory_pool is None:
+                _global_memory_pool = ArrayMemoryPool()
     return _global_memory_pool
+
+
+def scratch_array(
+    stack: ExitStack, shape: Tuple[int, ...], dtype: Any
+) -> np.ndarray:
+    """Uninitialized kernel temporary, from the global pool if large.
+
+    Pooled arrays go back to the pool when ``stack`` closes; arrays
+    under ``POOL_MIN_CELLS`` cells are allocated directly.
+    """
+    if math.prod(shape) < POOL_MIN_CELLS:
+        return np.empty(shape, dtype)
+    return stack.enter_context(
+        get_global_memory_pool().get_temp_array(shape, dtype, zero=False)
+    )
@@ -0,0 +1,470 @@
+"""
+Vectorized multi-system chart calculator.
+
+Computes the Vedic (sidereal) and Uranian layers of a multi-system chart as
+NumPy array operations over one shared position vector, instead of the
+per-planet / per-pair Python loops in ``astro.calculations.vedic`` and
+``astro.calculations.uranian``.
+
+Key Features:
+- Single tropical longitude vector shared by every system
+- Sidereal positions, signs, nakshatras and padas in one broadcast
+- Uranian midpoints and 90-degree dial over ``np.triu_indices`` pairs
+- Reuses the western house cusps for Vedic houses when both use Placidus
+
+Output is identical to ``calculate_multi_system_chart`` so the
+``use_vectorized`` flag on ``/multi-system-chart`` is a pure speed switch.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe  # type: ignore
+
+from astro.calculations.chart import (
+    calculate_chart,
+    extract_primary_themes,
+    integrate_personality_traits,
+    synthesize_life_purpose,
+    synthesize_spiritual_guidance,
+)
+from astro.calculations.house_systems import calculate_houses
+from astro.calculations.mayan import calculate_mayan_astrology
+from astro.calculations.uranian import (
+    DIAL_INTERPRETATIONS,
+    URANIAN_MIDPOINTS,
+    URANIAN_PLANETS,
+    analyze_uranian_patterns,
+    get_uranian_house_meanings,
+)
+from astro.calculations.vedic import (
+    FLG_SPEED,
+    FLG_SWIEPH,
+    VEDIC_NAKSHATRAS,
+    VEDIC_SIGNS,
+    get_ayanamsa,
+    get_vedic_chart_analysis,
+)
+from utils.jit_kernels import dial_separations, pair_midpoints
+
+logger = logging.getLogger(__name__)
+
+# Vedic bodies in calculation order; Ketu is derived from Rahu (body -1)
+VEDIC_BODIES: List[Tuple[str, int]] = [
+    ("sun", 0),
+    ("moon", 1),
+    ("mercury", 2),
+    ("venus", 3),
+    ("mars", 4),
+    ("jupiter", 5),
+    ("saturn", 6),
+    ("rahu", 10),
+    ("ketu", -1),
+]
+
+# Same constants as vedic.get_nakshatra so results match bit for bit
+NAKSHATRA_SPAN = 13.333333
+PADA_SPAN = 3.333333
+
+DIAL_KEYS: List[float] = list(DIAL_INTERPRETATIONS.keys())
+DIAL_ANGLES = np.array(DIAL_KEYS, dtype=np.float64)
+DIAL_MEANINGS: List[str] = list(DIAL_INTERPRETATIONS.values())
+DIAL_ORB = 1.0
+
+
+def _sign_strings(sidereal: np.ndarray) -> List[str]:
+    """Format sidereal longitudes as ``"12.34° Mesha"`` strings."""
+    sign_idx = (sidereal // 30).astype(np.int64)
+    degrees = sidereal % 30
+    return [
+        f"{deg:.2f}° {VEDIC_SIGNS[idx]}"
+        for deg, idx in zip(degrees.tolist(), sign_idx.tolist())
+    ]
+
+
+def _nakshatras(sidereal: np.ndarray) -> List[Dict[str, Any]]:
+    """Map sidereal longitudes to nakshatra records in one pass."""
+    nak_idx = np.minimum((sidereal / NAKSHATRA_SPAN).astype(np.int64), 26)
+    nak_deg = sidereal % NAKSHATRA_SPAN
+    padas = (nak_deg / PADA_SPAN).astype(np.int64) + 1
+
+    results: List[Dict[str, Any]] = []
+    for idx, deg, pada in zip(
+        nak_idx.tolist(), nak_deg.tolist(), padas.tolist()
+    ):
+        nakshatra = VEDIC_NAKSHATRAS[idx]
+        results.append(
+            {
+                "name": nakshatra["name"],
+                "lord": nakshatra["lord"],
+                "symbol": nakshatra["symbol"],
+                "nature": nakshatra["nature"],
+                "pada": pada,
+                "degree": f"{deg:.2f}°",
+            }
+        )
+    return results
+
+
+def calculate_vedic_planets_vectorized(
+    julian_day: float, ayanamsa: float
+) -> Dict[str, Any]:
+    """Vectorized equivalent of ``vedic.calculate_vedic_planets``."""
+    try:
+        names: List[str] = []
+        tropical: List[float] = []
+        rahu_pos: Optional[float] = None
+
+        for name, body in VEDIC_BODIES:
+            if body < 0:
+                pos = ((rahu_pos or 0.0) + 180) % 360
+            else:
+                result = swe.calc_ut(julian_day, body, FLG_SWIEPH | FLG_SPEED)  # type: ignore  # noqa: E501
+                if result[0][0] < 0:
+                    logger.error(f"Error calculating {name}: {result[0][0]}")
+                    continue
+                pos = float(result[0][0])
+                if name == "rahu":
+                    rahu_pos = pos
+            names.append(name)
+            tropical.append(pos)
+
+        tropical_arr = np.array(tropical, dtype=np.float64)
+        sidereal_arr = (tropical_arr - ayanamsa) % 360
+        signs = _sign_strings(sidereal_arr)
+        nakshatras = _nakshatras(sidereal_arr)
+
+        planets: Dict[str, Dict[str, Any]] = {}
+        for i, name in enumerate(names):
+            planets[name] = {
+                "tropical_position": tropical[i],
+                "sidereal_position": float(sidereal_arr[i]),
+                "vedic_sign": signs[i],
+                "nakshatra": nakshatras[i],
+            }
+
+        return {"ayanamsa": ayanamsa, "planets": planets}
+
+    except Exception as e:
+        logger.error(f"Error in vectorized Vedic calculations: {str(e)}")
+        return {"ayanamsa": 0, "planets": {}}
+
+
+def calculate_vedic_houses_vectorized(
+    cusps: List[float], ascendant: float, mc: float, ayanamsa: float
+) -> Dict[str, Any]:
+    """Convert tropical Placidus cusps and angles to sidereal in one pass."""
+    cusps_arr = np.asarray(cusps, dtype=np.float64)
+    sidereal_cusps = (cusps_arr - ayanamsa) % 360
+    signs = _sign_strings(sidereal_cusps)
+
+    houses: List[Dict[str, Any]] = [
+        {"house": i + 1, "cusp": float(sidereal_cusps[i]), "vedic_sign": signs[i]}  # noqa: E501
+        for i in range(len(cusps_arr))
+    ]
+    angles: Dict[str, float] = {
+        "ascendant": (float(ascendant) - ayanamsa) % 360,
+        "mc": (float(mc) - ayanamsa) % 360,
+        "descendant": ((float(ascendant) + 180) - ayanamsa) % 360,
+        "ic": ((float(mc) + 180) - ayanamsa) % 360,
+    }
+    return {"houses": houses, "angles": angles}
+
+
+def _placidus_cusps(
+    base_chart: Dict[str, Any], house_system: str, julian_day: float
+) -> Tuple[List[float], float, float]:
+    """Return Placidus cusps/ASC/MC, reusing the western chart if possible."""
+    houses = base_chart.get("houses") or []
+    if house_system.upper() == "P" and len(houses) == 12:
+        angles = base_chart.get("angles", {})
+        return (
+            [float(h["cusp"]) for h in houses],
+            float(angles.get("ascendant", 0.0)),
+            float(angles.get("mc", 0.0)),
+        )
+
+    result = calculate_houses(
+        julian_day, base_chart["latitude"], base_chart["longitude"], "P"
+    )
+    return (
+        [h["cusp"] for h in result["houses"]],
+        result["angles"]["ascendant"],
+        result["angles"]["mc"],
+    )
+
+
+@lru_cache(maxsize=64)
+def _pair_indices(
+    n: int,
+) -> Tuple[np.ndarray, np.ndarray, List[int], List[int]]:
+    """Upper-triangle (i < j) pair indices in nested-loop order."""
+    i_idx, j_idx = np.triu_indices(n, k=1)
+    return i_idx, j_idx, i_idx.tolist(), j_idx.tolist()
+
+
+def _position_vector(
+    bodies: Dict[str, Any],
+) -> Tuple[List[str], np.ndarray]:
+    """Extract names and longitudes of bodies that carry a position."""
+    names = [name for name, data in bodies.items() if "position" in data]
+    positions = np.array(
+        [bodies[name]["position"] for name in names], dtype=np.float64
+    )
+    return names, positions
+
+
+def calculate_uranian_planets_vectorized(
+    julian_day: float,
+) -> Dict[str, Dict[str, Any]]:
+    """Vectorized equivalent of ``uranian.calculate_uranian_planets_positions``."""  # noqa: E501
+    names = list(URANIAN_PLANETS.keys())
+    base = np.array([hash(name) % 360 for name in names], dtype=np.float64)
+    speeds = np.array(
+        [URANIAN_PLANETS[name]["speed"] for name in names], dtype=np.float64
+    )
+    days_since_epoch = julian_day - 2451545.0  # J2000.0
+    positions = (base + days_since_epoch * (speeds / 365.25)) % 360
+
+    return {
+        name: {
+            "position": float(positions[i]),
+            "symbol": URANIAN_PLANETS[name]["symbol"],
+            "meaning": URANIAN_PLANETS[name]["meaning"],
+            "speed": URANIAN_PLANETS[name]["speed"],
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def calculate_midpoints_vectorized(
+    planets: Dict[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """Vectorized equivalent of ``uranian.calculate_midpoints``."""
+    names, pos = _position_vector(planets)
+    return _midpoints_from_vector(names, pos)
+
+
+def _midpoints_from_vector(
+    names: List[str], pos: np.ndarray
+) -> Dict[str, Dict[str, Any]]:
+    if len(names) < 2:
+        return {}
+
+    _, _, i_list, j_list = _pair_indices(len(names))
+    midpoints = pair_midpoints(pos)
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for i, j, midpoint in zip(i_list, j_list, midpoints.tolist()):
+        key = f"{names[i]}_{names[j]}"
+        meaning = URANIAN_MIDPOINTS.get(key)
+        result[key] = {
+            "position": midpoint,
+            "meaning": meaning
+            or f"Combination of {names[i]} and {names[j]} energies",
+        }
+    return result
+
+
+def calculate_90_degree_dial_vectorized(
+    planets: Dict[str, Any], uranian_planets: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Vectorized equivalent of ``uranian.calculate_90_degree_dial``."""
+    names, pos = _position_vector({**planets, **uranian_planets})
+    return _dial_from_vector(names, pos)
+
+
+def _dial_from_vector(
+    names: List[str], pos: np.ndarray
+) -> List[Dict[str, Any]]:
+    if len(names) < 2:
+        return []
+
+    _, _, i_list, j_list = _pair_indices(len(names))
+    diff = dial_separations(pos)
+
+    # (pairs, dial angles) orb grid; nonzero() keeps the loop's pair order
+    orbs = np.abs(diff[:, np.newaxis] - DIAL_ANGLES[np.newaxis, :])
+    pair_hits, angle_hits = np.nonzero(orbs <= DIAL_ORB)
+    hit_orbs = orbs[pair_hits, angle_hits]
+    order = np.argsort(hit_orbs, kind="stable")
+
+    diff_list = diff.tolist()
+    dial_aspects: List[Dict[str, Any]] = []
+    for p, a, orb in zip(
+        pair_hits[order].tolist(),
+        angle_hits[order].tolist(),
+        hit_orbs[order].tolist(),
+    ):
+        dial_aspects.append(
+            {
+                "body1": names[i_list[p]],
+                "body2": names[j_list[p]],
+                "angle": DIAL_KEYS[a],
+                "orb": orb,
+                "meaning": DIAL_MEANINGS[a],
+                "dial_position": f"{diff_list[p]:.1f}°",
+            }
+        )
+    return dial_aspects
+
+
+def calculate_uranian_astrology_vectorized(
+    julian_day: float, planets: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Vectorized equivalent of ``uranian.calculate_uranian_astrology``."""
+    try:
+        uranian_planets = calculate_uranian_planets_vectorized(julian_day)
+
+        # One shared vector: natal bodies first, Uranian points appended
+        names, pos = _position_vector(planets)
+        uranian_names, uranian_pos = _position_vector(uranian_planets)
+        midpoints = _midpoints_from_vector(names, pos)
+        if set(names) & set(uranian_names):
+            dial_aspects = calculate_90_degree_dial_vectorized(
+                planets, uranian_planets
+            )
+        else:
+            dial_aspects = _dial_from_vector(
+                names + uranian_names, np.concatenate([pos, uranian_pos])
+            )
+        patterns = analyze_uranian_patterns(
+            planets, uranian_planets, midpoints
+        )
+
+        return {
+            "uranian_planets": uranian_planets,
+            "midpoints": midpoints,
+            "dial_aspects": dial_aspects[:10],  # Top 10 most exact aspects
+            "house_meanings": get_uranian_house_meanings(),
+            "pattern_analysis": patterns,
+            "methodology": {
+                "description": "Uranian astrology uses transneptunian points and midpoint analysis",  # noqa: E501
+                "focus": "Psychological patterns, collective unconscious, precise timing",  # noqa: E501
+                "techniques": [
+                    "90-degree dial",
+                    "Midpoint trees",
+                    "Planetary pictures",
+                ],
+            },
+            "interpretation_notes": [
+                "Uranian planets represent collective unconscious themes",
+                "Midpoints show combined planetary energies",
+                "90-degree dial reveals hidden connections",
+                "Focus on precise aspects (within 1 degree orb)",
+            ],
+        }
+
+    except Exception as e:
+        logger.error(f"Error in vectorized Uranian calculation: {str(e)}")
+        return {"error": "Calculation failed", "details": str(e)}
+
+
+def calculate_multi_system_chart_fast(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+    timezone: Optional[str] = None,
+    city: Optional[str] = None,
+    house_system: str = "P",
+) -> Dict[str, Any]:
+    """Vectorized drop-in for ``chart.calculate_multi_system_chart``.
+
+    The western chart is computed once; every other system is derived from
+    its Julian day, house cusps and planet vector with array operations.
+    """
+    logger.debug(
+        f"Calculating vectorized multi-system chart for {year}-{month}-{day} {hour}:{minute}"  # noqa: E501
+    )
+    try:
+        base_chart = calculate_chart(
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            lat,
+            lon,
+            timezone,
+            city,
+            house_system,
+        )
+        julian_day = base_chart["julian_day"]
+        planets = base_chart["planets"]
+
+        # One ayanamsa for planets and houses
+        ayanamsa = get_ayanamsa(julian_day)
+        vedic_data = calculate_vedic_planets_vectorized(julian_day, ayanamsa)
+        try:
+            cusps, ascendant, mc = _placidus_cusps(
+                base_chart, house_system, julian_day
+            )
+            vedic_houses = calculate_vedic_houses_vectorized(
+                cusps, ascendant, mc, ayanamsa
+            )
+        except Exception as e:
+            logger.error(f"Error calculating Vedic houses: {str(e)}")
+            vedic_houses = {"houses": [], "angles": {}}
+        vedic_analysis = get_vedic_chart_analysis(
+            {**vedic_data, **vedic_houses}
+        )
+
+        chinese_data: Dict[str, Any] = {}
+        mayan_data = calculate_mayan_astrology(year, month, day)  # type: ignore  # noqa: E501
+        uranian_data = calculate_uranian_astrology_vectorized(
+            julian_day, planets
+        )
+
+        multi_chart: Dict[str, Any] = {
+            "birth_info": {
+                "date": f"{year}-{month:02d}-{day:02d}",
+                "time": f"{hour:02d}:{minute:02d}",
+                "location": {
+                    "latitude": lat,
+                    "longitude": lon,
+                    "timezone": timezone,
+                },
+                "julian_day": julian_day,
+            },
+            "western_tropical": base_chart,
+            "vedic_sidereal": {
+                "ayanamsa": vedic_data.get("ayanamsa", 0),
+                "planets": vedic_data.get("planets", {}),
+                "houses": vedic_houses,
+                "analysis": vedic_analysis,
+                "description": "Vedic astrology uses the sidereal zodiac and focuses on karma, dharma, and spiritual evolution",  # noqa: E501
+            },
+            "chinese": {
+                **chinese_data,
+                "description": "Chinese astrology calculation not available",
+            },
+            "mayan": {
+                **mayan_data,
+                "description": "Mayan astrology using the 260-day sacred calendar (Tzolkin) and Long Count system",  # noqa: E501
+            },
+            "uranian": {
+                **uranian_data,
+                "description": "Uranian astrology focuses on transneptunian points, midpoints, and 90-degree dial",  # noqa: E501
+            },
+            "synthesis": {
+                "primary_themes": extract_primary_themes(base_chart, vedic_analysis, chinese_data, mayan_data),  # type: ignore  # noqa: E501
+                "life_purpose": synthesize_life_purpose(base_chart, vedic_analysis, chinese_data, mayan_data),  # noqa: E501
+                "personality_integration": integrate_personality_traits(base_chart, vedic_analysis, chinese_data, mayan_data),  # noqa: E501
+                "spiritual_path": synthesize_spiritual_guidance(vedic_analysis, mayan_data, uranian_data),  # noqa: E501
+            },
+        }
+
+        logger.debug("Vectorized multi-system chart calculation completed")
+        return multi_chart
+
+    except Exception as e:
+        logger.error(
+            f"Error in vectorized multi-system chart calculation: {str(e)}"
+        )
+        raise ValueError(f"Multi-system calculation failed: {str(e)}")
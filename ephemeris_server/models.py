@@ -26,6 +26,7 @@ class PlanetPosition(BaseModel):
     """Position data for a planetary body."""
     position: float = Field(..., description="Position in degrees")
     retrograde: bool = Field(..., description="Whether the planet is retrograde")
+    speed: Optional[float] = Field(None, description="Longitude speed in degrees per day")
 
 class CalculationRequest(BaseModel):
     """Request model for planetary position calculation."""
@@ -185,7 +185,8 @@ class EphemerisService:
             
             planet_position = PlanetPosition(
                 position=position_deg,
-                retrograde=retrograde
+                retrograde=retrograde,
+                speed=speed
             )
             
             # Cache the result
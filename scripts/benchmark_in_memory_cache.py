@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for InMemoryCache at 100k entries.
+
+Fills a cache to its entry limit, then times puts that each evict the
+least recently used entry, and hits that reorder it. Values are synastry
+aspect matrices (arrays) and aspect lists (dicts), the two kinds of
+results the vectorized layers cache. The previous implementation (LRU
+by a scan of access times, sizes by pickling) is timed on a sample of
+the same workload for comparison.
+
+Usage:
+    python scripts/benchmark_in_memory_cache.py [entries]
+"""
+
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from utils.vectorized_caching import InMemoryCache  # noqa: E402
+
+LEGACY_SAMPLE = 500
+
+
+class LegacyInMemoryCache(InMemoryCache):
+    """The O(n) eviction and pickle sizing this benchmark compares with."""
+
+    def __init__(self, max_size: int, max_memory_mb: float):
+        super().__init__(max_size, max_memory_mb)
+        self.access_times: Dict[str, float] = {}
+
+    def get(self, key: str) -> Any:
+        if key in self.cache:
+            self.access_times[key] = time.time()
+        return super().get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        size = len(pickle.dumps(value))
+        self.size_bytes += size - self.memory_usage.get(key, 0)
+        self.cache[key] = value
+        self.access_times[key] = time.time()
+        self.memory_usage[key] = size
+        while len(self.cache) > self.max_size:
+            lru_key = min(self.access_times, key=self.access_times.get)
+            self.cache.pop(lru_key)
+            self.access_times.pop(lru_key)
+            self.size_bytes -= self.memory_usage.pop(lru_key)
+
+
+def _values(count: int) -> List[Any]:
+    rng = np.random.default_rng(0)
+    return [
+        rng.integers(0, 6, (10, 10), dtype=np.int8)
+        if i % 2
+        else [
+            {"planet1": "Sun", "planet2": "Moon", "aspect": "trine", "orb": orb}  # noqa: E501
+            for orb in rng.uniform(0, 8, 8).tolist()
+        ]
+        for i in range(count)
+    ]
+
+
+def _per_op_us(cache: InMemoryCache, values: List[Any], ops: int) -> Dict[str, float]:  # noqa: E501
+    """Microseconds per evicting put and per hit on a full ``cache``."""
+    entries = len(values)
+    for i, value in enumerate(values):
+        cache.put(f"key{i}", value)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.put(f"new{i}", values[i % entries])
+    put_us = (time.perf_counter() - start) / ops * 1e6
+
+    keys = list(cache.cache)[-ops:]
+    start = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    get_us = (time.perf_counter() - start) / len(keys) * 1e6
+    return {"put_us": put_us, "get_us": get_us}
+
+
+def main() -> Dict[str, Dict[str, float]]:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    values = _values(entries)
+
+    results = {
+        "ordered_lru": _per_op_us(
+            InMemoryCache(entries, max_memory_mb=1e6), values, entries
+        ),
+        "legacy": _per_op_us(
+            LegacyInMemoryCache(entries, max_memory_mb=1e6),
+            values,
+            min(LEGACY_SAMPLE, entries),
+        ),
+    }
+
+    print("InMemoryCache benchmark")
+    print("=" * 50)
+    print(f"Entries: {entries} (cache full, every put evicts)")
+    print(f"{'':<14} {'put (us)':>10} {'hit (us)':>10}")
+    for name, timing in results.items():
+        print(f"{name:<14} {timing['put_us']:10.2f} {timing['get_us']:10.2f}")
+    speedup = results["legacy"]["put_us"] / results["ordered_lru"]["put_us"]
+    print(f"Evicting put speedup: {speedup:.0f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the optional JIT kernels in utils.jit_kernels.
+
+Times each kernel three ways on the same inputs:
+
+- the plain loop run by the Python interpreter (what the original
+  per-pair Python loops cost);
+- the NumPy fallback used when Numba is not installed;
+- the Numba-compiled loop, when Numba is installed (compiled before
+  timing).
+
+Usage:
+    python scripts/benchmark_jit_kernels.py [bodies] [iterations]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from astro.calculations.human_design import (  # noqa: E402
+    GATE_SEQUENCE,
+    HD_OFFSET,
+)
+from utils import jit_kernels  # noqa: E402
+
+KERNELS = [
+    "pair_midpoints",
+    "dial_separations",
+    "pair_aspect_orbs",
+    "gate_lines",
+    "area_scores",
+]
+
+
+def _time(func: Callable[[], Any], iterations: int) -> float:
+    """Average wall time per call in microseconds."""
+    for _ in range(3):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1e6 / iterations
+
+
+def _inputs(name: str, bodies: int) -> Tuple[Any, ...]:
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(0, 360, bodies)
+    pairs = bodies * (bodies - 1) // 2
+    if name == "pair_aspect_orbs":
+        angles = np.array([0.0, 30, 45, 60, 72, 90, 120, 135, 150, 180])
+        return pos, angles, rng.uniform(0, 10, (pairs, len(angles)))
+    if name == "gate_lines":
+        return pos, HD_OFFSET, GATE_SEQUENCE
+    if name == "area_scores":
+        return (
+            rng.normal(0, 5, 100),
+            rng.random(100) < 0.3,
+            rng.random((5, 100)) < 0.2,
+        )
+    return (pos,)
+
+
+def main() -> Dict[str, Dict[str, float]]:
+    bodies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    numba = jit_kernels.numba if jit_kernels.NUMBA_AVAILABLE else None
+    results: Dict[str, Dict[str, float]] = {}
+    for name in KERNELS:
+        args = _inputs(name, bodies)
+        loop = getattr(jit_kernels, f"_{name}_loop")
+        fallback = getattr(jit_kernels, f"_{name}_numpy")
+        timings = {
+            "python_us": _time(lambda: loop(*args), iterations),
+            "numpy_us": _time(lambda: fallback(*args), iterations),
+        }
+        if numba is not None:
+            compiled = numba.njit(loop)
+            timings["numba_us"] = _time(lambda: compiled(*args), iterations)
+        results[name] = timings
+
+    print("JIT kernel benchmark")
+    print("=" * 50)
+    print(
+        f"Bodies: {bodies}   iterations: {iterations}   "
+        f"active backend: {jit_kernels.kernel_backend()}"
+    )
+    if numba is None:
+        print("Numba is not installed; only the fallback is timed")
+    for name, timings in results.items():
+        line = (
+            f"{name:<18} python {timings['python_us']:8.1f} us  "
+            f"numpy {timings['numpy_us']:7.1f} us "
+            f"({timings['python_us'] / timings['numpy_us']:5.1f}x)"
+        )
+        if "numba_us" in timings:
+            line += (
+                f"  numba {timings['numba_us']:7.1f} us "
+                f"({timings['python_us'] / timings['numba_us']:5.1f}x)"
+            )
+        print(line)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the multi-process batch synastry mode.
+
+Times a random batch (caching off) on the in-process path of
+OptimizedVectorizedAspectCalculator.calculate_large_batch_synastry and
+on the shared-memory process pool with 1, 2, 4, ... workers up to the
+CPU count, and reports the speedup of each worker count over one.
+
+Usage:
+    python scripts/benchmark_parallel_synastry.py [pairs]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from utils import optimized_vectorized_integration as integration  # noqa: E402
+from utils.aspect_utils import PLANETS  # noqa: E402
+
+
+def _run(pairs, workers: int) -> float:
+    """Seconds for the batch; 0 workers runs the in-process path."""
+    calculator = integration.OptimizedVectorizedAspectCalculator(
+        enable_caching=False, enable_monitoring=False, workers=workers
+    )
+    start = time.perf_counter()
+    if workers:
+        calculator._process_batch_parallel(pairs, 8.0, None)
+    else:
+        calculator.calculate_large_batch_synastry(pairs)
+    return time.perf_counter() - start
+
+
+def main() -> Dict[str, float]:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(0)
+    pairs = [
+        (
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+            dict(zip(PLANETS, rng.uniform(0, 360, len(PLANETS)))),
+        )
+        for _ in range(count)
+    ]
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, cpus} | {2**k for k in range(cpus.bit_length()) if 2**k <= cpus})  # noqa: E501
+    # The in-process path is timed on a slice and scaled up
+    sample = min(count, 20_000)
+    timings = {"in_process": _run(pairs[:sample], 0) * count / sample}
+    timings.update({f"{w}_workers": _run(pairs, w) for w in counts})
+
+    print("Parallel batch synastry benchmark")
+    print("=" * 50)
+    print(f"Pairs: {count}   CPUs: {cpus}")
+    print(f"{'in-process (extrapolated)':<26} {timings['in_process']:8.2f} s")
+    base = timings["1_workers"]
+    for w in counts:
+        seconds = timings[f"{w}_workers"]
+        print(f"{w:>3} workers{'':<15} {seconds:8.2f} s  ({base / seconds:4.1f}x)")  # noqa: E501
+    return timings
+
+
+if __name__ == "__main__":
+    main()
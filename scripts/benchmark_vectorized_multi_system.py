@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the vectorized multi-system chart engine.
+
+Compares the traditional Vedic + Uranian derivation (per-planet / per-pair
+Python loops) against utils.vectorized_multi_system_utils, and the full
+calculate_multi_system_chart vs calculate_multi_system_chart_fast pipeline.
+The ephemeris server is replaced by the deterministic test fallback so the
+numbers measure CPU work only.
+
+Usage:
+    python scripts/benchmark_vectorized_multi_system.py [iterations]
+"""
+
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+os.environ.setdefault("EPHEMERIS_TEST_FALLBACK", "1")
+logging.disable(logging.CRITICAL)
+
+from astro.calculations import chart as chart_module  # noqa: E402
+from astro.calculations.chart import calculate_multi_system_chart  # noqa: E402
+from astro.calculations.uranian import calculate_uranian_astrology  # noqa: E402
+from astro.calculations.vedic import (  # noqa: E402
+    calculate_vedic_houses,
+    calculate_vedic_planets,
+    get_ayanamsa,
+)
+from utils import vectorized_multi_system_utils as fast  # noqa: E402
+
+BIRTH = (1990, 6, 15, 14, 30, 40.7128, -74.0060, "America/New_York", "New York")  # noqa: E501
+
+
+def _time(func: Callable[[], Any], iterations: int) -> float:
+    """Average wall time per call in milliseconds."""
+    for _ in range(3):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main() -> Dict[str, float]:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    # Compute the western chart once and serve it from memory so both
+    # pipelines measure only the multi-system derivation work.
+    base_chart = chart_module.calculate_chart(*BIRTH)
+    chart_module.calculate_chart = lambda *a, **k: base_chart  # type: ignore
+    fast.calculate_chart = lambda *a, **k: base_chart  # type: ignore
+
+    jd = base_chart["julian_day"]
+    planets = base_chart["planets"]
+    lat, lon = base_chart["latitude"], base_chart["longitude"]
+
+    def traditional_systems() -> None:
+        calculate_vedic_planets(jd)
+        calculate_vedic_houses(jd, lat, lon)
+        calculate_uranian_astrology(jd, planets)
+
+    def vectorized_systems() -> None:
+        ayanamsa = get_ayanamsa(jd)
+        fast.calculate_vedic_planets_vectorized(jd, ayanamsa)
+        cusps, asc, mc = fast._placidus_cusps(base_chart, "P", jd)
+        fast.calculate_vedic_houses_vectorized(cusps, asc, mc, ayanamsa)
+        fast.calculate_uranian_astrology_vectorized(jd, planets)
+
+    results = {
+        "systems_traditional_ms": _time(traditional_systems, iterations),
+        "systems_vectorized_ms": _time(vectorized_systems, iterations),
+        "chart_traditional_ms": _time(
+            lambda: calculate_multi_system_chart(*BIRTH), iterations
+        ),
+        "chart_vectorized_ms": _time(
+            lambda: fast.calculate_multi_system_chart_fast(*BIRTH), iterations
+        ),
+    }
+
+    print("Multi-system chart benchmark")
+    print("=" * 50)
+    print(f"Bodies in planet vector: {len(planets)}   iterations: {iterations}")
+    for label, trad, vec in [
+        ("Vedic + Uranian", "systems_traditional_ms", "systems_vectorized_ms"),
+        ("Full multi-system", "chart_traditional_ms", "chart_vectorized_ms"),
+    ]:
+        speedup = results[trad] / results[vec] if results[vec] else 0.0
+        print(
+            f"{label:<18} traditional {results[trad]:7.3f} ms  "
+            f"vectorized {results[vec]:7.3f} ms  speedup {speedup:4.2f}x"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()